@@ -1,3 +1,4 @@
 @echo off
 
 python setup.py build_ext --inplace -j 8
+python hummingbot\client\connector_manifest.py
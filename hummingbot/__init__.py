@@ -167,6 +167,7 @@ def init_logging(conf_filename: str,
     from ruamel.yaml import YAML
 
     from hummingbot.client.config.global_config_map import global_config_map
+    from hummingbot.logger.log_pipeline import LogPipeline
     from hummingbot.logger.struct_logger import (
         StructLogRecord,
         StructLogger
@@ -194,7 +195,13 @@ def init_logging(conf_filename: str,
                 if global_config_map["logger_override_whitelist"].value and \
                         logger in global_config_map["logger_override_whitelist"].value:
                     config_dict["loggers"][logger]["level"] = override_log_level
+        log_pipeline_config: Dict = config_dict.pop("log_pipeline", None) or {}
+        log_pipeline: LogPipeline = LogPipeline.get_instance()
+        # Write the records queued for the current handlers before they are replaced.
+        log_pipeline.stop()
         logging.config.dictConfig(config_dict)
+        if log_pipeline_config.get("enabled", False):
+            log_pipeline.install(log_pipeline_config.get("handlers", []))
         # add remote logging to logger if in dev mode
         if dev_mode:
             add_remote_logger_handler(config_dict.get("loggers", []))
@@ -3,6 +3,8 @@ import logging
 import pandas as pd
 import decimal
 
+from hummingbot.core.utils.table_formatter import set_display_float_format
+
 
 def format_decimal(n):
     """
@@ -23,3 +25,4 @@ def format_decimal(n):
 
 
 pd.options.display.float_format = lambda x: format_decimal(x)
+set_display_float_format(format_decimal)
@@ -12,7 +12,7 @@ from hummingbot.client.config.config_validators import validate_decimal, validat
 from hummingbot.market.celo.celo_cli import CeloCLI
 from hummingbot.client.performance import smart_round
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
-import pandas as pd
+from hummingbot.core.utils.table_formatter import Table
 from decimal import Decimal
 from typing import TYPE_CHECKING, Dict, Optional, List
 
@@ -90,15 +90,17 @@ class BalanceCommand:
 
         for exchange, bals in all_ex_bals.items():
             self._notify(f"\n{exchange}:")
-            df, allocated_total = await self.exchange_balances_extra_df(bals, all_ex_avai_bals.get(exchange, {}))
-            if df.empty:
+            table, allocated_total = await self.exchange_balances_extra_table(bals,
+                                                                              all_ex_avai_bals.get(exchange, {}))
+            if table.empty:
                 self._notify("You have no balance on this exchange.")
             else:
-                lines = ["    " + line for line in df.to_string(index=False).split("\n")]
+                lines = ["    " + line for line in table.to_string(index=False).split("\n")]
                 self._notify("\n".join(lines))
-                self._notify(f"\n  Total: {RateOracle.global_token_symbol} {smart_round(df[total_col_name].sum())}    "
-                             f"Allocated: {allocated_total / df[total_col_name].sum():.2%}")
-                exchanges_total += df[total_col_name].sum()
+                total = sum(table[total_col_name])
+                self._notify(f"\n  Total: {RateOracle.global_token_symbol} {smart_round(total)}    "
+                             f"Allocated: {allocated_total / total:.2%}")
+                exchanges_total += total
 
         self._notify(f"\n\nExchanges Total: {RateOracle.global_token_symbol} {exchanges_total:.0f}    ")
 
@@ -107,8 +109,8 @@ class BalanceCommand:
             try:
                 if not CeloCLI.unlocked:
                     await self.validate_n_connect_celo()
-                df = await self.celo_balances_df()
-                lines = ["    " + line for line in df.to_string(index=False).split("\n")]
+                table = await self.celo_balances_table()
+                lines = ["    " + line for line in table.to_string(index=False).split("\n")]
                 self._notify("\ncelo:")
                 self._notify("\n".join(lines))
             except Exception as e:
@@ -116,20 +118,20 @@ class BalanceCommand:
 
         eth_address = global_config_map["ethereum_wallet"].value
         if eth_address is not None:
-            eth_df = await self.ethereum_balances_df()
-            lines = ["    " + line for line in eth_df.to_string(index=False).split("\n")]
+            eth_table = await self.ethereum_balances_table()
+            lines = ["    " + line for line in eth_table.to_string(index=False).split("\n")]
             self._notify("\nethereum:")
             self._notify("\n".join(lines))
 
             # XDAI balances
-            xdai_df = await self.xdai_balances_df()
-            lines = ["    " + line for line in xdai_df.to_string(index=False).split("\n")]
+            xdai_table = await self.xdai_balances_table()
+            lines = ["    " + line for line in xdai_table.to_string(index=False).split("\n")]
             self._notify("\nxdai:")
             self._notify("\n".join(lines))
 
-    async def exchange_balances_extra_df(self,  # type: HummingbotApplication
-                                         ex_balances: Dict[str, Decimal],
-                                         ex_avai_balances: Dict[str, Decimal]):
+    async def exchange_balances_extra_table(self,  # type: HummingbotApplication
+                                            ex_balances: Dict[str, Decimal],
+                                            ex_avai_balances: Dict[str, Decimal]):
         total_col_name = f"Total ({RateOracle.global_token_symbol})"
         allocated_total = Decimal("0")
         rows = []
@@ -147,22 +149,19 @@ class BalanceCommand:
                          total_col_name: smart_round(global_value),
                          "Allocated": allocated,
                          })
-        df = pd.DataFrame(data=rows, columns=["Asset", "Total", total_col_name, "Allocated"])
-        df.sort_values(by=["Asset"], inplace=True)
-        return df, allocated_total
+        table = Table(data=rows, columns=["Asset", "Total", total_col_name, "Allocated"]).sort_values(by=["Asset"])
+        return table, allocated_total
 
-    async def celo_balances_df(self,  # type: HummingbotApplication
-                               ):
+    async def celo_balances_table(self,  # type: HummingbotApplication
+                                  ):
         rows = []
         bals = CeloCLI.balances()
         for token, bal in bals.items():
             rows.append({"Asset": token.upper(), "Amount": round(bal.total, 4)})
-        df = pd.DataFrame(data=rows, columns=["Asset", "Amount"])
-        df.sort_values(by=["Asset"], inplace=True)
-        return df
+        return Table(data=rows, columns=["Asset", "Amount"]).sort_values(by=["Asset"])
 
-    async def ethereum_balances_df(self,  # type: HummingbotApplication
-                                   ):
+    async def ethereum_balances_table(self,  # type: HummingbotApplication
+                                      ):
         rows = []
         if ethereum_required_trading_pairs():
             bals = await UserBalances.eth_n_erc20_balances()
@@ -171,29 +170,23 @@ class BalanceCommand:
         else:
             eth_bal = UserBalances.ethereum_balance()
             rows.append({"Asset": "ETH", "Amount": round(eth_bal, 4)})
-        df = pd.DataFrame(data=rows, columns=["Asset", "Amount"])
-        df.sort_values(by=["Asset"], inplace=True)
-        return df
+        return Table(data=rows, columns=["Asset", "Amount"]).sort_values(by=["Asset"])
 
-    async def xdai_balances_df(self,  # type: HummingbotApplication
-                               ):
+    async def xdai_balances_table(self,  # type: HummingbotApplication
+                                  ):
         rows = []
         bals = await UserBalances.xdai_balances()
         for token, bal in bals.items():
             rows.append({"Asset": token, "Amount": round(bal, 4)})
-        df = pd.DataFrame(data=rows, columns=["Asset", "Amount"])
-        df.sort_values(by=["Asset"], inplace=True)
-        return df
+        return Table(data=rows, columns=["Asset", "Amount"]).sort_values(by=["Asset"])
 
-    async def asset_limits_df(self,
-                              asset_limit_conf: Dict[str, str]):
+    async def asset_limits_table(self,
+                                 asset_limit_conf: Dict[str, str]):
         rows = []
         for token, amount in asset_limit_conf.items():
             rows.append({"Asset": token, "Limit": round(Decimal(amount), 4)})
 
-        df = pd.DataFrame(data=rows, columns=["Asset", "Limit"])
-        df.sort_values(by=["Asset"], inplace=True)
-        return df
+        return Table(data=rows, columns=["Asset", "Limit"]).sort_values(by=["Asset"])
 
     async def show_asset_limits(self):
         config_var = global_config_map["balance_asset_limit"]
@@ -211,22 +204,20 @@ class BalanceCommand:
                 continue
 
             self._notify(f"\n{exchange}")
-            df = await self.asset_limits_df(asset_limit_config)
-            if df.empty:
+            table = await self.asset_limits_table(asset_limit_config)
+            if table.empty:
                 self._notify("You have no limits on this exchange.")
             else:
-                lines = ["    " + line for line in df.to_string(index=False).split("\n")]
+                lines = ["    " + line for line in table.to_string(index=False).split("\n")]
                 self._notify("\n".join(lines))
         self._notify("\n")
         return
 
-    async def paper_acccount_balance_df(self, paper_balances: Dict[str, Decimal]):
+    async def paper_acccount_balance_table(self, paper_balances: Dict[str, Decimal]):
         rows = []
         for asset, balance in paper_balances.items():
             rows.append({"Asset": asset, "Balance": round(Decimal(str(balance)), 4)})
-        df = pd.DataFrame(data=rows, columns=["Asset", "Balance"])
-        df.sort_values(by=["Asset"], inplace=True)
-        return df
+        return Table(data=rows, columns=["Asset", "Balance"]).sort_values(by=["Asset"])
 
     def notify_balance_limit_set(self):
         self._notify("To set a balance limit (how much the bot can use): \n"
@@ -245,8 +236,8 @@ class BalanceCommand:
             self.notify_balance_paper_set()
             return
         self._notify("Paper account balances:")
-        df = await self.paper_acccount_balance_df(paper_balances)
-        lines = ["    " + line for line in df.to_string(index=False).split("\n")]
+        table = await self.paper_acccount_balance_table(paper_balances)
+        lines = ["    " + line for line in table.to_string(index=False).split("\n")]
         self._notify("\n".join(lines))
         self._notify("\n")
         return
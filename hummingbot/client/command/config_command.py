@@ -11,7 +11,11 @@ from hummingbot.client.settings import (
     GLOBAL_CONFIG_PATH,
     CONF_FILE_PATH,
 )
-from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.config.global_config_map import (
+    active_global_config_map,
+    global_config_map,
+    main_config_map,
+)
 from hummingbot.client.config.config_validators import validate_bool, validate_decimal
 from hummingbot.client.config.config_helpers import (
     missing_required_configs,
@@ -53,7 +57,8 @@ global_configs_to_display = ["0x_active_cancels",
                              "balancer_max_swaps",
                              "rate_oracle_source",
                              "global_token",
-                             "global_token_symbol"]
+                             "global_token_symbol",
+                             "market_data_latency_tracing"]
 
 
 class ConfigCommand:
@@ -73,7 +78,7 @@ class ConfigCommand:
     def list_configs(self,  # type: HummingbotApplication
                      ):
         columns = ["Key", "  Value"]
-        data = [[cv.key, cv.value] for cv in global_config_map.values()
+        data = [[cv.key, cv.value] for cv in main_config_map.values()
                 if cv.key in global_configs_to_display and not cv.is_secure]
         df = pd.DataFrame(data=data, columns=columns)
         self._notify("\nGlobal Configurations:")
@@ -93,7 +98,7 @@ class ConfigCommand:
         Returns a list of configurable keys - using config command, excluding exchanges api keys
         as they are set from connect command.
         """
-        keys = [c.key for c in global_config_map.values() if c.prompt is not None and not c.is_connect_key]
+        keys = [c.key for c in active_global_config_map().values() if c.prompt is not None and not c.is_connect_key]
         if self.strategy_config_map is not None:
             keys += [c.key for c in self.strategy_config_map.values() if c.prompt is not None]
         return keys
@@ -264,6 +269,10 @@ class ConfigCommand:
                 self._notify("Inventory price not updated due to bad input")
                 return
 
+            # A running strategy keeps the inventory cost in memory, save its pending fills before overwriting.
+            delegate = getattr(self.strategy, "inventory_cost_price_delegate", None)
+            if delegate is not None:
+                delegate.flush()
             session: Session = self.trade_fill_db.get_shared_session()
             InventoryCost.add_volume(
                 session,
@@ -273,3 +282,5 @@ class ConfigCommand:
                 quote_volume=quote_volume,
                 overwrite=True,
             )
+            if delegate is not None:
+                delegate.reload()
@@ -34,8 +34,7 @@ class ConnectCommand:
         self.app.hide_input = True
         if exchange == "kraken":
             self._notify("Reminder: Please ensure your Kraken API Key Nonce Window is at least 10.")
-        exchange_configs = [c for c in global_config_map.values()
-                            if c.key in settings.CONNECTOR_SETTINGS[exchange].config_keys and c.is_connect_key]
+        exchange_configs = [c for c in settings.CONNECTOR_SETTINGS[exchange].config_keys.values() if c.is_connect_key]
         to_connect = True
         if Security.encrypted_file_exists(exchange_configs[0].key):
             await Security.wait_til_decryption_done()
@@ -3,7 +3,6 @@ import pandas as pd
 import threading
 import time
 from typing import (
-    Set,
     Tuple,
     TYPE_CHECKING,
     List,
@@ -20,7 +19,8 @@ from hummingbot.client.settings import (
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.user.user_balances import UserBalances
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.client.performance import PerformanceMetrics, calculate_performance_metrics, smart_round
+from hummingbot.core.utils.table_formatter import Table
+from hummingbot.client.performance import PerformanceMetrics, PerformanceMetricsStore, smart_round
 
 s_float_0 = float(0)
 s_decimal_0 = Decimal("0")
@@ -50,29 +50,40 @@ class HistoryCommand:
         if global_config_map.get("paper_trade_enabled").value:
             self._notify("\n  Paper Trading ON: All orders are simulated, and no real orders are placed.")
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
-        if not trades:
+        performance_store: PerformanceMetricsStore = self._get_performance_metrics_store(start_time, days)
+        if performance_store.num_trades == 0:
             self._notify("\n  No past trades to report.")
             return
         if verbose:
             self.list_trades(start_time)
         if self.strategy_name != "celo_arb":
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            safe_ensure_future(self.history_report(start_time, performance_store, precision))
+
+    def _get_performance_metrics_store(self,  # type: HummingbotApplication
+                                       start_time: float,
+                                       days: float = 0) -> PerformanceMetricsStore:
+        """
+        Returns the running performance metrics of this session, or builds them from the trades since start_time
+        when reporting on other days or when no strategy is running.
+        """
+        if days == 0 and self.performance_metrics_store is not None:
+            return self.performance_metrics_store
+        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
+                                                                config_file_path=self.strategy_file_name)
+        return PerformanceMetricsStore.from_trades(trades)
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             performance_store: PerformanceMetricsStore,
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        market_info: List[Tuple[str, str]] = list(performance_store.accumulators.keys())
         if display_report:
             self.report_header(start_time)
         return_pcts = []
         for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
             cur_balances = await self.get_current_balances(market)
-            perf = await calculate_performance_metrics(market, symbol, cur_trades, cur_balances)
+            perf = await performance_store.calculate_metrics(market, symbol, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -139,8 +150,8 @@ class HistoryCommand:
              smart_round(perf.avg_s_price, precision),
              smart_round(perf.avg_tot_price, precision)],
         ]
-        trades_df: pd.DataFrame = pd.DataFrame(data=trades_data, columns=trades_columns)
-        lines.extend(["", "  Trades:"] + ["    " + line for line in trades_df.to_string(index=False).split("\n")])
+        trades_table = Table(data=trades_data, columns=trades_columns)
+        lines.extend(["", "  Trades:"] + ["    " + line for line in trades_table.to_string(index=False).split("\n")])
 
         assets_columns = ["", "start", "current", "change"]
         assets_data = [
@@ -163,8 +174,8 @@ class HistoryCommand:
              f"{perf.cur_base_ratio_pct:.2%}",
              f"{perf.cur_base_ratio_pct - perf.start_base_ratio_pct:.2%}"],
         ]
-        assets_df: pd.DataFrame = pd.DataFrame(data=assets_data, columns=assets_columns)
-        lines.extend(["", "  Assets:"] + ["    " + line for line in assets_df.to_string(index=False).split("\n")])
+        assets_table = Table(data=assets_data, columns=assets_columns)
+        lines.extend(["", "  Assets:"] + ["    " + line for line in assets_table.to_string(index=False).split("\n")])
 
         perf_data = [
             ["Hold portfolio value    ", f"{smart_round(perf.hold_value, precision)} {quote}"],
@@ -179,9 +190,9 @@ class HistoryCommand:
             [["Total P&L               ", f"{smart_round(perf.total_pnl, precision)} {quote}"],
              ["Return %                ", f"{perf.return_pct:.2%}"]]
         )
-        perf_df: pd.DataFrame = pd.DataFrame(data=perf_data)
+        perf_table = Table(data=perf_data)
         lines.extend(["", "  Performance:"] +
-                     ["    " + line for line in perf_df.to_string(index=False, header=False).split("\n")])
+                     ["    " + line for line in perf_table.to_string(index=False, header=False).split("\n")])
 
         self._notify("\n".join(lines))
 
@@ -198,9 +209,8 @@ class HistoryCommand:
             return s_decimal_0
 
         start_time = self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
-        avg_return = await self.history_report(start_time, trades, display_report=False)
+        performance_store: PerformanceMetricsStore = self._get_performance_metrics_store(start_time)
+        avg_return = await self.history_report(start_time, performance_store, display_report=False)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
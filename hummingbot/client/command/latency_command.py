@@ -0,0 +1,65 @@
+import os
+import time
+from typing import (
+    Optional,
+    TYPE_CHECKING,
+)
+
+import pandas as pd
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
+from hummingbot.core.utils.market_data_latency import MarketDataLatencyTracer
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class LatencyCommand:
+    def latency(self,  # type: HummingbotApplication
+                exchange: Optional[str] = None,
+                market: Optional[str] = None,
+                export: bool = False,
+                reset: bool = False):
+        tracer: MarketDataLatencyTracer = MarketDataLatencyTracer.get_instance()
+        if reset:
+            tracer.reset()
+            self._notify("Market data latency statistics have been reset.")
+            return
+        if not tracer.enabled and len(tracer.histograms) == 0:
+            self._notify("Market data latency tracing is off, turn it on with "
+                         "'config market_data_latency_tracing'.")
+            return
+        if export:
+            self.export_latency(tracer)
+            return
+        self.show_latency(tracer, exchange, market)
+
+    def show_latency(self,  # type: HummingbotApplication
+                     tracer: MarketDataLatencyTracer,
+                     exchange: Optional[str] = None,
+                     market: Optional[str] = None):
+        df: pd.DataFrame = tracer.summary_df()
+        if exchange is not None:
+            df = df[df["Exchange"] == exchange]
+        if market is not None:
+            df = df[df["Market"] == market.upper()]
+        if len(df) == 0:
+            self._notify("No market data latency has been recorded yet.")
+            return
+        lines = ["", "  Market data latency (receive: network and parsing, queue: order book tracker queues, "
+                 "apply: order book update, strategy: wait for the next tick):"]
+        lines.extend(["    " + line for line in df.to_string(index=False, float_format="{:.2f}".format).split("\n")])
+        self._notify("\n".join(lines))
+
+    def export_latency(self,  # type: HummingbotApplication
+                       tracer: MarketDataLatencyTracer):
+        path = global_config_map["log_file_path"].value
+        if path is None:
+            path = DEFAULT_LOG_FILE_PATH
+        file_path = os.path.join(path, f"market_data_latency_{int(time.time())}.csv")
+        try:
+            tracer.export_csv(file_path)
+            self._notify(f"Successfully exported market data latency to {file_path}")
+        except Exception as e:
+            self._notify(f"Error exporting market data latency to {path}: {e}")
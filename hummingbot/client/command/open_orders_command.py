@@ -1,6 +1,6 @@
 from decimal import Decimal
-import pandas as pd
 import threading
+import time
 from typing import (
     TYPE_CHECKING,
     List,
@@ -10,6 +10,7 @@ from datetime import timezone
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.data_type.common import OpenOrder
 from hummingbot.core.utils.market_price import get_binance_mid_price
+from hummingbot.core.utils.table_formatter import Table
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 
 s_float_0 = float(0)
@@ -54,8 +55,8 @@ class OpenOrdersCommand:
             mid_price = await get_binance_mid_price(order.trading_pair)
             spread = abs(order.price - mid_price) / mid_price
             size_global = await RateOracle.global_value(order.trading_pair.split("-")[0], order.amount)
-            age = pd.Timestamp((datetime.utcnow().replace(tzinfo=timezone.utc).timestamp() * 1e3 - order.time) / 1e3,
-                               unit='s').strftime('%H:%M:%S')
+            age = time.strftime('%H:%M:%S', time.gmtime(
+                (datetime.utcnow().replace(tzinfo=timezone.utc).timestamp() * 1e3 - order.time) / 1e3))
             data_row = [order.trading_pair, side, f"{spread:.2%}", round(size_global), age]
             if full_report:
                 token = quote if order.is_buy else base
@@ -65,7 +66,7 @@ class OpenOrdersCommand:
                 data_row.extend([f"{per_bal:.0%} {token_txt:>6}", f"{size_global / total_value:.0%}"])
             data.append(data_row)
         lines = []
-        orders_df: pd.DataFrame = pd.DataFrame(data=data, columns=columns)
-        lines.extend(["    " + line for line in orders_df.to_string(index=False).split("\n")])
+        orders_table = Table(data=data, columns=columns)
+        lines.extend(["    " + line for line in orders_table.to_string(index=False).split("\n")])
         self._notify("\n" + "\n".join(lines))
         self._notify(f"\n  Total: {g_sym} {total_value:.0f}")
@@ -1,3 +1,4 @@
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.utils.async_utils import safe_ensure_future
 import pandas as pd
 from typing import TYPE_CHECKING
@@ -38,9 +39,10 @@ class OrderBookCommand:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
         def get_order_book(lines):
-            bids = order_book.snapshot[0][['price', 'amount']].head(lines)
+            bids, asks = order_book.top_levels(lines)
+            bids = pd.DataFrame(data=bids, columns=OrderBookRow._fields, dtype="float64")[["price", "amount"]]
             bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(lines)
+            asks = pd.DataFrame(data=asks, columns=OrderBookRow._fields, dtype="float64")[["price", "amount"]]
             asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
             joined_df = pd.concat([bids, asks], axis=1)
             text_lines = ["    " + line for line in joined_df.to_string(index=False).split("\n")]
@@ -50,8 +52,13 @@ class OrderBookCommand:
         if live:
             await self.stop_live_update()
             self.app.live_updates = True
+            version, text = None, None
             while self.app.live_updates:
-                await self.cls_display_delay(get_order_book(min(lines, 35)) + "\n\n Press escape key to stop update.", 0.5)
+                # The book is only rendered again when it has changed since the last refresh.
+                if order_book.version != version:
+                    version = order_book.version
+                    text = get_order_book(min(lines, 35)) + "\n\n Press escape key to stop update."
+                await self.cls_display_delay(text, 0.5)
             self._notify("Stopped live orderbook display update.")
         else:
             self._notify(get_order_book(lines))
@@ -188,6 +188,7 @@ class SillyCommands:
         self.app.hide_input = False
 
     async def cls_display_delay(self, lines, delay=0.5):
+        self.app.output_field.flush_log()
         self.app.output_field.buffer.save_to_undo_stack()
         self.app.log("".join(lines), save_log=False)
         await asyncio.sleep(delay)
@@ -60,4 +60,5 @@ class StopCommand:
         self.market_pair = None
         self.clock = None
         self.markets_recorder = None
+        self.performance_metrics_store = None
         self.market_trading_pairs_map.clear()
@@ -51,8 +51,13 @@ class TickerCommand:
         if live:
             await self.stop_live_update()
             self.app.live_updates = True
+            version, text = None, None
             while self.app.live_updates:
-                await self.cls_display_delay(get_ticker() + "\n\n Press escape key to stop update.", 1)
+                # The prices are only looked up again when the order book has changed since the last refresh.
+                if order_book.version != version:
+                    version = order_book.version
+                    text = get_ticker() + "\n\n Press escape key to stop update."
+                await self.cls_display_delay(text, 1)
             self._notify("Stopped live ticker display update.")
         else:
             self._notify(get_ticker())
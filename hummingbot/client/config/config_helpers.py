@@ -23,7 +23,11 @@ from os import listdir
 import shutil
 
 from hummingbot.client.config.config_var import ConfigVar
-from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.config.global_config_map import (
+    active_global_config_map,
+    global_config_map,
+    key_config_map,
+)
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.client.settings import (
     GLOBAL_CONFIG_PATH,
@@ -242,7 +246,7 @@ def load_required_configs(strategy_name) -> OrderedDict:
     strategy_config_map = get_strategy_config_map(strategy_name)
     # create an ordered dict where `strategy` is inserted first
     # so that strategy-specific configs are prompted first and populate required_exchanges
-    return _merge_dicts(strategy_config_map, global_config_map)
+    return _merge_dicts(strategy_config_map, active_global_config_map())
 
 
 def strategy_name_from_file(file_path: str) -> str:
@@ -271,6 +275,10 @@ async def update_strategy_config_map_from_file(yml_path: str) -> str:
     return strategy
 
 
+def _is_unloaded_connector_key(cm: Dict[str, ConfigVar], key: str) -> bool:
+    return cm is global_config_map and key in key_config_map and not key_config_map.is_loaded(key)
+
+
 async def load_yml_into_cm(yml_path: str, template_file_path: str, cm: Dict[str, ConfigVar]):
     try:
         with open(yml_path) as stream:
@@ -285,6 +293,10 @@ async def load_yml_into_cm(yml_path: str, template_file_path: str, cm: Dict[str,
             if key in {"template_version"}:
                 continue
 
+            if _is_unloaded_connector_key(cm, key) and data.get(key) is None and Security.decrypted_value(key) is None:
+                # Nothing to assign, the connector is imported once its keys are used.
+                continue
+
             cvar = cm.get(key)
             if cvar is None:
                 logging.getLogger().error(f"Cannot find corresponding config to key {key} in template.")
@@ -347,6 +359,9 @@ def save_to_yml(yml_path: str, cm: Dict[str, ConfigVar]):
         with open(yml_path) as stream:
             data = yaml_parser.load(stream) or {}
             for key in cm:
+                if _is_unloaded_connector_key(cm, key):
+                    # Nothing has accessed the connector's config vars, so their values haven't changed.
+                    continue
                 cvar = cm.get(key)
                 if cvar.is_secure:
                     Security.update_secure_config(key, cvar.value)
@@ -447,12 +462,19 @@ def all_configs_complete(strategy):
     return config_map_complete(global_config_map) and config_map_complete(strategy_map)
 
 
+def _config_vars(config_map: Dict[str, ConfigVar]) -> List[ConfigVar]:
+    if config_map is global_config_map:
+        # Connectors that aren't loaded or required have nothing to check, don't import them.
+        config_map = active_global_config_map()
+    return list(config_map.values())
+
+
 def config_map_complete(config_map):
-    return not any(c.required and c.value is None for c in config_map.values())
+    return not any(c.required and c.value is None for c in _config_vars(config_map))
 
 
 def missing_required_configs(config_map):
-    return [c for c in config_map.values() if c.required and c.value is None and not c.is_connect_key]
+    return [c for c in _config_vars(config_map) if c.required and c.value is None and not c.is_connect_key]
 
 
 def load_all_secure_values(strategy):
@@ -462,9 +484,9 @@ def load_all_secure_values(strategy):
 
 
 def load_secure_values(config_map):
-    for key, config in config_map.items():
+    for config in _config_vars(config_map):
         if config.is_secure:
-            config.value = Security.decrypted_value(key)
+            config.value = Security.decrypted_value(config.key)
 
 
 def format_config_file_name(file_name):
@@ -1,5 +1,7 @@
+from collections import ChainMap
+from collections.abc import Mapping
 import random
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 from decimal import Decimal
 import os.path
 from hummingbot.client.config.config_var import ConfigVar
@@ -11,6 +13,8 @@ from hummingbot.client.config.config_validators import (
     validate_decimal
 )
 from hummingbot.core.rate_oracle.rate_oracle import RateOracleSource, RateOracle
+from hummingbot.core.utils import json_codec
+from hummingbot.core.utils.market_data_latency import set_tracing_enabled
 
 
 def generate_client_id() -> str:
@@ -39,11 +43,45 @@ def validate_script_file_path(file_path: str) -> Optional[bool]:
         return f"{file_path} file does not exist."
 
 
-def connector_keys():
-    all_keys = {}
-    for connector_setting in settings.CONNECTOR_SETTINGS.values():
-        all_keys.update(connector_setting.config_keys)
-    return all_keys
+class ConnectorKeysConfigMap(Mapping):
+    """
+    The config keys of all connectors. A connector's utils module is imported when one of its config vars is accessed,
+    listing or checking the key names doesn't import anything.
+    """
+    def __init__(self, connector_settings: Dict[str, settings.ConnectorSetting]):
+        self._connector_keys: Dict[str, settings.ConnectorConfigKeys] = {}
+        self._connector_names: Dict[str, str] = {}
+        for connector_setting in connector_settings.values():
+            for key in connector_setting.config_keys:
+                self._connector_keys[key] = connector_setting.config_keys
+                self._connector_names[key] = connector_setting.name
+
+    def is_loaded(self, key: str) -> bool:
+        return self._connector_keys[key].is_loaded
+
+    def active_keys(self) -> List[str]:
+        """
+        The keys of the connectors that are loaded already or that the strategy requires, the only connector keys
+        that can have a value or be required.
+        """
+        return [key for key, config_keys in self._connector_keys.items()
+                if config_keys.is_loaded or self._connector_names[key] in settings.required_exchanges]
+
+    def __getitem__(self, key: str) -> ConfigVar:
+        return self._connector_keys[key][key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._connector_keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._connector_keys)
+
+    def __len__(self) -> int:
+        return len(self._connector_keys)
+
+
+def connector_keys() -> ConnectorKeysConfigMap:
+    return ConnectorKeysConfigMap(settings.CONNECTOR_SETTINGS)
 
 
 def validate_rate_oracle_source(value: str) -> Optional[str]:
@@ -78,12 +116,29 @@ main_config_map = {
                   prompt=None,
                   required_if=lambda: False,
                   default="INFO"),
+    "json_backend":
+        ConfigVar(key="json_backend",
+                  prompt=f"Which JSON library should connectors use? "
+                         f"({','.join([json_codec.AUTO_BACKEND] + json_codec.BACKEND_NAMES)}) >>> ",
+                  type_str="str",
+                  required_if=lambda: False,
+                  validator=json_codec.validate_backend,
+                  on_validated=json_codec.set_backend,
+                  default=json_codec.AUTO_BACKEND),
     "debug_console":
         ConfigVar(key="debug_console",
                   prompt=None,
                   type_str="bool",
                   required_if=lambda: False,
                   default=False),
+    "market_data_latency_tracing":
+        ConfigVar(key="market_data_latency_tracing",
+                  prompt="Would you like to trace the latency of market data (Yes/No)? >>> ",
+                  type_str="bool",
+                  required_if=lambda: False,
+                  validator=validate_bool,
+                  on_validated=set_tracing_enabled,
+                  default=False),
     "strategy_report_interval":
         ConfigVar(key="strategy_report_interval",
                   prompt=None,
@@ -357,4 +412,16 @@ main_config_map = {
                   default="$"),
 }
 
-global_config_map = {**key_config_map, **main_config_map}
+# Connector keys stay lazy, iterating over the keys doesn't import the connectors. Iterating over the config vars
+# does, go through active_global_config_map() instead.
+global_config_map = ChainMap(main_config_map, key_config_map)
+
+
+def active_global_config_map() -> Dict[str, ConfigVar]:
+    """
+    The main config vars and those of the connectors that are loaded or required.
+    """
+    config_map = dict(main_config_map)
+    for key in key_config_map.active_keys():
+        config_map[key] = key_config_map[key]
+    return config_map
@@ -11,7 +11,6 @@ from hummingbot.core.utils.wallet_setup import (
     unlock_wallet,
     import_and_save_wallet
 )
-from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.settings import CONNECTOR_SETTINGS
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
@@ -110,9 +109,10 @@ class Security:
 
     @classmethod
     def update_config_map(cls, config_map):
-        for config in config_map.values():
-            if config.is_secure and config.value is None:
-                config.value = cls.decrypted_value(config.key)
+        for key, value in list(cls._secure_configs.items()):
+            config = config_map.get(key)
+            if config is not None and config.is_secure and config.value is None:
+                config.value = value
 
     @classmethod
     def is_decryption_done(cls):
@@ -137,7 +137,5 @@ class Security:
     @classmethod
     async def api_keys(cls, exchange):
         await cls.wait_til_decryption_done()
-        exchange_configs = [c for c in global_config_map.values()
-                            if c.key in CONNECTOR_SETTINGS[exchange].config_keys and
-                            c.key in cls._secure_configs]
-        return {c.key: cls.decrypted_value(c.key) for c in exchange_configs}
+        return {key: cls.decrypted_value(key) for key in CONNECTOR_SETTINGS[exchange].config_keys
+                if key in cls._secure_configs}
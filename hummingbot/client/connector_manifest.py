@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+"""
+The connector manifest is a static description of every connector (names, domains, fees, example pairs and module
+paths) generated from the connectors' *_utils modules at build time, so that the client can list connectors without
+importing all of them. Regenerate it after adding or changing a connector:
+
+    python hummingbot/client/connector_manifest.py
+"""
+
+import importlib
+import json
+import logging
+from os import scandir
+from os.path import (
+    isfile,
+    join,
+    realpath,
+)
+from pathlib import Path
+import sys
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+
+CONNECTOR_MANIFEST_PATH = realpath(join(__file__, "../connector_manifest.json"))
+CONNECTOR_EXCEPTIONS = ["paper_trade", "eterbase"]
+
+
+def generate_connector_manifest(skip_missing_dependencies: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Scans the connector directories and imports every *_utils module to build the manifest.
+    :param skip_missing_dependencies: whether connectors missing an optional dependency (e.g. web3) are left out of
+    the manifest, or raise ModuleNotFoundError as when generating the manifest at build time
+    """
+    manifest = {}
+    package_dir = Path(__file__).resolve().parent.parent.parent
+    type_dirs = sorted([f for f in scandir(f'{str(package_dir)}/hummingbot/connector') if f.is_dir()],
+                       key=lambda f: f.name)
+    for type_dir in type_dirs:
+        connector_dirs = sorted([f for f in scandir(type_dir.path) if f.is_dir()], key=lambda f: f.name)
+        for connector_dir in connector_dirs:
+            if connector_dir.name.startswith("_") or \
+                    connector_dir.name in CONNECTOR_EXCEPTIONS:
+                continue
+            if connector_dir.name in manifest:
+                raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+            path = f"hummingbot.connector.{type_dir.name}.{connector_dir.name}.{connector_dir.name}_utils"
+            try:
+                util_module = importlib.import_module(path)
+            except ModuleNotFoundError as e:
+                if e.name != path:
+                    if not skip_missing_dependencies:
+                        raise
+                    logging.getLogger().warning(f"Skipping the {connector_dir.name} connector, its {e.name} "
+                                                f"dependency is missing.")
+                continue
+            manifest[connector_dir.name] = {
+                "name": connector_dir.name,
+                "type": type_dir.name.capitalize(),
+                "utils_module": path,
+                "centralised": getattr(util_module, "CENTRALIZED", True),
+                "example_pair": getattr(util_module, "EXAMPLE_PAIR", ""),
+                "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                "fee_type": getattr(util_module, "FEE_TYPE", None) or "Percent",
+                "fee_token": getattr(util_module, "FEE_TOKEN", ""),
+                "default_fees": getattr(util_module, "DEFAULT_FEES", []),
+                "config_keys": list(getattr(util_module, "KEYS", {}).keys()),
+                "is_sub_domain": False,
+                "parent_name": None,
+                "domain_parameter": None,
+                "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False)
+            }
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                parent = manifest[connector_dir.name]
+                manifest[domain] = {
+                    **parent,
+                    "name": domain,
+                    "example_pair": getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    "default_fees": getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain],
+                    "config_keys": list(getattr(util_module, "OTHER_DOMAINS_KEYS")[domain].keys()),
+                    "is_sub_domain": True,
+                    "parent_name": parent["name"],
+                    "domain_parameter": getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                }
+    return manifest
+
+
+def load_connector_manifest(path: str = CONNECTOR_MANIFEST_PATH) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Reads the generated manifest, returns None if it hasn't been generated.
+    """
+    if not isfile(path):
+        return None
+    with open(path) as fd:
+        return json.load(fd)
+
+
+def write_connector_manifest(path: str = CONNECTOR_MANIFEST_PATH) -> Dict[str, Dict[str, Any]]:
+    manifest = generate_connector_manifest(skip_missing_dependencies=False)
+    with open(path, "w") as fd:
+        json.dump(manifest, fd, indent=2)
+        fd.write("\n")
+    return manifest
+
+
+if __name__ == "__main__":
+    # Replace the script's directory, whose modules would shadow the standard library ones (e.g. platform).
+    sys.path[0] = realpath(join(__file__, "../../../"))
+    written = write_connector_manifest()
+    print(f"Wrote {len(written)} connectors to {CONNECTOR_MANIFEST_PATH}.")
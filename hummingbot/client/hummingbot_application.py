@@ -28,12 +28,12 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.cross_exchange_market_making import CrossExchangeMarketPair
 from hummingbot.core.utils.kill_switch import KillSwitch
-from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.client.performance import PerformanceMetricsStore
 from hummingbot.client.config.security import Security
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType
@@ -61,8 +61,6 @@ class HummingbotApplication(*commands):
         return cls._main_app
 
     def __init__(self):
-        # This is to start fetching trading pairs for auto-complete
-        TradingPairFetcher.get_instance()
         self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self.parser: ThrowingArgumentParser = load_parser(self)
         self.app = HummingbotCLI(
@@ -96,6 +94,7 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.performance_metrics_store: Optional[PerformanceMetricsStore] = None
         self._script_iterator = None
         self._binance_connector = None
 
@@ -236,8 +235,7 @@ class HummingbotApplication(*commands):
                     connector.set_balance(asset, balance)
             else:
                 Security.update_config_map(global_config_map)
-                keys = {key: config.value for key, config in global_config_map.items()
-                        if key in conn_setting.config_keys}
+                keys = {key: config.value for key, config in conn_setting.config_keys.items()}
                 init_params = conn_setting.conn_init_parameters(keys)
                 init_params.update(trading_pairs=trading_pairs, trading_required=self._trading_required)
                 if conn_setting.use_ethereum_wallet:
@@ -253,11 +251,17 @@ class HummingbotApplication(*commands):
                 connector = connector_class(**init_params)
             self.markets[connector_name] = connector
 
+        # Seeded with this session's trades, then kept up to date by the markets recorder as fills come in.
+        self.performance_metrics_store = PerformanceMetricsStore.from_trades(
+            self._get_trades_from_session(int(self.init_time * 1e3), config_file_path=self.strategy_file_name),
+            fee_price_ttl=60.0
+        )
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
+            self.performance_metrics_store,
         )
         self.markets_recorder.start()
 
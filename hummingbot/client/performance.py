@@ -1,10 +1,15 @@
+import time
+from collections import OrderedDict
 from decimal import Decimal
 from dataclasses import dataclass
 from typing import (
+    Awaitable,
+    Callable,
     Dict,
     Optional,
     List,
-    Any
+    Any,
+    Tuple
 )
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.core.utils.market_price import get_last_price
@@ -53,64 +58,238 @@ class PerformanceMetrics:
         self.fees: Dict[str, Decimal] = {}
 
 
-def position_order(open: list, close: list):
-    """
-    Pair open position order with close position orders
-    :param open: a list of orders that may have an open position order
-    :param close: a list of orders that may have an close position order
-    :return: A tuple containing a pair of an open order with a close position order
-    """
-    for o in open:
-        for c in close:
-            if o.position == "OPEN" and c.position == "CLOSE":
-                open.remove(o)
-                close.remove(c)
-                return (o, c)
-    return None
+def divide(value, divisor):
+    value = Decimal(str(value))
+    divisor = Decimal(str(divisor))
+    if divisor == s_decimal_0:
+        return s_decimal_0
+    return value / divisor
 
 
-def aggregate_position_order(buys: list, sells: list):
+class PerformanceAccumulator:
     """
-    Aggregate the amount field for orders with multiple fills
-    :param buys: a list of buy orders
-    :param sells: a list of sell orders
-    :return: 2 lists containing aggregated amounts for buy and sell orders.
+    Running totals of the trades of one market and trading pair. Trades are added one at a time as they come in, so
+    PerformanceMetrics can be calculated at any time without going through all trades again.
     """
-    aggregated_buys = []
-    aggregated_sells = []
-    for buy in buys:
-        if buy.order_id not in [ag.order_id for ag in aggregated_buys]:
-            aggregate_price = [b.price for b in buys if b.order_id == buy.order_id]
-            aggregate_amount = [b.amount for b in buys if b.order_id == buy.order_id]
-            buy.price = sum(aggregate_price) / len(aggregate_price)
-            buy.amount = sum(aggregate_amount)
-            aggregated_buys.append(buy)
-
-    for sell in sells:
-        if sell.order_id not in [ag.order_id for ag in aggregated_sells]:
-            aggregate_price = [s.price for s in sells if s.order_id == sell.order_id]
-            aggregate_amount = [s.amount for s in sells if s.order_id == sell.order_id]
-            sell.price = sum(aggregate_price) / len(aggregate_price)
-            sell.amount = sum(aggregate_amount)
-            aggregated_sells.append(sell)
-
-    return aggregated_buys, aggregated_sells
-
-
-def derivative_pnl(long: list, short: list):
-    # It is assumed that the amount and leverage for both open and close orders are thesame.
+    def __init__(self, exchange: str, trading_pair: str):
+        self._exchange: str = exchange
+        self._trading_pair: str = trading_pair
+        self._base, self._quote = trading_pair.split("-")
+        self._num_buys: int = 0
+        self._num_sells: int = 0
+        # The sums are kept in the trades' own number type and converted when calculating the metrics, as the trades
+        # from the trade fill table are floats.
+        self._b_vol_base = 0
+        self._s_vol_base = 0
+        self._b_vol_quote = 0
+        self._s_vol_quote = 0
+        self._start_price: Optional[Decimal] = None
+        self._last_trade_price: Optional[Decimal] = None
+        self._fees: Dict[str, Decimal] = {}
+        self._all_trade_fills: bool = True
+        self._has_nill_position: bool = False
+        # Derivative orders by order id: [trade_type, position, sum of fill prices, number of fills, amount]
+        self._position_orders: Dict[str, list] = OrderedDict()
+
+    @property
+    def exchange(self) -> str:
+        return self._exchange
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def num_trades(self) -> int:
+        return self._num_buys + self._num_sells
+
+    @property
+    def is_derivative(self) -> bool:
+        return self.num_trades > 0 and self._all_trade_fills and not self._has_nill_position
+
+    def add_trade(self, trade: Any):
+        """
+        Adds a trade to the running totals.
+        :param trade: a TradeFill or Trade object of this accumulator's market and trading pair
+        """
+        trade_type = trade.trade_type.upper()
+        if trade_type == "BUY":
+            self._num_buys += 1
+            self._b_vol_base += trade.amount
+            self._b_vol_quote += trade.amount * trade.price
+        elif trade_type == "SELL":
+            self._num_sells += 1
+            self._s_vol_base += trade.amount
+            self._s_vol_quote += trade.amount * trade.price
+        if self._start_price is None:
+            self._start_price = Decimal(str(trade.price))
+        self._last_trade_price = Decimal(str(trade.price))
+
+        if type(trade) is TradeFill:
+            if trade.position == "NILL":
+                self._has_nill_position = True
+            else:
+                self._add_position_fill(trade, trade_type)
+            if trade.trade_fee.get("percent") is not None and trade.trade_fee["percent"] > 0:
+                self._add_fee(self._quote, Decimal(trade.price * trade.amount * trade.trade_fee["percent"]))
+            for flat_fee in trade.trade_fee.get("flat_fees", []):
+                self._add_fee(flat_fee["asset"], Decimal(flat_fee["amount"]))
+        else:  # assume this is Trade object
+            self._all_trade_fills = False
+            if trade.trade_fee.percent > 0:
+                self._add_fee(self._quote, (trade.price * trade.order_amount) * trade.trade_fee.percent)
+            for flat_fee in trade.trade_fee.flat_fees:
+                self._add_fee(flat_fee[0], flat_fee[1])
+
+    def _add_fee(self, token: str, amount: Decimal):
+        if token not in self._fees:
+            self._fees[token] = s_decimal_0
+        self._fees[token] += amount
+
+    def _add_position_fill(self, trade: TradeFill, trade_type: str):
+        # Fills of the same order are aggregated, with the average of the fill prices as the order price.
+        position_order = self._position_orders.get(trade.order_id)
+        if position_order is None or position_order[0] != trade_type:
+            self._position_orders[trade.order_id] = [trade_type, trade.position, trade.price, 1, trade.amount]
+        else:
+            position_order[2] += trade.price
+            position_order[3] += 1
+            position_order[4] += trade.amount
+
+    def derivative_trade_pnl(self) -> Decimal:
+        """
+        Pairs open position orders with close position orders in the order they were placed, i.e. open buys with
+        close sells for longs and open sells with close buys for shorts, and sums up the PnL of the closed positions.
+        """
+        orders = {("BUY", "OPEN"): [], ("SELL", "CLOSE"): [], ("SELL", "OPEN"): [], ("BUY", "CLOSE"): []}
+        for trade_type, position, price_sum, fill_count, amount in self._position_orders.values():
+            if (trade_type, position) in orders:
+                orders[(trade_type, position)].append((price_sum / fill_count, amount))
+        pnls = []
+        for open_order, close_order in zip(orders[("BUY", "OPEN")], orders[("SELL", "CLOSE")]):
+            pnls.append((close_order[0] - open_order[0]) * close_order[1])
+        for open_order, close_order in zip(orders[("SELL", "OPEN")], orders[("BUY", "CLOSE")]):
+            pnls.append((open_order[0] - close_order[0]) * close_order[1])
+        return Decimal(str(sum(pnls)))
+
+    async def calculate_metrics(self,
+                                current_balances: Dict[str, Decimal],
+                                fee_price_function: Optional[Callable[[str, str], Awaitable[Optional[Decimal]]]] = None) \
+            -> PerformanceMetrics:
+        """
+        Calculates PnL, fees, Return % and etc... from the running totals.
+        :param current_balances: current user account balance
+        :param fee_price_function: looks up the last price of an exchange and trading pair to convert fees paid in
+        other tokens to the quote token, get_last_price by default
+        :return: A PerformanceMetrics object
+        """
+        get_fee_price = fee_price_function if fee_price_function is not None else get_last_price
+        base, quote = self._base, self._quote
+        perf = PerformanceMetrics()
+        perf.num_buys = self._num_buys
+        perf.num_sells = self._num_sells
+        perf.num_trades = perf.num_buys + perf.num_sells
+
+        perf.b_vol_base = Decimal(str(self._b_vol_base))
+        perf.s_vol_base = Decimal(str(self._s_vol_base)) * Decimal("-1")
+        perf.tot_vol_base = perf.b_vol_base + perf.s_vol_base
+
+        perf.b_vol_quote = Decimal(str(self._b_vol_quote)) * Decimal("-1")
+        perf.s_vol_quote = Decimal(str(self._s_vol_quote))
+        perf.tot_vol_quote = perf.b_vol_quote + perf.s_vol_quote
+
+        perf.avg_b_price = divide(perf.b_vol_quote, perf.b_vol_base)
+        perf.avg_s_price = divide(perf.s_vol_quote, perf.s_vol_base)
+        perf.avg_tot_price = divide(abs(perf.b_vol_quote) + abs(perf.s_vol_quote),
+                                    abs(perf.b_vol_base) + abs(perf.s_vol_base))
+        perf.avg_b_price = abs(perf.avg_b_price)
+        perf.avg_s_price = abs(perf.avg_s_price)
+
+        perf.cur_base_bal = current_balances.get(base, 0)
+        perf.cur_quote_bal = current_balances.get(quote, 0)
+        perf.start_base_bal = perf.cur_base_bal - perf.tot_vol_base
+        perf.start_quote_bal = perf.cur_quote_bal - perf.tot_vol_quote
+
+        perf.start_price = self._start_price
+        perf.cur_price = await get_last_price(self._exchange.replace("_PaperTrade", ""), self._trading_pair)
+        if perf.cur_price is None:
+            perf.cur_price = self._last_trade_price
+        perf.start_base_ratio_pct = divide(perf.start_base_bal * perf.start_price,
+                                           (perf.start_base_bal * perf.start_price) + perf.start_quote_bal)
+        perf.cur_base_ratio_pct = divide(perf.cur_base_bal * perf.cur_price,
+                                         (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal)
+
+        perf.hold_value = (perf.start_base_bal * perf.cur_price) + perf.start_quote_bal
+        perf.cur_value = (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal
+        perf.trade_pnl = perf.cur_value - perf.hold_value
+
+        # Handle trade_pnl differently for derivatives
+        if self.is_derivative:
+            perf.trade_pnl = self.derivative_trade_pnl()
+
+        perf.fees = dict(self._fees)
+        for fee_token, fee_amount in perf.fees.items():
+            if fee_token == quote:
+                perf.fee_in_quote += fee_amount
+            else:
+                last_price = await get_fee_price(self._exchange, f"{fee_token}-{quote}")
+                if last_price is not None:
+                    perf.fee_in_quote += fee_amount * last_price
+
+        perf.total_pnl = perf.trade_pnl - perf.fee_in_quote
+        perf.return_pct = divide(perf.total_pnl, perf.hold_value)
+
+        return perf
+
+
+class PerformanceMetricsStore:
     """
-    Calculates PnL for a close position
-    :param long: a list containing pairs of open and closed long position orders
-    :param short: a list containing pairs of open and closed short position orders
-    :return: A list containing PnL for each closed positions
+    Keeps a PerformanceAccumulator for each market and trading pair traded, fed with trade fills as they are
+    recorded. Reports and the kill switch read their metrics from here instead of querying and going through all
+    trades of the session every time. The prices used to convert fees to the quote token are cached for
+    fee_price_ttl seconds, so frequent metrics calculations don't send a price request for every fee token each time.
     """
-    pnls = []
-    for lg in long:
-        pnls.append((lg[1].price - lg[0].price) * lg[1].amount)
-    for st in short:
-        pnls.append((st[0].price - st[1].price) * st[1].amount)
-    return pnls
+    def __init__(self, fee_price_ttl: float = 60.0):
+        self._accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = OrderedDict()
+        self._fee_price_ttl: float = fee_price_ttl
+        self._fee_prices: Dict[Tuple[str, str], Tuple[float, Optional[Decimal]]] = {}
+
+    @classmethod
+    def from_trades(cls, trades: List[Any], fee_price_ttl: float = 0.0) -> "PerformanceMetricsStore":
+        store = cls(fee_price_ttl)
+        for trade in trades:
+            store.add_trade(trade)
+        return store
+
+    @property
+    def accumulators(self) -> Dict[Tuple[str, str], PerformanceAccumulator]:
+        return self._accumulators
+
+    @property
+    def num_trades(self) -> int:
+        return sum(accumulator.num_trades for accumulator in self._accumulators.values())
+
+    def add_trade(self, trade: Any):
+        key = (trade.market, trade.symbol if type(trade) is TradeFill else trade.trading_pair)
+        if key not in self._accumulators:
+            self._accumulators[key] = PerformanceAccumulator(*key)
+        self._accumulators[key].add_trade(trade)
+
+    async def get_fee_price(self, exchange: str, trading_pair: str) -> Optional[Decimal]:
+        key = (exchange, trading_pair)
+        now = time.time()
+        if key in self._fee_prices and now - self._fee_prices[key][0] < self._fee_price_ttl:
+            return self._fee_prices[key][1]
+        price = await get_last_price(exchange, trading_pair)
+        self._fee_prices[key] = (now, price)
+        return price
+
+    async def calculate_metrics(self,
+                                exchange: str,
+                                trading_pair: str,
+                                current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        accumulator = self._accumulators[(exchange, trading_pair)]
+        return await accumulator.calculate_metrics(current_balances, self.get_fee_price)
 
 
 async def calculate_performance_metrics(exchange: str,
@@ -125,109 +304,10 @@ async def calculate_performance_metrics(exchange: str,
     :param current_balances: current user account balance
     :return: A PerformanceMetrics object
     """
-
-    def divide(value, divisor):
-        value = Decimal(str(value))
-        divisor = Decimal(str(divisor))
-        if divisor == s_decimal_0:
-            return s_decimal_0
-        return value / divisor
-
-    base, quote = trading_pair.split("-")
-    perf = PerformanceMetrics()
-    buys = [t for t in trades if t.trade_type.upper() == "BUY"]
-    sells = [t for t in trades if t.trade_type.upper() == "SELL"]
-    derivative = False
-    if trades and type(trades[0]) == TradeFill and "NILL" not in [t.position for t in trades]:
-        derivative = True
-    perf.num_buys = len(buys)
-    perf.num_sells = len(sells)
-    perf.num_trades = perf.num_buys + perf.num_sells
-
-    perf.b_vol_base = Decimal(str(sum(b.amount for b in buys)))
-    perf.s_vol_base = Decimal(str(sum(s.amount for s in sells))) * Decimal("-1")
-    perf.tot_vol_base = perf.b_vol_base + perf.s_vol_base
-
-    perf.b_vol_quote = Decimal(str(sum(b.amount * b.price for b in buys))) * Decimal("-1")
-    perf.s_vol_quote = Decimal(str(sum(s.amount * s.price for s in sells)))
-    perf.tot_vol_quote = perf.b_vol_quote + perf.s_vol_quote
-
-    perf.avg_b_price = divide(perf.b_vol_quote, perf.b_vol_base)
-    perf.avg_s_price = divide(perf.s_vol_quote, perf.s_vol_base)
-    perf.avg_tot_price = divide(abs(perf.b_vol_quote) + abs(perf.s_vol_quote),
-                                abs(perf.b_vol_base) + abs(perf.s_vol_base))
-    perf.avg_b_price = abs(perf.avg_b_price)
-    perf.avg_s_price = abs(perf.avg_s_price)
-
-    perf.cur_base_bal = current_balances.get(base, 0)
-    perf.cur_quote_bal = current_balances.get(quote, 0)
-    perf.start_base_bal = perf.cur_base_bal - perf.tot_vol_base
-    perf.start_quote_bal = perf.cur_quote_bal - perf.tot_vol_quote
-
-    perf.start_price = Decimal(str(trades[0].price))
-    perf.cur_price = await get_last_price(exchange.replace("_PaperTrade", ""), trading_pair)
-    if perf.cur_price is None:
-        perf.cur_price = Decimal(str(trades[-1].price))
-    perf.start_base_ratio_pct = divide(perf.start_base_bal * perf.start_price,
-                                       (perf.start_base_bal * perf.start_price) + perf.start_quote_bal)
-    perf.cur_base_ratio_pct = divide(perf.cur_base_bal * perf.cur_price,
-                                     (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal)
-
-    perf.hold_value = (perf.start_base_bal * perf.cur_price) + perf.start_quote_bal
-    perf.cur_value = (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal
-    perf.trade_pnl = perf.cur_value - perf.hold_value
-
-    # Handle trade_pnl differently for derivatives
-    if derivative:
-        buys_copy, sells_copy = aggregate_position_order(buys.copy(), sells.copy())
-        long = []
-        short = []
-
-        while True:
-            lng = position_order(buys_copy, sells_copy)
-            if lng is not None:
-                long.append(lng)
-
-            sht = position_order(sells_copy, buys_copy)
-            if sht is not None:
-                short.append(sht)
-            if lng is None and sht is None:
-                break
-
-        perf.trade_pnl = Decimal(str(sum(derivative_pnl(long, short))))
-
+    accumulator = PerformanceAccumulator(exchange, trading_pair)
     for trade in trades:
-        if type(trade) is TradeFill:
-            if trade.trade_fee.get("percent") is not None and trade.trade_fee["percent"] > 0:
-                if quote not in perf.fees:
-                    perf.fees[quote] = s_decimal_0
-                perf.fees[quote] += Decimal(trade.price * trade.amount * trade.trade_fee["percent"])
-            for flat_fee in trade.trade_fee.get("flat_fees", []):
-                if flat_fee["asset"] not in perf.fees:
-                    perf.fees[flat_fee["asset"]] = s_decimal_0
-                perf.fees[flat_fee["asset"]] += Decimal(flat_fee["amount"])
-        else:  # assume this is Trade object
-            if trade.trade_fee.percent > 0:
-                if quote not in perf.fees:
-                    perf.fees[quote] = s_decimal_0
-                perf.fees[quote] += (trade.price * trade.order_amount) * trade.trade_fee.percent
-            for flat_fee in trade.trade_fee.flat_fees:
-                if flat_fee[0] not in perf.fees:
-                    perf.fees[flat_fee[0]] = s_decimal_0
-                perf.fees[flat_fee[0]] += flat_fee[1]
-
-    for fee_token, fee_amount in perf.fees.items():
-        if fee_token == quote:
-            perf.fee_in_quote += fee_amount
-        else:
-            last_price = await get_last_price(exchange, f"{fee_token}-{quote}")
-            if last_price is not None:
-                perf.fee_in_quote += fee_amount * last_price
-
-    perf.total_pnl = perf.trade_pnl - perf.fee_in_quote
-    perf.return_pct = divide(perf.total_pnl, perf.hold_value)
-
-    return perf
+        accumulator.add_trade(trade)
+    return await accumulator.calculate_metrics(current_balances)
 
 
 def smart_round(value: Decimal, precision: Optional[int] = None) -> Decimal:
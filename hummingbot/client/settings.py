@@ -1,15 +1,18 @@
+from collections.abc import Mapping
 import importlib
-from os import scandir
 from os.path import (
     realpath,
     join,
 )
 from enum import Enum
 from decimal import Decimal
-from typing import List, NamedTuple, Dict, Any
+from typing import List, NamedTuple, Dict, Any, Iterator, Optional
 from hummingbot import get_strategy_list
-from pathlib import Path
 from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.connector_manifest import (
+    generate_connector_manifest,
+    load_connector_manifest,
+)
 from hummingbot.core.event.events import TradeFeeType
 
 # Global variables
@@ -57,7 +60,7 @@ class ConnectorSetting(NamedTuple):
     fee_type: TradeFeeType
     fee_token: str
     default_fees: List[Decimal]
-    config_keys: Dict[str, ConfigVar]
+    config_keys: "ConnectorConfigKeys"
     is_sub_domain: bool
     parent_name: str
     domain_parameter: str
@@ -97,61 +100,69 @@ class ConnectorSetting(NamedTuple):
             return self.name
 
 
+class ConnectorConfigKeys(Mapping):
+    """
+    The config keys of a connector. Key names come from the connector manifest, the config vars themselves are only
+    imported from the connector's utils module when they are accessed.
+    """
+    def __init__(self, utils_module: str, key_names: List[str], domain: Optional[str] = None):
+        self._utils_module = utils_module
+        self._key_names = key_names
+        self._domain = domain
+        self._config_keys: Optional[Dict[str, ConfigVar]] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._config_keys is not None
+
+    def load(self) -> Dict[str, ConfigVar]:
+        if self._config_keys is None:
+            util_module = importlib.import_module(self._utils_module)
+            if self._domain is None:
+                self._config_keys = getattr(util_module, "KEYS", {})
+            else:
+                self._config_keys = getattr(util_module, "OTHER_DOMAINS_KEYS")[self._domain]
+        return self._config_keys
+
+    def __getitem__(self, key: str) -> ConfigVar:
+        if key not in self._key_names:
+            raise KeyError(key)
+        return self.load()[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._key_names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._key_names)
+
+    def __len__(self) -> int:
+        return len(self._key_names)
+
+
 def _create_connector_settings() -> Dict[str, ConnectorSetting]:
-    connector_exceptions = ["paper_trade", "eterbase"]
+    manifest = load_connector_manifest()
+    if manifest is None:
+        # The manifest is generated at build time, scan the connectors if running from a tree without it.
+        manifest = generate_connector_manifest()
     connector_settings = {}
-    package_dir = Path(__file__).resolve().parent.parent.parent
-    type_dirs = [f for f in scandir(f'{str(package_dir)}/hummingbot/connector') if f.is_dir()]
-    for type_dir in type_dirs:
-        connector_dirs = [f for f in scandir(type_dir.path) if f.is_dir()]
-        for connector_dir in connector_dirs:
-            if connector_dir.name.startswith("_") or \
-                    connector_dir.name in connector_exceptions:
-                continue
-            if connector_dir.name in connector_settings:
-                raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-            path = f"hummingbot.connector.{type_dir.name}.{connector_dir.name}.{connector_dir.name}_utils"
-            try:
-                util_module = importlib.import_module(path)
-            except ModuleNotFoundError:
-                continue
-            fee_type = TradeFeeType.Percent
-            fee_type_setting = getattr(util_module, "FEE_TYPE", None)
-            if fee_type_setting is not None:
-                fee_type = TradeFeeType[fee_type_setting]
-            connector_settings[connector_dir.name] = ConnectorSetting(
-                name=connector_dir.name,
-                type=ConnectorType[type_dir.name.capitalize()],
-                centralised=getattr(util_module, "CENTRALIZED", True),
-                example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                fee_type=fee_type,
-                fee_token=getattr(util_module, "FEE_TOKEN", ""),
-                default_fees=getattr(util_module, "DEFAULT_FEES", []),
-                config_keys=getattr(util_module, "KEYS", {}),
-                is_sub_domain=False,
-                parent_name=None,
-                domain_parameter=None,
-                use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False)
-            )
-            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-            for domain in other_domains:
-                parent = connector_settings[connector_dir.name]
-                connector_settings[domain] = ConnectorSetting(
-                    name=domain,
-                    type=parent.type,
-                    centralised=parent.centralised,
-                    example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                    use_ethereum_wallet=parent.use_ethereum_wallet,
-                    fee_type=parent.fee_type,
-                    fee_token=parent.fee_token,
-                    default_fees=getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain],
-                    config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                    is_sub_domain=True,
-                    parent_name=parent.name,
-                    domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                    use_eth_gas_lookup=parent.use_eth_gas_lookup
-                )
+    for name, entry in manifest.items():
+        connector_settings[name] = ConnectorSetting(
+            name=name,
+            type=ConnectorType[entry["type"]],
+            centralised=entry["centralised"],
+            example_pair=entry["example_pair"],
+            use_ethereum_wallet=entry["use_ethereum_wallet"],
+            fee_type=TradeFeeType[entry["fee_type"]],
+            fee_token=entry["fee_token"],
+            default_fees=entry["default_fees"],
+            config_keys=ConnectorConfigKeys(entry["utils_module"],
+                                            entry["config_keys"],
+                                            name if entry["is_sub_domain"] else None),
+            is_sub_domain=entry["is_sub_domain"],
+            parent_name=entry["parent_name"],
+            domain_parameter=entry["domain_parameter"],
+            use_eth_gas_lookup=entry["use_eth_gas_lookup"]
+        )
     return connector_settings
 
 
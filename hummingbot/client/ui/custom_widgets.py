@@ -1,15 +1,24 @@
 from __future__ import unicode_literals
 import six
+from bisect import bisect_right
 from collections import deque
+from itertools import accumulate
+import re
+import threading
 from typing import (
-    List,
     Deque,
+    List,
+    Optional,
 )
 
 from prompt_toolkit.auto_suggest import DynamicAutoSuggest
 from prompt_toolkit.buffer import Buffer
 from prompt_toolkit.completion import DynamicCompleter
 from prompt_toolkit.document import Document
+from prompt_toolkit.search import (
+    SearchDirection,
+    SearchState,
+)
 from prompt_toolkit.widgets.toolbars import SearchToolbar
 from prompt_toolkit.filters import (
     to_filter,
@@ -31,6 +40,7 @@ from prompt_toolkit.layout.processors import (
     AppendAutoSuggestion,
 )
 from prompt_toolkit.lexers import DynamicLexer
+from prompt_toolkit.utils import Event
 
 
 class CustomBuffer(Buffer):
@@ -45,6 +55,177 @@ class CustomBuffer(Buffer):
                 self.reset()
 
 
+class LogLines:
+    """
+    The lines of a log pane, in a ring buffer of max_line_count lines. The joined text is kept between renders and only
+    brought up to date when it's read: new lines are appended to it and the lines dropped from the front sliced off,
+    instead of joining all the lines again. Lines may be added from other threads (see StdoutProxy).
+
+    The lines of the text as last read are kept along with their start positions and their lower case copies, which the
+    pane's search goes through line by line.
+    """
+
+    def __init__(self, max_line_count: int):
+        self._max_line_count: int = max_line_count
+        self._lines: Deque[str] = deque()
+        # Lower case copies of the lines, None when lowering a line changes its length.
+        self._lower_lines: Deque[Optional[str]] = deque()
+        # The text as last read, the number of its lines still in the buffer and the length of those that aren't.
+        self._text: str = ""
+        self._text_line_count: int = 0
+        self._dropped_length: int = 0
+        self._new_lines: Deque[str] = deque()
+        # The lines of the text as last read, their start positions in it and their lower case copies.
+        self._text_lines: List[str] = [""]
+        self._text_line_indexes: List[int] = [0]
+        self._text_lower_lines: List[Optional[str]] = [""]
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __iter__(self):
+        return iter(list(self._lines))
+
+    def extend(self, lines: List[str]):
+        with self._lock:
+            self._lines.extend(lines)
+            self._new_lines.extend(lines)
+            for line in lines:
+                lower_line: str = line.lower()
+                self._lower_lines.append(lower_line if len(lower_line) == len(line) else None)
+            while len(self._lines) > self._max_line_count:
+                dropped: str = self._lines.popleft()
+                self._lower_lines.popleft()
+                if self._text_line_count > 0:
+                    self._text_line_count -= 1
+                    self._dropped_length += len(dropped) + 1
+                else:
+                    self._new_lines.popleft()
+
+    @property
+    def text(self) -> str:
+        with self._lock:
+            if len(self._new_lines) > 0 or self._dropped_length > 0:
+                if self._text_line_count == 0:
+                    text = "\n".join(self._new_lines)
+                else:
+                    text = self._text[self._dropped_length:]
+                    if len(self._new_lines) > 0:
+                        text = text + "\n" + "\n".join(self._new_lines)
+                self._text = text
+                self._text_line_count = len(self._lines)
+                self._dropped_length = 0
+                self._new_lines.clear()
+                self._text_lines = list(self._lines) if len(self._lines) > 0 else [""]
+                self._text_lower_lines = list(self._lower_lines) if len(self._lines) > 0 else [""]
+                self._text_line_indexes = list(accumulate([0] + [len(line) + 1 for line in self._text_lines[:-1]]))
+            return self._text
+
+    @property
+    def document(self) -> Document:
+        """
+        A document of the text, with the cursor at the end.
+        """
+        text: str = self.text
+        return Document(text=text, cursor_position=len(text))
+
+    def _find_in_line(self, row: int, sub: str, ignore_case: bool, start: int, end: int, backwards: bool) -> int:
+        line: str = self._text_lines[row]
+        if ignore_case:
+            lower_line: Optional[str] = self._text_lower_lines[row]
+            if lower_line is None:
+                positions = [m.start() for m in re.finditer(re.escape(sub), line[start:end], re.IGNORECASE)]
+                if len(positions) == 0:
+                    return -1
+                return start + (positions[-1] if backwards else positions[0])
+            line = lower_line
+        return line.rfind(sub, start, end) if backwards else line.find(sub, start, end)
+
+    def is_text(self, text: str) -> bool:
+        """
+        Whether the text is the one last read, e.g. that a buffer's document still holds it.
+        """
+        return text is self._text
+
+    def find(self,
+             sub: str,
+             position: int,
+             backwards: bool = False,
+             ignore_case: bool = False,
+             include_current_position: bool = False) -> Optional[int]:
+        """
+        Searches the text as last read line by line, from the position to its end (its start when searching backwards)
+        and on from the other end, as a buffer's search does. Returns the position of the match, None if there's none.
+        """
+        with self._lock:
+            if ignore_case:
+                sub = sub.lower()
+            line_count: int = len(self._text_lines)
+            row: int = bisect_right(self._text_line_indexes, position) - 1
+            column: int = position - self._text_line_indexes[row]
+            if backwards:
+                # Matches ending before the position, then those of the whole text from its end.
+                rows = [(row, 0, column)] + [(r, 0, None) for r in range(row - 1, -1, -1)] + \
+                    [(r, 0, None) for r in range(line_count - 1, row - 1, -1)]
+            else:
+                rows = [(row, column if include_current_position else column + 1, None)] + \
+                    [(r, 0, None) for r in range(row + 1, line_count)] + [(r, 0, None) for r in range(0, row + 1)]
+            for r, start, end in rows:
+                found: int = self._find_in_line(r, sub, ignore_case, start, end, backwards)
+                if found >= 0:
+                    return self._text_line_indexes[r] + found
+            return None
+
+
+class LogBuffer(CustomBuffer):
+    """
+    The buffer of a log pane. While it holds the pane's log text, searching goes through the pane's lines instead of
+    the whole text after (or before) the cursor. Buffers with a history are searched as usual, history included.
+    """
+
+    def __init__(self, text_area: "CustomTextArea", **kwargs):
+        super().__init__(**kwargs)
+        self._text_area: CustomTextArea = text_area
+
+    def _search(self, search_state: SearchState, include_current_position: bool = False, count: int = 1):
+        log_lines: LogLines = self._text_area.log_lines
+        sub: str = search_state.text
+        if len(sub) == 0 or "\n" in sub or len(self.history.get_strings()) > 0 or not log_lines.is_text(self.text):
+            return super()._search(search_state, include_current_position, count)
+        position: Optional[int] = self.cursor_position
+        for _ in range(count):
+            position = log_lines.find(sub,
+                                      position,
+                                      backwards=search_state.direction == SearchDirection.BACKWARD,
+                                      ignore_case=search_state.ignore_case(),
+                                      include_current_position=include_current_position)
+            if position is None:
+                return None
+            include_current_position = False
+        return self.working_index, position
+
+
+class LogBufferControl(BufferControl):
+    """
+    A BufferControl that updates its buffer with the log lines added since the last render right before rendering, so
+    that a burst of log lines costs one buffer update, and one layout of the document, per frame instead of per line.
+    """
+
+    def __init__(self, text_area: "CustomTextArea", **kwargs):
+        super().__init__(**kwargs)
+        self._text_area: CustomTextArea = text_area
+        self.on_log: Event = Event(self)
+
+    def get_invalidate_events(self):
+        yield from super().get_invalidate_events()
+        yield self.on_log
+
+    def create_content(self, width: int, height: int, preview_search: bool = False):
+        self._text_area.flush_log()
+        return super().create_content(width, height, preview_search)
+
+
 class CustomTextArea:
     def __init__(self, text='', multiline=True, password=False,
                  lexer=None, auto_suggest=None, completer=None,
@@ -75,7 +256,8 @@ class CustomTextArea:
         self.wrap_lines = wrap_lines
         self.max_line_count = max_line_count
 
-        self.buffer = CustomBuffer(
+        self.buffer = LogBuffer(
+            self,
             document=Document(text, 0),
             multiline=multiline,
             read_only=Condition(lambda: is_true(self.read_only)),
@@ -86,7 +268,8 @@ class CustomTextArea:
             accept_handler=accept_handler,
             history=history)
 
-        self.control = BufferControl(
+        self.control = LogBufferControl(
+            self,
             buffer=self.buffer,
             lexer=DynamicLexer(lambda: self.lexer),
             input_processors=[
@@ -132,7 +315,9 @@ class CustomTextArea:
             get_line_prefix=get_line_prefix,
             align=align)
 
-        self.log_lines: Deque[str] = deque()
+        self.log_lines: LogLines = LogLines(max_line_count)
+        # Whether lines were logged since the buffer was last updated.
+        self._log_pending: bool = False
         self.log(initial_text)
 
     @property
@@ -140,6 +325,7 @@ class CustomTextArea:
         """
         The `Buffer` text.
         """
+        self.flush_log()
         return self.buffer.text
 
     @text.setter
@@ -151,6 +337,7 @@ class CustomTextArea:
         """
         The `Buffer` document (text + cursor position).
         """
+        self.flush_log()
         return self.buffer.document
 
     @document.setter
@@ -195,10 +382,20 @@ class CustomTextArea:
 
         if save_log:
             self.log_lines.extend(new_lines)
-            while len(self.log_lines) > self.max_line_count:
-                self.log_lines.popleft()
-            new_text: str = "\n".join(self.log_lines)
-        else:
+            if not silent:
+                self._log_pending = True
+                self.control.on_log.fire()
+        elif not silent:
+            # Shown until the next log, the lines logged in the meantime are shown along with it.
+            self._log_pending = False
             new_text: str = "\n".join(new_lines)
-        if not silent:
             self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+
+    def flush_log(self):
+        """
+        Updates the buffer with the lines logged since the last update, the cursor goes to the end.
+        """
+        if not self._log_pending:
+            return
+        self._log_pending = False
+        self.buffer.document = self.log_lines.document
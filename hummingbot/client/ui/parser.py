@@ -146,4 +146,13 @@ def load_parser(hummingbot) -> ThrowingArgumentParser:
                              dest="token", help="The token you want to see its value.")
     rate_parser.set_defaults(func=hummingbot.rate)
 
+    latency_parser = subparsers.add_parser("latency", help="Show market data latency from the exchange to the strategy")
+    latency_parser.add_argument("--exchange", type=str, dest="exchange", help="The exchange of the market")
+    latency_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair)")
+    latency_parser.add_argument("--export", default=False, action="store_true", dest="export",
+                                help="Export the latency histograms to a csv file")
+    latency_parser.add_argument("--reset", default=False, action="store_true", dest="reset",
+                                help="Reset the latency statistics")
+    latency_parser.set_defaults(func=hummingbot.latency)
+
     return parser
@@ -95,6 +95,10 @@ class BalancerConnector(ConnectorBase):
     def name(self):
         return "balancer"
 
+    @property
+    def order_price_is_quote_price(self) -> bool:
+        return True
+
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         return await fetch_trading_pairs()
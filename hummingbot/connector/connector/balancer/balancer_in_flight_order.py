@@ -10,6 +10,8 @@ from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 
 
 class BalancerInFlightOrder(InFlightOrderBase):
+    __slots__ = ("_gas_price",)
+
     def __init__(self,
                  client_order_id: str,
                  exchange_order_id: Optional[str],
@@ -30,7 +32,6 @@ class BalancerInFlightOrder(InFlightOrderBase):
             amount,
             initial_state,
         )
-        self.trade_id_set = set()
         self._gas_price = gas_price
 
     @property
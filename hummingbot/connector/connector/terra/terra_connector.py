@@ -80,6 +80,10 @@ class TerraConnector(ConnectorBase):
     def name(self):
         return "terra"
 
+    @property
+    def order_price_is_quote_price(self) -> bool:
+        return True
+
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         return ["LUNA-UST", "LUNA-KRT", "LUNA-SDT", "LUNA-MNT",
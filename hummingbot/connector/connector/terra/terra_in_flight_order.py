@@ -10,6 +10,8 @@ from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 
 
 class TerraInFlightOrder(InFlightOrderBase):
+    __slots__ = ()
+
     def __init__(self,
                  client_order_id: str,
                  exchange_order_id: Optional[str],
@@ -29,7 +31,6 @@ class TerraInFlightOrder(InFlightOrderBase):
             amount,
             initial_state,
         )
-        self.trade_id_set = set()
 
     @property
     def is_done(self) -> bool:
@@ -94,6 +94,10 @@ class UniswapConnector(ConnectorBase):
     def name(self):
         return "uniswap"
 
+    @property
+    def order_price_is_quote_price(self) -> bool:
+        return True
+
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         return await fetch_trading_pairs()
@@ -67,6 +67,13 @@ cdef class ConnectorBase(NetworkIterator):
     def real_time_balance_update(self, value: bool):
         self._real_time_balance_update = value
 
+    @property
+    def order_price_is_quote_price(self) -> bool:
+        """
+        Whether get_order_price returns the quote price, so that callers needing both can reuse a single quote.
+        """
+        return False
+
     @property
     def in_flight_orders_snapshot(self) -> Dict[str, InFlightOrderBase]:
         return self._in_flight_orders_snapshot
@@ -193,6 +200,21 @@ cdef class ConnectorBase(NetworkIterator):
     def tracking_states(self) -> Dict[str, any]:
         return {}
 
+    def tracking_state_deltas(self, saved_states: Dict[str, any]) -> Tuple[Dict[str, any], List[str]]:
+        """
+        The changes of the tracking states since they were saved, as the states to upsert by key and the keys to
+        delete. States are compared by identity before equality, in flight orders keep their JSON until they change.
+        :param saved_states: Previously saved tracking states from `tracking_states` property.
+        """
+        tracking_states = self.tracking_states
+        upserts = {}
+        for key, state in tracking_states.items():
+            saved_state = saved_states.get(key)
+            if saved_state is not state and saved_state != state:
+                upserts[key] = state
+        deletes = [key for key in saved_states if key not in tracking_states]
+        return upserts, deletes
+
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         """
         Restores the tracking states from a previously saved state.
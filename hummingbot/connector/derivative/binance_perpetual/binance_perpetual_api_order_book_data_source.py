@@ -5,7 +5,7 @@ from typing import Dict, List, Optional, Any, AsyncIterable
 
 import aiohttp
 import pandas as pd
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -30,6 +30,8 @@ TICKER_PRICE_URL = "{}/fapi/v1/ticker/bookTicker"
 TICKER_PRICE_CHANGE_URL = "{}/fapi/v1/ticker/24hr"
 EXCHANGE_INFO_URL = "{}/fapi/v1/exchangeInfo"
 RECENT_TRADES_URL = "{}/fapi/v1/trades"
+# Price levels of depth snapshots (bids, asks) and diffs (b, a) are decoded to floats once, on receipt.
+DEPTH_NUMERIC_SCHEMA = json_codec.NumericSchema(["bids", "asks", "b", "a"])
 
 
 class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -60,7 +62,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         async with aiohttp.ClientSession() as client:
             url = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
             resp = await client.get(f"{TICKER_PRICE_CHANGE_URL.format(url)}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
-            resp_json = await resp.json()
+            resp_json = await resp.json(loads=json_codec.loads)
             return float(resp_json["lastPrice"])
 
     """
@@ -88,7 +90,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(EXCHANGE_INFO_URL.format(BASE_URL), timeout=10) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=json_codec.loads)
                         raw_trading_pairs = [d["symbol"] for d in data["symbols"] if d["status"] == "TRADING"]
                         trading_pair_list: List[str] = []
                         for raw_trading_pair in raw_trading_pairs:
@@ -114,7 +116,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Binance market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response.json(loads=json_codec.loads_with(DEPTH_NUMERIC_SCHEMA))
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
@@ -178,7 +180,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self.ws_messages(ws):
-                        msg_json = ujson.loads(raw_msg)
+                        msg_json = json_codec.loads(raw_msg, DEPTH_NUMERIC_SCHEMA)
                         timestamp: float = time.time()
                         order_book_message: OrderBookMessage = BinancePerpetualOrderBook.diff_message_from_exchange(
                             msg_json,
@@ -202,7 +204,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self.ws_messages(ws):
-                        msg_json = ujson.loads(raw_msg)
+                        msg_json = json_codec.loads(raw_msg)
                         trade_msg: OrderBookMessage = BinancePerpetualOrderBook.trade_message_from_exchange(msg_json)
                         output.put_nowait(trade_msg)
             except asyncio.CancelledError:
@@ -1,4 +1,4 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 from enum import Enum
 from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
@@ -21,11 +21,11 @@ import hashlib
 import hmac
 import time
 import logging
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 from decimal import Decimal
-from typing import Optional, List, Dict, Any, AsyncIterable
+from typing import Optional, List, Dict, Any, AsyncIterable, Deque, Set, Tuple
 from urllib.parse import urlencode
 
 import aiohttp
@@ -45,6 +45,10 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent, PositionSide, PositionMode, PositionAction)
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.warm_start_cache import (
+    TRADING_RULES_CACHE_NAMESPACE,
+    WarmStartCache,
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_order_book_tracker import BinancePerpetualOrderBookTracker
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_user_stream_tracker import BinancePerpetualUserStreamTracker
@@ -95,7 +99,10 @@ class BinancePerpetualDerivative(DerivativeBase):
     API_CALL_TIMEOUT = 10.0
     SHORT_POLL_INTERVAL = 5.0
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
-    LONG_POLL_INTERVAL = 120.0
+    TRADING_RULES_CACHE_INTERVAL = 60.0 * 60.0
+    RECONCILIATION_INTERVAL = 600.0
+    USER_STREAM_SILENCE_THRESHOLD = 60.0
+    REST_WEIGHT_WINDOW = 60.0
     ORDER_NOT_EXIST_CONFIRMATION_COUNT = 3
 
     @classmethod
@@ -137,6 +144,12 @@ class BinancePerpetualDerivative(DerivativeBase):
         self._last_poll_timestamp = 0
         self._throttler = Throttler((10.0, 1.0))
         self._funding_payment_span = [0, 15]
+        self._reconciliation_requested = False
+        self._user_stream_was_silent = True
+        self._gaps_detected = 0
+        self._reconciliations = 0
+        self._rest_weight_log: Deque[Tuple[float, int]] = deque()
+        self._last_position_update_time = 0.0
 
     @property
     def name(self) -> str:
@@ -163,6 +176,40 @@ class BinancePerpetualDerivative(DerivativeBase):
             "funding_info": len(self._funding_info) > 0
         }
 
+    @property
+    def rest_weight_per_minute(self) -> int:
+        """
+        REST request weight used over the last minute, out of the 2400 Binance allows.
+        """
+        self._trim_rest_weight_log(time.time())
+        return sum(weight for _, weight in self._rest_weight_log)
+
+    def _trim_rest_weight_log(self, now: float):
+        cutoff = now - self.REST_WEIGHT_WINDOW
+        while len(self._rest_weight_log) > 0 and self._rest_weight_log[0][0] < cutoff:
+            self._rest_weight_log.popleft()
+
+    @property
+    def position_staleness(self) -> float:
+        """
+        Seconds the positions may lag behind the exchange: the age of the last message on a live user stream, or of the
+        last position update otherwise.
+        """
+        now = time.time()
+        stream_age = now - self._user_stream_tracker.last_recv_time
+        if stream_age <= self.USER_STREAM_SILENCE_THRESHOLD:
+            return stream_age
+        return now - self._last_position_update_time
+
+    @property
+    def tracking_metrics(self) -> Dict[str, Any]:
+        return {
+            "rest_weight_per_minute": self.rest_weight_per_minute,
+            "position_staleness": self.position_staleness,
+            "gaps_detected": self._gaps_detected,
+            "reconciliations": self._reconciliations,
+        }
+
     @property
     def limit_orders(self):
         return [in_flight_order.to_limit_order() for in_flight_order in self._in_flight_orders.values()]
@@ -174,6 +221,7 @@ class BinancePerpetualDerivative(DerivativeBase):
         super().stop(clock)
 
     async def start_network(self):
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         self._funding_info_polling_task = safe_ensure_future(self._funding_info_polling_loop())
@@ -478,138 +526,181 @@ class BinancePerpetualDerivative(DerivativeBase):
     async def _user_stream_event_listener(self):
         async for event_message in self._iter_user_event_queue():
             try:
-                event_type = event_message.get("e")
-                if event_type == "ORDER_TRADE_UPDATE":
-                    order_message = event_message.get("o")
-                    client_order_id = order_message.get("c")
-
-                    # If the order has already been cancelled
-                    if client_order_id not in self._in_flight_orders:
-                        continue
-
-                    tracked_order = self._in_flight_orders.get(client_order_id)
-                    tracked_order.update_with_execution_report(event_message)
-
-                    # Execution Type: Trade => Filled
-                    trade_type = TradeType.BUY if order_message.get("S") == "BUY" else TradeType.SELL
-                    if order_message.get("X") in ["PARTIALLY_FILLED", "FILLED"]:
-                        order_filled_event = OrderFilledEvent(
-                            timestamp=event_message.get("E") * 1e-3,
-                            order_id=client_order_id,
-                            trading_pair=convert_from_exchange_trading_pair(order_message.get("s")),
-                            trade_type=trade_type,
-                            order_type=OrderType.LIMIT if order_message.get("o") == "LIMIT" else OrderType.MARKET,
-                            price=Decimal(order_message.get("L")),
-                            amount=Decimal(order_message.get("l")),
-                            leverage=self._leverage[convert_from_exchange_trading_pair(order_message.get("s"))],
-                            trade_fee=self.get_fee(
-                                base_currency=tracked_order.base_asset,
-                                quote_currency=tracked_order.quote_asset,
-                                order_type=tracked_order.order_type,
-                                order_side=trade_type,
-                                amount=Decimal(order_message.get("q")),
-                                price=Decimal(order_message.get("p"))
-                            ),
-                            exchange_trade_id=order_message.get("t"),
-                            position=tracked_order.position
-                        )
-                        self.trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG, order_filled_event)
-
-                    if tracked_order.is_done:
-                        if not tracked_order.is_failure:
-                            event_tag = None
-                            event_class = None
-                            if trade_type is TradeType.BUY:
-                                event_tag = self.MARKET_BUY_ORDER_COMPLETED_EVENT_TAG
-                                event_class = BuyOrderCompletedEvent
-                            else:
-                                event_tag = self.MARKET_SELL_ORDER_COMPLETED_EVENT_TAG
-                                event_class = SellOrderCompletedEvent
-                            self.logger().info(f"The {tracked_order.order_type.name.lower()} {trade_type} order {client_order_id} has completed "
-                                               f"according to websocket delta.")
-                            self.trigger_event(event_tag,
-                                               event_class(self.current_timestamp,
-                                                           client_order_id,
-                                                           tracked_order.base_asset,
-                                                           tracked_order.quote_asset,
-                                                           (tracked_order.fee_asset or tracked_order.quote_asset),
-                                                           tracked_order.executed_amount_base,
-                                                           tracked_order.executed_amount_quote,
-                                                           tracked_order.fee_paid,
-                                                           tracked_order.order_type))
-                        else:
-                            if tracked_order.is_cancelled:
-                                if tracked_order.client_order_id in self._in_flight_orders:
-                                    self.logger().info(f"Successfully cancelled order {tracked_order.client_order_id} according to websocket delta.")
-                                    self.trigger_event(self.MARKET_ORDER_CANCELLED_EVENT_TAG,
-                                                       OrderCancelledEvent(self.current_timestamp,
-                                                                           tracked_order.client_order_id))
-                                else:
-                                    self.logger().info(f"The {tracked_order.order_type.name.lower()} order {tracked_order.client_order_id} has failed "
-                                                       f"according to websocket delta.")
-                                    self.trigger_event(self.MARKET_ORDER_FAILURE_EVENT_TAG,
-                                                       MarketOrderFailureEvent(self.current_timestamp,
-                                                                               tracked_order.client_order_id,
-                                                                               tracked_order.order_type))
-                        self.stop_tracking_order(tracked_order.client_order_id)
-                elif event_type == "ACCOUNT_UPDATE":
-                    update_data = event_message.get("a", {})
-                    event_reason = update_data.get("m", {})
-                    if event_reason == "FUNDING_FEE":
-                        await self.get_funding_payment()
-                    else:
-                        # update balances
-                        for asset in update_data.get("B", []):
-                            asset_name = asset["a"]
-                            self._account_balances[asset_name] = Decimal(asset["wb"])
-                            self._account_available_balances[asset_name] = Decimal(asset["cw"])
-
-                        # update position
-                        for asset in update_data.get("P", []):
-                            position = self._account_positions.get(f"{asset['s']}{asset['ps']}", None)
-                            if position is not None:
-                                position.update_position(position_side=PositionSide[asset["ps"]],
-                                                         unrealized_pnl = Decimal(asset["up"]),
-                                                         entry_price = Decimal(asset["ep"]),
-                                                         amount = Decimal(asset["pa"]))
-                            else:
-                                await self._update_positions()
-                elif event_type == "MARGIN_CALL":
-                    positions = event_message.get("p", [])
-                    total_maint_margin_required = 0
-                    # total_pnl = 0
-                    negative_pnls_msg = ""
-                    for position in positions:
-                        existing_position = self._account_positions.get(f"{asset['s']}{asset['ps']}", None)
-                        if existing_position is not None:
-                            existing_position.update_position(position_side=PositionSide[asset["ps"]],
-                                                              unrealized_pnl = Decimal(asset["up"]),
-                                                              amount = Decimal(asset["pa"]))
-                        total_maint_margin_required += position.get("mm", 0)
-                        if position.get("up", 0) < 1:
-                            negative_pnls_msg += f"{position.get('s')}: {position.get('up')}, "
-                    self.logger().warning("Margin Call: Your position risk is too high, and you are at risk of "
-                                          "liquidation. Close your positions or add additional margin to your wallet.")
-                    self.logger().info(f"Margin Required: {total_maint_margin_required}. Total Unrealized PnL: "
-                                       f"{negative_pnls_msg}. Negative PnL assets: {negative_pnls_msg}.")
+                await self._process_user_stream_event(event_message)
             except asyncio.CancelledError:
                 raise
             except Exception as e:
                 self.logger().error(f"Unexpected error in user stream listener loop: {e}", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    async def _process_user_stream_event(self, event_message: Dict[str, Any]):
+        event_type = event_message.get("e")
+        if event_type == "ORDER_TRADE_UPDATE":
+            order_message = event_message.get("o")
+            client_order_id = order_message.get("c")
+
+            # If the order has already been cancelled
+            if client_order_id not in self._in_flight_orders:
+                return
+
+            tracked_order = self._in_flight_orders.get(client_order_id)
+            trade_applied = tracked_order.update_with_execution_report(event_message)
+            if Decimal(order_message.get("z", "0")) > tracked_order.executed_amount_base:
+                # The exchange reports more filled than the stream delivered, some fills were missed.
+                self._request_reconciliation(f"missed fills of order {client_order_id}")
+
+            # Execution Type: Trade => Filled
+            trade_type = TradeType.BUY if order_message.get("S") == "BUY" else TradeType.SELL
+            if trade_applied:
+                order_filled_event = OrderFilledEvent(
+                    timestamp=event_message.get("E") * 1e-3,
+                    order_id=client_order_id,
+                    trading_pair=convert_from_exchange_trading_pair(order_message.get("s")),
+                    trade_type=trade_type,
+                    order_type=OrderType.LIMIT if order_message.get("o") == "LIMIT" else OrderType.MARKET,
+                    price=Decimal(order_message.get("L")),
+                    amount=Decimal(order_message.get("l")),
+                    leverage=self._leverage[convert_from_exchange_trading_pair(order_message.get("s"))],
+                    trade_fee=self.get_fee(
+                        base_currency=tracked_order.base_asset,
+                        quote_currency=tracked_order.quote_asset,
+                        order_type=tracked_order.order_type,
+                        order_side=trade_type,
+                        amount=Decimal(order_message.get("q")),
+                        price=Decimal(order_message.get("p"))
+                    ),
+                    exchange_trade_id=order_message.get("t"),
+                    position=tracked_order.position
+                )
+                self.trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG, order_filled_event)
+
+            if tracked_order.is_done:
+                if not tracked_order.is_failure:
+                    event_tag = None
+                    event_class = None
+                    if trade_type is TradeType.BUY:
+                        event_tag = self.MARKET_BUY_ORDER_COMPLETED_EVENT_TAG
+                        event_class = BuyOrderCompletedEvent
+                    else:
+                        event_tag = self.MARKET_SELL_ORDER_COMPLETED_EVENT_TAG
+                        event_class = SellOrderCompletedEvent
+                    self.logger().info(f"The {tracked_order.order_type.name.lower()} {trade_type} order {client_order_id} has completed "
+                                       f"according to websocket delta.")
+                    self.trigger_event(event_tag,
+                                       event_class(self.current_timestamp,
+                                                   client_order_id,
+                                                   tracked_order.base_asset,
+                                                   tracked_order.quote_asset,
+                                                   (tracked_order.fee_asset or tracked_order.quote_asset),
+                                                   tracked_order.executed_amount_base,
+                                                   tracked_order.executed_amount_quote,
+                                                   tracked_order.fee_paid,
+                                                   tracked_order.order_type))
+                else:
+                    if tracked_order.is_cancelled:
+                        if tracked_order.client_order_id in self._in_flight_orders:
+                            self.logger().info(f"Successfully cancelled order {tracked_order.client_order_id} according to websocket delta.")
+                            self.trigger_event(self.MARKET_ORDER_CANCELLED_EVENT_TAG,
+                                               OrderCancelledEvent(self.current_timestamp,
+                                                                   tracked_order.client_order_id))
+                        else:
+                            self.logger().info(f"The {tracked_order.order_type.name.lower()} order {tracked_order.client_order_id} has failed "
+                                               f"according to websocket delta.")
+                            self.trigger_event(self.MARKET_ORDER_FAILURE_EVENT_TAG,
+                                               MarketOrderFailureEvent(self.current_timestamp,
+                                                                       tracked_order.client_order_id,
+                                                                       tracked_order.order_type))
+                self.stop_tracking_order(tracked_order.client_order_id)
+        elif event_type == "ACCOUNT_UPDATE":
+            update_data = event_message.get("a", {})
+            event_reason = update_data.get("m", {})
+            if event_reason == "FUNDING_FEE":
+                await self.get_funding_payment()
+            else:
+                # update balances
+                for asset in update_data.get("B", []):
+                    asset_name = asset["a"]
+                    self._account_balances[asset_name] = Decimal(asset["wb"])
+                    self._account_available_balances[asset_name] = Decimal(asset["cw"])
+
+                # update position
+                for asset in update_data.get("P", []):
+                    self._update_position_from_stream(asset)
+                self._last_position_update_time = time.time()
+        elif event_type == "MARGIN_CALL":
+            positions = event_message.get("p", [])
+            total_maint_margin_required = 0
+            # total_pnl = 0
+            negative_pnls_msg = ""
+            for position in positions:
+                existing_position = self._account_positions.get(f"{position['s']}{position['ps']}", None)
+                if existing_position is not None:
+                    existing_position.update_position(position_side=PositionSide[position["ps"]],
+                                                      unrealized_pnl = Decimal(position["up"]),
+                                                      amount = Decimal(position["pa"]))
+                total_maint_margin_required += position.get("mm", 0)
+                if position.get("up", 0) < 1:
+                    negative_pnls_msg += f"{position.get('s')}: {position.get('up')}, "
+            self.logger().warning("Margin Call: Your position risk is too high, and you are at risk of "
+                                  "liquidation. Close your positions or add additional margin to your wallet.")
+            self.logger().info(f"Margin Required: {total_maint_margin_required}. Total Unrealized PnL: "
+                               f"{negative_pnls_msg}. Negative PnL assets: {negative_pnls_msg}.")
+
+    def _update_position_from_stream(self, position_update: Dict[str, Any]):
+        position_key = f"{position_update['s']}{position_update['ps']}"
+        amount = Decimal(position_update["pa"])
+        position = self._account_positions.get(position_key, None)
+        if amount == 0:
+            if position is not None:
+                del self._account_positions[position_key]
+        elif position is not None:
+            position.update_position(position_side=PositionSide[position_update["ps"]],
+                                     unrealized_pnl = Decimal(position_update["up"]),
+                                     entry_price = Decimal(position_update["ep"]),
+                                     amount = amount)
+        else:
+            trading_pair = convert_from_exchange_trading_pair(position_update["s"])
+            if trading_pair not in self._leverage:
+                # The leverage isn't part of the update, let the next reconciliation fill it in.
+                self._request_reconciliation(f"unknown leverage of new {trading_pair} position")
+            self._account_positions[position_key] = Position(
+                trading_pair=trading_pair,
+                position_side=PositionSide[position_update["ps"]],
+                unrealized_pnl=Decimal(position_update["up"]),
+                entry_price=Decimal(position_update["ep"]),
+                amount=amount,
+                leverage=Decimal(self._leverage.get(trading_pair, 1))
+            )
+
+    def _request_reconciliation(self, reason: str):
+        """
+        Asks for the account, positions and orders to be reconciled over REST on the next tick, after a gap is detected
+        in the user stream.
+        """
+        if not self._reconciliation_requested:
+            self.logger().debug(f"Reconciling account state over REST: {reason}.")
+            self._reconciliation_requested = True
+            self._gaps_detected += 1
+
     def tick(self, timestamp: float):
         """
         Is called automatically by the clock for each clock's tick (1 second by default).
         It checks if status polling task is due for execution.
+        Balances, positions and orders follow the user stream, REST reconciliation runs every RECONCILIATION_INTERVAL
+        as a safety net, right after a gap in the stream is detected, and every SHORT_POLL_INTERVAL while the stream
+        is silent.
         """
         now = time.time()
+        user_stream_silent = now - self._user_stream_tracker.last_recv_time > self.USER_STREAM_SILENCE_THRESHOLD
+        if self._user_stream_was_silent and not user_stream_silent:
+            self._request_reconciliation("user stream resumed")
+        self._user_stream_was_silent = user_stream_silent
         poll_interval = (self.SHORT_POLL_INTERVAL
-                         if now - self._user_stream_tracker.last_recv_time > 60.0
-                         else self.LONG_POLL_INTERVAL)
+                         if user_stream_silent
+                         else self.RECONCILIATION_INTERVAL)
         last_tick = int(self._last_timestamp / poll_interval)
         current_tick = int(timestamp / poll_interval)
-        if current_tick > last_tick:
+        if current_tick > last_tick or self._reconciliation_requested:
             if not self._poll_notifier.is_set():
                 self._poll_notifier.set()
         self._last_timestamp = timestamp
@@ -629,12 +720,23 @@ class BinancePerpetualDerivative(DerivativeBase):
     async def _update_trading_rules(self):
         last_tick = int(self._last_timestamp / 60.0)
         current_tick = int(self.current_timestamp / 60.0)
-        if current_tick > last_tick or len(self._trading_rules) < 1:
+        initial_update = len(self._trading_rules) < 1
+        if initial_update:
+            cached_exchange_info = WarmStartCache.get_instance().get(TRADING_RULES_CACHE_NAMESPACE, self.name)
+            if cached_exchange_info is not None:
+                # Ready with the trading rules of the last run right away, the request below refreshes them.
+                self._set_trading_rules(cached_exchange_info.value)
+        if current_tick > last_tick or initial_update:
             exchange_info = await self.request(path="/fapi/v1/exchangeInfo", method=MethodType.GET, is_signed=False)
-            trading_rules_list = self._format_trading_rules(exchange_info)
-            self._trading_rules.clear()
-            for trading_rule in trading_rules_list:
-                self._trading_rules[trading_rule.trading_pair] = trading_rule
+            self._set_trading_rules(exchange_info)
+            WarmStartCache.get_instance().set(TRADING_RULES_CACHE_NAMESPACE, self.name, exchange_info,
+                                              min_interval=self.TRADING_RULES_CACHE_INTERVAL)
+
+    def _set_trading_rules(self, exchange_info: Dict[str, Any]):
+        trading_rules_list = self._format_trading_rules(exchange_info)
+        self._trading_rules.clear()
+        for trading_rule in trading_rules_list:
+            self._trading_rules[trading_rule.trading_pair] = trading_rule
 
     def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         rules: list = exchange_info_dict.get("symbols", [])
@@ -692,7 +794,7 @@ class BinancePerpetualDerivative(DerivativeBase):
                     while True:
                         try:
                             raw_msg: str = await asyncio.wait_for(ws.recv(), timeout=10.0)
-                            msg = ujson.loads(raw_msg)
+                            msg = json_codec.loads(raw_msg)
                             trading_pair = convert_from_exchange_trading_pair(msg["data"]["s"])
                             self._funding_info[trading_pair] = {"indexPrice": msg["data"]["i"],
                                                                 "markPrice": msg["data"]["p"],
@@ -714,13 +816,15 @@ class BinancePerpetualDerivative(DerivativeBase):
             try:
                 self._poll_notifier = asyncio.Event()
                 await self._poll_notifier.wait()
+                gap_detected = self._reconciliation_requested
+                self._reconciliation_requested = False
                 await safe_gather(
                     self._update_balances(),
                     self._update_positions()
                 )
-                await self._update_order_fills_from_trades(),
-                await self._update_order_status()
+                await self._update_order_status(force=gap_detected)
                 self._last_poll_timestamp = self.current_timestamp
+                self._reconciliations += 1
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -732,7 +836,7 @@ class BinancePerpetualDerivative(DerivativeBase):
     async def _update_balances(self):
         local_asset_names = set(self._account_balances.keys())
         remote_asset_names = set()
-        account_info = await self.request(path="/fapi/v2/account", is_signed=True, add_timestamp=True)
+        account_info = await self.request(path="/fapi/v2/account", is_signed=True, add_timestamp=True, request_weight=5)
         assets = account_info.get("assets")
         for asset in assets:
             asset_name = asset.get("asset")
@@ -748,7 +852,8 @@ class BinancePerpetualDerivative(DerivativeBase):
             del self._account_balances[asset_name]
 
     async def _update_positions(self):
-        positions = await self.request(path="/fapi/v2/positionRisk", add_timestamp=True, is_signed=True)
+        positions = await self.request(path="/fapi/v2/positionRisk", add_timestamp=True, is_signed=True,
+                                       request_weight=5)
         for position in positions:
             trading_pair = position.get("symbol")
             position_side = PositionSide[position.get("positionSide")]
@@ -768,69 +873,96 @@ class BinancePerpetualDerivative(DerivativeBase):
             else:
                 if (trading_pair + position_side.name) in self._account_positions:
                     del self._account_positions[trading_pair + position_side.name]
+        self._last_position_update_time = time.time()
 
-    async def _update_order_fills_from_trades(self):
-        last_tick = int(self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
-        current_tick = int(self.current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
-        if current_tick > last_tick and len(self._in_flight_orders) > 0:
-            trading_pairs_to_order_map = defaultdict(lambda: {})
-            for order in self._in_flight_orders.values():
+    async def _update_order_fills_from_trades(self, trading_pairs: Set[str]):
+        trading_pairs_to_order_map = defaultdict(lambda: {})
+        for order in self._in_flight_orders.values():
+            if order.trading_pair in trading_pairs:
                 trading_pairs_to_order_map[order.trading_pair][order.exchange_order_id] = order
-            trading_pairs = list(trading_pairs_to_order_map.keys())
-            tasks = [
-                self.request(
-                    path="/fapi/v1/userTrades",
-                    params={
-                        "symbol": convert_to_exchange_trading_pair(trading_pair)
-                    },
-                    is_signed=True,
-                    add_timestamp=True
-                ) for trading_pair in trading_pairs]
-            self.logger().debug(f"Polling for order fills of {len(tasks)} trading_pairs.")
-            results = await safe_gather(*tasks, return_exceptions=True)
-            for trades, trading_pair in zip(results, trading_pairs):
-                order_map = trading_pairs_to_order_map.get(trading_pair)
-                if isinstance(trades, Exception):
-                    self.logger().network(
-                        f"Error fetching trades update for the order {trading_pair}: {trades}.",
-                        app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
-                    )
-                    continue
-                for trade in trades:
-                    order_id = str(trade.get("orderId"))
-                    if order_id in order_map:
-                        tracked_order = order_map.get(order_id)
-                        order_type = tracked_order.order_type
-                        applied_trade = tracked_order.update_with_trade_updates(trade)
-                        if applied_trade:
-                            self.trigger_event(
-                                self.MARKET_ORDER_FILLED_EVENT_TAG,
-                                OrderFilledEvent(
-                                    self.current_timestamp,
-                                    tracked_order.client_order_id,
-                                    tracked_order.trading_pair,
-                                    tracked_order.trade_type,
+        trading_pairs = list(trading_pairs_to_order_map.keys())
+        tasks = [
+            self.request(
+                path="/fapi/v1/userTrades",
+                params={
+                    "symbol": convert_to_exchange_trading_pair(trading_pair)
+                },
+                is_signed=True,
+                add_timestamp=True,
+                request_weight=5
+            ) for trading_pair in trading_pairs]
+        self.logger().debug(f"Polling for order fills of {len(tasks)} trading_pairs.")
+        results = await safe_gather(*tasks, return_exceptions=True)
+        for trades, trading_pair in zip(results, trading_pairs):
+            order_map = trading_pairs_to_order_map.get(trading_pair)
+            if isinstance(trades, Exception):
+                self.logger().network(
+                    f"Error fetching trades update for the order {trading_pair}: {trades}.",
+                    app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
+                )
+                continue
+            for trade in trades:
+                order_id = str(trade.get("orderId"))
+                if order_id in order_map:
+                    tracked_order = order_map.get(order_id)
+                    order_type = tracked_order.order_type
+                    applied_trade = tracked_order.update_with_trade_updates(trade)
+                    if applied_trade:
+                        self.trigger_event(
+                            self.MARKET_ORDER_FILLED_EVENT_TAG,
+                            OrderFilledEvent(
+                                self.current_timestamp,
+                                tracked_order.client_order_id,
+                                tracked_order.trading_pair,
+                                tracked_order.trade_type,
+                                order_type,
+                                Decimal(trade.get("price")),
+                                Decimal(trade.get("qty")),
+                                self.get_fee(
+                                    tracked_order.base_asset,
+                                    tracked_order.quote_asset,
                                     order_type,
-                                    Decimal(trade.get("price")),
-                                    Decimal(trade.get("qty")),
-                                    self.get_fee(
-                                        tracked_order.base_asset,
-                                        tracked_order.quote_asset,
-                                        order_type,
-                                        tracked_order.trade_type,
-                                        Decimal(trade["price"]),
-                                        Decimal(trade["qty"])),
-                                    exchange_trade_id=trade["id"],
-                                    leverage=self._leverage[tracked_order.trading_pair],
-                                    position=tracked_order.position
-                                )
+                                    tracked_order.trade_type,
+                                    Decimal(trade["price"]),
+                                    Decimal(trade["qty"])),
+                                exchange_trade_id=trade["id"],
+                                leverage=self._leverage[tracked_order.trading_pair],
+                                position=tracked_order.position
                             )
+                        )
 
-    async def _update_order_status(self):
-        last_tick = int(self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
-        current_tick = int(self.current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
-        if current_tick > last_tick and len(self._in_flight_orders) > 0:
+    async def _update_order_status(self, force: bool = False):
+        """
+        Reconciles the tracked orders with the exchange. Orders still open are checked with one open orders request per
+        trading pair, only the others are requested one by one, and trades are only fetched for the trading pairs
+        where the exchange reports more filled than was tracked.
+        :param force: reconcile even if the last reconciliation is less than UPDATE_ORDER_STATUS_MIN_INTERVAL old, as
+        is done right after a gap in the user stream
+        """
+        update_due = force
+        if not update_due:
+            last_tick = int(self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
+            current_tick = int(self.current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
+            update_due = current_tick > last_tick
+        if update_due and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
+            trading_pairs = sorted({order.trading_pair for order in tracked_orders})
+            open_orders_results = await safe_gather(*[
+                self.request(path="/fapi/v1/openOrders",
+                             params={"symbol": convert_to_exchange_trading_pair(trading_pair)},
+                             method=MethodType.GET,
+                             add_timestamp=True,
+                             is_signed=True)
+                for trading_pair in trading_pairs], return_exceptions=True)
+            open_orders: Dict[str, Dict[str, Any]] = {}
+            for trading_pair, result in zip(trading_pairs, open_orders_results):
+                if isinstance(result, Exception):
+                    self.logger().network(f"Error fetching open orders of {trading_pair}: {result}.")
+                    continue
+                for open_order in result:
+                    open_orders[open_order["clientOrderId"]] = open_order
+
+            closed_orders = [order for order in tracked_orders if order.client_order_id not in open_orders]
             tasks = [self.request(path="/fapi/v1/order",
                                   params={
                                       "symbol": convert_to_exchange_trading_pair(order.trading_pair),
@@ -840,14 +972,31 @@ class BinancePerpetualDerivative(DerivativeBase):
                                   add_timestamp=True,
                                   is_signed=True,
                                   return_err=True)
-                     for order in tracked_orders]
+                     for order in closed_orders]
             self.logger().debug(f"Polling for order status updates of {len(tasks)} orders.")
             results = await safe_gather(*tasks, return_exceptions=True)
-            for order_update, tracked_order in zip(results, tracked_orders):
+
+            order_updates = list(zip(results, closed_orders)) + [
+                (open_orders[order.client_order_id], order) for order in tracked_orders
+                if order.client_order_id in open_orders
+            ]
+            trading_pairs_with_missed_fills = {
+                tracked_order.trading_pair for order_update, tracked_order in order_updates
+                if isinstance(order_update, dict) and
+                Decimal(order_update.get("executedQty", "0")) > tracked_order.executed_amount_base
+            }
+            if len(trading_pairs_with_missed_fills) > 0:
+                await self._update_order_fills_from_trades(trading_pairs_with_missed_fills)
+
+            for order_update, tracked_order in order_updates:
                 client_order_id = tracked_order.client_order_id
                 if client_order_id not in self._in_flight_orders:
                     continue
                 if isinstance(order_update, Exception):
+                    self.logger().network(f"Error fetching status update for the order {client_order_id}: "
+                                          f"{order_update}.")
+                    continue
+                if "code" in order_update:
                     # NO_SUCH_ORDER code
                     if order_update["code"] == -2013 or order_update["msg"] == "Order does not exist.":
                         self._order_not_found_records[client_order_id] = \
@@ -996,6 +1145,9 @@ class BinancePerpetualDerivative(DerivativeBase):
     async def request(self, path: str, params: Dict[str, Any] = {}, method: MethodType = MethodType.GET,
                       add_timestamp: bool = False, is_signed: bool = False, request_weight: int = 1, return_err: bool = False):
         async with self._throttler.weighted_task(request_weight):
+            now = time.time()
+            self._trim_rest_weight_log(now)
+            self._rest_weight_log.append((now, request_weight))
             try:
                 # TODO: QUESTION --- SHOULD I ADD AN ASYNC TIMEOUT? (aync with timeout(API_CALL_TIMEOUT)
                 # async with aiohttp.ClientSession() as client:
@@ -1013,13 +1165,13 @@ class BinancePerpetualDerivative(DerivativeBase):
                         url=self._base_url + path + "?" + query,
                         headers={"X-MBX-APIKEY": self._api_key}) as response:
                     if response.status != 200:
-                        error_response = await response.json()
+                        error_response = await response.json(loads=json_codec.loads)
                         if return_err:
                             return error_response
                         else:
                             raise IOError(f"Error fetching data from {path}. HTTP status is {response.status}. "
                                           f"Request Error: {error_response}")
-                    return await response.json()
+                    return await response.json(loads=json_codec.loads)
             except Exception as e:
                 self.logger().error(f"Error fetching {path}", exc_info=True)
                 self.logger().warning(f"{e}")
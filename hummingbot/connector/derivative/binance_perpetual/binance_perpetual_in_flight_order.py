@@ -6,6 +6,8 @@ from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 
 
 class BinancePerpetualsInFlightOrder(InFlightOrderBase):
+    __slots__ = ("leverage", "position")
+
     def __init__(self,
                  client_order_id: str,
                  exchange_order_id: str,
@@ -27,7 +29,6 @@ class BinancePerpetualsInFlightOrder(InFlightOrderBase):
             amount,
             initial_state
         )
-        self.trade_id_set = set()
         self.leverage = leverage
         self.position = position
 
@@ -61,16 +62,20 @@ class BinancePerpetualsInFlightOrder(InFlightOrderBase):
         return_val.fee_paid = Decimal(data["fee_paid"])
         return return_val
 
-    def update_with_execution_report(self, execution_report: Dict[str, Any]):
+    def update_with_execution_report(self, execution_report: Dict[str, Any]) -> bool:
+        """
+        Updates the order state, and applies the trade carried by the report unless it was applied already.
+        :return: True if a trade was applied
+        """
         order_report = execution_report.get("o")
+        self.last_state = order_report.get("X")
         trade_id = order_report.get("t")
-        if trade_id in self.trade_id_set:
-            return
-        self.trade_id_set.add(trade_id)
         last_executed_quantity = Decimal(order_report.get("l"))
+        if last_executed_quantity == 0 or trade_id in self.trade_id_set:
+            return False
+        self.add_trade_id(trade_id)
         last_commission_amount = Decimal(order_report.get("n", "0"))
         last_commission_asset = order_report.get("N")
-        last_order_state = order_report.get("X")
         last_executed_price = Decimal(order_report.get("L"))
         executed_amount_quote = last_executed_price * last_executed_quantity
         self.executed_amount_base += last_executed_quantity
@@ -78,13 +83,13 @@ class BinancePerpetualsInFlightOrder(InFlightOrderBase):
         if last_commission_asset is not None:
             self.fee_asset = last_commission_asset
         self.fee_paid += last_commission_amount
-        self.last_state = last_order_state
+        return True
 
     def update_with_trade_updates(self, trade_update: Dict[str, Any]):
         trade_id = trade_update.get("id")
-        if str(trade_update.get("order_id")) != self.exchange_order_id or trade_id in self.trade_id_set:
+        if str(trade_update.get("orderId")) != self.exchange_order_id or trade_id in self.trade_id_set:
             return
-        self.trade_id_set.add(trade_id)
+        self.add_trade_id(trade_id)
         self.executed_amount_base += Decimal(trade_update.get("qty"))
         self.executed_amount_quote += Decimal(trade_update.get("quoteQty"))
         self.fee_paid += Decimal(trade_update.get("commission"))
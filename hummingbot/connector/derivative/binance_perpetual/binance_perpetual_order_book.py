@@ -39,7 +39,8 @@ class BinancePerpetualOrderBook(OrderBook):
             "trading_pair": binance_perpetual_utils.convert_from_exchange_trading_pair(data["s"]),
             "update_id": data["u"],
             "bids": data["b"],
-            "asks": data["a"]
+            "asks": data["a"],
+            "exchange_timestamp": data["E"] * 1e-3
         }, timestamp=timestamp)
 
     @classmethod
@@ -4,7 +4,7 @@ import time
 from typing import Optional, Dict, AsyncIterable
 
 import aiohttp
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets import ConnectionClosed
 
@@ -45,7 +45,7 @@ class BinancePerpetualUserStreamDataSource(UserStreamTrackerDataSource):
                 if response.status != 200:
                     raise IOError(f"Error fetching Binance Perpetual user stream listen key. "
                                   f"HTTP status is {response.status}.")
-                data: Dict[str, str] = await response.json()
+                data: Dict[str, str] = await response.json(loads=json_codec.loads)
                 return data["listenKey"]
 
     async def ping_listen_key(self, listen_key: str) -> bool:
@@ -53,7 +53,7 @@ class BinancePerpetualUserStreamDataSource(UserStreamTrackerDataSource):
             async with client.put(self._http_stream_url,
                                   headers={"X-MBX-APIKEY": self._api_key},
                                   params={"listenKey": listen_key}) as response:
-                data: [str, any] = await response.json()
+                data: [str, any] = await response.json(loads=json_codec.loads)
                 if "code" in data:
                     self.logger().warning(f"Failed to refresh the listen key {listen_key}: {data}")
                     return False
@@ -88,7 +88,7 @@ class BinancePerpetualUserStreamDataSource(UserStreamTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self.ws_messages(ws):
-                        msg_json: Dict[str, any] = ujson.loads(raw_msg)
+                        msg_json: Dict[str, any] = json_codec.loads(raw_msg)
                         output.put_nowait(msg_json)
             except asyncio.CancelledError:
                 raise
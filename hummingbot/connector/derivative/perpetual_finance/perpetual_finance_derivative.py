@@ -93,6 +93,10 @@ class PerpetualFinanceDerivative(DerivativeBase):
     def name(self):
         return "perpetual_finance"
 
+    @property
+    def order_price_is_quote_price(self) -> bool:
+        return True
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
         return [
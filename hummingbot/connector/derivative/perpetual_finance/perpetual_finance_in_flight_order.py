@@ -10,6 +10,8 @@ from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 
 
 class PerpetualFinanceInFlightOrder(InFlightOrderBase):
+    __slots__ = ("leverage", "position")
+
     def __init__(self,
                  client_order_id: str,
                  exchange_order_id: Optional[str],
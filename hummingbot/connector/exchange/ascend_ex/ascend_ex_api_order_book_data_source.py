@@ -3,7 +3,7 @@ import asyncio
 import logging
 import aiohttp
 import websockets
-import ujson
+from hummingbot.core.utils import json_codec
 import time
 import pandas as pd
 
@@ -51,7 +51,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         f"HTTP status is {resp.status}."
                     )
 
-                resp_json = await resp.json()
+                resp_json = await resp.json(loads=json_codec.loads)
                 if resp_json.get("code") != 0:
                     raise IOError(
                         f"Error fetching last traded prices at {EXCHANGE_NAME}. "
@@ -76,7 +76,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 # Do nothing if the request fails -- there will be no autocomplete for kucoin trading pairs
                 return []
 
-            data: Dict[str, Dict[str, Any]] = await resp.json()
+            data: Dict[str, Dict[str, Any]] = await resp.json(loads=json_codec.loads)
             return [convert_from_exchange_trading_pair(item["symbol"]) for item in data["data"]]
 
     @staticmethod
@@ -92,7 +92,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     f"HTTP status is {resp.status}."
                 )
 
-            data: List[Dict[str, Any]] = await safe_gather(resp.json())
+            data: List[Dict[str, Any]] = await safe_gather(resp.json(loads=json_codec.loads))
             item = data[0]
             if item.get("code") != 0:
                 raise IOError(
@@ -129,11 +129,11 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
                 async with websockets.connect(WS_URL) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
-                    await ws.send(ujson.dumps(payload))
+                    await ws.send(json_codec.dumps(payload))
 
                     async for raw_msg in self._inner_messages(ws):
                         try:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_codec.loads(raw_msg)
                             if (msg is None or msg.get("m") != "trades"):
                                 continue
 
@@ -171,11 +171,11 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
                 async with websockets.connect(WS_URL) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
-                    await ws.send(ujson.dumps(payload))
+                    await ws.send(json_codec.dumps(payload))
 
                     async for raw_msg in self._inner_messages(ws):
                         try:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_codec.loads(raw_msg)
                             if (msg is None or msg.get("m") != "depth"):
                                 continue
 
@@ -248,7 +248,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     yield raw_msg
                 except asyncio.TimeoutError:
                     try:
-                        pong_waiter = ws.send(ujson.dumps(PONG_PAYLOAD))
+                        pong_waiter = ws.send(json_codec.dumps(PONG_PAYLOAD))
                         await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
                         self._last_recv_time = time.time()
                     except asyncio.TimeoutError:
@@ -4,7 +4,7 @@ import asyncio
 import logging
 import websockets
 import aiohttp
-import ujson
+from hummingbot.core.utils import json_codec
 
 from typing import Optional, List, AsyncIterable, Any
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -54,7 +54,7 @@ class AscendExAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     **self._ascend_ex_auth.get_headers(),
                     **self._ascend_ex_auth.get_auth_headers("info"),
                 })
-                info = await response.json()
+                info = await response.json(loads=json_codec.loads)
                 accountGroup = info.get("data").get("accountGroup")
                 headers = self._ascend_ex_auth.get_auth_headers("stream")
                 payload = {
@@ -65,11 +65,11 @@ class AscendExAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 async with websockets.connect(f"{get_ws_url_private(accountGroup)}/stream", extra_headers=headers) as ws:
                     try:
                         ws: websockets.WebSocketClientProtocol = ws
-                        await ws.send(ujson.dumps(payload))
+                        await ws.send(json_codec.dumps(payload))
 
                         async for raw_msg in self._inner_messages(ws):
                             try:
-                                msg = ujson.loads(raw_msg)
+                                msg = json_codec.loads(raw_msg)
                                 if msg is None:
                                     continue
 
@@ -107,7 +107,7 @@ class AscendExAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     yield raw_msg
                 except asyncio.TimeoutError:
                     try:
-                        pong_waiter = ws.send(ujson.dumps(PONG_PAYLOAD))
+                        pong_waiter = ws.send(json_codec.dumps(PONG_PAYLOAD))
                         await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
                         self._last_recv_time = time.time()
                     except asyncio.TimeoutError:
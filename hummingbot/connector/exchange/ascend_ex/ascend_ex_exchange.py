@@ -9,6 +9,7 @@ from typing import (
 from decimal import Decimal
 import asyncio
 import json
+from hummingbot.core.utils import json_codec
 import aiohttp
 import time
 from collections import namedtuple
@@ -194,6 +195,7 @@ class AscendExExchange(ExchangeBase):
         It starts tracking order book, polling trading rules,
         updating statuses and tracking user data.
         """
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         await self._update_account_data()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
@@ -325,7 +327,7 @@ class AscendExExchange(ExchangeBase):
         response = await aiohttp.ClientSession().get(url, headers=headers)
 
         try:
-            parsed_response = json.loads(await response.text())
+            parsed_response = json_codec.loads(await response.text())
         except Exception as e:
             raise IOError(f"Error parsing data from {url}. Error: {str(e)}")
         if response.status != 200:
@@ -392,7 +394,7 @@ class AscendExExchange(ExchangeBase):
             raise NotImplementedError
 
         try:
-            parsed_response = json.loads(await response.text())
+            parsed_response = json_codec.loads(await response.text())
         except Exception as e:
             raise IOError(f"Error parsing data from {url}. Error: {str(e)}")
         if response.status != 200:
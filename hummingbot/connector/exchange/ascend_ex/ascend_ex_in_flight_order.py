@@ -4,7 +4,6 @@ from typing import (
     Dict,
     Optional,
 )
-import asyncio
 from hummingbot.core.event.events import (
     OrderType,
     TradeType
@@ -13,6 +12,8 @@ from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 
 
 class AscendExInFlightOrder(InFlightOrderBase):
+    __slots__ = ()
+
     def __init__(self,
                  client_order_id: str,
                  exchange_order_id: Optional[str],
@@ -32,8 +33,6 @@ class AscendExInFlightOrder(InFlightOrderBase):
             amount,
             initial_state,
         )
-        self.trade_id_set = set()
-        self.cancelled_event = asyncio.Event()
 
     @property
     def is_done(self) -> bool:
@@ -12,7 +12,7 @@ from typing import (
 )
 import re
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -97,7 +97,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             response: aiohttp.ClientResponse = response
             if response.status != 200:
                 raise IOError(f"Error fetching token info. HTTP status is {response.status}.")
-            data = await response.json()
+            data = await response.json(loads=json_codec.loads)
             return {d["address"]: d for d in data}
 
     @staticmethod
@@ -111,7 +111,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                           timeout=5) as response:
                         if response.status == 200:
 
-                            markets = await response.json()
+                            markets = await response.json(loads=json_codec.loads)
                             new_trading_pairs = set(map(lambda details: details.get("id"), markets))
                             if len(new_trading_pairs) == 0:
                                 break
@@ -142,7 +142,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Bamboo Relay market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            return await response.json()
+            return await response.json(loads=json_codec.loads)
 
     async def get_trading_pairs(self) -> List[str]:
         return await self.fetch_trading_pairs()
@@ -199,7 +199,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     if not self._motd_done:
                         try:
                             raw_msg = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                            msg = ujson.loads(raw_msg)
+                            msg = json_codec.loads(raw_msg)
                             # Print MOTD and announcements if present
                             if "motd" in msg:
                                 self._motd_done = True
@@ -216,11 +216,11 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             "market": trading_pair,
                             "networkId": self._network_id
                         }
-                        await ws.send(ujson.dumps(request))
+                        await ws.send(json_codec.dumps(request))
                     async for raw_msg in self._inner_messages(ws):
                         # Try here, else any errors cause the websocket to disconnect
                         try:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_codec.loads(raw_msg)
                             # Valid Diff messages from BambooRelay have actions array
                             if "actions" in msg:
                                 diff_msg: BambooRelayOrderBookMessage = BambooRelayOrderBook.diff_message_from_exchange(
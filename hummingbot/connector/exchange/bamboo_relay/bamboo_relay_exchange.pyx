@@ -96,6 +96,7 @@ from hummingbot.connector.exchange.bamboo_relay.bamboo_relay_constants import (
 )
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils import json_codec
 
 brm_logger = None
 s_decimal_0 = Decimal(0)
@@ -952,7 +953,7 @@ cdef class BambooRelayExchange(ExchangeBase):
                     if response.status == 201:
                         return response
                     elif response.status == 200:
-                        response_json = await response.json()
+                        response_json = await response.json(loads=json_codec.loads)
                         return response_json
                     else:
                         raise IOError
@@ -1647,6 +1648,7 @@ cdef class BambooRelayExchange(ExchangeBase):
 
     async def start_network(self):
         self._stop_network()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._status_polling_task = safe_ensure_future(self._status_polling_loop())
         if self._trading_required:
@@ -1,5 +1,5 @@
 #!/usr/bin/env python
-import ujson
+from hummingbot.core.utils import json_codec
 import logging
 from typing import (
     Dict,
@@ -52,7 +52,7 @@ cdef class BambooRelayOrderBook(OrderBook):
 
     @classmethod
     def snapshot_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = record.json if type(record.json)==dict else ujson.loads(record.json)
+        msg = record.json if type(record.json)==dict else json_codec.loads(record.json)
         return BambooRelayOrderBookMessage(OrderBookMessageType.SNAPSHOT, msg, timestamp=record.timestamp * 1e-3)
 
     @classmethod
@@ -4,7 +4,7 @@ import logging
 import aiohttp
 import asyncio
 import json
-import ujson
+from hummingbot.core.utils import json_codec
 from typing import Any, AsyncIterable, Optional, List, Dict
 import pandas as pd
 import websockets
@@ -59,8 +59,8 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(f'Error fetching Beaxy exchange information. '
                               f'HTTP status is {symbols_response.status}.')
 
-            symbols_data = await symbols_response.json()
-            rates_data = await rates_response.json()
+            symbols_data = await symbols_response.json(loads=json_codec.loads)
+            rates_data = await rates_response.json(loads=json_codec.loads)
 
             market_data: List[Dict[str, Any]] = [{'pair': pair, **rates_data[pair], **item}
                                                  for pair in rates_data
@@ -101,7 +101,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(BeaxyConstants.PublicApi.SYMBOLS_URL, timeout=5) as response:
                     if response.status == 200:
-                        all_trading_pairs: List[Dict[str, Any]] = await response.json()
+                        all_trading_pairs: List[Dict[str, Any]] = await response.json(loads=json_codec.loads)
                         return ['{}-{}'.format(*p) for p in
                                 split_market_pairs([i['symbol'] for i in all_trading_pairs])]
         except Exception:  # nopep8
@@ -120,7 +120,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     if response.status != 200:
                         raise IOError(f'Error fetching Beaxy market trade for {trading_pair}. '
                                       f'HTTP status is {response.status}.')
-                    data: Dict[str, Any] = await response.json()
+                    data: Dict[str, Any] = await response.json(loads=json_codec.loads)
                     return trading_pair, float(data['price'])
 
         fetches = [last_price_for_pair(p) for p in trading_pairs]
@@ -149,7 +149,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     'sequenceNumber': 1,
                 }
 
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response.json(loads=json_codec.loads)
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
@@ -270,7 +270,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_codec.loads(raw_msg)
                         trade_msg: OrderBookMessage = BeaxyOrderBook.trade_message_from_exchange(msg)
                         output.put_nowait(trade_msg)
             except asyncio.CancelledError:
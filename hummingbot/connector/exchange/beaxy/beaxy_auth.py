@@ -12,6 +12,7 @@ from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 
 from hummingbot.connector.exchange.beaxy.beaxy_constants import BeaxyConstants
+from hummingbot.core.utils import json_codec
 
 s_logger = None
 
@@ -94,7 +95,7 @@ class BeaxyAuth:
                     response: aiohttp.ClientResponse = response
                     if response.status != 200:
                         raise IOError(f'Error while connecting to login token endpoint. HTTP status is {response.status}.')
-                    data: Dict[str, str] = await response.json()
+                    data: Dict[str, str] = await response.json(loads=json_codec.loads)
 
                     if data['type'] != 'Bearer':
                         raise IOError(f'Error while connecting to login token endpoint. Token type is {data["type"]}.')
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import json
+from hummingbot.core.utils import json_codec
 
 from typing import Any, Dict, List, AsyncIterable, Optional, Tuple
 from datetime import datetime, timedelta
@@ -233,6 +234,7 @@ cdef class BeaxyExchange(ExchangeBase):
         """
         self.logger().debug(f'Starting beaxy network. Trading required is {self._trading_required}')
         self._stop_network()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self.logger().debug('OrderBookTracker started, starting polling tasks.')
         if self._trading_required:
@@ -1050,7 +1052,7 @@ cdef class BeaxyExchange(ExchangeBase):
             async with client.request(http_method.upper(), url=url, timeout=self.API_CALL_TIMEOUT, data=data_str, headers=headers) as response:
                 result = None
                 try:
-                    result = await response.json()
+                    result = await response.json(loads=json_codec.loads)
                 except ContentTypeError:
                     pass
 
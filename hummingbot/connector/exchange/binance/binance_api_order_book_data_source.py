@@ -14,7 +14,7 @@ from typing import (
 from decimal import Decimal
 import re
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 from hummingbot.core.utils import async_ttl_cache
@@ -32,6 +32,8 @@ SNAPSHOT_REST_URL = "https://api.binance.{}/api/v1/depth"
 DIFF_STREAM_URL = "wss://stream.binance.{}:9443/ws"
 TICKER_PRICE_CHANGE_URL = "https://api.binance.{}/api/v1/ticker/24hr"
 EXCHANGE_INFO_URL = "https://api.binance.{}/api/v1/exchangeInfo"
+# Price levels of depth snapshots (bids, asks) and diffs (b, a) are decoded to floats once, on receipt.
+DEPTH_NUMERIC_SCHEMA = json_codec.NumericSchema(["bids", "asks", "b", "a"])
 
 
 class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -63,7 +65,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         async with aiohttp.ClientSession() as client:
             url = TICKER_PRICE_CHANGE_URL.format(domain)
             resp = await client.get(f"{url}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
-            resp_json = await resp.json()
+            resp_json = await resp.json(loads=json_codec.loads)
             return float(resp_json["lastPrice"])
 
     @staticmethod
@@ -73,7 +75,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         async with aiohttp.ClientSession() as client:
             url = "https://api.binance.{}/api/v3/ticker/bookTicker".format(domain)
             resp = await client.get(url)
-            resp_json = await resp.json()
+            resp_json = await resp.json(loads=json_codec.loads)
             ret_val = {}
             for record in resp_json:
                 pair = convert_from_exchange_trading_pair(record["symbol"])
@@ -88,7 +90,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 url = EXCHANGE_INFO_URL.format(domain)
                 async with client.get(url, timeout=10) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=json_codec.loads)
                         raw_trading_pairs = [d["symbol"] for d in data["symbols"] if d["status"] == "TRADING"]
                         trading_pair_list: List[str] = []
                         for raw_trading_pair in raw_trading_pairs:
@@ -115,7 +117,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response.json(loads=json_codec.loads_with(DEPTH_NUMERIC_SCHEMA))
 
             # Need to add the symbol into the snapshot message for the Kafka message queue.
             # Because otherwise, there'd be no way for the receiver to know which market the
@@ -169,7 +171,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_codec.loads(raw_msg)
                         trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg)
                         output.put_nowait(trade_msg)
             except asyncio.CancelledError:
@@ -190,7 +192,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_codec.loads(raw_msg, DEPTH_NUMERIC_SCHEMA)
                         order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
                             msg, time.time())
                         output.put_nowait(order_book_message)
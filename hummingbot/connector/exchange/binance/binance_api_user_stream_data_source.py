@@ -9,7 +9,7 @@ from typing import (
     Dict,
     Optional
 )
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -54,7 +54,7 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 response: aiohttp.ClientResponse = response
                 if response.status != 200:
                     raise IOError(f"Error fetching user stream listen key. HTTP status is {response.status}.")
-                data: Dict[str, str] = await response.json()
+                data: Dict[str, str] = await response.json(loads=json_codec.loads)
                 return data["listenKey"]
 
     async def ping_listen_key(self, listen_key: str) -> bool:
@@ -63,7 +63,7 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
             async with client.put(f"{url}{BINANCE_USER_STREAM_ENDPOINT}",
                                   headers={"X-MBX-APIKEY": self._binance_client.API_KEY},
                                   params={"listenKey": listen_key}) as response:
-                data: [str, any] = await response.json()
+                data: [str, any] = await response.json(loads=json_codec.loads)
                 if "code" in data:
                     self.logger().warning(f"Failed to refresh the listen key {listen_key}: {data}")
                     return False
@@ -144,7 +144,7 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
         while True:
             try:
                 async for message in self.messages():
-                    decoded: Dict[str, any] = ujson.loads(message)
+                    decoded: Dict[str, any] = json_codec.loads(message)
                     output.put_nowait(decoded)
             except asyncio.CancelledError:
                 raise
@@ -59,6 +59,10 @@ from hummingbot.core.data_type.transaction_tracker import TransactionTracker
 from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.warm_start_cache import (
+    TRADING_RULES_CACHE_NAMESPACE,
+    WarmStartCache,
+)
 from .binance_order_book_tracker import BinanceOrderBookTracker
 from .binance_user_stream_tracker import BinanceUserStreamTracker
 from .binance_time import BinanceTime
@@ -68,6 +72,7 @@ from .binance_utils import (
     convert_to_exchange_trading_pair)
 from hummingbot.core.data_type.common import OpenOrder
 from hummingbot.core.data_type.trade import Trade
+from hummingbot.core.utils import json_codec
 s_logger = None
 s_decimal_0 = Decimal(0)
 s_decimal_NaN = Decimal("nan")
@@ -110,6 +115,7 @@ cdef class BinanceExchange(ExchangeBase):
     API_CALL_TIMEOUT = 10.0
     SHORT_POLL_INTERVAL = 5.0
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
+    TRADING_RULES_CACHE_INTERVAL = 60.0 * 60.0
     LONG_POLL_INTERVAL = 120.0
     BINANCE_TRADE_TOPIC_NAME = "binance-trade.serialized"
     BINANCE_USER_STREAM_TOPIC_NAME = "binance-user-stream.serialized"
@@ -246,7 +252,7 @@ cdef class BinanceExchange(ExchangeBase):
                 async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
                     if response.status != 200:
                         raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
-                    data = await response.json()
+                    data = await response.json(loads=json_codec.loads)
                     return data
 
     async def _update_balances(self):
@@ -323,12 +329,23 @@ cdef class BinanceExchange(ExchangeBase):
         cdef:
             int64_t last_tick = <int64_t>(self._last_timestamp / 60.0)
             int64_t current_tick = <int64_t>(self._current_timestamp / 60.0)
-        if current_tick > last_tick or len(self._trading_rules) < 1:
+            bint initial_update = len(self._trading_rules) < 1
+        if initial_update:
+            cached_exchange_info = WarmStartCache.get_instance().get(TRADING_RULES_CACHE_NAMESPACE, self.name)
+            if cached_exchange_info is not None:
+                # Ready with the trading rules of the last run right away, the request below refreshes them.
+                self._set_trading_rules(cached_exchange_info.value)
+        if current_tick > last_tick or initial_update:
             exchange_info = await self.query_api(self._binance_client.get_exchange_info)
-            trading_rules_list = self._format_trading_rules(exchange_info)
-            self._trading_rules.clear()
-            for trading_rule in trading_rules_list:
-                self._trading_rules[convert_from_exchange_trading_pair(trading_rule.trading_pair)] = trading_rule
+            self._set_trading_rules(exchange_info)
+            WarmStartCache.get_instance().set(TRADING_RULES_CACHE_NAMESPACE, self.name, exchange_info,
+                                              min_interval=self.TRADING_RULES_CACHE_INTERVAL)
+
+    def _set_trading_rules(self, exchange_info: Dict[str, Any]):
+        trading_rules_list = self._format_trading_rules(exchange_info)
+        self._trading_rules.clear()
+        for trading_rule in trading_rules_list:
+            self._trading_rules[convert_from_exchange_trading_pair(trading_rule.trading_pair)] = trading_rule
 
     def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         """
@@ -775,6 +792,7 @@ cdef class BinanceExchange(ExchangeBase):
         self._async_scheduler.stop()
 
     async def start_network(self):
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         if self._trading_required:
@@ -33,7 +33,6 @@ cdef class BinanceInFlightOrder(InFlightOrderBase):
             amount,
             initial_state
         )
-        self.trade_id_set = set()
 
     @property
     def is_done(self) -> bool:
@@ -71,7 +70,7 @@ cdef class BinanceInFlightOrder(InFlightOrderBase):
         if trade_id in self.trade_id_set:
             # trade already recorded
             return False
-        self.trade_id_set.add(trade_id)
+        self.add_trade_id(trade_id)
         last_executed_quantity = Decimal(execution_report["l"])
         last_commission_amount = Decimal(execution_report["n"])
         last_commission_asset = execution_report["N"]
@@ -92,7 +91,7 @@ cdef class BinanceInFlightOrder(InFlightOrderBase):
         if str(trade_update["orderId"]) != self.exchange_order_id or trade_id in self.trade_id_set:
             # trade already recorded
             return
-        self.trade_id_set.add(trade_id)
+        self.add_trade_id(trade_id)
         self.executed_amount_base += Decimal(trade_update["qty"])
         self.fee_paid += Decimal(trade_update["commission"])
         self.executed_amount_quote += Decimal(trade_update["quoteQty"])
@@ -4,7 +4,7 @@ from typing import (
     Dict,
     Optional
 )
-import ujson
+from hummingbot.core.utils import json_codec
 
 from aiokafka import ConsumerRecord
 from sqlalchemy.engine import RowProxy
@@ -55,12 +55,13 @@ cdef class BinanceOrderBook(OrderBook):
             "first_update_id": msg["U"],
             "update_id": msg["u"],
             "bids": msg["b"],
-            "asks": msg["a"]
+            "asks": msg["a"],
+            "exchange_timestamp": msg["E"] * 1e-3
         }, timestamp=timestamp)
 
     @classmethod
     def snapshot_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = record["json"] if type(record["json"])==dict else ujson.loads(record["json"])
+        msg = record["json"] if type(record["json"])==dict else json_codec.loads(record["json"])
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
@@ -72,7 +73,7 @@ cdef class BinanceOrderBook(OrderBook):
 
     @classmethod
     def diff_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = ujson.loads(record["json"])  # Binance json in DB is TEXT
+        msg = json_codec.loads(record["json"])  # Binance json in DB is TEXT
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.DIFF, {
@@ -85,7 +86,7 @@ cdef class BinanceOrderBook(OrderBook):
 
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = ujson.loads(record.value.decode("utf-8"))
+        msg = json_codec.loads(record.value.decode("utf-8"))
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
@@ -97,7 +98,7 @@ cdef class BinanceOrderBook(OrderBook):
 
     @classmethod
     def diff_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = ujson.loads(record.value.decode("utf-8"))
+        msg = json_codec.loads(record.value.decode("utf-8"))
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.DIFF, {
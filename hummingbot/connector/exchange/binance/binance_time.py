@@ -8,6 +8,7 @@ from typing import Dict, Deque, Optional
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils import json_codec
 
 
 class BinanceTime:
@@ -101,7 +102,7 @@ class BinanceTime:
             local_before_ms: float = time.perf_counter() * 1e3
             async with aiohttp.ClientSession() as session:
                 async with session.get(self.BINANCE_TIME_API) as resp:
-                    resp_data: Dict[str, float] = await resp.json()
+                    resp_data: Dict[str, float] = await resp.json(loads=json_codec.loads)
                     binance_server_time_ms: float = float(resp_data["serverTime"])
                     local_after_ms: float = time.perf_counter() * 1e3
             local_server_time_pre_image_ms: float = (local_before_ms + local_after_ms) / 2.0
@@ -4,7 +4,7 @@ import logging
 import time
 import aiohttp
 import asyncio
-import ujson
+from hummingbot.core.utils import json_codec
 import pandas as pd
 from typing import (
     Any,
@@ -94,7 +94,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get("https://api-pub.bitfinex.com/v2/conf/pub:list:pair:exchange", timeout=10) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=json_codec.loads)
                         trading_pair_list: List[str] = []
                         for trading_pair in data[0]:
                             # change the following line accordingly
@@ -182,7 +182,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         }
 
     def _prepare_trade(self, raw_response: str) -> Optional[Dict[str, Any]]:
-        *_, content = ujson.loads(raw_response)
+        *_, content = json_codec.loads(raw_response)
         if content == ContentEventType.HEART_BEAT:
             return None
         try:
@@ -246,7 +246,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Returns OrderBookMessage
         """
 
-        *_, content = ujson.loads(raw_response)
+        *_, content = json_codec.loads(raw_response)
 
         if isinstance(content, list) and len(content) == 3:
             price = content[0]
@@ -283,9 +283,9 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(f"Error fetching Bitfinex symbol details. "
                               f"HTTP status is {symbol_details_response.status}.")
 
-            tickers_raw: List[Any] = await tickers_response.json()
-            exchange_confs_raw: List[Any] = await exchange_conf_response.json()
-            symbol_details_raw: List[Any] = await symbol_details_response.json()
+            tickers_raw: List[Any] = await tickers_response.json(loads=json_codec.loads)
+            exchange_confs_raw: List[Any] = await exchange_conf_response.json(loads=json_codec.loads)
+            symbol_details_raw: List[Any] = await symbol_details_response.json(loads=json_codec.loads)
 
             def itemToTicker(item: Any) -> Ticker:
                 try:
@@ -360,7 +360,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             # https://api-pub.bitfinex.com/v2/ticker/tBTCUSD
             ticker_url: str = join_paths(BITFINEX_REST_URL, f"ticker/{convert_to_exchange_trading_pair(trading_pair)}")
             resp = await client.get(ticker_url)
-            resp_json = await resp.json()
+            resp_json = await resp.json(loads=json_codec.loads)
             ticker = Ticker(*resp_json)
             return float(ticker.last_price)
 
@@ -402,7 +402,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(f"Error fetching Bitfinex market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
 
-            raw_data: Dict[str, Any] = await response.json()
+            raw_data: Dict[str, Any] = await response.json(loads=json_codec.loads)
             return self._prepare_snapshot(trading_pair, [BookStructure(*i) for i in raw_data])
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
@@ -479,7 +479,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             "channel": "trades",
                             "symbol": convert_to_exchange_trading_pair(trading_pair),
                         }
-                        await ws.send(ujson.dumps(payload))
+                        await ws.send(json_codec.dumps(payload))
                         await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)  # response
                         await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)  # subscribe info
                         await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)  # snapshot
@@ -519,11 +519,11 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             "prec": "P0",
                             "symbol": convert_to_exchange_trading_pair(trading_pair),
                         }
-                        await ws.send(ujson.dumps(payload))
+                        await ws.send(json_codec.dumps(payload))
                         await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)  # response
                         await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)  # subscribe info
                         raw_snapshot = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)  # snapshot
-                        snapshot = self._prepare_snapshot(trading_pair, [BookStructure(*i) for i in ujson.loads(raw_snapshot)[1]])
+                        snapshot = self._prepare_snapshot(trading_pair, [BookStructure(*i) for i in json_codec.loads(raw_snapshot)[1]])
                         snapshot_timestamp: float = time.time()
                         snapshot_msg: OrderBookMessage = BitfinexOrderBook.snapshot_message_from_exchange(
                             snapshot,
@@ -1,6 +1,7 @@
 import asyncio
 import collections
 import json
+from hummingbot.core.utils import json_codec
 import logging
 import math
 import time
@@ -314,6 +315,7 @@ cdef class BitfinexExchange(ExchangeBase):
         Async function used by NetworkBase class to handle when a single market goes online
         """
         # when exchange is online start streams
+        self._order_book_tracker.connector_name = self.name
         self._order_tracker_task = self._order_book_tracker.start()
         if self._trading_required:
             self._ws_task = safe_ensure_future(self._ws_message_listener())
@@ -491,7 +493,7 @@ cdef class BitfinexExchange(ExchangeBase):
             async with client.request(http_method,
                                       url=url, timeout=self.API_CALL_TIMEOUT, json=data_str,
                                       headers=headers) as response:
-                data = await response.json()
+                data = await response.json(loads=json_codec.loads)
 
                 if response.status != 200:
                     raise IOError(
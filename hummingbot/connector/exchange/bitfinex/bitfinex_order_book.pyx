@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 
 import pandas as pd
 from sqlalchemy.engine import RowProxy
-import ujson
+from hummingbot.core.utils import json_codec
 
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book_message import (
@@ -61,7 +61,7 @@ cdef class BitfinexOrderBook(OrderBook):
     def snapshot_message_from_db(cls,
                                  record: RowProxy,
                                  metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = record.json if type(record.json)==dict else ujson.loads(record.json)
+        msg = record.json if type(record.json)==dict else json_codec.loads(record.json)
         return BitfinexOrderBookMessage(
             message_type=OrderBookMessageType.SNAPSHOT,
             content=msg,
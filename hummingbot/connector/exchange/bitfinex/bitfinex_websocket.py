@@ -2,7 +2,7 @@
 import asyncio
 import logging
 import websockets
-import ujson
+from hummingbot.core.utils import json_codec
 import uuid
 
 from typing import Optional, AsyncIterable, Any
@@ -58,7 +58,7 @@ class BitfinexWebsocket():
             while True:
                 try:
                     msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    msg = ujson.loads(msg_str)
+                    msg = json_codec.loads(msg_str)
                     # print("received", msg)
 
                     for queue in self._consumers.values():
@@ -137,7 +137,7 @@ class BitfinexWebsocket():
             await self.connect()
 
         # print("send", data)
-        await self._client.send(ujson.dumps(data))
+        await self._client.send(json_codec.dumps(data))
 
     # authenticate: authenticate session
     async def authenticate(self):
@@ -9,7 +9,7 @@ from zlib import decompress, MAX_WBITS
 
 import pandas as pd
 import signalr_aio
-import ujson
+from hummingbot.core.utils import json_codec
 from signalr_aio import Connection
 from signalr_aio.hubs import Hub
 from async_timeout import timeout
@@ -58,7 +58,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         results = dict()
         async with aiohttp.ClientSession() as client:
             resp = await client.get(f"{BITTREX_REST_URL}{BITTREX_TICKER_PATH}")
-            resp_json = await resp.json()
+            resp_json = await resp.json(loads=json_codec.loads)
             for trading_pair in trading_pairs:
                 resp_record = [o for o in resp_json if o["symbol"] == trading_pair][0]
                 results[trading_pair] = float(resp_record["lastTradeRate"])
@@ -103,7 +103,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(f"{BITTREX_REST_URL}{BITTREX_EXCHANGE_INFO_PATH}", timeout=5) as response:
                     if response.status == 200:
-                        all_trading_pairs: List[Dict[str, Any]] = await response.json()
+                        all_trading_pairs: List[Dict[str, Any]] = await response.json(loads=json_codec.loads)
                         return [item["symbol"]
                                 for item in all_trading_pairs
                                 if item["status"] == "ONLINE"]
@@ -121,7 +121,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Bittrex market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response.json(loads=json_codec.loads)
             data["sequence"] = response.headers["sequence"]
             return data
 
@@ -193,7 +193,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             except Exception:
                 return {}
 
-            return ujson.loads(decoded_msg.decode())
+            return json_codec.loads(decoded_msg.decode())
 
         def _is_market_delta(msg) -> bool:
             return len(msg.get("M", [])) > 0 and type(msg["M"][0]) == dict and msg["M"][0].get("M", None) == "orderBook"
@@ -202,7 +202,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return len(msg.get("M", [])) > 0 and type(msg["M"][0]) == dict and msg["M"][0].get("M", None) == "trade"
 
         output: Dict[str, Any] = {"nonce": None, "type": None, "results": {}}
-        msg: Dict[str, Any] = ujson.loads(msg)
+        msg: Dict[str, Any] = json_codec.loads(msg)
         if len(msg.get("M", [])) > 0:
             output["results"] = _decode_message(msg["M"][0]["A"][0])
             output["nonce"] = time.time() * 1000
@@ -11,7 +11,7 @@ from typing import AsyncIterable, Dict, Optional, List, Any
 from zlib import decompress, MAX_WBITS
 
 import signalr_aio
-import ujson
+from hummingbot.core.utils import json_codec
 from async_timeout import timeout
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.connector.exchange.bittrex.bittrex_auth import BittrexAuth
@@ -79,7 +79,7 @@ class BittrexAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 self.logger().error("Error decoding message", exc_info=True)
                 return {"error": "Error decoding message"}
 
-            return ujson.loads(decode_msg.decode(), precise_float=True)
+            return json_codec.loads(decode_msg.decode(), precise_float=True)
 
         def _is_heartbeat(msg):
             return len(msg.get("M", [])) > 0 and type(msg["M"][0]) == dict and msg["M"][0].get("M", None) == "heartbeat"
@@ -94,7 +94,7 @@ class BittrexAPIUserStreamDataSource(UserStreamTrackerDataSource):
             return len(msg.get("M", [])) > 0 and type(msg["M"][0]) == dict and msg["M"][0].get("M", None) == "balance"
 
         output: Dict[str, Any] = {"event_type": None, "content": None, "error": None}
-        msg: Dict[str, Any] = ujson.loads(msg)
+        msg: Dict[str, Any] = json_codec.loads(msg)
 
         if _is_auth_notification(msg):
             output["event_type"] = "re-authenticate"
@@ -4,7 +4,7 @@ import hashlib
 import urllib
 from typing import Dict, Any, Tuple
 
-import ujson
+from hummingbot.core.utils import json_codec
 
 
 class BittrexAuth:
@@ -40,7 +40,7 @@ class BittrexAuth:
         def construct_content_hash(body: Dict[str, any] = {}) -> Tuple[str, bytes]:
             json_byte: bytes = "".encode()
             if body:
-                json_byte = ujson.dumps(body).encode()
+                json_byte = json_codec.dumps(body).encode()
                 return hashlib.sha512(json_byte).hexdigest(), json_byte
             return hashlib.sha512(json_byte).hexdigest(), json_byte
 
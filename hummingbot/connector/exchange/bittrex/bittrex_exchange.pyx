@@ -33,6 +33,7 @@ from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.utils import json_codec
 
 bm_logger = None
 s_decimal_0 = Decimal(0)
@@ -997,7 +998,7 @@ cdef class BittrexExchange(ExchangeBase):
                                   params=params,
                                   data=body,
                                   timeout=self.API_CALL_TIMEOUT) as response:
-            data = await response.json()
+            data = await response.json(loads=json_codec.loads)
             if response.status not in [200, 201]:  # HTTP Response code of 20X generally means it is successful
                 raise IOError(f"Error fetching response from {http_method}-{url}. HTTP Status Code {response.status}: "
                               f"{data}")
@@ -1028,6 +1029,7 @@ cdef class BittrexExchange(ExchangeBase):
 
     async def start_network(self):
         self._stop_network()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         if self._trading_required:
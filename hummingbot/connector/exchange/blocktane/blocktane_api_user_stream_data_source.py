@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from typing import (
     AsyncIterable,
@@ -46,7 +46,7 @@ class BlocktaneAPIUserStreamDataSource(UserStreamTrackerDataSource):
             try:
                 ws = await self.get_ws_connection()
                 async for message in self._inner_messages(ws):
-                    decoded: Dict[str, any] = ujson.loads(message)
+                    decoded: Dict[str, any] = json_codec.loads(message)
                     output.put_nowait(decoded)
             except asyncio.CancelledError:
                 raise
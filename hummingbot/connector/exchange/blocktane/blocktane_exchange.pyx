@@ -1034,6 +1034,7 @@ cdef class BlocktaneExchange(ExchangeBase):
 
     async def start_network(self):
         self._stop_network()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         if self._trading_required:
@@ -40,7 +40,7 @@ cdef class BlocktaneInFlightOrder(InFlightOrderBase):
         self.created_at = created_at
 
     def to_json(self) -> Dict[str, Any]:
-        response = super().to_json()
+        response = dict(super().to_json())
         response["created_at"] = self.created_at
         return response
 
@@ -4,7 +4,7 @@ from typing import (
     Dict,
     Optional
 )
-import ujson
+from hummingbot.core.utils import json_codec
 
 from aiokafka import ConsumerRecord
 from sqlalchemy.engine import RowProxy
@@ -69,7 +69,7 @@ cdef class BlocktaneOrderBook(OrderBook):
 
     @classmethod
     def snapshot_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = record["json"] if type(record["json"])==dict else ujson.loads(record["json"])
+        msg = record["json"] if type(record["json"])==dict else json_codec.loads(record["json"])
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
@@ -81,7 +81,7 @@ cdef class BlocktaneOrderBook(OrderBook):
 
     @classmethod
     def diff_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = ujson.loads(record["json"])
+        msg = json_codec.loads(record["json"])
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.DIFF, {
@@ -93,7 +93,7 @@ cdef class BlocktaneOrderBook(OrderBook):
 
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = ujson.loads(record.value.decode("utf-8"))
+        msg = json_codec.loads(record.value.decode("utf-8"))
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
@@ -105,7 +105,7 @@ cdef class BlocktaneOrderBook(OrderBook):
 
     @classmethod
     def diff_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = ujson.loads(record.value.decode("utf-8"))
+        msg = json_codec.loads(record.value.decode("utf-8"))
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.DIFF, {
@@ -12,7 +12,7 @@ from typing import (
     Optional,
 )
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 from hummingbot.core.data_type.order_book import OrderBook
@@ -58,7 +58,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
         async with aiohttp.ClientSession() as client:
             ticker_url: str = f"{COINBASE_REST_URL}/products/{trading_pair}/ticker"
             resp = await client.get(ticker_url)
-            resp_json = await resp.json()
+            resp_json = await resp.json(loads=json_codec.loads)
             return float(resp_json["price"])
 
     @staticmethod
@@ -67,7 +67,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(f"{COINBASE_REST_URL}/products/", timeout=5) as response:
                     if response.status == 200:
-                        markets = await response.json()
+                        markets = await response.json(loads=json_codec.loads)
                         raw_trading_pairs: List[str] = list(map(lambda details: details.get('id'), markets))
                         trading_pair_list: List[str] = []
                         for raw_trading_pair in raw_trading_pairs:
@@ -92,7 +92,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Coinbase Pro market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response.json(loads=json_codec.loads)
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
@@ -204,9 +204,9 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         "product_ids": trading_pairs,
                         "channels": ["full"]
                     }
-                    await ws.send(ujson.dumps(subscribe_request))
+                    await ws.send(json_codec.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_codec.loads(raw_msg)
                         msg_type: str = msg.get("type", None)
                         if msg_type is None:
                             raise ValueError(f"Coinbase Pro Websocket message does not contain a type - {msg}")
@@ -9,7 +9,7 @@ from typing import (
     Optional,
     List,
 )
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -77,9 +77,9 @@ class CoinbaseProAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     }
                     auth_dict: Dict[str] = self._coinbase_pro_auth.generate_auth_dict("get", "/users/self/verify", "")
                     subscribe_request.update(auth_dict)
-                    await ws.send(ujson.dumps(subscribe_request))
+                    await ws.send(json_codec.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_codec.loads(raw_msg)
                         msg_type: str = msg.get("type", None)
                         if msg_type is None:
                             raise ValueError(f"Coinbase Pro Websocket message does not contain a type - {msg}")
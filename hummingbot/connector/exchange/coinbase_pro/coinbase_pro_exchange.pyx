@@ -3,6 +3,7 @@ import asyncio
 from async_timeout import timeout
 from decimal import Decimal
 import json
+from hummingbot.core.utils import json_codec
 import logging
 import pandas as pd
 from typing import (
@@ -230,6 +231,7 @@ cdef class CoinbaseProExchange(ExchangeBase):
         Async function used by NetworkBase class to handle when a single market goes online
         """
         self._stop_network()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         if self._trading_required:
             self._status_polling_task = safe_ensure_future(self._status_polling_loop())
@@ -313,7 +315,7 @@ cdef class CoinbaseProExchange(ExchangeBase):
         client = await self._http_client()
         async with client.request(http_method,
                                   url=url, timeout=self.API_CALL_TIMEOUT, data=data_str, headers=headers) as response:
-            data = await response.json()
+            data = await response.json(loads=json_codec.loads)
             if response.status != 200:
                 raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}. {data}")
             return data
@@ -1,5 +1,5 @@
 #!/usr/bin/env python
-import ujson
+from hummingbot.core.utils import json_codec
 import logging
 from typing import (
     Dict,
@@ -78,7 +78,7 @@ cdef class CoinbaseProOrderBook(OrderBook):
         :param record: a row of snapshot data from the database
         :return: CoinbaseProOrderBookMessage
         """
-        msg = record.json if type(record.json)==dict else ujson.loads(record.json)
+        msg = record.json if type(record.json)==dict else json_codec.loads(record.json)
         return CoinbaseProOrderBookMessage(
             message_type=OrderBookMessageType.SNAPSHOT,
             content=msg,
@@ -11,7 +11,7 @@ import asyncio
 import aiohttp
 import math
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 from async_timeout import timeout
 
 from hummingbot.core.network_iterator import NetworkStatus
@@ -195,6 +195,7 @@ class CoinzoomExchange(ExchangeBase):
         It starts tracking order book, polling trading rules,
         updating statuses and tracking user data.
         """
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         if self._trading_required:
@@ -324,7 +325,7 @@ class CoinzoomExchange(ExchangeBase):
             shared_client = await self._http_client()
             # Turn `params` into either GET params or POST body data
             qs_params: dict = params if method.upper() == "GET" else None
-            req_params = ujson.dumps(params) if method.upper() == "POST" and params is not None else None
+            req_params = json_codec.dumps(params) if method.upper() == "POST" and params is not None else None
             # Generate auth headers if needed.
             headers: dict = {"Content-Type": "application/json", "User-Agent": "hummingbot"}
             if is_auth_required:
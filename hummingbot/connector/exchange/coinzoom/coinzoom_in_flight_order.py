@@ -4,7 +4,6 @@ from typing import (
     Dict,
     Optional,
 )
-import asyncio
 from hummingbot.core.event.events import (
     OrderType,
     TradeType
@@ -15,6 +14,8 @@ s_decimal_0 = Decimal(0)
 
 
 class CoinzoomInFlightOrder(InFlightOrderBase):
+    __slots__ = ()
+
     def __init__(self,
                  client_order_id: str,
                  exchange_order_id: Optional[str],
@@ -34,8 +35,6 @@ class CoinzoomInFlightOrder(InFlightOrderBase):
             amount,
             initial_state,
         )
-        self.trade_id_set = set()
-        self.cancelled_event = asyncio.Event()
 
     @property
     def is_done(self) -> bool:
@@ -133,7 +132,7 @@ class CoinzoomInFlightOrder(InFlightOrderBase):
             for trade in trades:
                 trade_id = str(trade["timestamp"])
                 if trade_id not in self.trade_id_set:
-                    self.trade_id_set.add(trade_id)
+                    self.add_trade_id(trade_id)
                     order_update["exchange_trade_id"] = trade.get("id")
                     # Add executed amounts
                     executed_price = Decimal(str(trade.get("lastPrice", "0")))
@@ -149,7 +148,7 @@ class CoinzoomInFlightOrder(InFlightOrderBase):
             if trade_id in self.trade_id_set:
                 # trade already recorded
                 return False
-            self.trade_id_set.add(trade_id)
+            self.add_trade_id(trade_id)
             # Set executed amounts
             executed_price = Decimal(str(order_update.get("averagePrice", order_update.get("price", "0"))))
             self.executed_amount_base = Decimal(str(order_update["cumulativeQuantity"]))
@@ -11,6 +11,7 @@ from typing import (
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.config_methods import using_exchange
+from hummingbot.core.utils import json_codec
 from .coinzoom_constants import Constants
 
 
@@ -79,7 +80,7 @@ async def aiohttp_response_with_errors(request_coroutine):
         async with request_coroutine as response:
             http_status = response.status
             try:
-                parsed_response = await response.json()
+                parsed_response = await response.json(loads=json_codec.loads)
             except Exception:
                 if response.status not in [204]:
                     request_errors = True
@@ -9,6 +9,7 @@ from typing import (
 from decimal import Decimal
 import asyncio
 import json
+from hummingbot.core.utils import json_codec
 import aiohttp
 import math
 import time
@@ -184,6 +185,7 @@ class CryptoComExchange(ExchangeBase):
         It starts tracking order book, polling trading rules,
         updating statuses and tracking user data.
         """
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         if self._trading_required:
@@ -335,7 +337,7 @@ class CryptoComExchange(ExchangeBase):
             raise NotImplementedError
 
         try:
-            parsed_response = json.loads(await response.text())
+            parsed_response = json_codec.loads(await response.text())
         except Exception as e:
             raise IOError(f"Error parsing data from {url}. Error: {str(e)}")
         if response.status != 200:
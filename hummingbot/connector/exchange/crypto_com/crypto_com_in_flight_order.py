@@ -4,7 +4,6 @@ from typing import (
     Dict,
     Optional,
 )
-import asyncio
 from hummingbot.core.event.events import (
     OrderType,
     TradeType
@@ -13,6 +12,8 @@ from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 
 
 class CryptoComInFlightOrder(InFlightOrderBase):
+    __slots__ = ()
+
     def __init__(self,
                  client_order_id: str,
                  exchange_order_id: Optional[str],
@@ -32,8 +33,6 @@ class CryptoComInFlightOrder(InFlightOrderBase):
             amount,
             initial_state,
         )
-        self.trade_id_set = set()
-        self.cancelled_event = asyncio.Event()
 
     @property
     def is_done(self) -> bool:
@@ -89,7 +88,7 @@ class CryptoComInFlightOrder(InFlightOrderBase):
         if str(trade_update["order_id"]) != self.exchange_order_id or trade_id in self.trade_id_set:
             # trade already recorded
             return False
-        self.trade_id_set.add(trade_id)
+        self.add_trade_id(trade_id)
         self.executed_amount_base += Decimal(str(trade_update["traded_quantity"]))
         self.fee_paid += Decimal(str(trade_update["fee"]))
         self.executed_amount_quote += (Decimal(str(trade_update["traded_price"])) *
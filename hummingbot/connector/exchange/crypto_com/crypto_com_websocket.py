@@ -3,7 +3,7 @@ import asyncio
 import copy
 import logging
 import websockets
-import ujson
+from hummingbot.core.utils import json_codec
 import hummingbot.connector.exchange.crypto_com.crypto_com_constants as constants
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
@@ -64,10 +64,10 @@ class CryptoComWebsocket(RequestId):
             while True:
                 try:
                     raw_msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    raw_msg = ujson.loads(raw_msg_str)
+                    raw_msg = json_codec.loads(raw_msg_str)
                     if "method" in raw_msg and raw_msg["method"] == "public/heartbeat":
                         payload = {"id": raw_msg["id"], "method": "public/respond-heartbeat"}
-                        safe_ensure_future(self._client.send(ujson.dumps(payload)))
+                        safe_ensure_future(self._client.send(json_codec.dumps(payload)))
                     yield raw_msg
                 except asyncio.TimeoutError:
                     await asyncio.wait_for(self._client.ping(), timeout=self.PING_TIMEOUT)
@@ -102,7 +102,7 @@ class CryptoComWebsocket(RequestId):
             payload["sig"] = auth["sig"]
             payload["api_key"] = auth["api_key"]
 
-        await self._client.send(ujson.dumps(payload))
+        await self._client.send(json_codec.dumps(payload))
 
         return id
 
@@ -7,6 +7,7 @@ from typing import List, Dict, Any
 # from hummingbot.connector.exchange.digifinex.digifinex_utils import get_ms_timestamp
 from hummingbot.connector.exchange.digifinex import digifinex_constants as Constants
 from hummingbot.connector.exchange.digifinex.time_patcher import TimePatcher
+from hummingbot.core.utils import json_codec
 # import time
 
 _time_patcher: TimePatcher = None
@@ -35,7 +36,7 @@ class DigifinexAuth():
     async def query_time_func() -> float:
         async with aiohttp.ClientSession() as session:
             async with session.get(Constants.REST_URL + '/time') as resp:
-                resp_data: Dict[str, float] = await resp.json()
+                resp_data: Dict[str, float] = await resp.json(loads=json_codec.loads)
                 return float(resp_data["server_time"])
 
     def get_private_headers(
@@ -5,7 +5,6 @@ from typing import (
     Optional,
     Tuple,
 )
-import asyncio
 from hummingbot.core.event.events import (
     OrderType,
     TradeType
@@ -14,6 +13,8 @@ from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 
 
 class DigifinexInFlightOrder(InFlightOrderBase):
+    __slots__ = ()
+
     def __init__(self,
                  client_order_id: str,
                  exchange_order_id: Optional[str],
@@ -33,8 +34,6 @@ class DigifinexInFlightOrder(InFlightOrderBase):
             amount,
             initial_state,
         )
-        self.trade_id_set = set()
-        self.cancelled_event = asyncio.Event()
 
     @property
     def is_done(self) -> bool:
@@ -91,7 +90,7 @@ class DigifinexInFlightOrder(InFlightOrderBase):
         if trade_id in self.trade_id_set:
             # trade already recorded
             return False
-        self.trade_id_set.add(trade_id)
+        self.add_trade_id(trade_id)
         self.executed_amount_base += Decimal(str(trade_update["executed_amount"]))
         # self.fee_paid += Decimal(str(trade_update["fee"]))
         self.executed_amount_quote += (Decimal(str(trade_update["executed_price"])) *
@@ -110,7 +109,7 @@ class DigifinexInFlightOrder(InFlightOrderBase):
         if order_update['filled'] == '0':
             return (0, 0)
 
-        self.trade_id_set.add("N/A")
+        self.add_trade_id("N/A")
         executed_amount_base = Decimal(order_update['filled'])
         if executed_amount_base == self.executed_amount_base:
             return (0, 0)
@@ -1,6 +1,6 @@
 from typing import Callable, Dict, Any
 import aiohttp
-import json
+from hummingbot.core.utils import json_codec
 import urllib
 from hummingbot.connector.exchange.digifinex.digifinex_auth import DigifinexAuth
 from hummingbot.connector.exchange.digifinex import digifinex_constants as Constants
@@ -44,7 +44,7 @@ class DigifinexRestApi:
             raise NotImplementedError
 
         try:
-            parsed_response = json.loads(await response.text())
+            parsed_response = json_codec.loads(await response.text())
         except Exception as e:
             raise IOError(f"Error parsing data from {url}. Error: {str(e)}")
         if response.status != 200:
@@ -4,7 +4,7 @@ import copy
 import logging
 import websockets
 import zlib
-import ujson
+from hummingbot.core.utils import json_codec
 from asyncio import InvalidStateError
 import hummingbot.connector.exchange.digifinex.digifinex_constants as constants
 # from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -96,10 +96,10 @@ class DigifinexWebsocket(RequestId):
                 try:
                     raw_msg_bytes: bytes = await asyncio.wait_for(self._client.recv(), timeout=self.MESSAGE_TIMEOUT)
                     inflated_msg: bytes = zlib.decompress(raw_msg_bytes)
-                    raw_msg = ujson.loads(inflated_msg)
+                    raw_msg = json_codec.loads(inflated_msg)
                     # if "method" in raw_msg and raw_msg["method"] == "server.ping":
                     #     payload = {"id": raw_msg["id"], "method": "public/respond-heartbeat"}
-                    #     safe_ensure_future(self._client.send(ujson.dumps(payload)))
+                    #     safe_ensure_future(self._client.send(json_codec.dumps(payload)))
                     # self.logger().debug(inflated_msg)
                     # method = raw_msg.get('method')
                     # if method not in ['depth.update', 'trades.update']:
@@ -138,7 +138,7 @@ class DigifinexWebsocket(RequestId):
             "params": copy.deepcopy(data),
         }
 
-        req = ujson.dumps(payload)
+        req = json_codec.dumps(payload)
         self.logger().network(req)   # todo remove log
         await self._client.send(req)
 
@@ -11,7 +11,7 @@ import math
 from typing import AsyncIterable, Dict, List, Optional, Any
 
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -68,7 +68,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if markets_response.status != 200:
                 raise IOError(f"Error fetching active Dolomite markets. HTTP status is {markets_response.status}.")
 
-            markets_data = await markets_response.json()
+            markets_data = await markets_response.json(loads=json_codec.loads)
             markets_data = markets_data["data"]
 
             field_mapping = {
@@ -105,7 +105,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get("https://exchange-api.dolomite.io/v1/markets", timeout=10) as response:
                     if response.status == 200:
-                        all_trading_pairs: Dict[str, Any] = await response.json()
+                        all_trading_pairs: Dict[str, Any] = await response.json(loads=json_codec.loads)
                         valid_trading_pairs: list = []
                         for item in all_trading_pairs["data"]:
                             valid_trading_pairs.append(item["market"])
@@ -138,7 +138,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(
                     f"Error fetching Dolomite market snapshot for {trading_pair}. " f"HTTP status is {response.status}."
                 )
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response.json(loads=json_codec.loads)
             return data
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
@@ -226,10 +226,10 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         "route": SNAPSHOT_WS_ROUTE,
                     }
 
-                    await ws.send(ujson.dumps(orderbook_subscription_request))
+                    await ws.send(json_codec.dumps(orderbook_subscription_request))
 
                     async for raw_msg in self._inner_messages(ws):
-                        message = ujson.loads(raw_msg)
+                        message = json_codec.loads(raw_msg)
 
                         if message["route"] == SNAPSHOT_WS_ROUTE and message["action"] == SNAPSHOT_WS_UPDATE_ACTION:
                             snapshot_timestamp: float = time.time()
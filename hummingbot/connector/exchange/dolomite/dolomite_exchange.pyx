@@ -2,6 +2,7 @@ import aiohttp
 import asyncio
 import binascii
 import json
+from hummingbot.core.utils import json_codec
 import time
 import uuid
 import traceback
@@ -497,6 +498,7 @@ cdef class DolomiteExchange(ExchangeBase):
 
     async def start_network(self):
         await self.stop_network()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._polling_update_task = safe_ensure_future(self._polling_update())
 
@@ -768,7 +770,7 @@ cdef class DolomiteExchange(ExchangeBase):
                 self.logger().info(f"Issue with Dolomite API {http_method} to {url}, response: ")
                 self.logger().info(await response.text())
                 raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
-            data = await response.json()
+            data = await response.json(loads=json_codec.loads)
             return data
 
     def get_order_book(self, trading_pair: str) -> OrderBook:
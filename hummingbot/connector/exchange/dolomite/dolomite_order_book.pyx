@@ -8,7 +8,7 @@ from typing import (
     List,
     Optional,
 )
-import ujson
+from hummingbot.core.utils import json_codec
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.dolomite.dolomite_order_book_message import DolomiteOrderBookMessage
@@ -49,7 +49,7 @@ cdef class DolomiteOrderBook(OrderBook):
 
     @classmethod
     def snapshot_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = record.json if type(record.json)==dict else ujson.loads(record.json)
+        msg = record.json if type(record.json)==dict else json_codec.loads(record.json)
         return DolomiteOrderBookMessage(OrderBookMessageType.SNAPSHOT, msg, timestamp=record.timestamp * 1e-3)
 
     @classmethod
@@ -58,12 +58,12 @@ cdef class DolomiteOrderBook(OrderBook):
 
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = ujson.loads(record.value.decode())
+        msg = json_codec.loads(record.value.decode())
         return DolomiteOrderBookMessage(OrderBookMessageType.SNAPSHOT, msg, timestamp=record.timestamp * 1e-3)
 
     @classmethod
     def diff_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = ujson.loads(record.value.decode())
+        msg = json_codec.loads(record.value.decode())
         return DolomiteOrderBookMessage(OrderBookMessageType.DIFF, msg)
 
     @classmethod
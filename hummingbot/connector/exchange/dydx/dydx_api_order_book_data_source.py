@@ -6,7 +6,7 @@ import aiohttp
 import logging
 from typing import AsyncIterable, Dict, List, Optional, Any
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -70,7 +70,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         async with aiohttp.ClientSession() as client:
             resp = await client.get(f"{DYDX_V1_API_URL}{TICKER_URL}")
-            resp_json = await resp.json()
+            resp_json = await resp.json(loads=json_codec.loads)
             retval = {}
             for pair in trading_pairs:
                 retval[pair] = float(resp_json["markets"][convert_v2_pair_to_v1(pair)]["last"])
@@ -91,7 +91,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(
                     f"Error fetching dydx market snapshot for {trading_pair}. " f"HTTP status is {response.status}."
                 )
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response.json(loads=json_codec.loads)
             data["market"] = trading_pair
             return data
 
@@ -136,7 +136,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(DYDX_MARKET_INFO_URL.format(""), timeout=5) as response:
                     if response.status == 200:
-                        all_trading_pairs: Dict[str, Any] = await response.json()
+                        all_trading_pairs: Dict[str, Any] = await response.json(loads=json_codec.loads)
                         valid_trading_pairs: list = []
                         for item in all_trading_pairs["markets"].keys():
                             if "baseCurrency" in all_trading_pairs["markets"][item]:
@@ -164,9 +164,9 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             "channel": "trades",
                             "id": pair
                         }
-                        await ws.send(ujson.dumps(subscribe_request))
+                        await ws.send(json_codec.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_codec.loads(raw_msg)
                         if "contents" in msg:
                             if "trades" in msg["contents"]:
                                 for datum in msg["contents"]["trades"]:
@@ -190,9 +190,9 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             "channel": "orderbook",
                             "id": pair
                         }
-                        await ws.send(ujson.dumps(subscribe_request))
+                        await ws.send(json_codec.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_codec.loads(raw_msg)
                         if "contents" in msg:
                             if "updates" in msg["contents"]:
                                 ts = datetime.timestamp(datetime.now())
@@ -11,6 +11,7 @@ from typing import (
 )
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils import json_codec
 
 TOKEN_CONFIGURATIONS_URL = 'https://api.dydx.exchange/v2/markets'
 
@@ -44,7 +45,7 @@ class DydxAPITokenConfigurationDataSource():
             if response.status >= 300:
                 raise IOError(f"Error fetching active dydx token configurations. HTTP status is {response.status}.")
 
-            response_dict: Dict[str, Any] = await response.json()
+            response_dict: Dict[str, Any] = await response.json(loads=json_codec.loads)
 
             for market, details in response_dict['markets'].items():
                 if "baseCurrency" in details:
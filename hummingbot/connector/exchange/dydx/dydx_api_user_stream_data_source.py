@@ -10,7 +10,7 @@ from typing import (
     Any
 )
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.logger import HummingbotLogger
@@ -61,7 +61,7 @@ class DydxAPIUserStreamDataSource(UserStreamTrackerDataSource):
                         "channel": "orders",
                         "id": wallet_address
                     }
-                    await ws.send(ujson.dumps(orders_subscribe_request))
+                    await ws.send(json_codec.dumps(orders_subscribe_request))
 
                     balances_subscribe_request: Dict[str, Any] = {
                         "type": "subscribe",
@@ -69,12 +69,12 @@ class DydxAPIUserStreamDataSource(UserStreamTrackerDataSource):
                         "id": wallet_address
                     }
 
-                    await ws.send(ujson.dumps(balances_subscribe_request))
+                    await ws.send(json_codec.dumps(balances_subscribe_request))
 
                     async for raw_msg in self._inner_messages(ws):
                         self._last_recv_time = time.time()
 
-                        diff_msg = ujson.loads(raw_msg)
+                        diff_msg = json_codec.loads(raw_msg)
                         if diff_msg["type"] == "channel_data":
                             output.put_nowait(diff_msg)
             except asyncio.CancelledError:
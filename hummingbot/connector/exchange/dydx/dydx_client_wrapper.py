@@ -4,6 +4,7 @@ from functools import partial
 
 from dydx.client import Client
 from dydx.exceptions import DydxAPIError
+from hummingbot.core.utils import json_codec
 
 BASE_URL = 'https://api.dydx.exchange'
 FILLS_ROUTE = '/v2/fills'
@@ -63,9 +64,9 @@ class DYDXClientWrapper:
 
             if response.status >= 300:
                 try:
-                    msg = await response.json()
+                    msg = await response.json(loads=json_codec.loads)
                 except ValueError:
                     msg = await response.text()
                 raise DydxAsyncAPIError(response.status, msg)
 
-            return await response.json()
+            return await response.json(loads=json_codec.loads)
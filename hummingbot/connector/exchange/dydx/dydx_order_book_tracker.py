@@ -81,7 +81,7 @@ class DydxOrderBookTracker(OrderBookTracker):
                     message = await message_queue.get()
                 if message.type is OrderBookMessageType.DIFF:
                     bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
-                    order_book.apply_diffs(bids, asks, int(message.timestamp))
+                    self._apply_diff_message(trading_pair, order_book, message, bids, asks, int(message.timestamp))
 
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     s_bids, s_asks = active_order_tracker.convert_snapshot_message_to_order_book_row(message)
@@ -12,7 +12,7 @@ from typing import (
     Optional,
 )
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -55,7 +55,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         results = dict()
         async with aiohttp.ClientSession() as client:
             resp = await client.get(f"{constants.REST_URL}/tickers")
-            resp_json = await resp.json()
+            resp_json = await resp.json(loads=json_codec.loads)
             for trading_pair in trading_pairs:
                 resp_record = [o for o in resp_json if o["symbol"] == convert_to_exchange_trading_pair(trading_pair)][0]
                 results[trading_pair] = float(resp_record["price"])
@@ -73,7 +73,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 products_response: aiohttp.ClientResponse = products_response
                 if products_response.status != 200:
                     raise IOError(f"Error fetching active Eterbase markets. HTTP status is {products_response.status}.")
-                data = await products_response.json()
+                data = await products_response.json(loads=json_codec.loads)
                 for pair in data:
                     pair["symbol"] = convert_from_exchange_trading_pair(pair["symbol"])
                 all_markets: pd.DataFrame = pd.DataFrame.from_records(data=data, index="id")
@@ -88,7 +88,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with client.get(f"{constants.REST_URL}/tickers") as tickers_response:
                     tickers_response: aiohttp.ClientResponse = tickers_response
                     if tickers_response.status == 200:
-                        data = await tickers_response.json()
+                        data = await tickers_response.json(loads=json_codec.loads)
                         tickers: pd.DataFrame = pd.DataFrame.from_records(data=data, index="marketId")
                     else:
                         raise IOError(f"Error fetching tickers on Eterbase. "
@@ -104,7 +104,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with client.get(f"{constants.REST_URL}/tickers/cross-rates") as crossrates_response:
                     crossrates_response: aiohttp.ClientResponse = crossrates_response
                     if crossrates_response.status == 200:
-                        data = await crossrates_response.json()
+                        data = await crossrates_response.json(loads=json_codec.loads)
                         cross_rates: pd.DataFrame = pd.json_normalize(data, record_path ='rates', meta = ['base'])
                     else:
                         raise IOError(f"Error fetching cross-rates on Eterbase. "
@@ -161,7 +161,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 products_response: aiohttp.ClientResponse = products_response
                 if products_response.status != 200:
                     raise IOError(f"Error fetching active Eterbase markets. HTTP status is {products_response.status}.")
-                data = await products_response.json()
+                data = await products_response.json(loads=json_codec.loads)
                 for dt in data:
                     tp_map_mid[convert_from_exchange_trading_pair(dt['symbol'])] = dt['id']
         return tp_map_mid
@@ -174,7 +174,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get("https://api.eterbase.exchange/api/markets", timeout=10) as response:
                     if response.status == 200:
-                        markets = await response.json()
+                        markets = await response.json(loads=json_codec.loads)
                         raw_trading_pairs: List[str] = list(map(lambda trading_market: trading_market.get('symbol'), filter(lambda details: details.get('state') == 'Trading', markets)))
                         trading_pair_list: List[str] = []
                         for raw_trading_pair in raw_trading_pairs:
@@ -203,7 +203,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Eterbase market snapshot for marketId: {market_id}. "
                               f"HTTP status is {response.status}.")
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response.json(loads=json_codec.loads)
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
@@ -275,9 +275,9 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         "channelId": "order_book",
                         "marketIds": marketIds,
                     }
-                    await ws.send(ujson.dumps(subscribe_request))
+                    await ws.send(json_codec.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_codec.loads(raw_msg)
                         msg_type: str = msg.get("type", None)
                         if msg_type is None:
                             raise ValueError(f"Eterbase Websocket message does not contain a type - {msg}")
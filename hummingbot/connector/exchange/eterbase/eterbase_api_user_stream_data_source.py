@@ -8,7 +8,7 @@ from typing import (
     Optional,
     List
 )
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -81,10 +81,10 @@ class EterbaseAPIUserStreamDataSource(UserStreamTrackerDataSource):
                         "channelId": "my_orders",
                         "accountId": self._eterbase_account
                     }
-                    await ws.send(ujson.dumps(subscribe_request))
+                    await ws.send(json_codec.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
                         self.logger().debug(f"websocket raw msg: {raw_msg}")
-                        msg = ujson.loads(raw_msg)
+                        msg = json_codec.loads(raw_msg)
                         msg_type: str = msg.get("type", None)
                         if msg_type is None:
                             raise ValueError(f"Eterbase Websocket message does not contain a type - {msg}")
@@ -240,6 +240,7 @@ cdef class EterbaseExchange(ExchangeBase):
         """
         if self._order_tracker_task is not None:
             self._stop_network()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         if self._trading_required:
             self._status_polling_task = safe_ensure_future(self._status_polling_loop())
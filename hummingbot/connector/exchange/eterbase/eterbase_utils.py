@@ -8,6 +8,7 @@ from hummingbot.client.config.config_methods import using_exchange
 import aiohttp
 import asyncio
 import json
+from hummingbot.core.utils import json_codec
 from threading import Thread
 
 _eu_logger = logging.getLogger(__name__)
@@ -82,7 +83,7 @@ async def api_request(http_method: str,
         _eu_logger.debug(f"Response text data: '{data}'."[:400])
         if len(data) > 0:
             try:
-                data = json.loads(data)
+                data = json_codec.loads(data)
             except ValueError:
                 _eu_logger.info(f"Response is not a json text: '{data}'."[:400])
         if (response.status != 200) and (response.status != 204):
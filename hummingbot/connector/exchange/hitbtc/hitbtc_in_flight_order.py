@@ -4,7 +4,6 @@ from typing import (
     Dict,
     Optional,
 )
-import asyncio
 from hummingbot.core.event.events import (
     OrderType,
     TradeType
@@ -15,6 +14,8 @@ s_decimal_0 = Decimal(0)
 
 
 class HitbtcInFlightOrder(InFlightOrderBase):
+    __slots__ = ()
+
     def __init__(self,
                  client_order_id: str,
                  exchange_order_id: Optional[str],
@@ -34,8 +35,6 @@ class HitbtcInFlightOrder(InFlightOrderBase):
             amount,
             initial_state,
         )
-        self.trade_id_set = set()
-        self.cancelled_event = asyncio.Event()
 
     @property
     def is_done(self) -> bool:
@@ -109,7 +108,7 @@ class HitbtcInFlightOrder(InFlightOrderBase):
         if trade_id in self.trade_id_set:
             # trade already recorded
             return False
-        self.trade_id_set.add(trade_id)
+        self.add_trade_id(trade_id)
         self.fee_paid += Decimal(str(trade_update.get("tradeFee", "0")))
         self.executed_amount_quote += (Decimal(str(trade_update.get("tradePrice", "0"))) *
                                        Decimal(str(trade_update.get("tradeQuantity", "0"))))
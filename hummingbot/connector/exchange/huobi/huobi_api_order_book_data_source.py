@@ -4,6 +4,7 @@ import aiohttp
 import asyncio
 import gzip
 import json
+from hummingbot.core.utils import json_codec
 import logging
 import pandas as pd
 import time
@@ -51,7 +52,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
         results = dict()
         async with aiohttp.ClientSession() as client:
             resp = await client.get(HUOBI_TICKER_URL)
-            resp_json = await resp.json()
+            resp_json = await resp.json(loads=json_codec.loads)
             for trading_pair in trading_pairs:
                 resp_record = [o for o in resp_json["data"] if o["symbol"] == convert_to_exchange_trading_pair(trading_pair)][0]
                 results[trading_pair] = float(resp_record["close"])
@@ -65,7 +66,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(HUOBI_SYMBOLS_URL, timeout=10) as response:
                     if response.status == 200:
-                        all_trading_pairs: Dict[str, Any] = await response.json()
+                        all_trading_pairs: Dict[str, Any] = await response.json(loads=json_codec.loads)
                         valid_trading_pairs: list = []
                         for item in all_trading_pairs["data"]:
                             if item["state"] == "online":
@@ -94,7 +95,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(f"Error fetching Huobi market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
             api_data = await response.read()
-            data: Dict[str, Any] = json.loads(api_data)
+            data: Dict[str, Any] = json_codec.loads(api_data)
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
@@ -144,7 +145,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         # Huobi compresses their ws data
                         encoded_msg: bytes = gzip.decompress(raw_msg)
                         # Huobi's data value for id is a large int too big for ujson to parse
-                        msg: Dict[str, Any] = json.loads(encoded_msg.decode('utf-8'))
+                        msg: Dict[str, Any] = json_codec.loads(encoded_msg.decode('utf-8'))
                         if "ping" in msg:
                             await ws.send(f'{{"op":"pong","ts": {str(msg["ping"])}}}')
                         elif "subbed" in msg:
@@ -182,7 +183,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         # Huobi compresses their ws data
                         encoded_msg: bytes = gzip.decompress(raw_msg)
                         # Huobi's data value for id is a large int too big for ujson to parse
-                        msg: Dict[str, Any] = json.loads(encoded_msg.decode('utf-8'))
+                        msg: Dict[str, Any] = json_codec.loads(encoded_msg.decode('utf-8'))
                         if "ping" in msg:
                             await ws.send(f'{{"op":"pong","ts": {str(msg["ping"])}}}')
                         elif "subbed" in msg:
@@ -15,6 +15,7 @@ from typing import (
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.huobi.huobi_auth import HuobiAuth
+from hummingbot.core.utils import json_codec
 
 HUOBI_API_ENDPOINT = "https://api.huobi.pro"
 HUOBI_WS_ENDPOINT = "wss://api.huobi.pro/ws/v2"
@@ -74,7 +75,7 @@ class HuobiAPIUserStreamDataSource(UserStreamTrackerDataSource):
         }
         await self._websocket_connection.send_json(auth_request)
         resp: aiohttp.WSMessage = await self._websocket_connection.receive()
-        msg = resp.json()
+        msg = resp.json(loads=json_codec.loads)
         if msg.get("code", 0) == 200:
             self.logger().info("Successfully authenticated")
 
@@ -106,7 +107,7 @@ class HuobiAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     # since all ws messages from huobi are TEXT, any other type should cause ws to reconnect
                     return
 
-                message = raw_msg.json()
+                message = raw_msg.json(loads=json_codec.loads)
 
                 # Handle ping messages
                 if message["action"] == "ping":
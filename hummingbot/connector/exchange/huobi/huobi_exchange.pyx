@@ -13,7 +13,7 @@ from typing import (
     List,
     Optional
 )
-import ujson
+from hummingbot.core.utils import json_codec
 
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.cancellation_result import CancellationResult
@@ -195,6 +195,7 @@ cdef class HuobiExchange(ExchangeBase):
 
     async def start_network(self):
         self._stop_network()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
@@ -277,14 +278,14 @@ cdef class HuobiExchange(ExchangeBase):
                 url=url,
                 headers=headers,
                 params=params,
-                data=ujson.dumps(data),
+                data=json_codec.dumps(data),
                 timeout=self.API_CALL_TIMEOUT
             )
 
         if response.status != 200:
             raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
         try:
-            parsed_response = await response.json()
+            parsed_response = await response.json(loads=json_codec.loads)
         except Exception:
             raise IOError(f"Error parsing data from {url}.")
 
@@ -930,7 +931,7 @@ cdef class HuobiExchange(ExchangeBase):
         cancel_order_ids = [o.exchange_order_id for o in open_orders]
         self.logger().debug(f"cancel_order_ids {cancel_order_ids} {open_orders}")
         path_url = "/order/orders/batchcancel"
-        params = {"order-ids": ujson.dumps(cancel_order_ids)}
+        params = {"order-ids": json_codec.dumps(cancel_order_ids)}
         data = {"order-ids": cancel_order_ids}
         cancellation_results = []
         try:
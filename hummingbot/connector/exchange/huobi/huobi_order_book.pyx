@@ -10,7 +10,7 @@ from typing import (
     Optional,
     Dict
 )
-import ujson
+from hummingbot.core.utils import json_codec
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import TradeType
@@ -82,7 +82,7 @@ cdef class HuobiOrderBook(OrderBook):
     @classmethod
     def snapshot_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
         ts = record["timestamp"]
-        msg = record["json"] if type(record["json"])==dict else ujson.loads(record["json"])
+        msg = record["json"] if type(record["json"])==dict else json_codec.loads(record["json"])
         if metadata:
             msg.update(metadata)
 
@@ -96,7 +96,7 @@ cdef class HuobiOrderBook(OrderBook):
     @classmethod
     def diff_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
         ts = record["timestamp"]
-        msg = record["json"] if type(record["json"])==dict else ujson.loads(record["json"])
+        msg = record["json"] if type(record["json"])==dict else json_codec.loads(record["json"])
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.DIFF, {
@@ -109,7 +109,7 @@ cdef class HuobiOrderBook(OrderBook):
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
         ts = record.timestamp
-        msg = ujson.loads(record.value.decode())
+        msg = json_codec.loads(record.value.decode())
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
@@ -122,7 +122,7 @@ cdef class HuobiOrderBook(OrderBook):
     @classmethod
     def diff_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
         decompressed = bz2.decompress(record.value)
-        msg = ujson.loads(decompressed)
+        msg = json_codec.loads(decompressed)
         ts = record.timestamp
         if metadata:
             msg.update(metadata)
@@ -12,7 +12,7 @@ from typing import (
     Optional
 )
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -60,7 +60,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def get_last_traded_price(cls, trading_pair: str) -> float:
         async with aiohttp.ClientSession() as client:
             resp = await client.get(f"{TICKER_URL}?pair={convert_to_exchange_trading_pair(trading_pair)}")
-            resp_json = await resp.json()
+            resp_json = await resp.json(loads=json_codec.loads)
             record = list(resp_json["result"].values())[0]
             return float(record["c"][0])
 
@@ -74,7 +74,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Kraken market snapshot for {original_trading_pair}. "
                               f"HTTP status is {response.status}.")
-            response_json = await response.json()
+            response_json = await response.json(loads=json_codec.loads)
             if len(response_json["error"]) > 0:
                 raise IOError(f"Error fetching Kraken market snapshot for {original_trading_pair}. "
                               f"Error is {response_json['error']}.")
@@ -133,7 +133,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with client.get(ASSET_PAIRS_URL, timeout=5) as response:
                     if response.status == 200:
                         from hummingbot.connector.exchange.kraken.kraken_utils import convert_from_exchange_trading_pair
-                        data: Dict[str, Any] = await response.json()
+                        data: Dict[str, Any] = await response.json(loads=json_codec.loads)
                         raw_pairs = data.get("result", [])
                         converted_pairs: List[str] = []
                         for pair, details in raw_pairs.items():
@@ -158,7 +158,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     ws: websockets.WebSocketClientProtocol = ws
                     await ws.send(ws_message)
                     async for raw_msg in self._inner_messages(ws):
-                        msg: List[Any] = ujson.loads(raw_msg)
+                        msg: List[Any] = json_codec.loads(raw_msg)
                         trades: List[Dict[str, Any]] = [{"pair": convert_from_exchange_trading_pair(msg[-1]), "trade": trade} for trade in msg[1]]
                         for trade in trades:
                             trade_msg: OrderBookMessage = KrakenOrderBook.trade_message_from_exchange(trade)
@@ -178,7 +178,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     ws: websockets.WebSocketClientProtocol = ws
                     await ws.send(ws_message)
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_codec.loads(raw_msg)
                         msg_dict = {"trading_pair": convert_from_exchange_trading_pair(msg[-1]),
                                     "asks": msg[1].get("a", []) or msg[1].get("as", []) or [],
                                     "bids": msg[1].get("b", []) or msg[1].get("bs", []) or []}
@@ -239,6 +239,6 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                            "pair": trading_pairs,
                                            "subscription": {"name": subscription_type, "depth": 1000}}
 
-        ws_message: str = ujson.dumps(ws_message_dict)
+        ws_message: str = json_codec.dumps(ws_message_dict)
 
         return ws_message
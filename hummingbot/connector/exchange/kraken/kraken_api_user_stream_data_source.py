@@ -10,7 +10,7 @@ from typing import (
     Any
 )
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.logger import HummingbotLogger
@@ -71,7 +71,7 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 raise IOError(f"Error fetching Kraken user stream listen key. HTTP status is {response.status}.")
 
             try:
-                response_json: Dict[str, Any] = await response.json()
+                response_json: Dict[str, Any] = await response.json(loads=json_codec.loads)
             except Exception:
                 raise IOError(f"Error parsing data from {url}.")
 
@@ -106,12 +106,12 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
                                 "token": self._current_auth_token
                             }
                         }
-                        await ws.send(ujson.dumps(subscribe_request))
+                        await ws.send(json_codec.dumps(subscribe_request))
 
                     async for raw_msg in self._inner_messages(ws):
                         self._last_recv_time = time.time()
 
-                        diff_msg = ujson.loads(raw_msg)
+                        diff_msg = json_codec.loads(raw_msg)
                         output.put_nowait(diff_msg)
             except asyncio.CancelledError:
                 raise
@@ -57,6 +57,7 @@ from hummingbot.core.data_type.transaction_tracker import TransactionTracker
 from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils import json_codec
 
 s_logger = None
 s_decimal_0 = Decimal(0)
@@ -196,7 +197,7 @@ cdef class KrakenExchange(ExchangeBase):
         if not self._asset_pairs:
             client = await self._http_client()
             asset_pairs_response = await client.get(ASSET_PAIRS_URI)
-            asset_pairs_data: Dict[str, Any] = await asset_pairs_response.json()
+            asset_pairs_data: Dict[str, Any] = await asset_pairs_response.json(loads=json_codec.loads)
             asset_pairs: Dict[str, Any] = asset_pairs_data["result"]
             self._asset_pairs = {f"{details['base']}-{details['quote']}": details
                                  for _, details in asset_pairs.items() if not is_dark_pool(details)}
@@ -637,6 +638,7 @@ cdef class KrakenExchange(ExchangeBase):
 
     async def start_network(self):
         self._stop_network()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         if self._trading_required:
@@ -771,7 +773,7 @@ cdef class KrakenExchange(ExchangeBase):
                 if response.status != 200:
                     raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
                 try:
-                    response_json = await response.json()
+                    response_json = await response.json(loads=json_codec.loads)
                 except Exception:
                     raise IOError(f"Error parsing data from {url}.")
 
@@ -34,7 +34,6 @@ cdef class KrakenInFlightOrder(InFlightOrderBase):
             amount,
             initial_state
         )
-        self.trade_id_set = set()
         self.userref = userref
 
     @property
@@ -91,7 +90,7 @@ cdef class KrakenInFlightOrder(InFlightOrderBase):
         if trade_id in self.trade_id_set:
             # trade already recorded
             return
-        self.trade_id_set.add(trade_id)
+        self.add_trade_id(trade_id)
         last_executed_quantity = Decimal(execution_report["l"])
         last_commission_amount = Decimal(execution_report["n"])
         last_commission_asset = execution_report["N"]
@@ -110,7 +109,7 @@ cdef class KrakenInFlightOrder(InFlightOrderBase):
         if str(trade_update["ordertxid"]) != self.exchange_order_id or trade_id in self.trade_id_set:
             # trade already recorded
             return
-        self.trade_id_set.add(trade_id)
+        self.add_trade_id(trade_id)
         self.executed_amount_base += Decimal(trade_update["vol"])
         self.fee_paid += Decimal(trade_update["fee"])
         self.executed_amount_quote += Decimal(trade_update["vol"]) * Decimal(trade_update["price"])
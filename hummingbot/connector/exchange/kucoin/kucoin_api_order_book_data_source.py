@@ -7,6 +7,7 @@ from async_timeout import timeout
 from collections import defaultdict
 from enum import Enum
 import json
+from hummingbot.core.utils import json_codec
 import logging
 import pandas as pd
 import time
@@ -98,7 +99,7 @@ class KucoinWSConnectionIterator:
                 if response.status != 200:
                     raise IOError(f"Error fetching Kucoin websocket connection data."
                                   f"HTTP status is {response.status}.")
-                data: Dict[str, Any] = await response.json()
+                data: Dict[str, Any] = await response.json(loads=json_codec.loads)
 
         endpoint: str = data["data"]["instanceServers"][0]["endpoint"]
         token: str = data["data"]["token"]
@@ -235,7 +236,7 @@ class KucoinWSConnectionIterator:
 
                 # Get messages
                 async for raw_msg in self._inner_messages(ws):
-                    msg: Dict[str, any] = json.loads(raw_msg)
+                    msg: Dict[str, any] = json_codec.loads(raw_msg)
                     yield msg
         finally:
             # Clean up.
@@ -297,7 +298,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
         results = dict()
         async with aiohttp.ClientSession() as client:
             resp = await client.get(TICKER_PRICE_CHANGE_URL)
-            resp_json = await resp.json()
+            resp_json = await resp.json(loads=json_codec.loads)
             for trading_pair in trading_pairs:
                 resp_record = [o for o in resp_json["data"]["ticker"] if o["symbolName"] == trading_pair][0]
                 results[trading_pair] = float(resp_record["last"])
@@ -322,7 +323,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with client.get(EXCHANGE_INFO_URL, timeout=5) as response:
                 if response.status == 200:
                     try:
-                        data: Dict[str, Any] = await response.json()
+                        data: Dict[str, Any] = await response.json(loads=json_codec.loads)
                         all_trading_pairs = data.get("data", [])
                         return [item["symbol"] for item in all_trading_pairs if item["enableTrading"] is True]
                     except Exception:
@@ -338,7 +339,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Kucoin market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response.json(loads=json_codec.loads)
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
@@ -9,7 +9,7 @@ from typing import (
     Dict,
     Optional
 )
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -55,7 +55,7 @@ class KucoinAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 response: aiohttp.ClientResponse = response
                 if response.status != 200:
                     raise IOError(f"Error fetching Kucoin user stream listen key. HTTP status is {response.status}.")
-                data: Dict[str, str] = await response.json()
+                data: Dict[str, str] = await response.json(loads=json_codec.loads)
                 return data
 
     async def _subscribe_topic(self, ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -67,7 +67,7 @@ class KucoinAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     "topic": topic,
                     "privateChannel": True,
                     "response": True}
-                await ws.send(ujson.dumps(subscribe_request))
+                await ws.send(json_codec.dumps(subscribe_request))
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -102,7 +102,7 @@ class KucoinAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     async with (await self.get_ws_connection()) as ws:
                         await self._subscribe_topic(ws)
                         async for msg in self._inner_messages(ws):
-                            decoded: Dict[str, any] = ujson.loads(msg)
+                            decoded: Dict[str, any] = json_codec.loads(msg)
                             output.put_nowait(decoded)
 
             except asyncio.CancelledError:
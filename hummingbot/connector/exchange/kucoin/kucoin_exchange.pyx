@@ -13,6 +13,7 @@ from typing import (
     Tuple
 )
 import json
+from hummingbot.core.utils import json_codec
 import time
 
 from hummingbot.core.clock cimport Clock
@@ -204,6 +205,7 @@ cdef class KucoinExchange(ExchangeBase):
 
     async def start_network(self):
         self._stop_network()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         if self._trading_required:
@@ -409,7 +411,7 @@ cdef class KucoinExchange(ExchangeBase):
             if response.status != 200:
                 raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
             try:
-                parsed_response = json.loads(await response.text())
+                parsed_response = json_codec.loads(await response.text())
             except Exception:
                 raise IOError(f"Error parsing data from {url}.")
             return parsed_response
@@ -4,7 +4,7 @@ from typing import (
     Dict,
     Optional
 )
-import ujson
+from hummingbot.core.utils import json_codec
 
 from aiokafka import ConsumerRecord
 from sqlalchemy.engine import RowProxy
@@ -61,7 +61,7 @@ cdef class KucoinOrderBook(OrderBook):
     @classmethod
     def snapshot_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
         ts = int(record["timestamp"])
-        msg = record["json"] if type(record["json"]) == dict else ujson.loads(record["json"])
+        msg = record["json"] if type(record["json"]) == dict else json_codec.loads(record["json"])
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
@@ -74,7 +74,7 @@ cdef class KucoinOrderBook(OrderBook):
     @classmethod
     def diff_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
         ts = int(record["timestamp"])
-        msg = ujson.loads(record["json"])  # Kucoin json in DB is TEXT
+        msg = json_codec.loads(record["json"])  # Kucoin json in DB is TEXT
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.DIFF, {
@@ -88,7 +88,7 @@ cdef class KucoinOrderBook(OrderBook):
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
         ts = record.timestamp
-        msg = ujson.loads(record.value.decode("utf-8"))
+        msg = json_codec.loads(record.value.decode("utf-8"))
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
@@ -100,7 +100,7 @@ cdef class KucoinOrderBook(OrderBook):
 
     @classmethod
     def diff_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = ujson.loads(record.value.decode("utf-8"))
+        msg = json_codec.loads(record.value.decode("utf-8"))
         if metadata:
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.DIFF, {
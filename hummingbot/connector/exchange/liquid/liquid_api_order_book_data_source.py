@@ -4,7 +4,7 @@ import logging
 import pandas as pd
 import time
 from typing import Any, AsyncIterable, Dict, List, Optional
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -39,7 +39,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         results = dict()
         async with aiohttp.ClientSession() as client:
             resp = await client.get(Constants.GET_EXCHANGE_MARKETS_URL)
-            resp_json = await resp.json()
+            resp_json = await resp.json(loads=json_codec.loads)
             for record in resp_json:
                 trading_pair = f"{record['base_currency']}-{record['quoted_currency']}"
                 if trading_pair in trading_pairs:
@@ -144,7 +144,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(f"Error fetching Liquid markets information. "
                               f"HTTP status is {exchange_markets_response.status}.")
 
-            exchange_markets_data = await exchange_markets_response.json()
+            exchange_markets_data = await exchange_markets_response.json(loads=json_codec.loads)
             return exchange_markets_data
 
     @classmethod
@@ -166,7 +166,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(f"{Constants.BASE_URL}{Constants.PRODUCTS_URI}", timeout=10) as response:
                     if response.status == 200:
-                        products: List[Dict[str, Any]] = await response.json()
+                        products: List[Dict[str, Any]] = await response.json(loads=json_codec.loads)
                         for data in products:
                             data['trading_pair'] = '-'.join([data['base_currency'], data['quoted_currency']])
                         return [
@@ -229,7 +229,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Liquid market snapshot for {id}. "
                               f"HTTP status is {response.status}.")
-            snapshot: Dict[str, Any] = await response.json()
+            snapshot: Dict[str, Any] = await response.json(loads=json_codec.loads)
             return {
                 **snapshot,
                 'trading_pair': trading_pair
@@ -348,10 +348,10 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                 }
                             }
 
-                            await ws.send(ujson.dumps(subscribe_request))
+                            await ws.send(json_codec.dumps(subscribe_request))
 
                     async for raw_msg in self._inner_messages(ws):
-                        diff_msg: Dict[str, Any] = ujson.loads(raw_msg)
+                        diff_msg: Dict[str, Any] = json_codec.loads(raw_msg)
 
                         event_type = diff_msg.get('event', None)
                         if event_type == 'updated':
@@ -363,7 +363,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             buy_or_sell = diff_msg.get('channel').split('_')[-1].lower()
                             side = 'asks' if buy_or_sell == Constants.SIDE_ASK else 'bids'
                             diff_msg = {
-                                '{0}'.format(side): ujson.loads(diff_msg.get('data', [])),
+                                '{0}'.format(side): json_codec.loads(diff_msg.get('data', [])),
                                 'trading_pair': trading_pair
                             }
                             diff_timestamp: float = time.time()
@@ -11,7 +11,7 @@ from typing import (
 )
 import time
 
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 from hummingbot.logger import HummingbotLogger
@@ -70,7 +70,7 @@ class LiquidAPIUserStreamDataSource(UserStreamTrackerDataSource):
                         "event": Constants.WS_AUTH_REQUEST_EVENT,
                         "data": self._liquid_auth.get_ws_auth_data()
                     }
-                    await ws.send(ujson.dumps(auth_request))
+                    await ws.send(json_codec.dumps(auth_request))
 
                     quoted_currencies = [
                         trading_pair.split('-')[1]
@@ -86,9 +86,9 @@ class LiquidAPIUserStreamDataSource(UserStreamTrackerDataSource):
                                 )
                             }
                         }
-                        await ws.send(ujson.dumps(subscribe_request))
+                        await ws.send(json_codec.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        diff_msg = ujson.loads(raw_msg)
+                        diff_msg = json_codec.loads(raw_msg)
 
                         event_type = diff_msg.get('event', None)
                         if event_type == 'updated':
@@ -134,7 +134,7 @@ class LiquidAPIUserStreamDataSource(UserStreamTrackerDataSource):
         ping_data: Dict[str, Any] = {"event": "pusher:ping", "data": {}}
         try:
             while True:
-                await ws.send(ujson.dumps(ping_data))
+                await ws.send(json_codec.dumps(ping_data))
                 await asyncio.sleep(60.0)
         except Exception:
             return
@@ -3,6 +3,7 @@ import asyncio
 from async_timeout import timeout
 from decimal import Decimal
 import json
+from hummingbot.core.utils import json_codec
 import logging
 import math
 import pandas as pd
@@ -225,6 +226,7 @@ cdef class LiquidExchange(ExchangeBase):
         Async function used by NetworkBase class to handle when a single market goes online
         """
         self._stop_network()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         if self._trading_required:
             self._status_polling_task = safe_ensure_future(self._status_polling_loop())
@@ -311,7 +313,7 @@ cdef class LiquidExchange(ExchangeBase):
         client = await self._http_client()
         async with client.request(http_method,
                                   url=url, timeout=Constants.API_CALL_TIMEOUT, data=data_str, headers=headers) as response:
-            data = await response.json()
+            data = await response.json(loads=json_codec.loads)
             if response.status != 200:
                 raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}. {data}")
             return data
@@ -746,7 +748,7 @@ cdef class LiquidExchange(ExchangeBase):
         """
         async for event_message in self._iter_user_event_queue():
             try:
-                content = json.loads(event_message.get('data', {}))
+                content = json_codec.loads(event_message.get('data', {}))
                 event_status = content["status"]
 
                 # Order id retreived from exhcnage, that initially sent by client
@@ -5,7 +5,7 @@ import aiohttp
 import logging
 from typing import AsyncIterable, Dict, List, Optional, Any
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -57,7 +57,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         async with aiohttp.ClientSession() as client:
             resp = await client.get(f"https://api3.loopring.io{TICKER_URL}".replace(":markets", ",".join(trading_pairs)))
-            resp_json = await resp.json()
+            resp_json = await resp.json(loads=json_codec.loads)
             return {x[0]: float(x[7]) for x in resp_json.get("tickers", [])}
 
     @property
@@ -75,7 +75,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(
                     f"Error fetching loopring market snapshot for {trading_pair}. " f"HTTP status is {response.status}."
                 )
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response.json(loads=json_codec.loads)
             data["market"] = trading_pair
             return data
 
@@ -120,7 +120,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(f"https://api3.loopring.io{MARKETS_URL}", timeout=5) as response:
                     if response.status == 200:
-                        all_trading_pairs: Dict[str, Any] = await response.json()
+                        all_trading_pairs: Dict[str, Any] = await response.json(loads=json_codec.loads)
                         valid_trading_pairs: list = []
                         for item in all_trading_pairs["markets"]:
                             valid_trading_pairs.append(item["market"])
@@ -148,10 +148,10 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 ws_key: str = await get_ws_api_key()
                 async with websockets.connect(f"{WS_URL}?wsApiKey={ws_key}") as ws:
                     ws: websockets.WebSocketClientProtocol = ws
-                    await ws.send(ujson.dumps(subscribe_request))
+                    await ws.send(json_codec.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
                         if len(raw_msg) > 4:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_codec.loads(raw_msg)
                             if "topic" in msg:
                                 for datum in msg["data"]:
                                     trade_msg: OrderBookMessage = LoopringOrderBook.trade_message_from_exchange(datum, msg)
@@ -175,10 +175,10 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             "op": "sub",
                             "topics": topics,
                         }
-                        await ws.send(ujson.dumps(subscribe_request))
+                        await ws.send(json_codec.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
                         if len(raw_msg) > 4:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_codec.loads(raw_msg)
                             if "topic" in msg:
                                 order_msg: OrderBookMessage = LoopringOrderBook.diff_message_from_exchange(msg)
                                 output.put_nowait(order_msg)
@@ -202,11 +202,11 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             "topics": topics,
                         }
 
-                        await ws.send(ujson.dumps(subscribe_request))
+                        await ws.send(json_codec.dumps(subscribe_request))
 
                     async for raw_msg in self._inner_messages(ws):
                         if len(raw_msg) > 4:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_codec.loads(raw_msg)
                             if ("topic" in msg.keys()):
                                 order_msg: OrderBookMessage = LoopringOrderBook.snapshot_message_from_exchange(msg, msg["ts"])
                                 output.put_nowait(order_msg)
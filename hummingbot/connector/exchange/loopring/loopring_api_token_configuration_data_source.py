@@ -12,6 +12,7 @@ from typing import (
 
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils import json_codec
 
 TOKEN_CONFIGURATIONS_URL = '/api/v3/exchange/tokens'
 
@@ -44,7 +45,7 @@ class LoopringAPITokenConfigurationDataSource():
             if response.status >= 300:
                 raise IOError(f"Error fetching active loopring token configurations. HTTP status is {response.status}.")
 
-            response_dict: Dict[str, Any] = await response.json()
+            response_dict: Dict[str, Any] = await response.json(loads=json_codec.loads)
 
             for config in response_dict:
                 self._token_configurations[config['tokenId']] = config
@@ -10,7 +10,7 @@ from typing import (
     Any
 )
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.logger import HummingbotLogger
@@ -67,12 +67,12 @@ class LoopringAPIUserStreamDataSource(UserStreamTrackerDataSource):
                         "unsubscribeAll": True,
                         "topics": topics
                     }
-                    await ws.send(ujson.dumps(subscribe_request))
+                    await ws.send(json_codec.dumps(subscribe_request))
 
                     async for raw_msg in self._inner_messages(ws):
                         self._last_recv_time = time.time()
 
-                        diff_msg = ujson.loads(raw_msg)
+                        diff_msg = json_codec.loads(raw_msg)
                         if 'op' in diff_msg:
                             continue  # These messages are for control of the stream, so skip sending them to the market class
                         output.put_nowait(diff_msg)
@@ -2,6 +2,7 @@ import aiohttp
 import asyncio
 import binascii
 import json
+from hummingbot.core.utils import json_codec
 import time
 import uuid
 import traceback
@@ -538,6 +539,7 @@ cdef class LoopringExchange(ExchangeBase):
     async def start_network(self):
         await self.stop_network()
         await self._token_configuration._configure()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
 
         if self._trading_required:
@@ -940,11 +942,11 @@ cdef class LoopringExchange(ExchangeBase):
             if response.status != 200:
                 self.logger().info(f"Issue with Loopring API {http_method} to {url}, response: ")
                 self.logger().info(await response.text())
-                data = await response.json()
+                data = await response.json(loads=json_codec.loads)
                 if 'resultInfo' in data:
                     return data
                 raise IOError(f"Error fetching data from {full_url}. HTTP status is {response.status}.")
-            data = await response.json()
+            data = await response.json(loads=json_codec.loads)
             return data
 
     def get_order_book(self, trading_pair: str) -> OrderBook:
@@ -8,7 +8,7 @@ from typing import (
     List,
     Optional,
 )
-import ujson
+from hummingbot.core.utils import json_codec
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.loopring.loopring_order_book_message import LoopringOrderBookMessage
@@ -62,7 +62,7 @@ cdef class LoopringOrderBook(OrderBook):
 
     @classmethod
     def snapshot_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = record.json if type(record.json)==dict else ujson.loads(record.json)
+        msg = record.json if type(record.json)==dict else json_codec.loads(record.json)
         return LoopringOrderBookMessage(OrderBookMessageType.SNAPSHOT, msg, timestamp=record.timestamp * 1e-3)
 
     @classmethod
@@ -71,12 +71,12 @@ cdef class LoopringOrderBook(OrderBook):
 
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = ujson.loads(record.value.decode())
+        msg = json_codec.loads(record.value.decode())
         return LoopringOrderBookMessage(OrderBookMessageType.SNAPSHOT, msg, timestamp=record.timestamp * 1e-3)
 
     @classmethod
     def diff_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        msg = ujson.loads(record.value.decode())
+        msg = json_codec.loads(record.value.decode())
         return LoopringOrderBookMessage(OrderBookMessageType.DIFF, msg)
 
     @classmethod
@@ -3,6 +3,7 @@ from typing import Dict, Any
 
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.config_methods import using_exchange
+from hummingbot.core.utils import json_codec
 
 CENTRALIZED = True
 
@@ -59,5 +60,5 @@ async def get_ws_api_key():
         if response.status != 200:
             raise IOError(f"Error getting WS key. Server responded with status: {response.status}.")
 
-        response_dict: Dict[str, Any] = await response.json()
+        response_dict: Dict[str, Any] = await response.json(loads=json_codec.loads)
         return response_dict['data']
@@ -4,6 +4,7 @@ import aiohttp
 import asyncio
 
 import json
+from hummingbot.core.utils import json_codec
 import logging
 import pandas as pd
 import time
@@ -71,7 +72,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 if products_response.status != 200:
                     raise IOError(f"Error fetching active OKEx markets. HTTP status is {products_response.status}.")
 
-                data = await products_response.json()
+                data = await products_response.json(loads=json_codec.loads)
                 all_markets: pd.DataFrame = pd.DataFrame.from_records(data=data)
 
                 all_markets.rename({"quote_volume_24h": "volume", "last": "price"},
@@ -88,7 +89,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 if products_response.status != 200:
                     raise IOError(f"Error fetching active OKEx markets. HTTP status is {products_response.status}.")
 
-                data = await products_response.json()
+                data = await products_response.json(loads=json_codec.loads)
 
                 trading_pairs = []
                 for item in data:
@@ -120,7 +121,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 if products_response.status != 200:
                     raise IOError(f"Error fetching active OKEx markets. HTTP status is {products_response.status}.")
 
-                data = await products_response.json()
+                data = await products_response.json(loads=json_codec.loads)
                 all_markets: pd.DataFrame = pd.DataFrame.from_records(data=data)
                 all_markets.set_index('product_id', inplace=True)
 
@@ -155,7 +156,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(f"Error fetching OKEX market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
             api_data = await response.read()
-            data: Dict[str, Any] = json.loads(api_data)
+            data: Dict[str, Any] = json_codec.loads(api_data)
             data['timestamp'] = __class__.iso_to_timestamp(data['timestamp'])
 
             return data
@@ -191,7 +192,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         elif '"table":"spot/trade"' in decoded_msg:
                             self.logger().debug(f"Received new trade: {decoded_msg}")
 
-                            for data in json.loads(decoded_msg)['data']:
+                            for data in json_codec.loads(decoded_msg)['data']:
                                 trading_pair = data['instrument_id']
                                 trade_message: OrderBookMessage = OkexOrderBook.trade_message_from_exchange(
                                     data, __class__.iso_to_timestamp(data['timestamp']), metadata={"trading_pair": trading_pair}
@@ -248,7 +249,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         if '"event":"subscribe"' in decoded_msg:
                             self.logger().debug(f"Subscribed to channel, full message: {decoded_msg}")
                         elif '"action":"update"' in decoded_msg:
-                            for data in json.loads(decoded_msg)['data']:
+                            for data in json_codec.loads(decoded_msg)['data']:
 
                                 order_book_message: OrderBookMessage = OkexOrderBook.diff_message_from_exchange(data, __class__.iso_to_timestamp(data['timestamp']))
                                 output.put_nowait(order_book_message)
@@ -2,6 +2,7 @@
 import websockets
 import asyncio
 import json
+from hummingbot.core.utils import json_codec
 
 import logging
 
@@ -54,7 +55,7 @@ class OkexAPIUserStreamDataSource(UserStreamTrackerDataSource):
         await self._websocket_connection.send(json.dumps(self._auth.generate_ws_auth()))
 
         resp = await self._websocket_connection.recv()
-        msg = json.loads(inflate(resp))
+        msg = json_codec.loads(inflate(resp))
 
         if msg["success"] is not True:
             self.logger().error(f"Error occurred authenticating to websocket API server. {msg}")
@@ -69,7 +70,7 @@ class OkexAPIUserStreamDataSource(UserStreamTrackerDataSource):
         request = json.dumps(subscribe_request)
         await self._websocket_connection.send(request)
         resp = await self._websocket_connection.recv()
-        msg = json.loads(inflate(resp))
+        msg = json_codec.loads(inflate(resp))
         if msg["event"] != "subscribe":
             self.logger().error(f"Error occurred subscribing to topic. {topic}. {msg}")
         self.logger().info(f"Successfully subscribed to {topic}")
@@ -87,7 +88,7 @@ class OkexAPIUserStreamDataSource(UserStreamTrackerDataSource):
             try:
                 raw_msg = await asyncio.wait_for(self._websocket_connection.recv(), timeout=20)
 
-                yield json.loads(inflate(raw_msg))
+                yield json_codec.loads(inflate(raw_msg))
             except asyncio.TimeoutError:
                 try:
                     await self._websocket_connection.send('ping')
@@ -19,7 +19,7 @@ from typing import (
     Optional,
     Tuple
 )
-import ujson
+from hummingbot.core.utils import json_codec
 
 import hummingbot
 from hummingbot.core.clock cimport Clock
@@ -211,6 +211,7 @@ cdef class OkexExchange(ExchangeBase):
 
     async def start_network(self):
         self._stop_network()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
 
@@ -277,7 +278,7 @@ cdef class OkexExchange(ExchangeBase):
         headers = {"Content-Type": "application/json"}
         url = urljoin(OKEX_BASE_URL, path_url)
         client = await self._http_client()
-        text_data = ujson.dumps(data) if method.upper() == "POST" else None
+        text_data = json_codec.dumps(data) if method.upper() == "POST" else None
 
         if is_auth_required:
             headers.update(self._okex_auth.add_auth_to_params(method, '/' + path_url, text_data))
@@ -292,9 +293,9 @@ cdef class OkexExchange(ExchangeBase):
 
         async with response_coro as response:
             if response.status != 200:
-                raise IOError(f"Error fetching data from {url}. Response: {await response.json()}.")
+                raise IOError(f"Error fetching data from {url}. Response: {await response.json(loads=json_codec.loads)}.")
             try:
-                parsed_response = await response.json()
+                parsed_response = await response.json(loads=json_codec.loads)
                 return parsed_response
             except Exception:
                 raise IOError(f"Error parsing data from {url}.")
@@ -99,7 +99,7 @@ class OkexOrderBookTracker(OrderBookTracker):
             try:
                 message: OrderBookMessage = await message_queue.get()
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    self._apply_diff_message(trading_pair, order_book, message, message.bids, message.asks, message.update_id)
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -3,6 +3,8 @@ from hummingbot.client.config.config_helpers import get_connector_class
 from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
 from hummingbot.client.settings import CONNECTOR_SETTINGS
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.market_data_hub import MarketDataHub
 
 
 def get_order_book_tracker_class(connector_name: str) -> Callable:
@@ -22,7 +24,15 @@ def get_order_book_tracker_class(connector_name: str) -> Callable:
 def create_paper_trade_market(exchange_name: str, trading_pairs: List[str]):
     obt_class = get_order_book_tracker_class(exchange_name)
     conn_setting = CONNECTOR_SETTINGS[exchange_name]
-    obt_params = {"trading_pairs": trading_pairs}
-    return PaperTradeExchange(obt_class(**conn_setting.add_domain_parameter(obt_params)),
+    domain = conn_setting.domain_parameter if conn_setting.is_sub_domain else None
+    # Paper trade markets on the same exchange share their order books and websocket streams through the hub. Each
+    # market records its simulated fills on a composite order book of its own.
+    subscription = MarketDataHub.get_instance().subscribe(conn_setting.base_name(),
+                                                          trading_pairs,
+                                                          obt_class,
+                                                          domain=domain,
+                                                          order_book_overlay=CompositeOrderBook,
+                                                          connector_name=exchange_name)
+    return PaperTradeExchange(subscription,
                               MarketConfig.default_config(),
                               get_connector_class(exchange_name))
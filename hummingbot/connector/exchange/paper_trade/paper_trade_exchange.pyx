@@ -36,6 +36,7 @@ from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
 from hummingbot.core.data_type.composite_order_book cimport CompositeOrderBook
 from hummingbot.core.data_type.limit_order cimport c_create_limit_order_from_cpp_limit_order
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_data_hub import MarketDataSubscription
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.event.events import (
@@ -173,7 +174,9 @@ cdef class PaperTradeExchange(ExchangeBase):
     MARKET_BUY_ORDER_CREATED_EVENT_TAG = MarketEvent.BuyOrderCreated.value
 
     def __init__(self, order_book_tracker: OrderBookTracker, config: MarketConfig, target_market: type):
-        order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
+        if not isinstance(order_book_tracker, MarketDataSubscription):
+            # Market data hub subscriptions overlay composite order books on the shared ones themselves.
+            order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         self._order_book_tracker = order_book_tracker
         super(ExchangeBase, self).__init__()
         self._account_balances = {}
@@ -4,7 +4,7 @@ import asyncio
 import logging
 import pandas as pd
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 
 import hummingbot.connector.exchange.probit.probit_constants as CONSTANTS
@@ -50,7 +50,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
         async with aiohttp.ClientSession() as client:
             async with client.get(f"{CONSTANTS.TICKER_URL.format(domain)}") as response:
                 if response.status == 200:
-                    resp_json = await response.json()
+                    resp_json = await response.json(loads=json_codec.loads)
                     if "data" in resp_json:
                         for market in resp_json["data"]:
                             if market["market_id"] in trading_pairs:
@@ -63,7 +63,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
         async with aiohttp.ClientSession() as client:
             async with client.get(f"{CONSTANTS.MARKETS_URL.format(domain)}") as response:
                 if response.status == 200:
-                    resp_json: Dict[str, Any] = await response.json()
+                    resp_json: Dict[str, Any] = await response.json(loads=json_codec.loads)
                     return [market["id"] for market in resp_json["data"]]
                 return []
 
@@ -78,9 +78,9 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 if response.status != 200:
                     raise IOError(
                         f"Error fetching OrderBook for {trading_pair} at {CONSTANTS.ORDER_BOOK_PATH_URL.format(domain)}. "
-                        f"HTTP {response.status}. Response: {await response.json()}"
+                        f"HTTP {response.status}. Response: {await response.json(loads=json_codec.loads)}"
                     )
-                return await response.json()
+                return await response.json(loads=json_codec.loads)
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         snapshot: Dict[str, Any] = await self.get_order_book_data(trading_pair)
@@ -138,10 +138,10 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             "market_id": trading_pair,
                             "type": "subscribe"
                         }
-                        await ws.send(ujson.dumps(params))
+                        await ws.send(json_codec.dumps(params))
                     async for raw_msg in self._inner_messages(ws):
                         msg_timestamp: int = int(time.time() * 1e3)
-                        msg = ujson.loads(raw_msg)
+                        msg = json_codec.loads(raw_msg)
                         if "recent_trades" not in msg:
                             # Unrecognized response from "recent_trades" channel
                             continue
@@ -179,10 +179,10 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             "market_id": trading_pair,
                             "type": "subscribe"
                         }
-                        await ws.send(ujson.dumps(params))
+                        await ws.send(json_codec.dumps(params))
                     async for raw_msg in self._inner_messages(ws):
                         msg_timestamp: int = int(time.time() * 1e3)
-                        msg: Dict[str, Any] = ujson.loads(raw_msg)
+                        msg: Dict[str, Any] = json_codec.loads(raw_msg)
                         if "order_books" not in msg:
                             # Unrecognized response from "order_books" channel
                             continue
@@ -4,6 +4,7 @@ import asyncio
 import logging
 import time
 import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 
 import hummingbot.connector.exchange.probit.probit_constants as CONSTANTS
@@ -76,7 +77,7 @@ class ProbitAPIUserStreamDataSource(UserStreamTrackerDataSource):
             auth_payload: Dict[str, Any] = await self._probit_auth.get_ws_auth_payload()
             await ws.send(ujson.dumps(auth_payload, escape_forward_slashes=False))
             auth_resp = await ws.recv()
-            auth_resp: Dict[str, Any] = ujson.loads(auth_resp)
+            auth_resp: Dict[str, Any] = json_codec.loads(auth_resp)
 
             if auth_resp["result"] != "ok":
                 self.logger().error(f"Response: {auth_resp}",
@@ -99,7 +100,7 @@ class ProbitAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     "type": "subscribe",
                     "channel": channel
                 }
-                await ws.send(ujson.dumps(sub_payload))
+                await ws.send(json_codec.dumps(sub_payload))
 
         except asyncio.CancelledError:
             raise
@@ -137,7 +138,7 @@ class ProbitAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 self.logger().info("Successfully subscribed to all Private channels.")
 
                 async for msg in self._inner_messages(ws):
-                    output.put_nowait(ujson.loads(msg))
+                    output.put_nowait(json_codec.loads(msg))
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -3,7 +3,7 @@
 import aiohttp
 import base64
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 
 import hummingbot.connector.exchange.probit.probit_constants as CONSTANTS
 
@@ -51,13 +51,13 @@ class ProbitAuth():
                 headers.update({
                     "Authorization": f"Basic {self.token_payload}"
                 })
-                body = ujson.dumps({
+                body = json_codec.dumps({
                     "grant_type": "client_credentials"
                 })
                 resp = await http_client.post(url=CONSTANTS.TOKEN_URL.format(self._domain),
                                               headers=headers,
                                               data=body)
-                token_resp = await resp.json()
+                token_resp = await resp.json(loads=json_codec.loads)
 
                 if resp.status != 200:
                     raise ValueError(f"Error occurred retrieving new OAuth Token. Response: {token_resp}")
@@ -5,7 +5,7 @@ import asyncio
 import logging
 import math
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 
 from decimal import Decimal
 from typing import (
@@ -195,6 +195,7 @@ class ProbitExchange(ExchangeBase):
         It starts tracking order book, polling trading rules,
         updating statuses and tracking user data.
         """
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         if self._trading_required:
@@ -345,11 +346,11 @@ class ProbitExchange(ExchangeBase):
             if method == "GET":
                 response = await client.get(path_url, headers=headers, params=params)
             elif method == "POST":
-                response = await client.post(path_url, headers=headers, data=ujson.dumps(data))
+                response = await client.post(path_url, headers=headers, data=json_codec.dumps(data))
             else:
                 raise NotImplementedError(f"{method} HTTP Method not implemented. ")
 
-            parsed_response = await response.json()
+            parsed_response = await response.json(loads=json_codec.loads)
         except ValueError as e:
             self.logger().error(f"{str(e)}")
             raise ValueError(f"Error authenticating request {method} {path_url}. Error: {str(e)}")
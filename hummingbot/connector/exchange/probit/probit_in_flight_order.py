@@ -1,6 +1,5 @@
 #!/usr/bin/env python
 
-import asyncio
 
 from decimal import Decimal
 from typing import (
@@ -17,6 +16,8 @@ from hummingbot.core.event.events import (
 
 
 class ProbitInFlightOrder(InFlightOrderBase):
+    __slots__ = ()
+
     def __init__(self,
                  client_order_id: str,
                  exchange_order_id: Optional[str],
@@ -36,8 +37,6 @@ class ProbitInFlightOrder(InFlightOrderBase):
             amount,
             initial_state,
         )
-        self.trade_id_set = set()
-        self.cancelled_event = asyncio.Event()
 
     @property
     def is_done(self) -> bool:
@@ -83,7 +82,7 @@ class ProbitInFlightOrder(InFlightOrderBase):
         trade_id = trade_update["id"]
         if str(trade_update["order_id"]) != self.exchange_order_id or trade_id in self.trade_id_set:
             return False
-        self.trade_id_set.add(trade_id)
+        self.add_trade_id(trade_id)
         self.executed_amount_base += Decimal(str(trade_update["quantity"]))
         self.fee_paid += Decimal(str(trade_update["fee_amount"]))
         self.executed_amount_quote += Decimal(str(trade_update["cost"]))
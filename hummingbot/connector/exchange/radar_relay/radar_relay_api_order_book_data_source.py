@@ -12,7 +12,7 @@ from typing import (
 )
 import re
 import time
-import ujson
+from hummingbot.core.utils import json_codec
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -69,7 +69,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             response: aiohttp.ClientResponse = response
             if response.status != 200:
                 raise IOError(f"Error fetching token info. HTTP status is {response.status}.")
-            data = await response.json()
+            data = await response.json(loads=json_codec.loads)
             return {d["address"]: d for d in data}
 
     @classmethod
@@ -83,7 +83,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             response: aiohttp.ClientResponse = response
             if response.status != 200:
                 raise IOError(f"Error fetching active Radar Relay markets. HTTP status is {response.status}.")
-            data = await response.json()
+            data = await response.json(loads=json_codec.loads)
             data: List[Dict[str, any]] = [
                 {**item, **{"baseAsset": item["id"].split("-")[0], "quoteAsset": item["id"].split("-")[1]}}
                 for item in data
@@ -108,7 +108,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     async with client.get(f"{MARKETS_URL}?perPage=100&page={page_count}", timeout=10) \
                             as response:
                         if response.status == 200:
-                            markets = await response.json()
+                            markets = await response.json(loads=json_codec.loads)
                             new_trading_pairs = set(map(lambda details: details.get('id'), markets))
                             if len(new_trading_pairs) == 0:
                                 break
@@ -134,7 +134,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Radar Relay market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            return await response.json()
+            return await response.json(loads=json_codec.loads)
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         async with aiohttp.ClientSession() as client:
@@ -191,9 +191,9 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             "topic": "BOOK",
                             "market": trading_pair
                         }
-                        await ws.send(ujson.dumps(request))
+                        await ws.send(json_codec.dumps(request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_codec.loads(raw_msg)
                         # Valid Diff messages from RadarRelay have action key
                         if "action" in msg:
                             diff_msg: RadarRelayOrderBookMessage = RadarRelayOrderBook.diff_message_from_exchange(
@@ -57,6 +57,7 @@ from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils_v3 import fix_signa
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_exchange_v3 import ZeroExExchange
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils import json_codec
 
 rrm_logger = None
 s_decimal_0 = Decimal(0)
@@ -610,7 +611,7 @@ cdef class RadarRelayExchange(ExchangeBase):
                     if response.status == 201:
                         return response
                     elif response.status == 200:
-                        response_json = await response.json()
+                        response_json = await response.json(loads=json_codec.loads)
                         return response_json
                     else:
                         raise IOError
@@ -925,6 +926,7 @@ cdef class RadarRelayExchange(ExchangeBase):
 
     async def start_network(self):
         self._stop_network()
+        self._order_book_tracker.connector_name = self.name
         self._order_book_tracker.start()
         self._status_polling_task = safe_ensure_future(self._status_polling_loop())
         if self._trading_required:
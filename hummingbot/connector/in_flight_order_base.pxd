@@ -1,15 +1,23 @@
 cdef class InFlightOrderBase:
     cdef:
-        public str client_order_id
-        public str exchange_order_id
-        public str trading_pair
-        public object order_type
-        public object trade_type
-        public object price
-        public object amount
-        public object executed_amount_base
-        public object executed_amount_quote
-        public str fee_asset
-        public object fee_paid
-        public str last_state
-        public object exchange_order_id_update_event
+        str _client_order_id
+        str _exchange_order_id
+        str _trading_pair
+        str _base_asset
+        str _quote_asset
+        object _order_type
+        object _trade_type
+        object _price
+        object _amount
+        object _executed_amount_base
+        object _executed_amount_quote
+        str _fee_asset
+        object _fee_paid
+        str _last_state
+        object _trade_ids
+        object _exchange_order_id_update_event
+        object _cancelled_event
+        dict _json
+        long long _version
+
+    cdef c_did_change(self)
@@ -2,7 +2,10 @@ import asyncio
 from decimal import Decimal
 from typing import (
     Any,
+    Collection,
     Dict,
+    Hashable,
+    Iterable,
     Optional
 )
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -13,8 +16,20 @@ from hummingbot.core.event.events import (
 from async_timeout import timeout
 
 s_decimal_0 = Decimal(0)
+# Fill ids are kept in a tuple up to this count, in a set beyond.
+cdef int SMALL_TRADE_ID_COUNT = 8
+
 
 cdef class InFlightOrderBase:
+    """
+    The state of an order being tracked by a connector.
+
+    The order is kept compact, as a connector may track many of them: its fields are C attributes, the events to wait
+    for an exchange order id or a cancellation are only created when used, the assets of the trading pair are parsed
+    once and the fill ids are kept in a tuple while there are few. to_json() is cached until the order changes, and
+    version counts the changes, so that unchanged orders can be skipped when saving tracking states.
+    """
+
     def __init__(self,
                  client_order_id: str,
                  exchange_order_id: Optional[str],
@@ -25,19 +40,178 @@ cdef class InFlightOrderBase:
                  amount: Decimal,
                  initial_state: str):
 
-        self.client_order_id = client_order_id
-        self.exchange_order_id = exchange_order_id
-        self.trading_pair = trading_pair
-        self.order_type = order_type
-        self.trade_type = trade_type
-        self.price = price
-        self.amount = amount
-        self.executed_amount_base = s_decimal_0
-        self.executed_amount_quote = s_decimal_0
-        self.fee_asset = None
-        self.fee_paid = s_decimal_0
-        self.last_state = initial_state
-        self.exchange_order_id_update_event = asyncio.Event()
+        self._client_order_id = client_order_id
+        self._exchange_order_id = exchange_order_id
+        self._trading_pair = trading_pair
+        self._order_type = order_type
+        self._trade_type = trade_type
+        self._price = price
+        self._amount = amount
+        self._executed_amount_base = s_decimal_0
+        self._executed_amount_quote = s_decimal_0
+        self._fee_asset = None
+        self._fee_paid = s_decimal_0
+        self._last_state = initial_state
+        self._trade_ids = ()
+
+    cdef c_did_change(self):
+        self._json = None
+        self._version += 1
+
+    @property
+    def client_order_id(self) -> str:
+        return self._client_order_id
+
+    @client_order_id.setter
+    def client_order_id(self, str value):
+        self._client_order_id = value
+        self.c_did_change()
+
+    @property
+    def exchange_order_id(self) -> Optional[str]:
+        return self._exchange_order_id
+
+    @exchange_order_id.setter
+    def exchange_order_id(self, str value):
+        self._exchange_order_id = value
+        self.c_did_change()
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @trading_pair.setter
+    def trading_pair(self, str value):
+        self._trading_pair = value
+        self._base_asset = None
+        self._quote_asset = None
+        self.c_did_change()
+
+    @property
+    def order_type(self) -> OrderType:
+        return self._order_type
+
+    @order_type.setter
+    def order_type(self, value: OrderType):
+        self._order_type = value
+        self.c_did_change()
+
+    @property
+    def trade_type(self) -> TradeType:
+        return self._trade_type
+
+    @trade_type.setter
+    def trade_type(self, value: TradeType):
+        self._trade_type = value
+        self.c_did_change()
+
+    @property
+    def price(self) -> Decimal:
+        return self._price
+
+    @price.setter
+    def price(self, value: Decimal):
+        self._price = value
+        self.c_did_change()
+
+    @property
+    def amount(self) -> Decimal:
+        return self._amount
+
+    @amount.setter
+    def amount(self, value: Decimal):
+        self._amount = value
+        self.c_did_change()
+
+    @property
+    def executed_amount_base(self) -> Decimal:
+        return self._executed_amount_base
+
+    @executed_amount_base.setter
+    def executed_amount_base(self, value: Decimal):
+        self._executed_amount_base = value
+        self.c_did_change()
+
+    @property
+    def executed_amount_quote(self) -> Decimal:
+        return self._executed_amount_quote
+
+    @executed_amount_quote.setter
+    def executed_amount_quote(self, value: Decimal):
+        self._executed_amount_quote = value
+        self.c_did_change()
+
+    @property
+    def fee_asset(self) -> Optional[str]:
+        return self._fee_asset
+
+    @fee_asset.setter
+    def fee_asset(self, str value):
+        self._fee_asset = value
+        self.c_did_change()
+
+    @property
+    def fee_paid(self) -> Decimal:
+        return self._fee_paid
+
+    @fee_paid.setter
+    def fee_paid(self, value: Decimal):
+        self._fee_paid = value
+        self.c_did_change()
+
+    @property
+    def last_state(self) -> str:
+        return self._last_state
+
+    @last_state.setter
+    def last_state(self, str value):
+        self._last_state = value
+        self.c_did_change()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def exchange_order_id_update_event(self) -> asyncio.Event:
+        if self._exchange_order_id_update_event is None:
+            self._exchange_order_id_update_event = asyncio.Event()
+        return self._exchange_order_id_update_event
+
+    @property
+    def cancelled_event(self) -> asyncio.Event:
+        if self._cancelled_event is None:
+            self._cancelled_event = asyncio.Event()
+        return self._cancelled_event
+
+    @property
+    def trade_id_set(self) -> Collection[Hashable]:
+        """
+        The ids of the fills recorded with add_trade_id().
+        """
+        return self._trade_ids
+
+    @trade_id_set.setter
+    def trade_id_set(self, trade_ids: Iterable[Hashable]):
+        self._trade_ids = ()
+        for trade_id in trade_ids:
+            self.add_trade_id(trade_id)
+
+    def add_trade_id(self, trade_id: Hashable) -> bool:
+        """
+        Records the id of a fill of the order, returns False if it was already recorded. Ids are kept as the exchange
+        reports them, strings or numbers.
+        """
+        if trade_id in self._trade_ids:
+            return False
+        if isinstance(self._trade_ids, set):
+            self._trade_ids.add(trade_id)
+        elif len(self._trade_ids) < SMALL_TRADE_ID_COUNT:
+            self._trade_ids = self._trade_ids + (trade_id,)
+        else:
+            self._trade_ids = set(self._trade_ids)
+            self._trade_ids.add(trade_id)
+        return True
 
     def __repr__(self) -> str:
         return f"InFlightOrder(" \
@@ -68,15 +242,21 @@ cdef class InFlightOrderBase:
 
     @property
     def base_asset(self) -> str:
-        return self.trading_pair.split("-")[0]
+        if self._base_asset is None:
+            self._base_asset = self._trading_pair.split("-")[0]
+        return self._base_asset
 
     @property
     def quote_asset(self) -> str:
-        return self.trading_pair.split("-")[1]
+        if self._quote_asset is None:
+            self._quote_asset = self._trading_pair.split("-")[1]
+        return self._quote_asset
 
     def update_exchange_order_id(self, exchange_id: str):
         self.exchange_order_id = exchange_id
-        self.exchange_order_id_update_event.set()
+        # Only set when get_exchange_order_id() is waiting for it, or has been.
+        if self._exchange_order_id_update_event is not None:
+            self._exchange_order_id_update_event.set()
 
     async def get_exchange_order_id(self):
         if self.exchange_order_id is None:
@@ -96,20 +276,25 @@ cdef class InFlightOrderBase:
         )
 
     def to_json(self) -> Dict[str, Any]:
-        return {
-            "client_order_id": self.client_order_id,
-            "exchange_order_id": self.exchange_order_id,
-            "trading_pair": self.trading_pair,
-            "order_type": self.order_type.name,
-            "trade_type": self.trade_type.name,
-            "price": str(self.price),
-            "amount": str(self.amount),
-            "executed_amount_base": str(self.executed_amount_base),
-            "executed_amount_quote": str(self.executed_amount_quote),
-            "fee_asset": self.fee_asset,
-            "fee_paid": str(self.fee_paid),
-            "last_state": self.last_state
-        }
+        """
+        The order as a dict of JSON values. The dict is cached until the order changes, and must not be modified.
+        """
+        if self._json is None:
+            self._json = {
+                "client_order_id": self._client_order_id,
+                "exchange_order_id": self._exchange_order_id,
+                "trading_pair": self._trading_pair,
+                "order_type": self._order_type.name,
+                "trade_type": self._trade_type.name,
+                "price": str(self._price),
+                "amount": str(self._amount),
+                "executed_amount_base": str(self._executed_amount_base),
+                "executed_amount_quote": str(self._executed_amount_quote),
+                "fee_asset": self._fee_asset,
+                "fee_paid": str(self._fee_paid),
+                "last_state": self._last_state
+            }
+        return self._json
 
     @classmethod
     def from_json(cls, data: Dict[str, Any]) -> InFlightOrderBase:
@@ -10,6 +10,7 @@ from sqlalchemy.orm import (
 import time
 import threading
 from typing import (
+    Any,
     Dict,
     List,
     Optional,
@@ -32,9 +33,12 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.pubsub import EventSubscription
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.client.performance import PerformanceMetricsStore
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_delta import MarketStateDelta
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
@@ -43,6 +47,9 @@ from hummingbot.model.funding_payment import FundingPayment
 
 
 class MarketsRecorder:
+    # Market state deltas are compacted once there are more of them than tracking states, and at least this many.
+    MARKET_STATE_COMPACTION_MIN_DELTAS = 100
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
@@ -52,7 +59,8 @@ class MarketsRecorder:
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 performance_metrics_store: Optional[PerformanceMetricsStore] = None):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -61,6 +69,7 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._performance_metrics_store: Optional[PerformanceMetricsStore] = performance_metrics_store
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -90,6 +99,10 @@ class MarketsRecorder:
             (MarketEvent.OrderExpired, self._expire_order_forwarder),
             (MarketEvent.FundingPaymentCompleted, self._funding_payment_forwarder)
         ]
+        self._subscriptions: List[EventSubscription] = []
+        # The tracking states saved by config file path and market name, snapshot and deltas applied.
+        self._saved_tracking_states: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._market_state_delta_counts: Dict[Tuple[str, str], int] = {}
 
     @property
     def sql(self) -> SQLConnectionManager:
@@ -114,12 +127,12 @@ class MarketsRecorder:
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
-                market.add_listener(event_pair[0], event_pair[1])
+                self._subscriptions.append(market.subscribe(event_pair[0], event_pair[1]))
 
     def stop(self):
-        for market in self._markets:
-            for event_pair in self._event_pairs:
-                market.remove_listener(event_pair[0], event_pair[1])
+        for subscription in self._subscriptions:
+            subscription.unsubscribe()
+        self._subscriptions.clear()
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -150,22 +163,63 @@ class MarketsRecorder:
             return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, no_commit: bool = False):
+        """
+        Saves the tracking states of the market that changed since they were last saved, as market state deltas.
+        """
         session: Session = self.session
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
+        saved_key: Tuple[str, str] = (config_file_path, market.display_name)
+        saved_states: Dict[str, Any] = self._get_saved_tracking_states(config_file_path, market)
+        upserts, deletes = market.tracking_state_deltas(saved_states)
+        timestamp: int = self.db_timestamp
+
+        for key, state in upserts.items():
+            session.add(MarketStateDelta(config_file_path=config_file_path,
+                                         market=market.display_name,
+                                         timestamp=timestamp,
+                                         key=key,
+                                         state=state))
+            saved_states[key] = state
+        for key in deletes:
+            session.add(MarketStateDelta(config_file_path=config_file_path,
+                                         market=market.display_name,
+                                         timestamp=timestamp,
+                                         key=key,
+                                         state=None))
+            del saved_states[key]
+        self._market_state_delta_counts[saved_key] += len(upserts) + len(deletes)
+        if self._market_state_delta_counts[saved_key] > max(self.MARKET_STATE_COMPACTION_MIN_DELTAS,
+                                                            len(saved_states)):
+            self.compact_market_states(config_file_path, market)
+
+        if not no_commit:
+            session.commit()
+
+    def compact_market_states(self, config_file_path: str, market: ConnectorBase):
+        """
+        Folds the market state deltas of the market into its market state. Doesn't commit.
+        """
+        session: Session = self.session
+        saved_key: Tuple[str, str] = (config_file_path, market.display_name)
+        saved_states: Dict[str, Any] = self._get_saved_tracking_states(config_file_path, market)
+        market_states: Optional[MarketState] = self._query_market_states(config_file_path, market)
         timestamp: int = self.db_timestamp
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = dict(saved_states)
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
                                         market=market.display_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=dict(saved_states))
             session.add(market_states)
-
-        if not no_commit:
-            session.commit()
+        session.flush()
+        (session
+         .query(MarketStateDelta)
+         .filter(MarketStateDelta.config_file_path == config_file_path,
+                 MarketStateDelta.market == market.display_name)
+         .delete(synchronize_session=False))
+        self._market_state_delta_counts[saved_key] = 0
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
@@ -174,6 +228,17 @@ class MarketsRecorder:
             market.restore_tracking_states(market_states.saved_state)
 
     def get_market_states(self, config_file_path: str, market: ConnectorBase) -> Optional[MarketState]:
+        """
+        The market state of the market, compacted first if market state deltas were saved since.
+        """
+        saved_key: Tuple[str, str] = (config_file_path, market.display_name)
+        self._get_saved_tracking_states(config_file_path, market)
+        if self._market_state_delta_counts[saved_key] > 0:
+            self.compact_market_states(config_file_path, market)
+            self.session.commit()
+        return self._query_market_states(config_file_path, market)
+
+    def _query_market_states(self, config_file_path: str, market: ConnectorBase) -> Optional[MarketState]:
         session: Session = self.session
         query: Query = (session
                         .query(MarketState)
@@ -182,6 +247,26 @@ class MarketsRecorder:
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def _get_saved_tracking_states(self, config_file_path: str, market: ConnectorBase) -> Dict[str, Any]:
+        saved_key: Tuple[str, str] = (config_file_path, market.display_name)
+        if saved_key not in self._saved_tracking_states:
+            market_states: Optional[MarketState] = self._query_market_states(config_file_path, market)
+            saved_states: Dict[str, Any] = dict(market_states.saved_state) if market_states is not None else {}
+            deltas: List[MarketStateDelta] = (self.session
+                                              .query(MarketStateDelta)
+                                              .filter(MarketStateDelta.config_file_path == config_file_path,
+                                                      MarketStateDelta.market == market.display_name)
+                                              .order_by(MarketStateDelta.id)
+                                              .all())
+            for delta in deltas:
+                if delta.state is None:
+                    saved_states.pop(delta.key, None)
+                else:
+                    saved_states[delta.key] = delta.state
+            self._saved_tracking_states[saved_key] = saved_states
+            self._market_state_delta_counts[saved_key] = len(deltas)
+        return self._saved_tracking_states[saved_key]
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
@@ -260,6 +345,8 @@ class MarketsRecorder:
                                                  trade_fee=TradeFee.to_json(evt.trade_fee),
                                                  exchange_trade_id=evt.exchange_trade_id,
                                                  position=evt.position if evt.position else "NILL",)
+        if self._performance_metrics_store is not None:
+            self._performance_metrics_store.add_trade(trade_fill_record)
         session.add(order_status)
         session.add(trade_fill_record)
         self.save_market_states(self._config_file_path, market, no_commit=True)
@@ -21,6 +21,7 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils import json_codec
 
 
 class MockAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -70,7 +71,7 @@ class MockAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            parsed_response = await response.json()
+            parsed_response = await response.json(loads=json_codec.loads)
             return parsed_response
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
@@ -6,6 +6,7 @@ from decimal import Decimal
 import logging
 from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils import json_codec
 
 PARROT_MINER_BASE_URL = "https://papi.hummingbot.io/v1/mining_data/"
 
@@ -56,7 +57,7 @@ async def get_market_snapshots(market_id: int):
     async with aiohttp.ClientSession() as client:
         url = f"{PARROT_MINER_BASE_URL}market_snapshots/{market_id}?aggregate=1m"
         resp = await client.get(url)
-        resp_json = await resp.json()
+        resp_json = await resp.json(loads=json_codec.loads)
     return resp_json
 
 
@@ -65,7 +66,7 @@ async def get_active_campaigns(exchange: str, trading_pairs: List[str] = []) ->
     async with aiohttp.ClientSession() as client:
         url = f"{PARROT_MINER_BASE_URL}campaigns"
         resp = await client.get(url)
-        resp_json = await resp.json()
+        resp_json = await resp.json(loads=json_codec.loads)
     for campaign_retval in resp_json:
         for market in campaign_retval["markets"]:
             if market["exchange_name"] != exchange:
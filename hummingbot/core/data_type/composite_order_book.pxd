@@ -1,8 +1,14 @@
 # distutils: language=c++
+from libc.stdint cimport int64_t
 from hummingbot.core.data_type.order_book cimport OrderBook
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
+        OrderBook _order_book
+        dict _event_forwarders
 
+    cdef c_remove_event_forwarder(self, int64_t event_tag)
+    cdef OrderBook c_get_order_book(self)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef tuple c_top_levels(self, int depth)
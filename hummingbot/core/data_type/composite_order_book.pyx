@@ -1,7 +1,12 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-from typing import Iterator
+from itertools import islice
+from typing import (
+    Iterator,
+    List,
+)
+from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from cython.operator cimport(
     postincrement as inc,
@@ -10,7 +15,10 @@ from cython.operator cimport(
 )
 from libcpp.vector cimport vector
 
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 
@@ -20,18 +28,91 @@ cdef class CompositeOrderBook(OrderBook):
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
     the actual order book.
     Override the order book bid_entries, ask_entries methods to return the composite order book entries
+
+    When an order book is given, the composite is an overlay on it: the entries come from the given book, which can
+    be shared with other consumers, while the recorded orders stay with the overlay. Trade and top changed events of
+    the given book are forwarded to the overlay's listeners, the overlay only listens to the given book while it has
+    listeners of its own for the event.
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
         self._traded_order_book = OrderBook()
+        self._order_book = order_book
+        self._event_forwarders = {}
+
+    cdef c_add_listener(self, int64_t event_tag, EventListener listener):
+        OrderBook.c_add_listener(self, event_tag, listener)
+        if (self._order_book is not None and event_tag not in self._event_forwarders and
+                event_tag in (self.ORDER_BOOK_TRADE_EVENT_TAG, self.ORDER_BOOK_TOP_CHANGED_EVENT_TAG)):
+            # The order book keeps weak references to its listeners, the overlay keeps the forwarders alive.
+            forwarder = SourceInfoEventForwarder(self._forward_event)
+            self._order_book.c_add_listener(event_tag, forwarder)
+            self._event_forwarders[event_tag] = forwarder
+
+    cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
+        OrderBook.c_remove_listener(self, event_tag, listener)
+        if not self.c_has_listeners(event_tag):
+            self.c_remove_event_forwarder(event_tag)
+
+    cdef c_remove_event_forwarder(self, int64_t event_tag):
+        forwarder = self._event_forwarders.pop(event_tag, None)
+        if forwarder is not None:
+            self._order_book.c_remove_listener(event_tag, forwarder)
+
+    def _forward_event(self, event_tag: int, order_book: OrderBook, event_object):
+        if self.c_has_listeners(event_tag):
+            self.c_trigger_event(event_tag, event_object)
+        else:
+            # The overlay's listeners were garbage collected without being removed.
+            self.c_remove_event_forwarder(event_tag)
+
+    @property
+    def forwarded_event_tags(self) -> List[int]:
+        """
+        The events of the given order book the overlay listens to.
+        """
+        return list(self._event_forwarders.keys())
+
+    cdef OrderBook c_get_order_book(self):
+        return self if self._order_book is None else self._order_book
+
+    @property
+    def order_book(self) -> OrderBook:
+        """
+        The order book the recorded orders are applied to.
+        """
+        return self.c_get_order_book()
 
     @property
     def traded_order_book(self) -> OrderBook:
         return self._traded_order_book
 
+    @property
+    def version(self) -> int:
+        return self.c_get_order_book()._version + self._traded_order_book._version
+
+    @property
+    def last_trade_price(self) -> float:
+        return self.c_get_order_book()._last_trade_price
+
+    @last_trade_price.setter
+    def last_trade_price(self, value: float):
+        cdef OrderBook order_book = self.c_get_order_book()
+        order_book._last_trade_price = value
+        order_book._version += 1
+
+    @property
+    def snapshot_uid(self) -> int:
+        return self.c_get_order_book()._snapshot_uid
+
+    @property
+    def last_diff_uid(self) -> int:
+        return self.c_get_order_book()._last_diff_uid
+
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._traded_order_book._version += 1
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -77,21 +158,22 @@ cdef class CompositeOrderBook(OrderBook):
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
-        return super().bid_entries()
+        return OrderBook.bid_entries(self.c_get_order_book())
 
     def original_ask_entries(self) -> Iterator[OrderBookRow]:
-        return super().ask_entries()
+        return OrderBook.ask_entries(self.c_get_order_book())
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].reverse_iterator order_it = self._bid_book.rbegin()
+            OrderBook order_book = self.c_get_order_book()
+            set[OrderBookEntry].reverse_iterator order_it = order_book._bid_book.rbegin()
             set[OrderBookEntry].reverse_iterator traded_order_it = self._traded_order_book._bid_book.rbegin()
             OrderBookEntry traded_order_entry
             OrderBookEntry original_order_entry
             vector[OrderBookEntry] cpp_asks_changes
             vector[OrderBookEntry] cpp_bids_changes
 
-        while order_it != self._bid_book.rend():
+        while order_it != order_book._bid_book.rend():
             original_order_entry = deref(order_it)
             original_order_price = original_order_entry.getPrice()
             original_order_amount = original_order_entry.getAmount()
@@ -129,18 +211,19 @@ cdef class CompositeOrderBook(OrderBook):
 
             inc(order_it)
 
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, order_book._last_diff_uid)
 
     def ask_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].iterator order_it = self._ask_book.begin()
+            OrderBook order_book = self.c_get_order_book()
+            set[OrderBookEntry].iterator order_it = order_book._ask_book.begin()
             set[OrderBookEntry].iterator traded_order_it = self._traded_order_book._ask_book.begin()
             OrderBookEntry original_order_entry
             OrderBookEntry traded_order_entry
             vector[OrderBookEntry] cpp_asks_changes
             vector[OrderBookEntry] cpp_bids_changes
 
-        while order_it != self._ask_book.end():
+        while order_it != order_book._ask_book.end():
             original_order_entry = deref(order_it)
             original_order_price = original_order_entry.getPrice()
             original_order_amount = original_order_entry.getAmount()
@@ -177,11 +260,12 @@ cdef class CompositeOrderBook(OrderBook):
 
             inc(order_it)
 
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, order_book._last_diff_uid)
 
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
-            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            OrderBook order_book = self.c_get_order_book()
+            set[OrderBookEntry] *book = ref(order_book._ask_book) if is_buy else ref(order_book._bid_book)
         if deref(book).size() < 1:
             raise EnvironmentError("Order book is empty - no price quote is possible.")
 
@@ -196,3 +280,6 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    cdef tuple c_top_levels(self, int depth):
+        return list(islice(self.bid_entries(), depth)), list(islice(self.ask_entries(), depth))
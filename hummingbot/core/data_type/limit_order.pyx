@@ -9,10 +9,16 @@ import pandas as pd
 from typing import List
 import time
 
+from hummingbot.core.utils.table_formatter import Table
+
 cdef class LimitOrder:
     @classmethod
     def to_pandas(cls, limit_orders: List[LimitOrder], mid_price: float = 0.0, hanging_ids: List[str] = None) \
             -> pd.DataFrame:
+        return cls.to_table(limit_orders, mid_price, hanging_ids).to_pandas()
+
+    @classmethod
+    def to_table(cls, limit_orders: List[LimitOrder], mid_price: float = 0.0, hanging_ids: List[str] = None) -> Table:
         buys = [o for o in limit_orders if o.is_buy]
         buys.sort(key=lambda x: x.price, reverse=True)
         sells = [o for o in limit_orders if not o.is_buy]
@@ -28,12 +34,11 @@ cdef class LimitOrder:
                 float(order.quantity),
                 # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
                 ("n/a" if "//" in order.client_order_id else
-                 pd.Timestamp(int(time.time()) - int(order.client_order_id[-16:])/1e6,
-                              unit='s', tz='UTC').strftime('%H:%M:%S')),
+                 time.strftime('%H:%M:%S', time.gmtime(int(time.time()) - int(order.client_order_id[-16:])/1e6))),
                 "n/a" if hanging_ids is None else ("yes" if order.client_order_id in hanging_ids else "no")
             ] for order in limit_orders]
 
-        return pd.DataFrame(data=data, columns=columns)
+        return Table(data=data, columns=columns)
 
     def __init__(self,
                  client_order_id: str,
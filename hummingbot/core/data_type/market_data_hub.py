@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+
+import logging
+from collections import defaultdict
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.logger import HummingbotLogger
+
+VenueKey = Tuple[str, Optional[str]]
+PairKey = Tuple[str, Optional[str], str]
+
+
+class MarketDataSubscription:
+    """
+    A consumer's view on the order books of one venue. It exposes the part of the OrderBookTracker interface that
+    order book consumers use, so it can be handed over wherever a tracker is expected, and it resolves the shared
+    order books through the hub every time since the underlying trackers can be replaced before they are started.
+
+    A consumer that changes its order books, e.g. a paper trade market recording its simulated fills, gets an overlay
+    of its own on each shared order book, so the changes don't leak to the other consumers.
+    """
+    def __init__(self,
+                 hub: "MarketDataHub",
+                 exchange: str,
+                 domain: Optional[str],
+                 trading_pairs: List[str],
+                 order_book_overlay: Optional[Callable[[OrderBook], OrderBook]] = None):
+        self._hub: MarketDataHub = hub
+        self._exchange: str = exchange
+        self._domain: Optional[str] = domain
+        self._trading_pairs: List[str] = trading_pairs
+        self._order_book_overlay: Optional[Callable[[OrderBook], OrderBook]] = order_book_overlay
+        self._overlays: Dict[str, Tuple[OrderBook, OrderBook]] = {}
+        self._active: bool = False
+
+    @property
+    def exchange(self) -> str:
+        return self._exchange
+
+    @property
+    def exchange_name(self) -> str:
+        return self._hub.get_tracker(self._exchange, self._domain, self._trading_pairs[0]).exchange_name
+
+    @property
+    def domain(self) -> Optional[str]:
+        return self._domain
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    @property
+    def data_source(self) -> OrderBookTrackerDataSource:
+        return self._hub.get_tracker(self._exchange, self._domain, self._trading_pairs[0]).data_source
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        order_books = {}
+        for trading_pair in self._trading_pairs:
+            tracker = self._hub.get_tracker(self._exchange, self._domain, trading_pair)
+            if tracker is not None and trading_pair in tracker.order_books:
+                order_books[trading_pair] = self._get_order_book(trading_pair, tracker.order_books[trading_pair])
+        return order_books
+
+    def _get_order_book(self, trading_pair: str, shared_order_book: OrderBook) -> OrderBook:
+        if self._order_book_overlay is None:
+            return shared_order_book
+        overlay: Optional[Tuple[OrderBook, OrderBook]] = self._overlays.get(trading_pair)
+        # A restarted tracker comes with new order books.
+        if overlay is None or overlay[0] is not shared_order_book:
+            overlay = (shared_order_book, self._order_book_overlay(shared_order_book))
+            self._overlays[trading_pair] = overlay
+        return overlay[1]
+
+    @property
+    def ready(self) -> bool:
+        trackers = self._hub.get_trackers(self._exchange, self._domain, self._trading_pairs)
+        return len(trackers) > 0 and all(tracker.ready for tracker in trackers)
+
+    def start(self):
+        if not self._active:
+            self._hub.acquire(self)
+            self._active = True
+
+    def stop(self):
+        if self._active:
+            self._active = False
+            self._hub.release(self)
+
+
+class MarketDataHub:
+    """
+    Process wide registry of order book trackers, keyed by (exchange, domain, trading pair).
+
+    Consumers subscribe to the pairs they need and get a MarketDataSubscription. All subscriptions to the same venue
+    share one tracker, hence one set of websocket streams and one OrderBook per pair. Pairs requested before the
+    venue's tracker is started are merged into it, pairs requested afterwards get a tracker of their own. Trackers
+    are reference counted: they start with their first active subscription and stop with their last.
+    """
+    _mdh_logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["MarketDataHub"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mdh_logger is None:
+            cls._mdh_logger = logging.getLogger(__name__)
+        return cls._mdh_logger
+
+    @classmethod
+    def get_instance(cls) -> "MarketDataHub":
+        if cls._shared_instance is None:
+            cls._shared_instance = MarketDataHub()
+        return cls._shared_instance
+
+    def __init__(self):
+        self._pair_trackers: Dict[PairKey, OrderBookTracker] = {}
+        self._ref_counts: Dict[PairKey, int] = defaultdict(int)
+        self._pending_trackers: Dict[VenueKey, OrderBookTracker] = {}
+        self._tracker_factories: Dict[VenueKey, Callable[..., OrderBookTracker]] = {}
+        self._connector_names: Dict[VenueKey, str] = {}
+        self._subscription_count: int = 0
+
+    @property
+    def trackers(self) -> List[OrderBookTracker]:
+        unique_trackers = []
+        for tracker in self._pair_trackers.values():
+            if not any(tracker is t for t in unique_trackers):
+                unique_trackers.append(tracker)
+        return unique_trackers
+
+    @property
+    def status_dict(self) -> Dict[str, int]:
+        return {
+            "trackers": len(self.trackers),
+            "trading_pairs": len(self._pair_trackers),
+            "active_pairs": len([k for k, count in self._ref_counts.items() if count > 0]),
+            "active_subscriptions": self._subscription_count,
+        }
+
+    def subscribe(self,
+                  exchange: str,
+                  trading_pairs: List[str],
+                  tracker_factory: Callable[..., OrderBookTracker],
+                  domain: Optional[str] = None,
+                  order_book_overlay: Optional[Callable[[OrderBook], OrderBook]] = None,
+                  connector_name: Optional[str] = None) -> MarketDataSubscription:
+        """
+        Registers interest in the order books of the given pairs. Nothing is streamed until the subscription is
+        started.
+        :param tracker_factory: called as tracker_factory(trading_pairs=[...]) (plus domain=... when a domain is
+        given) to build the venue's tracker
+        :param order_book_overlay: called with each shared order book to build the subscription's own view on it,
+        e.g. CompositeOrderBook for paper trading
+        :param connector_name: the name of the venue's connector (e.g. binance_us), the venue's trackers are named
+        after it, defaults to the exchange
+        """
+        if len(trading_pairs) == 0:
+            raise ValueError("At least one trading pair is required to subscribe to market data.")
+        venue: VenueKey = (exchange, domain)
+        self._tracker_factories.setdefault(venue, tracker_factory)
+        self._connector_names.setdefault(venue, connector_name if connector_name is not None else exchange)
+        self._add_trading_pairs(venue, trading_pairs)
+        return MarketDataSubscription(self, exchange, domain, list(trading_pairs), order_book_overlay)
+
+    def get_tracker(self, exchange: str, domain: Optional[str], trading_pair: str) -> Optional[OrderBookTracker]:
+        return self._pair_trackers.get((exchange, domain, trading_pair))
+
+    def get_trackers(self, exchange: str, domain: Optional[str], trading_pairs: List[str]) -> List[OrderBookTracker]:
+        trackers = []
+        for trading_pair in trading_pairs:
+            tracker = self.get_tracker(exchange, domain, trading_pair)
+            if tracker is not None and not any(tracker is t for t in trackers):
+                trackers.append(tracker)
+        return trackers
+
+    def acquire(self, subscription: MarketDataSubscription):
+        venue: VenueKey = (subscription.exchange, subscription.domain)
+        # The pairs are gone if every consumer released them in the meantime.
+        self._add_trading_pairs(venue, subscription.trading_pairs)
+        pending_tracker = self._pending_trackers.get(venue)
+        self._subscription_count += 1
+        for trading_pair in subscription.trading_pairs:
+            self._ref_counts[(venue[0], venue[1], trading_pair)] += 1
+        for tracker in self.get_trackers(venue[0], venue[1], subscription.trading_pairs):
+            if tracker is pending_tracker:
+                del self._pending_trackers[venue]
+                tracker.start()
+                self.logger().debug(f"Started shared order book tracker for {venue[0]} "
+                                    f"({len(self._tracked_pairs(tracker))} trading pairs).")
+
+    def release(self, subscription: MarketDataSubscription):
+        venue: VenueKey = (subscription.exchange, subscription.domain)
+        released_trackers = []
+        self._subscription_count -= 1
+        for trading_pair in subscription.trading_pairs:
+            key: PairKey = (venue[0], venue[1], trading_pair)
+            if self._ref_counts[key] > 0:
+                self._ref_counts[key] -= 1
+            tracker = self._pair_trackers.get(key)
+            if tracker is not None and not any(tracker is t for t in released_trackers):
+                released_trackers.append(tracker)
+        for tracker in released_trackers:
+            tracked_pairs = self._tracked_pairs(tracker)
+            if tracker is self._pending_trackers.get(venue):
+                continue
+            if all(self._ref_counts[key] == 0 for key in tracked_pairs):
+                tracker.stop()
+                for key in tracked_pairs:
+                    del self._pair_trackers[key]
+                    del self._ref_counts[key]
+                self.logger().debug(f"Stopped shared order book tracker for {venue[0]}.")
+
+    def _tracked_pairs(self, tracker: OrderBookTracker) -> List[PairKey]:
+        return [key for key, t in self._pair_trackers.items() if t is tracker]
+
+    def _add_trading_pairs(self, venue: VenueKey, trading_pairs: List[str]):
+        new_pairs: List[str] = [trading_pair for trading_pair in trading_pairs
+                                if (venue[0], venue[1], trading_pair) not in self._pair_trackers]
+        if len(new_pairs) == 0:
+            return
+        # Data sources take their trading pairs at construction time, so the pending tracker is rebuilt with the
+        # union of pairs. That is cheap as long as it hasn't been started.
+        pending_tracker: Optional[OrderBookTracker] = self._pending_trackers.get(venue)
+        pending_pairs: Set[str] = set()
+        if pending_tracker is not None:
+            pending_pairs = {key[2] for key in self._tracked_pairs(pending_tracker)}
+        all_pairs: List[str] = sorted(pending_pairs.union(new_pairs))
+        tracker: OrderBookTracker = self._create_tracker(venue, all_pairs)
+        self._pending_trackers[venue] = tracker
+        for trading_pair in all_pairs:
+            self._pair_trackers[(venue[0], venue[1], trading_pair)] = tracker
+
+    def _create_tracker(self, venue: VenueKey, trading_pairs: List[str]) -> OrderBookTracker:
+        params = {"trading_pairs": trading_pairs}
+        if venue[1] is not None:
+            params["domain"] = venue[1]
+        tracker: OrderBookTracker = self._tracker_factories[venue](**params)
+        tracker.connector_name = self._connector_names[venue]
+        return tracker
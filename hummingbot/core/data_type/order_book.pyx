@@ -9,6 +9,7 @@ from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookTopChangedEvent,
     OrderBookTradeEvent
 )
 from typing import (
@@ -29,12 +30,14 @@ from sqlalchemy.engine import RowProxy
 import bisect
 import logging
 cimport numpy as np
+from libc.math cimport isnan
 ob_logger = None
 NaN = float("nan")
 
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_CHANGED_EVENT_TAG = OrderBookEvent.TopChangedEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,6 +55,7 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._version = 0
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -62,6 +66,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -92,6 +98,8 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self._version += 1
+        self.c_did_change_top(previous_best_bid, previous_best_ask)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -101,6 +109,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
@@ -132,10 +142,30 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._version += 1
+        self.c_did_change_top(previous_best_bid, previous_best_ask)
+
+    cdef c_did_change_top(self, double previous_best_bid, double previous_best_ask):
+        """
+        Triggers a top changed event if the best bid or ask price differs from before the update. The event is only
+        built when someone listens to it, diffs and snapshots don't pay for it otherwise.
+        """
+        cdef:
+            bint bid_changed = self._best_bid != previous_best_bid and not (isnan(self._best_bid) and
+                                                                            isnan(previous_best_bid))
+            bint ask_changed = self._best_ask != previous_best_ask and not (isnan(self._best_ask) and
+                                                                            isnan(previous_best_ask))
+        if not (bid_changed or ask_changed):
+            return
+        if not self.c_has_listeners(self.ORDER_BOOK_TOP_CHANGED_EVENT_TAG):
+            return
+        self.c_trigger_event(self.ORDER_BOOK_TOP_CHANGED_EVENT_TAG,
+                             OrderBookTopChangedEvent(self._best_bid, self._best_ask))
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
+        self._version += 1
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
     @property
@@ -145,6 +175,7 @@ cdef class OrderBook(PubSub):
     @last_trade_price.setter
     def last_trade_price(self, value: float):
         self._last_trade_price = value
+        self._version += 1
 
     @property
     def last_applied_trade(self) -> float:
@@ -166,6 +197,14 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def version(self) -> int:
+        """
+        Incremented on every diff, snapshot and trade applied, and on last trade price updates. A viewer showing the
+        same version as before has nothing new to show.
+        """
+        return self._version
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         bids_rows = list(self.bid_entries())
@@ -277,6 +316,30 @@ cdef class OrderBook(PubSub):
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
             inc(it)
 
+    cdef tuple c_top_levels(self, int depth):
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+            list bids = []
+            list asks = []
+        while bid_it != self._bid_book.rend() and len(bids) < depth:
+            entry = deref(bid_it)
+            bids.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+            inc(bid_it)
+        while ask_it != self._ask_book.end() and len(asks) < depth:
+            entry = deref(ask_it)
+            asks.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+            inc(ask_it)
+        return bids, asks
+
+    def top_levels(self, depth: int) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Returns the best depth levels of each side, bids from the highest price and asks from the lowest, without going
+        through the rest of the book as snapshot does.
+        """
+        return self.c_top_levels(depth)
+
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
         amount_left = amount
         retval = []
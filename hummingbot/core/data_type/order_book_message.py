@@ -3,6 +3,7 @@
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
+import time
 from typing import (
     Dict,
     List,
@@ -10,6 +11,10 @@ from typing import (
 )
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.utils.market_data_latency import (
+    exchange_timestamp_seconds,
+    MarketDataLatencyTracer,
+)
 
 
 class OrderBookMessageType(Enum):
@@ -23,6 +28,8 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     type: OrderBookMessageType
     content: Dict[str, any]
     timestamp: float
+    # The local time the message was built, only set while market data latency tracing is on.
+    received_timestamp: Optional[float] = None
 
     def __new__(
         cls,
@@ -32,7 +39,10 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
         *args,
         **kwargs,
     ):
-        return super(OrderBookMessage, cls).__new__(cls, message_type, content, timestamp, *args, **kwargs)
+        message = super(OrderBookMessage, cls).__new__(cls, message_type, content, timestamp, *args, **kwargs)
+        if MarketDataLatencyTracer.get_instance().enabled:
+            message.received_timestamp = time.time()
+        return message
 
     @property
     def update_id(self) -> int:
@@ -54,6 +64,14 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             return self.content["trade_id"]
         return -1
 
+    @property
+    def exchange_timestamp(self) -> Optional[float]:
+        """
+        The time the exchange sent the message in seconds, connectors whose message timestamp is the local time set it
+        in the content when the exchange provides one.
+        """
+        return exchange_timestamp_seconds(self.content.get("exchange_timestamp", self.timestamp))
+
     @property
     def trading_pair(self) -> str:
         return self.content["trading_pair"]
@@ -16,7 +16,9 @@ import time
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.market_data_latency import MarketDataLatencyTracer
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
@@ -35,6 +37,7 @@ class OrderBookTrackerDataSourceType(Enum):
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
     _obt_logger: Optional[HummingbotLogger] = None
+    _connector_name: Optional[str] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -65,6 +68,18 @@ class OrderBookTracker(ABC):
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
 
+    @property
+    def connector_name(self) -> str:
+        """
+        The name of the connector the tracker belongs to, e.g. binance_us, set by the connector when it starts the
+        tracker. Market data latency traces are keyed by it.
+        """
+        return self._connector_name if self._connector_name is not None else self.__class__.__name__
+
+    @connector_name.setter
+    def connector_name(self, value: str):
+        self._connector_name = value
+
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
         return self._data_source
@@ -242,6 +257,26 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    def _apply_diff_message(self,
+                            trading_pair: str,
+                            order_book: OrderBook,
+                            message: OrderBookMessage,
+                            bids: List[OrderBookRow],
+                            asks: List[OrderBookRow],
+                            update_id: int):
+        """
+        Applies the diff message's rows to the order book, timing it when market data latency tracing is on.
+        """
+        tracer: MarketDataLatencyTracer = MarketDataLatencyTracer.get_instance()
+        if not tracer.enabled:
+            order_book.apply_diffs(bids, asks, update_id)
+            return
+        dequeued_timestamp: float = time.time()
+        start: float = time.perf_counter()
+        order_book.apply_diffs(bids, asks, update_id)
+        tracer.trace_diff(self.connector_name, trading_pair, message.exchange_timestamp, message.received_timestamp,
+                          dequeued_timestamp, time.perf_counter() - start)
+
     async def _track_single_book(self, trading_pair: str):
         past_diffs_window: Deque[OrderBookMessage] = deque()
         self._past_diffs_windows[trading_pair] = past_diffs_window
@@ -255,7 +290,7 @@ class OrderBookTracker(ABC):
             try:
                 message: OrderBookMessage = await message_queue.get()
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    self._apply_diff_message(trading_pair, order_book, message, message.bids, message.asks, message.update_id)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
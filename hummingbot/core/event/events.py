@@ -52,6 +52,7 @@ class ERC20WatcherEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    TopChangedEvent = 902
 
 
 class ZeroExEvent(Enum):
@@ -136,6 +137,14 @@ class WalletUnwrappedEthEvent(NamedTuple):
     raw_amount: int
 
 
+class WalletBalanceChangedEvent(NamedTuple):
+    timestamp: float
+    address: str
+    asset_name: str
+    balance: Decimal
+    raw_balance: int
+
+
 class ZeroExFillEvent(NamedTuple):
     timestamp: float
     tx_hash: str
@@ -295,6 +304,11 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookTopChangedEvent(NamedTuple):
+    best_bid: float
+    best_ask: float
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -2,26 +2,46 @@
 
 from libc.stdint cimport int64_t
 from libcpp.unordered_map cimport unordered_map
-from libcpp.unordered_set cimport unordered_set
 from libcpp.utility cimport pair
 from hummingbot.core.PyRef cimport PyRef
 from hummingbot.core.event.event_listener cimport EventListener
 
-ctypedef unordered_set[PyRef] EventListenersCollection
-ctypedef unordered_set[PyRef].iterator EventListenersIterator
-ctypedef unordered_map[int64_t, EventListenersCollection] Events
-ctypedef unordered_map[int64_t, EventListenersCollection].iterator EventsIterator
-ctypedef pair[int64_t, EventListenersCollection] EventsPair
+ctypedef unordered_map[int64_t, PyRef] EventChannels
+ctypedef unordered_map[int64_t, PyRef].iterator EventChannelsIterator
+ctypedef pair[int64_t, PyRef] EventChannelsPair
+
+
+cdef class EventChannel:
+    cdef:
+        object __weakref__
+        tuple _listeners
+        object _collector
+        int64_t _dispatch_count
+        int64_t _listener_call_count
+        double _dispatch_time
+
+    cdef c_add(self, EventListener listener)
+    cdef c_remove(self, EventListener listener)
+    cdef c_remove_weakref(self, object listener_weakref)
+
+
+cdef class EventSubscription:
+    cdef:
+        object _pubsub_ref
+        int64_t _event_tag
+        EventListener _listener
 
 
 cdef class PubSub:
     cdef:
-        Events _events
+        EventChannels _channels
         object __weakref__
 
+    cdef EventChannel c_get_channel(self, int64_t event_tag, bint create)
+    cdef bint c_has_listeners(self, int64_t event_tag)
     cdef c_log_exception(self, int64_t event_tag, object arg)
     cdef c_add_listener(self, int64_t event_tag, EventListener listener)
+    cdef EventSubscription c_subscribe(self, int64_t event_tag, EventListener listener)
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
-    cdef c_remove_dead_listeners(self, int64_t event_tag)
     cdef c_get_listeners(self, int64_t event_tag)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
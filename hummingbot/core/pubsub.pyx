@@ -7,43 +7,116 @@ from cpython cimport(
     PyWeakref_GetObject
 )
 from cython.operator cimport(
-    postincrement as inc,
     dereference as deref,
-    address
 )
-from libcpp.vector cimport vector
 from enum import Enum
 import logging
-import random
-from typing import List
+import time
+from typing import (
+    Dict,
+    List,
+)
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_listener cimport EventListener
 
 class_logger = None
+cdef bint dispatch_timing_enabled = False
 
 
-cdef class PubSub:
+cdef class DeadListenerCollector:
+    """
+    The callback of the listener weak references of a channel: removes a listener from the channel as soon as it is
+    garbage collected. Holds the channel by a weak reference, so that channels and their listeners don't form cycles.
+    """
+    cdef:
+        object _channel_ref
+
+    def __init__(self, EventChannel channel):
+        self._channel_ref = PyWeakref_NewRef(channel, None)
+
+    def __call__(self, object listener_weakref):
+        channel = <object>PyWeakref_GetObject(self._channel_ref)
+        if channel is not None:
+            (<EventChannel>channel).c_remove_weakref(listener_weakref)
+
+
+cdef class EventChannel:
+    """
+    The listeners of an event tag, and its dispatch counters.
+
+    Listeners are kept in a tuple of weak references that is replaced, never modified, when listeners are added or
+    removed. A dispatch iterates over the tuple of the moment without copying it, listeners added or removed while
+    dispatching take effect on the next dispatch.
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    def __init__(self):
+        self._listeners = ()
+        self._collector = DeadListenerCollector(self)
+        self._dispatch_count = 0
+        self._listener_call_count = 0
+        self._dispatch_time = 0.0
+
+    @property
+    def listener_count(self) -> int:
+        return len(self._listeners)
+
+    cdef c_add(self, EventListener listener):
+        for listener_weakref in self._listeners:
+            if <object>PyWeakref_GetObject(listener_weakref) is listener:
+                return
+        self._listeners = self._listeners + (PyWeakref_NewRef(listener, self._collector),)
+
+    cdef c_remove(self, EventListener listener):
+        self._listeners = tuple(listener_weakref for listener_weakref in self._listeners
+                                if <object>PyWeakref_GetObject(listener_weakref) is not listener)
+
+    cdef c_remove_weakref(self, object listener_weakref):
+        self._listeners = tuple(r for r in self._listeners if r is not listener_weakref)
+
+
+cdef class EventSubscription:
+    """
+    A listener subscribed to an event tag. The subscription holds the listener, and lasts until unsubscribe() is called
+    or until the subscription itself is garbage collected.
+    """
+
+    def __init__(self, PubSub pubsub, int64_t event_tag, EventListener listener):
+        self._pubsub_ref = PyWeakref_NewRef(pubsub, None)
+        self._event_tag = event_tag
+        self._listener = listener
+
+    @property
+    def listener(self) -> EventListener:
+        return self._listener
+
+    @property
+    def active(self) -> bool:
+        return self._listener is not None and <object>PyWeakref_GetObject(self._pubsub_ref) is not None
+
+    def unsubscribe(self):
+        pubsub = <object>PyWeakref_GetObject(self._pubsub_ref)
+        if pubsub is not None and self._listener is not None:
+            (<PubSub>pubsub).c_remove_listener(self._event_tag, self._listener)
+        self._listener = None
 
-    Here's how the dead listener GC is performed:
+    def __enter__(self) -> "EventSubscription":
+        return self
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.unsubscribe()
+
+
+cdef class PubSub:
     """
+    PubSub with weak references. This avoids the lapsed listener problem, listeners are removed as soon as they are
+    garbage collected, by the callback of their weak reference.
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
+    Each event tag has its channel, with its listeners in the order they were added and its dispatch counters. Channels
+    are looked up in a C++ map by tag, and dispatching an event allocates nothing besides what the listeners do.
+    Dispatch times are only measured once enabled with enable_dispatch_timing(), for all PubSubs.
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,12 +125,23 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    @staticmethod
+    def enable_dispatch_timing(enabled: bool = True):
+        global dispatch_timing_enabled
+        dispatch_timing_enabled = enabled
+
     def __init__(self):
-        self._events = Events()
+        self._channels = EventChannels()
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
 
+    def subscribe(self, event_tag: Enum, listener: EventListener) -> EventSubscription:
+        """
+        Adds the listener and returns its subscription, which holds the listener until it is unsubscribed.
+        """
+        return self.c_subscribe(event_tag.value, listener)
+
     def remove_listener(self, event_tag: Enum, listener: EventListener):
         self.c_remove_listener(event_tag.value, listener)
 
@@ -67,99 +151,92 @@ cdef class PubSub:
     def trigger_event(self, event_tag: Enum, message: any):
         self.c_trigger_event(event_tag.value, message)
 
+    def dispatch_metrics(self) -> Dict[int, Dict[str, float]]:
+        """
+        Per event tag: the number of listeners, of events dispatched and of listener calls, and the time spent
+        dispatching when dispatch timing is enabled.
+        """
+        cdef:
+            EventChannel channel
+        metrics = {}
+        for channel_pair in self._channels:
+            channel = <object>channel_pair.second.get()
+            metrics[channel_pair.first] = {
+                "listeners": len(channel._listeners),
+                "dispatches": channel._dispatch_count,
+                "listener_calls": channel._listener_call_count,
+                "dispatch_time": channel._dispatch_time,
+            }
+        return metrics
+
+    cdef EventChannel c_get_channel(self, int64_t event_tag, bint create):
+        cdef:
+            EventChannelsIterator it = self._channels.find(event_tag)
+            EventChannel channel
+        if it != self._channels.end():
+            return <object>deref(it).second.get()
+        if not create:
+            return None
+        channel = EventChannel()
+        self._channels.insert(EventChannelsPair(event_tag, PyRef(<PyObject *>channel)))
+        return channel
+
+    cdef bint c_has_listeners(self, int64_t event_tag):
+        cdef:
+            EventChannel channel = self.c_get_channel(event_tag, False)
+        return channel is not None and len(channel._listeners) > 0
+
     cdef c_log_exception(self, int64_t event_tag, object arg):
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
     cdef c_add_listener(self, int64_t event_tag, EventListener listener):
-        cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection new_listeners
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-        if it != self._events.end():
-            listeners_ptr = address(deref(it).second)
-            deref(listeners_ptr).insert(listener_wrapper)
-        else:
-            new_listeners.insert(listener_wrapper)
-            self._events.insert(EventsPair(event_tag, new_listeners))
-
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+        self.c_get_channel(event_tag, True).c_add(listener)
 
-    cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
-        cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-            EventListenersIterator lit
-        if it == self._events.end():
-            return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).find(listener_wrapper)
-        if lit != deref(listeners_ptr).end():
-            deref(listeners_ptr).erase(lit)
-        self.c_remove_dead_listeners(event_tag)
+    cdef EventSubscription c_subscribe(self, int64_t event_tag, EventListener listener):
+        self.c_add_listener(event_tag, listener)
+        return EventSubscription(self, event_tag, listener)
 
-    cdef c_remove_dead_listeners(self, int64_t event_tag):
+    cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref
-            EventListenersIterator lit
-            vector[EventListenersIterator] lit_to_remove
-        if it == self._events.end():
-            return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).begin()
-        while lit != deref(listeners_ptr).end():
-            listener_weakref = <object>(deref(lit).get())
-            if <object>(PyWeakref_GetObject(listener_weakref)) is None:
-                lit_to_remove.push_back(lit)
-            inc(lit)
-        for lit in lit_to_remove:
-            deref(listeners_ptr).erase(lit)
-        if deref(listeners_ptr).size() < 1:
-            self._events.erase(it)
+            EventChannel channel = self.c_get_channel(event_tag, False)
+        if channel is not None:
+            channel.c_remove(listener)
 
     cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
-
-        if it == self._events.end():
+            EventChannel channel = self.c_get_channel(event_tag, False)
+        if channel is None:
             return []
-
         retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+        for listener_weakref in channel._listeners:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is not None:
+                retval.append(listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            EventChannelsIterator it = self._channels.find(event_tag)
+            EventChannel channel
+            tuple listeners
+            PyObject *listener_ptr
             EventListener typed_listener
-        if it == self._events.end():
+            double start = 0
+        if it == self._channels.end():
             return
-
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        channel = <object>deref(it).second.get()
+        listeners = channel._listeners
+        channel._dispatch_count += 1
+        if dispatch_timing_enabled:
+            start = time.perf_counter()
+
+        for listener_weakref in listeners:
+            listener_ptr = PyWeakref_GetObject(listener_weakref)
+            # Dead listeners whose weak reference callback hasn't run yet, during garbage collection.
+            if <object>listener_ptr is None:
+                continue
+            typed_listener = <object>listener_ptr
+            channel._listener_call_count += 1
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +244,6 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+
+        if dispatch_timing_enabled:
+            channel._dispatch_time += time.perf_counter() - start
@@ -6,16 +6,15 @@ from typing import (
     List
 )
 from decimal import Decimal
-import aiohttp
 from enum import Enum
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.network_base import NetworkBase, NetworkStatus
-from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair as \
     binance_convert_from_exchange_pair
 from hummingbot.core.rate_oracle.utils import find_rate
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.data_feed.price_feed_service import PriceFeedService
 
 
 class RateOracleSource(Enum):
@@ -31,6 +30,7 @@ class RateOracle(NetworkBase):
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
     The find_rate is then used on these prices to find a rate on a given pair.
+    Its requests go through the PriceFeedService, which also updates the prices of the running oracle.
     """
     # Set these below class members before query for rates
     source: RateOracleSource = RateOracleSource.binance
@@ -39,7 +39,6 @@ class RateOracle(NetworkBase):
 
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
-    _shared_client: Optional[aiohttp.ClientSession] = None
     _cgecko_supported_vs_tokens: List[str] = []
 
     binance_price_url = "https://api.binance.com/api/v3/ticker/bookTicker"
@@ -63,24 +62,20 @@ class RateOracle(NetworkBase):
     def __init__(self):
         super().__init__()
         self._check_network_interval = 30.0
-        self._ev_loop = asyncio.get_event_loop()
-        self._prices: Dict[str, Decimal] = {}
-        self._fetch_price_task: Optional[asyncio.Task] = None
-        self._ready_event = asyncio.Event()
+        self._subscribed: bool = False
+        self.price_feed_service().register_source(self.name, self.get_prices, 1.0)
 
-    @classmethod
-    async def _http_client(cls) -> aiohttp.ClientSession:
-        if cls._shared_client is None:
-            cls._shared_client = aiohttp.ClientSession()
-        return cls._shared_client
+    @staticmethod
+    def price_feed_service() -> PriceFeedService:
+        return PriceFeedService.get_instance()
 
     async def get_ready(self):
         """
         The network is ready when it first successfully get prices for a given source.
         """
         try:
-            if not self._ready_event.is_set():
-                await self._ready_event.wait()
+            if not self.price_feed_service().is_ready(self.name):
+                await self.price_feed_service().wait_ready(self.name)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -96,7 +91,7 @@ class RateOracle(NetworkBase):
         """
         Actual prices retrieved from URL
         """
-        return self._prices.copy()
+        return dict(self.price_feed_service().prices(self.name))
 
     def rate(self, pair: str) -> Decimal:
         """
@@ -105,7 +100,7 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return find_rate(self.price_feed_service().prices(self.name), pair)
 
     @classmethod
     async def rate_async(cls, pair: str) -> Decimal:
@@ -141,19 +136,6 @@ class RateOracle(NetworkBase):
         rate = Decimal("0") if rate is None else rate
         return amount * rate
 
-    async def fetch_price_loop(self):
-        while True:
-            try:
-                self._prices = await self.get_prices()
-                if self._prices:
-                    self._ready_event.set()
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(f"Error fetching new prices from {self.source.name}.", exc_info=True,
-                                      app_warning_msg=f"Couldn't fetch newest prices from {self.source.name}.")
-            await asyncio.sleep(1)
-
     @classmethod
     async def get_prices(cls) -> Dict[str, Decimal]:
         """
@@ -197,18 +179,16 @@ class RateOracle(NetworkBase):
         :return A dictionary of trading pairs and prices
         """
         results = {}
-        client = await cls._http_client()
-        async with client.request("GET", url) as resp:
-            records = await resp.json()
-            for record in records:
-                trading_pair = binance_convert_from_exchange_pair(record["symbol"])
-                if quote_symbol is not None:
-                    base, quote = trading_pair.split("-")
-                    if quote != quote_symbol:
-                        continue
-                if trading_pair and record["bidPrice"] is not None and record["askPrice"] is not None:
-                    results[trading_pair] = (Decimal(record["bidPrice"]) + Decimal(record["askPrice"])) / Decimal(
-                        "2")
+        records = await cls.price_feed_service().fetch(url, max_age=1.0)
+        for record in records:
+            trading_pair = binance_convert_from_exchange_pair(record["symbol"])
+            if quote_symbol is not None:
+                base, quote = trading_pair.split("-")
+                if quote != quote_symbol:
+                    continue
+            if trading_pair and record["bidPrice"] is not None and record["askPrice"] is not None:
+                results[trading_pair] = (Decimal(record["bidPrice"]) + Decimal(record["askPrice"])) / Decimal(
+                    "2")
         return results
 
     @classmethod
@@ -223,11 +203,10 @@ class RateOracle(NetworkBase):
         """
         results = {}
         if not cls._cgecko_supported_vs_tokens:
-            client = await cls._http_client()
-            async with client.request("GET", cls.coingecko_supported_vs_tokens_url) as resp:
-                records = await resp.json()
-                cls._cgecko_supported_vs_tokens = records
-        if vs_currency.lower() not in cls._cgecko_supported_vs_tokens:
+            cls._cgecko_supported_vs_tokens = await cls.price_feed_service().fetch(
+                cls.coingecko_supported_vs_tokens_url)
+        vs_currency = vs_currency.lower()
+        if vs_currency not in cls._cgecko_supported_vs_tokens:
             vs_currency = "usd"
         tasks = [cls.get_coingecko_prices_by_page(vs_currency, i) for i in range(1, 5)]
         task_results = await safe_gather(*tasks, return_exceptions=True)
@@ -250,23 +229,24 @@ class RateOracle(NetworkBase):
         :return A dictionary of trading pairs and prices (250 results max)
         """
         results = {}
-        client = await cls._http_client()
-        async with client.request("GET", cls.coingecko_usd_price_url.format(vs_currency, page_no)) as resp:
-            records = await resp.json()
-            for record in records:
-                pair = f'{record["symbol"].upper()}-{vs_currency.upper()}'
-                if record["current_price"]:
-                    results[pair] = Decimal(str(record["current_price"]))
+        # The usd pages are the ones the Coin Gecko data feed fetches, requests made within 30 seconds are shared.
+        records = await cls.price_feed_service().fetch(cls.coingecko_usd_price_url.format(vs_currency, page_no),
+                                                       max_age=30.0)
+        for record in records:
+            pair = f'{record["symbol"].upper()}-{vs_currency.upper()}'
+            if record["current_price"]:
+                results[pair] = Decimal(str(record["current_price"]))
         return results
 
     async def start_network(self):
         await self.stop_network()
-        self._fetch_price_task = safe_ensure_future(self.fetch_price_loop())
+        self.price_feed_service().subscribe(self.name)
+        self._subscribed = True
 
     async def stop_network(self):
-        if self._fetch_price_task is not None:
-            self._fetch_price_task.cancel()
-            self._fetch_price_task = None
+        if self._subscribed:
+            self.price_feed_service().unsubscribe(self.name)
+            self._subscribed = False
 
     async def check_network(self) -> NetworkStatus:
         try:
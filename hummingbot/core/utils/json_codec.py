@@ -0,0 +1,158 @@
+"""
+JSON decoding and encoding for connectors. Connectors call loads and dumps from this module instead of a JSON library,
+so that the backend is picked in one place: the json_backend global config selects orjson, rapidjson, ujson or the
+standard library, and the default (auto) uses the fastest one installed.
+
+Exchanges send most numbers as strings. A NumericSchema names the fields of a message that hold such numbers, decoding
+with it converts them once, so that the order book messages built from the result don't parse them again.
+
+Gateway and on chain responses, and saved tracking states, are decoded with the standard library instead: the other
+backends reject or round some numbers it decodes exactly, such as integers over 64 bits.
+"""
+
+from decimal import Decimal
+import json
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+AUTO_BACKEND = "auto"
+# Fastest first, the first installed one is used by the auto backend.
+BACKEND_NAMES = ["orjson", "rapidjson", "ujson", "json"]
+
+JsonData = Union[str, bytes, bytearray]
+
+
+class JsonBackend(NamedTuple):
+    name: str
+    loads: Callable[[JsonData], Any]
+    dumps: Callable[[Any], str]
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def _load_backend(name: str) -> Optional[JsonBackend]:
+    """
+    Returns the backend, None if its library isn't installed. dumps always returns compact JSON as a str.
+    """
+    try:
+        if name == "orjson":
+            import orjson
+            return JsonBackend(name, orjson.loads, lambda obj: orjson.dumps(obj, default=_default).decode("utf-8"))
+        elif name == "rapidjson":
+            import rapidjson
+            return JsonBackend(name, rapidjson.loads, lambda obj: rapidjson.dumps(obj, default=_default))
+        elif name == "ujson":
+            import ujson
+            return JsonBackend(name, ujson.loads, ujson.dumps)
+        elif name == "json":
+            return JsonBackend(name, json.loads,
+                               lambda obj: json.dumps(obj, separators=(",", ":"), default=_default))
+    except ImportError:
+        return None
+    raise ValueError(f"Unknown JSON backend {name}, choose from {', '.join([AUTO_BACKEND] + BACKEND_NAMES)}.")
+
+
+def available_backends() -> List[str]:
+    return [name for name in BACKEND_NAMES if _load_backend(name) is not None]
+
+
+def get_backend(name: str) -> JsonBackend:
+    if name == AUTO_BACKEND:
+        return _load_backend(available_backends()[0])
+    backend = _load_backend(name)
+    if backend is None:
+        raise ValueError(f"The {name} JSON backend is not installed.")
+    return backend
+
+
+_backend: JsonBackend = get_backend(AUTO_BACKEND)
+
+
+def set_backend(name: str):
+    global _backend
+    _backend = get_backend(name)
+
+
+def backend_name() -> str:
+    return _backend.name
+
+
+def validate_backend(name: str) -> Optional[str]:
+    if name != AUTO_BACKEND and name not in available_backends():
+        return f"Invalid JSON backend, please choose from {', '.join([AUTO_BACKEND] + available_backends())}."
+
+
+class NumericSchema:
+    """
+    The fields of a message whose values are numbers encoded as strings, or lists (of lists) of them, e.g. the bids
+    and asks of an order book snapshot. Strings that aren't numbers, such as order ids in a bid entry, are kept. The
+    fields are looked up in nested objects too, so the same schema covers messages wrapped in a stream envelope.
+    """
+
+    def __init__(self, fields: Iterable[str], number_type: Callable[[str], Any] = float):
+        self._fields = frozenset(fields)
+        self._number_type = number_type
+
+    @property
+    def fields(self) -> frozenset:
+        return self._fields
+
+    @property
+    def number_type(self) -> Callable[[str], Any]:
+        return self._number_type
+
+    def _convert(self, value: Any) -> Any:
+        if isinstance(value, str):
+            try:
+                return self._number_type(value)
+            except (ValueError, ArithmeticError):
+                return value
+        if isinstance(value, list):
+            return [self._convert(v) for v in value]
+        return value
+
+    def apply(self, message: Any) -> Any:
+        """
+        Converts the message's numeric fields in place and returns it.
+        """
+        if isinstance(message, dict):
+            for key, value in message.items():
+                if key in self._fields:
+                    message[key] = self._convert(value)
+                elif isinstance(value, (dict, list)):
+                    self.apply(value)
+        elif isinstance(message, list):
+            for item in message:
+                if isinstance(item, (dict, list)):
+                    self.apply(item)
+        return message
+
+
+def loads(data: JsonData, numeric_schema: Optional[NumericSchema] = None) -> Any:
+    if numeric_schema is None:
+        return _backend.loads(data)
+    return numeric_schema.apply(_backend.loads(data))
+
+
+def dumps(obj: Any) -> str:
+    return _backend.dumps(obj)
+
+
+def loads_with(numeric_schema: NumericSchema) -> Callable[[JsonData], Any]:
+    """
+    Returns a loads function for the schema, e.g. for aiohttp's response.json(loads=...).
+    """
+    def schema_loads(data: JsonData) -> Any:
+        return loads(data, numeric_schema)
+    return schema_loads
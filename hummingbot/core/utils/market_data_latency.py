@@ -0,0 +1,207 @@
+"""
+Latency tracing of order book diffs, from the exchange to the strategy. When tracing is on (the
+market_data_latency_tracing global config), each diff is timed at four stages:
+
+    receive   the exchange timestamp of the message -> the message built by the data source (network and parsing)
+    queue     the message built -> taken off the order book tracker's queues, about to be applied
+    apply     OrderBook.apply_diffs
+    strategy  the diff applied -> the first strategy tick after it (bounded by the clock's tick size)
+
+Each stage is aggregated per exchange and trading pair into a histogram of fixed buckets, shown by the latency command
+and exported to CSV from it. Connectors that stamp messages with the local time rather than the exchange's show only
+the parsing time in the receive stage.
+"""
+
+import csv
+from enum import Enum
+import time
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import pandas as pd
+
+# Upper bounds of the histogram buckets, in milliseconds. The last bucket is unbounded.
+BUCKET_BOUNDS_MS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class LatencyStage(Enum):
+    RECEIVE = "receive"
+    QUEUE = "queue"
+    APPLY = "apply"
+    STRATEGY = "strategy"
+
+
+class LatencyHistogram:
+    """
+    Counts of latencies per bucket, along with their sum, min and max. Percentiles are estimated from the buckets, as
+    the upper bound of the bucket holding them (the max for the last bucket).
+    """
+
+    def __init__(self):
+        self._counts: List[int] = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self._count: int = 0
+        self._sum_ms: float = 0.0
+        self._min_ms: Optional[float] = None
+        self._max_ms: Optional[float] = None
+
+    @property
+    def counts(self) -> List[int]:
+        return list(self._counts)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean_ms(self) -> float:
+        return self._sum_ms / self._count if self._count > 0 else 0.0
+
+    @property
+    def min_ms(self) -> Optional[float]:
+        return self._min_ms
+
+    @property
+    def max_ms(self) -> Optional[float]:
+        return self._max_ms
+
+    def add(self, latency_ms: float):
+        index = 0
+        while index < len(BUCKET_BOUNDS_MS) and latency_ms > BUCKET_BOUNDS_MS[index]:
+            index += 1
+        self._counts[index] += 1
+        self._count += 1
+        self._sum_ms += latency_ms
+        if self._min_ms is None or latency_ms < self._min_ms:
+            self._min_ms = latency_ms
+        if self._max_ms is None or latency_ms > self._max_ms:
+            self._max_ms = latency_ms
+
+    def percentile_ms(self, percentile: float) -> float:
+        if self._count == 0:
+            return 0.0
+        rank = self._count * percentile / 100.0
+        seen = 0
+        for index, count in enumerate(self._counts[:-1]):
+            seen += count
+            if seen >= rank:
+                return min(BUCKET_BOUNDS_MS[index], self._max_ms)
+        return self._max_ms
+
+
+TraceKey = Tuple[str, str, LatencyStage]
+
+
+class MarketDataLatencyTracer:
+    _shared_instance: "MarketDataLatencyTracer" = None
+
+    @classmethod
+    def get_instance(cls) -> "MarketDataLatencyTracer":
+        if cls._shared_instance is None:
+            cls._shared_instance = MarketDataLatencyTracer()
+        return cls._shared_instance
+
+    def __init__(self):
+        self._enabled: bool = False
+        self._histograms: Dict[TraceKey, LatencyHistogram] = {}
+        # The time the oldest diff not yet seen by a strategy tick was applied, per exchange and trading pair.
+        self._unobserved_applies: Dict[Tuple[str, str], float] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._enabled = value
+        if not value:
+            self._unobserved_applies.clear()
+
+    @property
+    def histograms(self) -> Dict[TraceKey, LatencyHistogram]:
+        return self._histograms
+
+    def record(self, exchange: str, trading_pair: str, stage: LatencyStage, latency_ms: float):
+        key = (exchange, trading_pair, stage)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LatencyHistogram()
+        histogram.add(latency_ms)
+
+    def trace_diff(self,
+                   exchange: str,
+                   trading_pair: str,
+                   exchange_timestamp: Optional[float],
+                   received_timestamp: Optional[float],
+                   dequeued_timestamp: float,
+                   apply_time: float):
+        """
+        Records the stages of a diff that has just been applied. The timestamps are in seconds, on the wall clock.
+        """
+        if received_timestamp is not None:
+            if exchange_timestamp is not None:
+                self.record(exchange, trading_pair, LatencyStage.RECEIVE,
+                            (received_timestamp - exchange_timestamp) * 1e3)
+            self.record(exchange, trading_pair, LatencyStage.QUEUE, (dequeued_timestamp - received_timestamp) * 1e3)
+        self.record(exchange, trading_pair, LatencyStage.APPLY, apply_time * 1e3)
+        self._unobserved_applies.setdefault((exchange, trading_pair), dequeued_timestamp + apply_time)
+
+    def observe_tick(self, now: Optional[float] = None):
+        """
+        Called on each strategy tick, records how long the diffs applied since the previous tick waited for it.
+        """
+        if len(self._unobserved_applies) == 0:
+            return
+        now = time.time() if now is None else now
+        for (exchange, trading_pair), applied_timestamp in self._unobserved_applies.items():
+            self.record(exchange, trading_pair, LatencyStage.STRATEGY, (now - applied_timestamp) * 1e3)
+        self._unobserved_applies.clear()
+
+    def reset(self):
+        self._histograms.clear()
+        self._unobserved_applies.clear()
+
+    def summary_df(self) -> pd.DataFrame:
+        columns = ["Exchange", "Market", "Stage", "Count", "Mean (ms)", "p50 (ms)", "p90 (ms)", "p99 (ms)",
+                   "Max (ms)"]
+        data = []
+        stage_order = list(LatencyStage)
+        for (exchange, trading_pair, stage), histogram in sorted(
+                self._histograms.items(), key=lambda item: (item[0][0], item[0][1], stage_order.index(item[0][2]))):
+            data.append([exchange, trading_pair, stage.value, histogram.count, histogram.mean_ms,
+                         histogram.percentile_ms(50), histogram.percentile_ms(90), histogram.percentile_ms(99),
+                         histogram.max_ms])
+        return pd.DataFrame(data=data, columns=columns)
+
+    def export_csv(self, file_path: str):
+        """
+        Writes the summary along with the bucket counts, one row per exchange, trading pair and stage.
+        """
+        df = self.summary_df()
+        bucket_columns = [f"<= {bound} ms" for bound in BUCKET_BOUNDS_MS] + [f"> {BUCKET_BOUNDS_MS[-1]} ms"]
+        with open(file_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(list(df.columns) + bucket_columns)
+            for row in df.itertuples(index=False):
+                histogram = self._histograms[(row[0], row[1], LatencyStage(row[2]))]
+                writer.writerow(list(row) + histogram.counts)
+
+
+def set_tracing_enabled(value: str):
+    MarketDataLatencyTracer.get_instance().enabled = str(value).lower() in ("true", "yes", "y")
+
+
+def exchange_timestamp_seconds(timestamp: Optional[float]) -> Optional[float]:
+    """
+    Message timestamps are in seconds for most connectors, milliseconds or microseconds for some.
+    """
+    if timestamp is None:
+        return None
+    if timestamp > 1e14:
+        return timestamp * 1e-6
+    if timestamp > 1e11:
+        return timestamp * 1e-3
+    return timestamp
@@ -0,0 +1,288 @@
+import math
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Union,
+)
+if TYPE_CHECKING:
+    import pandas as pd
+
+FLOAT_PRECISION = 6
+NA_REP = "NaN"
+
+_display_float_format: Optional[Callable[[float], str]] = None
+
+
+def get_display_float_format() -> Optional[Callable[[float], str]]:
+    return _display_float_format
+
+
+def set_display_float_format(float_format: Optional[Callable[[float], str]]):
+    """
+    Sets the format of the floats of the tables rendered without a float format, the counterpart of the pandas
+    display.float_format option.
+    """
+    global _display_float_format
+    _display_float_format = float_format
+
+
+def _dtype_kind(value: Any) -> Optional[str]:
+    # The kind of numpy scalars (b, i, u, f...), tables are built without importing numpy.
+    dtype = getattr(value, "dtype", None)
+    return dtype.kind if dtype is not None else None
+
+
+def _is_float(value: Any) -> bool:
+    return isinstance(value, float) or _dtype_kind(value) == "f"
+
+
+def _is_nan(value: Any) -> bool:
+    return value is None or (_is_float(value) and math.isnan(value))
+
+
+def _column_kind(values: List[Any]) -> str:
+    """
+    The dtype pandas infers for a column built from python values: int, float, bool or object.
+    """
+    kinds = set()
+    for value in values:
+        if value is None:
+            kinds.add("none")
+        elif isinstance(value, bool) or _dtype_kind(value) == "b":
+            kinds.add("bool")
+        elif isinstance(value, int) or _dtype_kind(value) in ("i", "u"):
+            kinds.add("int")
+        elif _is_float(value):
+            kinds.add("float")
+        else:
+            return "object"
+    if kinds == {"int"}:
+        return "int"
+    if kinds == {"bool"}:
+        return "bool"
+    if len(kinds & {"int", "float"}) > 0 and kinds <= {"int", "float", "none"}:
+        return "float"
+    return "object"
+
+
+def _trim_zeros(formatted: List[str]) -> List[str]:
+    def is_number(x: str) -> bool:
+        return x != NA_REP and not x.endswith("inf")
+
+    def can_trim(values: List[str]) -> bool:
+        finite = [x for x in values if is_number(x)]
+        return len(finite) > 0 and all(x.endswith("0") for x in finite) and not any("e" in x for x in finite)
+
+    while can_trim(formatted):
+        formatted = [x[:-1] if is_number(x) else x for x in formatted]
+    return [x + "0" if x.endswith(".") and is_number(x) else x for x in formatted]
+
+
+def _format_floats(values: List[Any]) -> List[str]:
+    def format_with(float_format: str) -> List[str]:
+        formatted = [NA_REP if _is_nan(v) else float_format.format(v) for v in values]
+        return _trim_zeros(formatted)
+
+    formatted = format_with(f"{{: .{FLOAT_PRECISION}f}}")
+    # Like pandas, switches to scientific notation for values that would show as 0 or that take too much space.
+    abs_values = [abs(v) for v in values if not _is_nan(v)]
+    too_long = len(formatted) > 0 and max(len(x) for x in formatted) > FLOAT_PRECISION + 6
+    has_large_values = any(v > 1e6 for v in abs_values)
+    has_small_values = any(0 < v < 10 ** -FLOAT_PRECISION for v in abs_values)
+    if has_small_values or (too_long and has_large_values):
+        formatted = format_with(f"{{: .{FLOAT_PRECISION}e}}")
+    return formatted
+
+
+def _format_generic(values: List[Any],
+                    leading_space: bool,
+                    formatter: Optional[Callable[[Any], str]],
+                    float_format: Optional[Callable[[float], str]]) -> List[str]:
+    formatted = []
+    for value in values:
+        if value is None:
+            text, is_float = "None", False
+        elif _is_nan(value):
+            text, is_float = NA_REP, False
+        elif _is_float(value):
+            text = float_format(value) if float_format is not None else f"{value: .{FLOAT_PRECISION}g}"
+            is_float = True
+        else:
+            text, is_float = str(formatter(value) if formatter is not None else value), False
+        formatted.append(text if is_float or not leading_space else " " + text)
+    return formatted
+
+
+class Table:
+    """
+    A small table of rows to display, a light replacement for building a pandas DataFrame just to print it:
+    to_string renders the same layout as DataFrame.to_string (as of pandas 1.0, the version the client is built with),
+    floats included, which are formatted with the display float format when it is set. str(table) is
+    the table with its index, like str(data_frame) when the terminal is wide enough to show the whole frame.
+    Rows are lists of values, or dicts of values by column.
+    """
+
+    def __init__(self,
+                 data: Optional[Sequence[Union[Sequence[Any], Dict[Any, Any]]]] = None,
+                 columns: Optional[Sequence[Any]] = None):
+        data = list(data) if data is not None else []
+        if columns is None:
+            if len(data) > 0 and isinstance(data[0], dict):
+                columns = list(data[0].keys())
+            else:
+                columns = list(range(max([len(row) for row in data], default=0)))
+        self._columns: List[Any] = list(columns)
+        self._rows: List[List[Any]] = [self._as_row(row) for row in data]
+
+    def _as_row(self, row: Union[Sequence[Any], Dict[Any, Any]]) -> List[Any]:
+        if isinstance(row, dict):
+            return [row.get(column) for column in self._columns]
+        row = list(row)
+        return row + [None] * (len(self._columns) - len(row))
+
+    @property
+    def columns(self) -> List[Any]:
+        return self._columns
+
+    @property
+    def rows(self) -> List[List[Any]]:
+        return self._rows
+
+    @property
+    def empty(self) -> bool:
+        return len(self._rows) == 0 or len(self._columns) == 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        return iter(self._rows)
+
+    def __getitem__(self, column: Any) -> List[Any]:
+        position = self._columns.index(column)
+        return [row[position] for row in self._rows]
+
+    def append(self, other: "Table") -> "Table":
+        """
+        A new table with the rows of other appended, by column.
+        """
+        columns = self._columns + [c for c in other.columns if c not in self._columns]
+        table = Table(columns=columns)
+        table._rows = [table._as_row(dict(zip(self._columns, row))) for row in self._rows] + \
+                      [table._as_row(dict(zip(other.columns, row))) for row in other.rows]
+        return table
+
+    def sort_values(self, by: Union[Any, List[Any]], ascending: bool = True) -> "Table":
+        """
+        A new table with the rows sorted by one or more columns.
+        """
+        positions = [self._columns.index(column) for column in (by if isinstance(by, list) else [by])]
+        return Table(data=sorted(self._rows, key=lambda row: [row[position] for position in positions],
+                                 reverse=not ascending),
+                     columns=self._columns)
+
+    def fillna(self, value: Any) -> "Table":
+        """
+        A new table with the NaN values replaced, like DataFrame.replace(np.nan, value).
+        """
+        return Table(data=[[value if _is_nan(v) else v for v in row] for row in self._rows], columns=self._columns)
+
+    def to_pandas(self) -> "pd.DataFrame":
+        import pandas as pd
+        return pd.DataFrame(data=self._rows, columns=self._columns)
+
+    def _format_column(self,
+                       position: int,
+                       index: bool,
+                       header: bool,
+                       formatter: Optional[Callable[[Any], str]],
+                       float_format: Optional[Callable[[float], str]],
+                       max_colwidth: Optional[int]) -> List[str]:
+        values = [row[position] for row in self._rows]
+        kind = _column_kind(values)
+        if kind == "int":
+            formatted = [formatter(v) if formatter is not None else f"{v: d}" if index else f"{v:d}" for v in values]
+        elif kind == "float" and (formatter or float_format) is not None:
+            formatted = [NA_REP if _is_nan(v) else (formatter or float_format)(v) for v in values]
+        elif kind == "float":
+            formatted = _format_floats(values)
+        else:
+            formatted = _format_generic(values, index, formatter, float_format)
+        name = str(self._columns[position])
+        # Numeric columns get a leading space in their header.
+        column_header = " " + name if kind != "object" and formatter is None else name
+        header_width = len(column_header) if header else 0
+
+        width = max(max(len(x) for x in formatted), header_width)
+        if max_colwidth is not None and width > max_colwidth:
+            width = max_colwidth
+            if max_colwidth > 3:
+                formatted = [x[:width - 3] + "..." if len(x) > width else x for x in formatted]
+        formatted = [x.rjust(width) for x in formatted]
+        width = max(max(len(x) for x in formatted), header_width)
+        if header:
+            return [column_header.rjust(width)] + formatted
+        return formatted
+
+    @staticmethod
+    def _adjoin(columns: List[List[str]]) -> List[str]:
+        widths = [max(len(x) for x in column) + 1 for column in columns[:-1]] + \
+                 [max(len(x) for x in columns[-1])]
+        row_count = max(len(column) for column in columns)
+        padded = [[x.ljust(width) for x in column] + [" " * width] * (row_count - len(column))
+                  for column, width in zip(columns, widths)]
+        return ["".join(line) for line in zip(*padded)]
+
+    def to_string(self,
+                  index: bool = True,
+                  header: bool = True,
+                  formatters: Optional[Dict[Any, Callable[[Any], str]]] = None,
+                  float_format: Optional[Callable[[float], str]] = None,
+                  line_width: Optional[int] = None,
+                  max_colwidth: Optional[int] = None) -> str:
+        """
+        Renders the table like DataFrame.to_string, with the same arguments.
+        """
+        if self.empty:
+            columns = ", ".join(str(c) for c in self._columns)
+            rows = ", ".join(str(i) for i in range(len(self._rows)))
+            return f"Empty DataFrame\nColumns: [{columns}]\nIndex: [{rows}]"
+        formatters = formatters or {}
+        float_format = float_format if float_format is not None else _display_float_format
+        str_columns = [self._format_column(position, index, header, formatters.get(column), float_format, max_colwidth)
+                       for position, column in enumerate(self._columns)]
+        index_column = ([""] if header else []) + [str(i) for i in range(len(self._rows))]
+        if line_width is None:
+            return "\n".join(self._adjoin(([index_column] if index else []) + str_columns))
+
+        # Wraps the columns that don't fit in the line width below, like the repr of a DataFrame.
+        available_width = line_width - (max(len(x) for x in index_column) + 1 if index else 0)
+        bins = []
+        current_width = 0
+        for i, column in enumerate(str_columns):
+            column_width = max(len(x) for x in column) + 1
+            current_width += column_width
+            margin = 1 if i == len(str_columns) - 1 else 2
+            if current_width + margin > available_width and i > 0:
+                bins.append(i)
+                current_width = column_width
+        bins.append(len(str_columns))
+        row_count = len(self._rows)
+        chunks = []
+        start = 0
+        for i, end in enumerate(bins):
+            chunk = ([index_column] if index else []) + str_columns[start:end]
+            if len(bins) > 1:
+                chunk.append([" \\"] + ["  "] * (row_count - 1) if i < len(bins) - 1 else [" "] * row_count)
+            chunks.append("\n".join(self._adjoin(chunk)))
+            start = end
+        return "\n\n".join(chunks)
+
+    def __str__(self) -> str:
+        return self.to_string(max_colwidth=50)
@@ -2,18 +2,27 @@ import importlib
 from typing import (
     Dict,
     Any,
+    List,
     Optional,
 )
 from hummingbot.logger import HummingbotLogger
 from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType
+from hummingbot.core.utils.warm_start_cache import (
+    TRADING_PAIRS_CACHE_NAMESPACE,
+    WarmStartCache,
+)
 import logging
 import asyncio
-import requests
 
-from .async_utils import safe_ensure_future
+from .async_utils import (
+    safe_ensure_future,
+    safe_gather,
+)
 
 
 class TradingPairFetcher:
+    CACHE_TTL = 60.0 * 60.0
+
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
@@ -30,31 +39,66 @@ class TradingPairFetcher:
         return cls._sf_shared_instance
 
     def __init__(self):
-        self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
-        safe_ensure_future(self.fetch_all())
+        self._fetch_tasks: Dict[str, asyncio.Future] = {}
+
+    def fetch(self, connector_name: str) -> asyncio.Future:
+        """
+        Starts fetching the trading pairs of a connector, its order book data source is only imported the first time
+        the connector's trading pairs are asked for and aren't cached.
+        """
+        if connector_name not in self._fetch_tasks:
+            self._fetch_tasks[connector_name] = safe_ensure_future(self._fetch_trading_pairs(connector_name))
+        return self._fetch_tasks[connector_name]
+
+    async def _fetch_trading_pairs(self, connector_name: str):
+        """
+        Serves the trading pairs cached by an earlier run right away, they are fetched from the exchange only when
+        missing or in the background once older than CACHE_TTL.
+        """
+        def on_revalidated(trading_pairs: List[str]):
+            self.trading_pairs[connector_name] = trading_pairs
 
-    async def fetch_all(self):
-        for conn_setting in CONNECTOR_SETTINGS.values():
-            module_name = f"{conn_setting.base_name()}_connector" if conn_setting.type is ConnectorType.Connector \
-                else f"{conn_setting.base_name()}_api_order_book_data_source"
-            module_path = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
-                          f"{conn_setting.base_name()}.{module_name}"
-            class_name = "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + \
-                         "APIOrderBookDataSource" if conn_setting.type is not ConnectorType.Connector \
-                         else "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + "Connector"
-            module = getattr(importlib.import_module(module_path), class_name)
-            args = {}
-            args = conn_setting.add_domain_parameter(args)
-            safe_ensure_future(self.call_fetch_pairs(module.fetch_trading_pairs(**args), conn_setting.name))
-
-        self.ready = True
-
-    async def call_fetch_pairs(self, fetch_fn, exchange_name):
-        # In case trading pair fetching returned timeout, using empty list
         try:
-            self.trading_pairs[exchange_name] = await fetch_fn
-        except (asyncio.TimeoutError, asyncio.CancelledError, requests.exceptions.RequestException):
-            self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
+            self.trading_pairs[connector_name] = await WarmStartCache.get_instance().get_or_fetch(
+                TRADING_PAIRS_CACHE_NAMESPACE,
+                connector_name,
+                lambda: self._fetch_from_exchange(connector_name),
+                on_revalidated,
+                ttl=self.CACHE_TTL
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # In case trading pair fetching failed, using empty list
+            self.logger().error(f"Connector {connector_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.")
-            self.trading_pairs[exchange_name] = []
+            self.trading_pairs[connector_name] = []
+
+    async def _fetch_from_exchange(self, connector_name: str) -> List[str]:
+        conn_setting = CONNECTOR_SETTINGS[connector_name]
+        module_name = f"{conn_setting.base_name()}_connector" if conn_setting.type is ConnectorType.Connector \
+            else f"{conn_setting.base_name()}_api_order_book_data_source"
+        module_path = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
+                      f"{conn_setting.base_name()}.{module_name}"
+        class_name = "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + \
+                     "APIOrderBookDataSource" if conn_setting.type is not ConnectorType.Connector \
+                     else "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + "Connector"
+        module = getattr(importlib.import_module(module_path), class_name)
+        args = {}
+        args = conn_setting.add_domain_parameter(args)
+        trading_pairs = await module.fetch_trading_pairs(**args)
+        if len(trading_pairs) == 0:
+            # Data sources return an empty list when the request fails, which mustn't end up in the cache.
+            raise IOError(f"No trading pairs received from {connector_name}.")
+        return trading_pairs
+
+    def get_trading_pairs(self, connector_name: str) -> List[str]:
+        """
+        Returns the trading pairs fetched so far, an empty list while they are still being fetched.
+        """
+        self.fetch(connector_name)
+        return self.trading_pairs.get(connector_name, [])
+
+    async def fetch_all(self):
+        await safe_gather(*[self.fetch(connector_name) for connector_name in CONNECTOR_SETTINGS])
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import logging
+import os
+from os.path import (
+    isfile,
+    join,
+)
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+)
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+TRADING_PAIRS_CACHE_NAMESPACE = "trading_pairs"
+TRADING_RULES_CACHE_NAMESPACE = "trading_rules"
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    timestamp: float
+
+    def age(self) -> float:
+        return time.time() - self.timestamp
+
+
+class WarmStartCache:
+    """
+    An on-disk cache of exchange metadata (trading pairs, trading rules) kept between runs, so that connectors become
+    ready from the last run's values while fresh ones are fetched in the background.
+    Entries are JSON files, one per namespace and key. Entries written by a different CACHE_VERSION are ignored.
+    """
+    CACHE_VERSION = 1
+    DEFAULT_TTL = 60.0 * 60.0
+    DEFAULT_MAX_AGE = 60.0 * 60.0 * 24.0 * 7
+
+    _wsc_logger: Optional[HummingbotLogger] = None
+    _shared_instance: "WarmStartCache" = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._wsc_logger is None:
+            cls._wsc_logger = logging.getLogger(__name__)
+        return cls._wsc_logger
+
+    @classmethod
+    def get_instance(cls) -> "WarmStartCache":
+        if cls._shared_instance is None:
+            cls._shared_instance = WarmStartCache(join(data_path(), "warm_start_cache"))
+        return cls._shared_instance
+
+    def __init__(self, cache_dir: str, version: int = CACHE_VERSION):
+        self._cache_dir = cache_dir
+        self._version = version
+        self._revalidation_tasks: Dict[str, asyncio.Future] = {}
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def _entry_path(self, namespace: str, key: str) -> str:
+        return join(self._cache_dir, namespace, f"{key}.json")
+
+    def get(self, namespace: str, key: str, max_age: float = DEFAULT_MAX_AGE) -> Optional[CacheEntry]:
+        """
+        Returns the cached entry, None if there is none, it was written by another cache version or it is older than
+        max_age.
+        """
+        path = self._entry_path(namespace, key)
+        if not isfile(path):
+            return None
+        try:
+            with open(path) as fd:
+                data = json.load(fd)
+        except Exception:
+            self.logger().warning(f"Ignoring unreadable cache entry {path}.", exc_info=True)
+            return None
+        if data.get("version") != self._version:
+            return None
+        entry = CacheEntry(data["value"], data["timestamp"])
+        if entry.age() > max_age:
+            return None
+        return entry
+
+    def set(self, namespace: str, key: str, value: Any, min_interval: float = 0):
+        """
+        Writes the entry, unless the one on disk was written less than min_interval seconds ago.
+        """
+        path = self._entry_path(namespace, key)
+        tmp_path = f"{path}.tmp"
+        if min_interval > 0 and isfile(path) and time.time() - os.path.getmtime(path) < min_interval:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w") as fd:
+                json.dump({"version": self._version, "timestamp": time.time(), "value": value}, fd)
+            # Readers never see a partially written entry.
+            os.replace(tmp_path, path)
+        except Exception:
+            self.logger().warning(f"Could not write cache entry {path}.", exc_info=True)
+
+    def invalidate(self, namespace: str, key: str):
+        path = self._entry_path(namespace, key)
+        if isfile(path):
+            os.unlink(path)
+
+    async def get_or_fetch(self,
+                           namespace: str,
+                           key: str,
+                           fetch: Callable[[], Awaitable[Any]],
+                           on_revalidated: Optional[Callable[[Any], None]] = None,
+                           ttl: float = DEFAULT_TTL,
+                           max_age: float = DEFAULT_MAX_AGE) -> Any:
+        """
+        Returns the cached value if there is one, else awaits fetch and caches its result.
+        A cached value older than ttl is still returned, it gets revalidated in the background and on_revalidated is
+        called with the fetched value. fetch should raise rather than return a value that must not be cached.
+        """
+        entry = self.get(namespace, key, max_age)
+        if entry is None:
+            value = await fetch()
+            self.set(namespace, key, value)
+            return value
+        if entry.age() > ttl:
+            self.revalidate(namespace, key, fetch, on_revalidated)
+        return entry.value
+
+    def revalidate(self,
+                   namespace: str,
+                   key: str,
+                   fetch: Callable[[], Awaitable[Any]],
+                   on_revalidated: Optional[Callable[[Any], None]] = None) -> asyncio.Future:
+        task_key = f"{namespace}/{key}"
+        task = self._revalidation_tasks.get(task_key)
+        if task is None or task.done():
+            task = safe_ensure_future(self._revalidate(namespace, key, fetch, on_revalidated))
+            self._revalidation_tasks[task_key] = task
+        return task
+
+    async def _revalidate(self,
+                          namespace: str,
+                          key: str,
+                          fetch: Callable[[], Awaitable[Any]],
+                          on_revalidated: Optional[Callable[[Any], None]]):
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(f"Could not revalidate cached {namespace} of {key}, keeping the cached value.",
+                                  exc_info=True)
+            return
+        self.set(namespace, key, value)
+        if on_revalidated is not None:
+            on_revalidated(value)
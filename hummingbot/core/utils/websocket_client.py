@@ -0,0 +1,399 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import (
+    deque,
+    OrderedDict,
+)
+from enum import Enum
+import gzip
+import logging
+import random
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Union,
+)
+import zlib
+
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+from hummingbot.core.utils import json_codec
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+RawMessage = Union[str, bytes]
+MessageDecoder = Callable[[RawMessage], Any]
+
+
+def json_decoder(raw_message: RawMessage) -> Any:
+    return json_codec.loads(raw_message)
+
+
+def gzip_json_decoder(raw_message: RawMessage) -> Any:
+    return json_codec.loads(gzip.decompress(raw_message))
+
+
+def deflate_json_decoder(raw_message: RawMessage) -> Any:
+    return json_codec.loads(zlib.decompress(raw_message, -zlib.MAX_WBITS))
+
+
+def raw_decoder(raw_message: RawMessage) -> Any:
+    return raw_message
+
+
+class OverflowPolicy(Enum):
+    DROP_OLDEST = 1
+    DROP_NEWEST = 2
+    COALESCE = 3
+
+
+class WebsocketMessageQueue:
+    """
+    Bounded, single event loop message queue. When full, a new message either evicts the oldest one (DROP_OLDEST) or
+    is discarded (DROP_NEWEST). With COALESCE, a message replaces the pending one with the same coalesce_key, e.g.
+    the latest snapshot of a trading pair, and the oldest key is evicted when the queue is full.
+    """
+    def __init__(self,
+                 maxsize: int = 1000,
+                 overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+                 coalesce_key: Optional[Callable[[Any], Hashable]] = None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        if overflow_policy is OverflowPolicy.COALESCE and coalesce_key is None:
+            raise ValueError("coalesce_key is required for the COALESCE overflow policy.")
+        self._maxsize = maxsize
+        self._overflow_policy = overflow_policy
+        self._coalesce_key = coalesce_key
+        self._messages: Union[Deque[Any], "OrderedDict[Hashable, Any]"] = (
+            OrderedDict() if overflow_policy is OverflowPolicy.COALESCE else deque()
+        )
+        self._getters: Deque[asyncio.Future] = deque()
+        self.dropped: int = 0
+        self.coalesced: int = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def qsize(self) -> int:
+        return len(self._messages)
+
+    def empty(self) -> bool:
+        return len(self._messages) == 0
+
+    def put_nowait(self, message: Any) -> bool:
+        """
+        :return: False if the message was discarded
+        """
+        if self._overflow_policy is OverflowPolicy.COALESCE:
+            key = self._coalesce_key(message)
+            if key in self._messages:
+                self._messages[key] = message
+                self.coalesced += 1
+                return True
+            if len(self._messages) >= self._maxsize:
+                self._messages.popitem(last=False)
+                self.dropped += 1
+            self._messages[key] = message
+        else:
+            if len(self._messages) >= self._maxsize:
+                self.dropped += 1
+                if self._overflow_policy is OverflowPolicy.DROP_NEWEST:
+                    return False
+                self._messages.popleft()
+            self._messages.append(message)
+        self._wake_up_getter()
+        return True
+
+    def get_nowait(self) -> Any:
+        if len(self._messages) == 0:
+            raise asyncio.QueueEmpty()
+        if self._overflow_policy is OverflowPolicy.COALESCE:
+            return self._messages.popitem(last=False)[1]
+        return self._messages.popleft()
+
+    async def get(self) -> Any:
+        while len(self._messages) == 0:
+            getter: asyncio.Future = asyncio.get_event_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except asyncio.CancelledError:
+                if getter in self._getters:
+                    self._getters.remove(getter)
+                elif len(self._messages) > 0:
+                    # This getter was woken up for a message it will not take, pass it on.
+                    self._wake_up_getter()
+                raise
+        return self.get_nowait()
+
+    def _wake_up_getter(self):
+        while len(self._getters) > 0:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                break
+
+
+class WebsocketSubscription:
+    """
+    A stream of decoded messages from a WebsocketClient, namely those accepted by its matcher (all messages if it has
+    none). The subscribe payload is sent on every (re)connection.
+    """
+    def __init__(self,
+                 name: str,
+                 payload: Optional[Any],
+                 matcher: Optional[Callable[[Any], bool]],
+                 queue: WebsocketMessageQueue):
+        self.name = name
+        self.payload = payload
+        self.matcher = matcher
+        self.queue = queue
+
+    def matches(self, message: Any) -> bool:
+        return self.matcher is None or self.matcher(message)
+
+    async def get(self) -> Any:
+        return await self.queue.get()
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        while True:
+            yield await self.queue.get()
+
+
+class WebsocketClient:
+    """
+    Shared websocket client for connectors. It keeps a connection to url open, reconnecting with jittered exponential
+    backoff and replaying subscriptions after each reconnection. Messages are decoded once by the decoder and routed
+    to the bounded queues of the matching subscriptions.
+
+    When no message arrives for message_timeout seconds, the connection is pinged and dropped if there is no pong
+    within ping_timeout. Exchanges with application level heartbeats are served by heartbeat_payload, sent every
+    heartbeat_interval seconds, and by ping_responder, which maps a decoded server ping to the reply to send (or None
+    for any other message).
+    """
+    _wsc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._wsc_logger is None:
+            cls._wsc_logger = logging.getLogger(__name__)
+        return cls._wsc_logger
+
+    def __init__(self,
+                 url: str,
+                 decoder: MessageDecoder = json_decoder,
+                 connect_kwargs: Optional[Dict[str, Any]] = None,
+                 message_timeout: float = 30.0,
+                 ping_timeout: float = 10.0,
+                 heartbeat_payload: Optional[Union[Any, Callable[[], Any]]] = None,
+                 heartbeat_interval: Optional[float] = None,
+                 ping_responder: Optional[Callable[[Any], Optional[Any]]] = None,
+                 on_connected: Optional[Callable[["WebsocketClient"], Awaitable[None]]] = None,
+                 reconnect_delay: float = 1.0,
+                 max_reconnect_delay: float = 60.0):
+        self._url = url
+        self._decoder = decoder
+        # Heartbeats are managed here, the library's own keepalive pings are off unless asked for.
+        self._connect_kwargs = {"ping_interval": None, **(connect_kwargs or {})}
+        self._message_timeout = message_timeout
+        self._ping_timeout = ping_timeout
+        self._heartbeat_payload = heartbeat_payload
+        self._heartbeat_interval = heartbeat_interval
+        self._ping_responder = ping_responder
+        self._on_connected = on_connected
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._subscriptions: List[WebsocketSubscription] = []
+        self._ws: Optional[websockets.WebSocketClientProtocol] = None
+        self._connection_task: Optional[asyncio.Task] = None
+        self._connected_event: asyncio.Event = asyncio.Event()
+        self._last_recv_time: float = 0.0
+
+        self._messages_received: int = 0
+        self._bytes_received: int = 0
+        self._decode_time: float = 0.0
+        self._decode_errors: int = 0
+        self._reconnects: int = 0
+        self._rate_window_start: float = time.perf_counter()
+        self._rate_window_messages: int = 0
+        self._messages_per_second: float = 0.0
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None and self._ws.open
+
+    @property
+    def subscriptions(self) -> List[WebsocketSubscription]:
+        return list(self._subscriptions)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "connected": self.connected,
+            "reconnects": self._reconnects,
+            "messages_received": self._messages_received,
+            "bytes_received": self._bytes_received,
+            "messages_per_second": self._messages_per_second,
+            "decode_errors": self._decode_errors,
+            "mean_decode_time_us": (self._decode_time / self._messages_received * 1e6
+                                    if self._messages_received > 0 else 0.0),
+            "queues": {s.name: {"depth": s.queue.qsize(), "dropped": s.queue.dropped, "coalesced": s.queue.coalesced}
+                       for s in self._subscriptions},
+        }
+
+    def start(self):
+        if self._connection_task is None:
+            self._connection_task = safe_ensure_future(self._connection_loop())
+
+    async def stop(self):
+        if self._connection_task is not None:
+            self._connection_task.cancel()
+            self._connection_task = None
+        await self._close()
+
+    async def wait_til_connected(self):
+        await self._connected_event.wait()
+
+    def subscribe(self,
+                  name: str,
+                  payload: Optional[Any] = None,
+                  matcher: Optional[Callable[[Any], bool]] = None,
+                  maxsize: int = 1000,
+                  overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+                  coalesce_key: Optional[Callable[[Any], Hashable]] = None) -> WebsocketSubscription:
+        subscription = WebsocketSubscription(name, payload, matcher,
+                                             WebsocketMessageQueue(maxsize, overflow_policy, coalesce_key))
+        self._subscriptions.append(subscription)
+        if payload is not None and self.connected:
+            safe_ensure_future(self.send(payload))
+        return subscription
+
+    async def unsubscribe(self, subscription: WebsocketSubscription, payload: Optional[Any] = None):
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+        if payload is not None and self.connected:
+            await self.send(payload)
+
+    async def send(self, payload: Any):
+        if self._ws is None:
+            raise ConnectionError(f"Websocket to {self._url} is not connected.")
+        await self._ws.send(payload if isinstance(payload, (str, bytes)) else json_codec.dumps(payload))
+
+    async def _connection_loop(self):
+        attempts = 0
+        while True:
+            background_tasks: List[asyncio.Task] = []
+            try:
+                self._ws = await websockets.connect(self._url, **self._connect_kwargs)
+                if self._on_connected is not None:
+                    await self._on_connected(self)
+                for subscription in list(self._subscriptions):
+                    if subscription.payload is not None:
+                        await self.send(subscription.payload)
+                self._connected_event.set()
+                self._last_recv_time = time.perf_counter()
+                background_tasks.append(safe_ensure_future(self._watchdog_loop()))
+                if self._heartbeat_interval is not None and self._heartbeat_payload is not None:
+                    background_tasks.append(safe_ensure_future(self._heartbeat_loop()))
+                messages_before = self._messages_received
+                await self._read_messages()
+                if self._messages_received > messages_before:
+                    attempts = 0
+            except asyncio.CancelledError:
+                raise
+            except ConnectionClosed:
+                self.logger().warning(f"Websocket to {self._url} closed. Going to reconnect...")
+            except Exception:
+                self.logger().network(f"Unexpected error with websocket to {self._url}.", exc_info=True)
+            finally:
+                for task in background_tasks:
+                    task.cancel()
+                self._connected_event.clear()
+                await self._close()
+            delay = min(self._max_reconnect_delay, self._reconnect_delay * 2 ** attempts)
+            attempts += 1
+            self._reconnects += 1
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+    async def _read_messages(self):
+        async for raw_message in self._ws:
+            self._last_recv_time = time.perf_counter()
+            self._process_message(raw_message)
+
+    async def _watchdog_loop(self):
+        # Watches for idle connections from a separate task, so that receiving needs no per message timeout.
+        while True:
+            idle_time = time.perf_counter() - self._last_recv_time
+            if idle_time < self._message_timeout:
+                await asyncio.sleep(self._message_timeout - idle_time)
+                continue
+            ws = self._ws
+            if ws is None:
+                return
+            try:
+                pong_waiter = await ws.ping()
+                await asyncio.wait_for(pong_waiter, timeout=self._ping_timeout)
+                self._last_recv_time = time.perf_counter()
+            except asyncio.TimeoutError:
+                self.logger().warning(f"Websocket ping to {self._url} timed out. Going to reconnect...")
+            except ConnectionClosed:
+                self.logger().warning(f"Websocket to {self._url} closed while pinging. Going to reconnect...")
+            else:
+                continue
+            # Closing the connection ends the read loop, which reconnects.
+            await ws.close()
+            return
+
+    def _process_message(self, raw_message: RawMessage):
+        start = time.perf_counter()
+        try:
+            message = self._decoder(raw_message)
+        except Exception:
+            self._decode_errors += 1
+            return
+        finally:
+            end = time.perf_counter()
+            self._decode_time += end - start
+            self._messages_received += 1
+            self._bytes_received += len(raw_message)
+            self._rate_window_messages += 1
+            if end - self._rate_window_start >= 1.0:
+                self._messages_per_second = self._rate_window_messages / (end - self._rate_window_start)
+                self._rate_window_start = end
+                self._rate_window_messages = 0
+        if message is None:
+            return
+        if self._ping_responder is not None:
+            reply = self._ping_responder(message)
+            if reply is not None:
+                safe_ensure_future(self.send(reply))
+                return
+        for subscription in self._subscriptions:
+            if subscription.matches(message):
+                subscription.queue.put_nowait(message)
+
+    async def _heartbeat_loop(self):
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            payload = self._heartbeat_payload() if callable(self._heartbeat_payload) else self._heartbeat_payload
+            await self.send(payload)
+
+    async def _close(self):
+        if self._ws is not None:
+            ws, self._ws = self._ws, None
+            await ws.close()
@@ -7,10 +7,15 @@ from typing import (
 )
 
 from hummingbot.core.network_base import NetworkBase, NetworkStatus
+from hummingbot.data_feed.price_feed_service import PriceFeedService
 from hummingbot.logger import HummingbotLogger
 
 
 class DataFeedBase(NetworkBase):
+    """
+    A data feed's prices are fetched by the PriceFeedService, under the feed's name, while the feed's network is
+    started. Subclasses register their price source on the service.
+    """
     dfb_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -21,8 +26,7 @@ class DataFeedBase(NetworkBase):
 
     def __init__(self):
         super().__init__()
-        self._ready_event = asyncio.Event()
-        self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._subscribed: bool = False
 
     @property
     def name(self):
@@ -36,18 +40,20 @@ class DataFeedBase(NetworkBase):
     def health_check_endpoint(self) -> str:
         raise NotImplementedError
 
+    @property
+    def price_feed_service(self) -> PriceFeedService:
+        return PriceFeedService.get_instance()
+
     def get_price(self, asset: str) -> float:
         raise NotImplementedError
 
     async def _http_client(self) -> aiohttp.ClientSession:
-        if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
-        return self._shared_client
+        return self.price_feed_service.http_client()
 
     async def get_ready(self):
         try:
-            if not self._ready_event.is_set():
-                await self._ready_event.wait()
+            if not self.price_feed_service.is_ready(self.name):
+                await self.price_feed_service.wait_ready(self.name)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -55,18 +61,22 @@ class DataFeedBase(NetworkBase):
                                 exc_info=True)
 
     async def start_network(self):
-        raise NotImplementedError
+        await self.stop_network()
+        self.price_feed_service.subscribe(self.name)
+        self._subscribed = True
 
     async def stop_network(self):
-        raise NotImplementedError
+        if self._subscribed:
+            self.price_feed_service.unsubscribe(self.name)
+            self._subscribed = False
 
     async def check_network(self) -> NetworkStatus:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.health_check_endpoint) as resp:
-                    status_text = await resp.text()
-                    if resp.status != 200:
-                        raise Exception(f"Data feed {self.name} server is down. Status is {status_text}")
+            client = await self._http_client()
+            async with client.get(self.health_check_endpoint) as resp:
+                status_text = await resp.text()
+                if resp.status != 200:
+                    raise Exception(f"Data feed {self.name} server is down. Status is {status_text}")
         except asyncio.CancelledError:
             raise
         except Exception:
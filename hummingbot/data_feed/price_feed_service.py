@@ -0,0 +1,287 @@
+import asyncio
+from collections import deque
+import logging
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Mapping,
+    NamedTuple,
+    Optional,
+)
+
+import aiohttp
+from yarl import URL
+
+from hummingbot.core.utils import json_codec
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+EMPTY_PRICES: Mapping[str, Any] = {}
+
+
+class CachedResponse(NamedTuple):
+    body: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    timestamp: float
+
+
+class PriceSource:
+    """
+    A price source registered on the PriceFeedService: fetcher returns the source's prices, it is run every interval
+    seconds as long as the source has subscribers.
+    """
+
+    def __init__(self,
+                 name: str,
+                 fetcher: Callable[[], Awaitable[Dict[str, Any]]],
+                 interval: float,
+                 app_warning_msg: Optional[str] = None):
+        self.name: str = name
+        self.fetcher: Callable[[], Awaitable[Dict[str, Any]]] = fetcher
+        self.interval: float = interval
+        self.app_warning_msg: str = app_warning_msg or f"Couldn't fetch newest prices from {name}. " \
+                                                       f"Check network connection."
+        self.subscribers: int = 0
+        self.next_update: float = 0.0
+        self.last_update: float = 0.0
+        self.update_task: Optional[asyncio.Task] = None
+        self.ready_event: asyncio.Event = asyncio.Event()
+
+
+class PriceFeedService:
+    """
+    Fetches the prices of all price sources (data feeds, rate oracle) on one schedule with one HTTP client:
+    - Each source is updated on its own interval by a single scheduler task, while it has subscribers.
+    - Requests for the same URL are coalesced: a request in flight is shared, and a response younger than the max_age
+      of a fetch is reused.
+    - Responses with an ETag or Last-Modified header are requested again conditionally, a 304 reuses the last body.
+    - The prices of each source are published as a new dict that is never modified afterwards, readers get them
+      without any locking.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _shared_instance: "PriceFeedService" = None
+
+    @classmethod
+    def get_instance(cls) -> "PriceFeedService":
+        if cls._shared_instance is None:
+            cls._shared_instance = PriceFeedService()
+        return cls._shared_instance
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self):
+        self._sources: Dict[str, PriceSource] = {}
+        self._prices: Dict[str, Mapping[str, Any]] = {}
+        self._responses: Dict[str, CachedResponse] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._client: Optional[aiohttp.ClientSession] = None
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._schedule_changed: asyncio.Event = asyncio.Event()
+        self._request_count: int = 0
+        self._not_modified_count: int = 0
+        self._coalesced_count: int = 0
+        self._request_timestamps: Deque[float] = deque()
+
+    @property
+    def sources(self) -> Dict[str, PriceSource]:
+        return self._sources
+
+    @property
+    def request_count(self) -> int:
+        return self._request_count
+
+    @property
+    def not_modified_count(self) -> int:
+        return self._not_modified_count
+
+    @property
+    def coalesced_count(self) -> int:
+        return self._coalesced_count
+
+    @property
+    def requests_per_minute(self) -> int:
+        while len(self._request_timestamps) > 0 and self._request_timestamps[0] < time.time() - 60:
+            self._request_timestamps.popleft()
+        return len(self._request_timestamps)
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "requests": self._request_count,
+            "requests_per_minute": self.requests_per_minute,
+            "not_modified": self._not_modified_count,
+            "coalesced": self._coalesced_count,
+        }
+
+    def http_client(self) -> aiohttp.ClientSession:
+        if self._client is None:
+            self._client = aiohttp.ClientSession()
+        return self._client
+
+    def register_source(self,
+                        name: str,
+                        fetcher: Callable[[], Awaitable[Dict[str, Any]]],
+                        interval: float,
+                        app_warning_msg: Optional[str] = None) -> PriceSource:
+        """
+        Registers a price source, a source already registered under the name is kept, so that consumers of the same
+        prices share one schedule.
+        """
+        if name not in self._sources:
+            self._sources[name] = PriceSource(name, fetcher, interval, app_warning_msg)
+        return self._sources[name]
+
+    def subscribe(self, name: str):
+        source = self._sources[name]
+        source.subscribers += 1
+        if self._scheduler_task is None:
+            self._scheduler_task = safe_ensure_future(self._scheduler_loop())
+        self._schedule_changed.set()
+
+    def unsubscribe(self, name: str):
+        source = self._sources[name]
+        source.subscribers = max(source.subscribers - 1, 0)
+        if source.subscribers == 0 and source.update_task is not None:
+            source.update_task.cancel()
+            source.update_task = None
+        if all(s.subscribers == 0 for s in self._sources.values()) and self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            self._scheduler_task = None
+
+    def prices(self, name: str) -> Mapping[str, Any]:
+        """
+        The last prices of a source, not to be modified.
+        """
+        return self._prices.get(name, EMPTY_PRICES)
+
+    def get_price(self, name: str, key: str, default: Any = None) -> Any:
+        return self._prices.get(name, EMPTY_PRICES).get(key, default)
+
+    def is_ready(self, name: str) -> bool:
+        return name in self._sources and self._sources[name].ready_event.is_set()
+
+    async def wait_ready(self, name: str):
+        await self._sources[name].ready_event.wait()
+
+    async def refresh(self, name: str) -> Mapping[str, Any]:
+        """
+        Updates the source now, or waits for the update in progress, and returns its prices. Errors of an update
+        started here are raised.
+        """
+        source = self._sources[name]
+        if source.update_task is None or source.update_task.done():
+            source.update_task = safe_ensure_future(self._fetch_source(source))
+            source.update_task.add_done_callback(lambda _: self._schedule_changed.set())
+        await asyncio.shield(source.update_task)
+        return self.prices(name)
+
+    async def fetch(self,
+                    url: str,
+                    params: Optional[Dict[str, Any]] = None,
+                    max_age: float = 0.0,
+                    as_json: bool = True) -> Any:
+        """
+        Fetches the url, parsed as json or as text. A response younger than max_age seconds is reused, and a request
+        in flight for the same url and params is shared.
+        """
+        key = self.request_key(url, params)
+        cached = self._responses.get(key)
+        if cached is not None and time.time() - cached.timestamp < max_age:
+            self._coalesced_count += 1
+            return cached.body
+        if key in self._in_flight:
+            self._coalesced_count += 1
+            return await asyncio.shield(self._in_flight[key])
+        future = safe_ensure_future(self._request(key, as_json))
+        self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(future)
+
+    @staticmethod
+    def request_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        query = dict(URL(url).query)
+        if params is not None:
+            query.update({k: str(v) for k, v in params.items()})
+        return str(URL(url).with_query(sorted(query.items())))
+
+    async def _request(self, key: str, as_json: bool) -> Any:
+        cached = self._responses.get(key)
+        headers = {}
+        if cached is not None:
+            if cached.etag is not None:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified is not None:
+                headers["If-Modified-Since"] = cached.last_modified
+        async with self.http_client().get(key, headers=headers) as resp:
+            self._request_count += 1
+            self._request_timestamps.append(time.time())
+            if resp.status == 304 and cached is not None:
+                self._not_modified_count += 1
+                # A 304 may leave out the validators, the cached ones still hold then.
+                self._responses[key] = CachedResponse(cached.body,
+                                                      resp.headers.get("ETag", cached.etag),
+                                                      resp.headers.get("Last-Modified", cached.last_modified),
+                                                      time.time())
+                return cached.body
+            elif resp.status != 200:
+                raise IOError(f"Error fetching {key}. HTTP status is {resp.status}. {await resp.text()}")
+            elif as_json:
+                body = await resp.json(loads=json_codec.loads, content_type=None)
+            else:
+                body = await resp.text()
+            self._responses[key] = CachedResponse(body,
+                                                  resp.headers.get("ETag"),
+                                                  resp.headers.get("Last-Modified"),
+                                                  time.time())
+        return body
+
+    async def _fetch_source(self, source: PriceSource):
+        prices = await source.fetcher()
+        # Published as a new dict, the previous one is left as it was for readers still holding it.
+        self._prices = dict(self._prices)
+        self._prices[source.name] = prices
+        source.last_update = time.time()
+        if len(prices) > 0:
+            source.ready_event.set()
+
+    async def _update_source(self, source: PriceSource):
+        try:
+            await self._fetch_source(source)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(f"Error fetching new prices from {source.name}.", exc_info=True,
+                                  app_warning_msg=source.app_warning_msg)
+        finally:
+            self._schedule_changed.set()
+
+    async def _scheduler_loop(self):
+        while True:
+            try:
+                now = time.time()
+                # Sources still updating are scheduled again once their update is done.
+                idle = [source for source in self._sources.values()
+                        if source.subscribers > 0 and (source.update_task is None or source.update_task.done())]
+                for source in idle:
+                    if source.next_update <= now:
+                        source.next_update = now + source.interval
+                        source.update_task = safe_ensure_future(self._update_source(source))
+                next_update = min([source.next_update for source in idle], default=now + 60.0)
+                self._schedule_changed.clear()
+                try:
+                    await asyncio.wait_for(self._schedule_changed.wait(), max(next_update - time.time(), 0.01))
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error in the price feed scheduler.", exc_info=True)
+                await asyncio.sleep(1.0)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+
+import atexit
+from collections import (
+    defaultdict,
+    deque,
+)
+import logging
+import threading
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+# Handlers left on the logging caller's thread: the reporting proxy schedules its sends on the event loop.
+THREAD_UNSAFE_HANDLER_CLASSES = ("ReportingProxyHandler",)
+
+
+class LogPipelineHandler(logging.Handler):
+    """
+    Stands in for a logger's handlers: records are put on the pipeline's queue as they are, their message is only
+    formatted, and written, by the handlers on the pipeline's thread. Arguments of a log call are therefore formatted a
+    little later than the call, objects changed in between are logged as changed.
+    """
+
+    def __init__(self, pipeline: "LogPipeline", targets: List[logging.Handler]):
+        super().__init__(min(target.level for target in targets))
+        self._pipeline = pipeline
+        self._targets: Tuple[logging.Handler, ...] = tuple(targets)
+
+    @property
+    def targets(self) -> Tuple[logging.Handler, ...]:
+        return self._targets
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # No handler lock, the queue is thread safe.
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record: logging.LogRecord):
+        self._pipeline.put(record, self._targets)
+
+
+class LogPipeline:
+    """
+    Moves the formatting and writing of log records off the event loop: the handlers of the configured loggers are
+    replaced by a LogPipelineHandler, which puts records on a bounded queue drained by a dedicated thread. Records
+    logged while the queue is full are dropped and counted, a warning with the count is logged once the queue has
+    room again. The queue is drained and the handlers flushed on stop, which is also run at exit.
+    The queue is a deque, appends and pops are atomic, the thread is only woken up when records are put on an empty
+    queue.
+    """
+    DEFAULT_CAPACITY = 10000
+    WAKE_UP_INTERVAL = 1.0
+
+    _shared_instance: "LogPipeline" = None
+
+    @classmethod
+    def get_instance(cls) -> "LogPipeline":
+        if cls._shared_instance is None:
+            cls._shared_instance = LogPipeline()
+        return cls._shared_instance
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._capacity: int = capacity
+        self._queue: Deque[Tuple[logging.LogRecord, Tuple[logging.Handler, ...]]] = deque()
+        self._records_queued: threading.Event = threading.Event()
+        self._stopping: bool = False
+        self._thread: Optional[threading.Thread] = None
+        self._targets: List[logging.Handler] = []
+        self._processed_count: int = 0
+        self._dropped_count: int = 0
+        self._dropped_by_level: Dict[str, int] = defaultdict(int)
+        self._unreported_drops: int = 0
+        self._drops_lock: threading.Lock = threading.Lock()
+        self._atexit_registered: bool = False
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def started(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def queue_size(self) -> int:
+        return len(self._queue)
+
+    @property
+    def processed_count(self) -> int:
+        return self._processed_count
+
+    @property
+    def dropped_count(self) -> int:
+        return self._dropped_count
+
+    @property
+    def dropped_by_level(self) -> Dict[str, int]:
+        return dict(self._dropped_by_level)
+
+    def put(self, record: logging.LogRecord, targets: Tuple[logging.Handler, ...]):
+        if len(self._queue) >= self._capacity:
+            with self._drops_lock:
+                self._dropped_count += 1
+                self._dropped_by_level[record.levelname] += 1
+                self._unreported_drops += 1
+            return
+        self._queue.append((record, targets))
+        if not self._records_queued.is_set():
+            self._records_queued.set()
+
+    def install(self, handler_names: Iterable[str], logger_names: Optional[Iterable[str]] = None):
+        """
+        Routes the named handlers through the pipeline, for the given loggers (the root and all configured loggers by
+        default), and starts the pipeline. Handlers of classes in THREAD_UNSAFE_HANDLER_CLASSES are left in place.
+        """
+        handler_names = set(handler_names)
+        self._targets = []
+        if logger_names is None:
+            logger_names = [""] + [name for name, logger in logging.root.manager.loggerDict.items()
+                                   if isinstance(logger, logging.Logger)]
+        for logger_name in logger_names:
+            logger = logging.getLogger(logger_name)
+            targets = [h for h in logger.handlers
+                       if h.name in handler_names and type(h).__name__ not in THREAD_UNSAFE_HANDLER_CLASSES]
+            if len(targets) == 0:
+                continue
+            for target in targets:
+                logger.removeHandler(target)
+                if target not in self._targets:
+                    self._targets.append(target)
+            logger.addHandler(LogPipelineHandler(self, targets))
+        self.start()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="LogPipeline", daemon=True)
+        self._thread.start()
+        if not self._atexit_registered:
+            # Registered after the logging module's own exit handler, so it runs before the handlers are closed.
+            atexit.register(self.stop)
+            self._atexit_registered = True
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Writes the queued records and flushes the handlers. The loggers keep their pipeline handlers, records logged
+        afterwards stay queued until the pipeline is started again.
+        """
+        if self._thread is None:
+            return
+        self._stopping = True
+        self._records_queued.set()
+        self._thread.join(timeout)
+        self._thread = None
+        self._stopping = False
+        for target in self._targets:
+            try:
+                target.flush()
+            except Exception:
+                pass
+
+    def uninstall(self):
+        """
+        Stops the pipeline and gives the loggers their handlers back.
+        """
+        self.stop()
+        for logger in [logging.root] + [lg for lg in logging.root.manager.loggerDict.values()
+                                        if isinstance(lg, logging.Logger)]:
+            for handler in [h for h in logger.handlers if isinstance(h, LogPipelineHandler)]:
+                logger.removeHandler(handler)
+                for target in handler.targets:
+                    logger.addHandler(target)
+        self._targets.clear()
+
+    def _run(self):
+        targets: Tuple[logging.Handler, ...] = ()
+        while True:
+            self._records_queued.wait(self.WAKE_UP_INTERVAL)
+            self._records_queued.clear()
+            while len(self._queue) > 0:
+                record, targets = self._queue.popleft()
+                for target in targets:
+                    if record.levelno >= target.level:
+                        target.handle(record)
+                self._processed_count += 1
+            if self._unreported_drops > 0:
+                self._report_drops(targets)
+            if self._stopping:
+                return
+
+    def _report_drops(self, targets: Tuple[logging.Handler, ...]):
+        """
+        Logs the drops to the handlers of the last record written.
+        """
+        with self._drops_lock:
+            drops, self._unreported_drops = self._unreported_drops, 0
+        record = logging.LogRecord(__name__, logging.WARNING, __file__, 0,
+                                   f"The log queue was full, {drops} log records were dropped "
+                                   f"({self._dropped_count} in total).", None, None)
+        for target in targets:
+            if record.levelno >= target.level:
+                target.handle(record)
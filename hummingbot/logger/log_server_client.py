@@ -1,9 +1,14 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import json
 import logging
+import os
 from typing import (
     Optional,
     Dict,
-    Any
+    Any,
+    List
 )
 import aiohttp
 
@@ -17,13 +22,24 @@ from hummingbot.logger import HummingbotLogger
 
 
 class LogServerClient(NetworkBase):
+    """
+    Sends requests to the log server from a bounded queue. Requests made while the queue is full are dropped, or with
+    the spill overflow policy appended to a spill file, up to spill_max_bytes, and queued again once the queue is
+    drained. Spill file reads and writes run in order on a dedicated thread, off the event loop. Request payloads are
+    gzip compressed when compress is set.
+    """
+    DEFAULT_QUEUE_CAPACITY = 1000
+    DEFAULT_SPILL_MAX_BYTES = 10 * 1024 * 1024
+    OVERFLOW_POLICIES = ("drop", "spill")
+
     lsc_logger: Optional[HummingbotLogger] = None
     _lsc_shared_instance: "LogServerClient" = None
 
     @classmethod
-    def get_instance(cls, log_server_url: str = "https://api.coinalpha.com/reporting-proxy/") -> "LogServerClient":
+    def get_instance(cls, log_server_url: str = "https://api.coinalpha.com/reporting-proxy/",
+                     **kwargs) -> "LogServerClient":
         if cls._lsc_shared_instance is None:
-            cls._lsc_shared_instance = LogServerClient(log_server_url=log_server_url)
+            cls._lsc_shared_instance = LogServerClient(log_server_url=log_server_url, **kwargs)
         return cls._lsc_shared_instance
 
     @classmethod
@@ -32,20 +48,145 @@ class LogServerClient(NetworkBase):
             cls.lsc_logger = logging.getLogger(__name__)
         return cls.lsc_logger
 
-    def __init__(self, log_server_url: str = "https://api.coinalpha.com/reporting-proxy/"):
+    def __init__(self,
+                 log_server_url: str = "https://api.coinalpha.com/reporting-proxy/",
+                 queue_capacity: int = DEFAULT_QUEUE_CAPACITY,
+                 overflow_policy: str = "drop",
+                 spill_file_path: Optional[str] = None,
+                 spill_max_bytes: int = DEFAULT_SPILL_MAX_BYTES,
+                 compress: bool = False):
         super().__init__()
-        self.queue: asyncio.Queue = asyncio.Queue()
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow policy {overflow_policy}, expected one of {self.OVERFLOW_POLICIES}.")
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_capacity)
         self.consume_queue_task: Optional[asyncio.Task] = None
         self.log_server_url: str = log_server_url
+        self._overflow_policy: str = overflow_policy
+        self._spill_file_path: Optional[str] = spill_file_path
+        self._spill_max_bytes: int = spill_max_bytes
+        self._compress: bool = compress
+        self._sent_count: int = 0
+        self._dropped_count: int = 0
+        self._spilled_count: int = 0
+        self._spilled_pending: int = 0
+        self._spilled_bytes: int = 0
+        self._spill_executor: Optional[ThreadPoolExecutor] = None
+        self._overflowing: bool = False
+
+    @property
+    def queue_depth(self) -> int:
+        return self.queue.qsize()
+
+    @property
+    def sent_count(self) -> int:
+        return self._sent_count
+
+    @property
+    def dropped_count(self) -> int:
+        return self._dropped_count
+
+    @property
+    def spilled_count(self) -> int:
+        return self._spilled_count
+
+    @property
+    def spilled_pending(self) -> int:
+        return self._spilled_pending
+
+    @property
+    def spill_executor(self) -> ThreadPoolExecutor:
+        if self._spill_executor is None:
+            self._spill_executor = ThreadPoolExecutor(max_workers=1)
+        return self._spill_executor
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "queue_depth": self.queue_depth,
+            "sent": self._sent_count,
+            "dropped": self._dropped_count,
+            "spilled": self._spilled_count,
+            "spilled_pending": self._spilled_pending,
+        }
 
     def request(self, req):
         if not self.started:
             self.start()
-        self.queue.put_nowait(req)
+        try:
+            self.queue.put_nowait(req)
+        except asyncio.QueueFull:
+            self.overflow(req)
+
+    def overflow(self, req: Dict[str, Any]):
+        if not self._overflowing:
+            self._overflowing = True
+            self.logger().warning(f"The log server queue is full ({self.queue.maxsize} requests), requests are "
+                                  f"{'spilled to disk' if self._overflow_policy == 'spill' else 'dropped'} until it "
+                                  f"is drained.", extra={"do_not_send": True})
+        if self._overflow_policy == "spill" and self._spill_file_path is not None and \
+                self._spilled_bytes < self._spill_max_bytes:
+            line = json.dumps(req) + "\n"
+            self.spill_executor.submit(self.write_spilled, line)
+            self._spilled_bytes += len(line)
+            self._spilled_count += 1
+            self._spilled_pending += 1
+            return
+        self._dropped_count += 1
+
+    def write_spilled(self, line: str):
+        try:
+            with open(self._spill_file_path, "a") as fd:
+                fd.write(line)
+        except Exception:
+            self.logger().error("Error spilling log server requests to disk.", exc_info=True,
+                                extra={"do_not_send": True})
+
+    def read_spilled(self, count: int) -> List[str]:
+        """
+        Takes up to count lines out of the spill file.
+        """
+        with open(self._spill_file_path) as fd:
+            lines = fd.read().splitlines()
+        if len(lines) > count:
+            with open(self._spill_file_path, "w") as fd:
+                fd.write("\n".join(lines[count:]) + "\n")
+        else:
+            os.remove(self._spill_file_path)
+        return lines[:count]
+
+    async def restore_spilled(self):
+        """
+        Queues spilled requests, as many as the queue has room for, the rest are left in the spill file.
+        """
+        room = self.queue.maxsize - self.queue.qsize() if self.queue.maxsize > 0 else self._spilled_pending
+        try:
+            lines = await asyncio.get_event_loop().run_in_executor(self.spill_executor, self.read_spilled, room)
+        except Exception:
+            self.logger().error("Error restoring spilled log server requests.", exc_info=True,
+                                extra={"do_not_send": True})
+            self._spilled_pending = 0
+            self._spilled_bytes = 0
+            return
+        # Requests spilled while the file was being read are still pending.
+        self._spilled_pending = max(self._spilled_pending - len(lines), 0)
+        self._spilled_bytes = max(self._spilled_bytes - sum(len(line) + 1 for line in lines), 0)
+        for line in lines:
+            req = json.loads(line)
+            try:
+                self.queue.put_nowait(req)
+            except asyncio.QueueFull:
+                self.overflow(req)
+
+    def compressed(self, request_obj: Dict[str, Any]) -> Dict[str, Any]:
+        if not self._compress or not isinstance(request_obj.get("data"), str):
+            return request_obj
+        headers = dict(request_obj.get("headers", {}))
+        headers["Content-Encoding"] = "gzip"
+        return dict(request_obj, headers=headers, data=gzip.compress(request_obj["data"].encode("utf8")))
 
     @async_retry(retry_count=3, exception_types=[asyncio.TimeoutError, EnvironmentError], raise_exp=True)
     async def send_log(self, session: aiohttp.ClientSession, request_dict: Dict[str, Any]):
-        async with session.request(request_dict["method"], request_dict["url"], **request_dict["request_obj"]) as resp:
+        request_obj = self.compressed(request_dict["request_obj"])
+        async with session.request(request_dict["method"], request_dict["url"], **request_obj) as resp:
             resp_text = await resp.text()
             self.logger().debug(f"Sent logs: {resp.status} {resp.url} {resp_text} ",
                                 extra={"do_not_send": True})
@@ -55,9 +196,14 @@ class LogServerClient(NetworkBase):
     async def consume_queue(self, session):
         while True:
             try:
+                if self.queue.empty():
+                    self._overflowing = False
+                    if self._spilled_pending > 0:
+                        await self.restore_spilled()
                 req = await self.queue.get()
                 self.logger().debug(f"Remote logging payload: {req}")
                 await self.send_log(session, req)
+                self._sent_count += 1
             except asyncio.CancelledError:
                 raise
             except aiohttp.ClientError:
@@ -88,6 +234,9 @@ class LogServerClient(NetworkBase):
         if self.consume_queue_task is not None:
             self.consume_queue_task.cancel()
             self.consume_queue_task = None
+        if self._spill_executor is not None:
+            self._spill_executor.shutdown(wait=False)
+            self._spill_executor = None
 
     async def check_network(self) -> NetworkStatus:
         try:
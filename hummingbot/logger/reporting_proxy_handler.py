@@ -7,6 +7,7 @@ from os.path import (
 )
 import json
 import logging
+import time
 import traceback
 from typing import Optional, List, Dict, Any
 import asyncio
@@ -25,6 +26,11 @@ CLIENT_VERSION = open(VERSIONFILE, "rt").read()
 
 
 class ReportingProxyHandler(logging.Handler):
+    """
+    Sends logs and order events to the reporting proxy in batches: a batch is sent once it has capacity records, or
+    once flush_interval seconds have passed since the last one was sent. Batches are queued on the LogServerClient,
+    configured with the queue_capacity, overflow_policy, spill_file_path and compress arguments.
+    """
     _rrh_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -37,7 +43,12 @@ class ReportingProxyHandler(logging.Handler):
                  level: int = logging.ERROR,
                  proxy_url: str = "http://127.0.0.1:9000",
                  enable_order_event_logging: bool = False,
-                 capacity: int = 1):
+                 capacity: int = 1,
+                 flush_interval: float = 5.0,
+                 queue_capacity: int = LogServerClient.DEFAULT_QUEUE_CAPACITY,
+                 overflow_policy: str = "drop",
+                 spill_file_path: Optional[str] = None,
+                 compress: bool = False):
         super().__init__()
         self.setLevel(level)
         self._enable_order_event_logging: bool = enable_order_event_logging
@@ -45,9 +56,20 @@ class ReportingProxyHandler(logging.Handler):
         self._event_queue: list = []
         self._logged_order_events: List[Dict] = []
         self._capacity: int = capacity
+        self._flush_interval: float = flush_interval
+        self._last_flush: float = time.time()
         self._proxy_url: str = proxy_url
         self._log_server_client: Optional[LogServerClient] = None
+        self._log_server_client_options: Dict[str, Any] = {
+            "queue_capacity": queue_capacity,
+            "overflow_policy": overflow_policy,
+            "spill_file_path": spill_file_path,
+            "compress": compress
+        }
         self._send_aggregated_metrics_loop_task = None
+        self._flush_loop_task = None
+        if capacity > 1:
+            self._flush_loop_task = safe_ensure_future(self.flush_loop())
         if global_config_map["heartbeat_enabled"].value:
             self._send_aggregated_metrics_loop_task = safe_ensure_future(
                 self.send_aggregated_metrics_loop(float(global_config_map["heartbeat_interval_min"].value)))
@@ -55,7 +77,8 @@ class ReportingProxyHandler(logging.Handler):
     @property
     def log_server_client(self):
         if not self._log_server_client:
-            self._log_server_client = LogServerClient.get_instance(log_server_url=self._proxy_url)
+            self._log_server_client = LogServerClient.get_instance(log_server_url=self._proxy_url,
+                                                                   **self._log_server_client_options)
         return self._log_server_client
 
     @property
@@ -187,7 +210,7 @@ class ReportingProxyHandler(logging.Handler):
     def flush(self, send_all=False):
         self.acquire()
         min_send_capacity = self._capacity
-        if send_all:
+        if send_all or time.time() - self._last_flush >= self._flush_interval:
             min_send_capacity = 0
         try:
             if global_config_map["send_error_logs"].value:
@@ -195,9 +218,13 @@ class ReportingProxyHandler(logging.Handler):
                     self.send_logs(self._log_queue)
 
                     self._log_queue = []
+                    self._last_flush = time.time()
+            else:
+                self._log_queue = []
             if len(self._event_queue) > 0 and len(self._event_queue) >= min_send_capacity:
                 self.send_events(self._event_queue)
                 self._event_queue = []
+                self._last_flush = time.time()
         except Exception:
             self.logger().error("Error sending logs.", exc_info=True, extra={"do_not_send": True})
         finally:
@@ -210,9 +237,26 @@ class ReportingProxyHandler(logging.Handler):
             if self._send_aggregated_metrics_loop_task is not None:
                 self._send_aggregated_metrics_loop_task.cancel()
                 self._send_aggregated_metrics_loop_task = None
+            if self._flush_loop_task is not None:
+                self._flush_loop_task.cancel()
+                self._flush_loop_task = None
         finally:
             logging.Handler.close(self)
 
+    async def flush_loop(self):
+        """
+        Sends the records of batches left open for flush_interval seconds.
+        """
+        while True:
+            try:
+                await asyncio.sleep(self._flush_interval)
+                if time.time() - self._last_flush >= self._flush_interval:
+                    self.flush(send_all=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error flushing logs.", exc_info=True, extra={"do_not_send": True})
+
     async def send_aggregated_metrics_loop(self, heartbeat_interval_min: float):
         while True:
             try:
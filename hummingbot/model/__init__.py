@@ -6,7 +6,10 @@ HummingbotBase = declarative_base()
 
 
 def get_declarative_base():
+    from .inventory_cost import InventoryCost  # noqa: F401
+    from .inventory_cost_fill import InventoryCostFill  # noqa: F401
     from .market_state import MarketState  # noqa: F401
+    from .market_state_delta import MarketStateDelta  # noqa: F401
     from .metadata import Metadata  # noqa: F401
     from .order import Order  # noqa: F401
     from .order_status import OrderStatus  # noqa: F401
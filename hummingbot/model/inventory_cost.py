@@ -44,7 +44,11 @@ class InventoryCost(HummingbotBase):
         base_volume: Decimal,
         quote_volume: Decimal,
         overwrite: bool = False,
-    ) -> None:
+    ) -> bool:
+        """
+        Adds the volumes to the record, or sets them when overwrite is True.
+        :return: True if the change was committed, False if it was rolled back
+        """
         if overwrite:
             update = {
                 "base_volume": base_volume,
@@ -73,3 +77,5 @@ class InventoryCost(HummingbotBase):
             sql_session.commit()
         except Exception:
             sql_session.rollback()
+            return False
+        return True
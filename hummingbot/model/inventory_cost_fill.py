@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Index,
+    Integer,
+    Numeric,
+    String,
+)
+from sqlalchemy.orm import Session
+
+from . import HummingbotBase
+from .inventory_cost import InventoryCost
+
+
+class InventoryCostFill(HummingbotBase):
+    """
+    The inventory cost volumes of a fill that haven't been added to the InventoryCost record yet. Each fill is saved
+    as soon as it happens, and the fills are coalesced into the record afterwards.
+    """
+    __tablename__ = "InventoryCostFill"
+    __table_args__ = (Index("icf_base_quote_index",
+                            "base_asset", "quote_asset"),
+                      )
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    base_asset = Column(String(45), nullable=False)
+    quote_asset = Column(String(45), nullable=False)
+    base_volume = Column(Numeric(48, 18), nullable=False)
+    quote_volume = Column(Numeric(48, 18), nullable=False)
+
+    @classmethod
+    def coalesce(cls, sql_session: Session, base_asset: str, quote_asset: str) -> int:
+        """
+        Adds the volumes of the saved fills to the InventoryCost record and deletes the fills. The caller commits.
+        :return: the number of fills coalesced
+        """
+        fills = (
+            sql_session.query(cls)
+            .filter(cls.base_asset == base_asset, cls.quote_asset == quote_asset)
+            .order_by(cls.id)
+            .all()
+        )
+        if len(fills) == 0:
+            return 0
+        base_volume = sum((Decimal(fill.base_volume) for fill in fills), Decimal("0"))
+        quote_volume = sum((Decimal(fill.quote_volume) for fill in fills), Decimal("0"))
+
+        rows_updated: int = sql_session.query(InventoryCost).filter(
+            InventoryCost.base_asset == base_asset, InventoryCost.quote_asset == quote_asset
+        ).update({
+            "base_volume": InventoryCost.base_volume + base_volume,
+            "quote_volume": InventoryCost.quote_volume + quote_volume,
+        })
+        if not rows_updated:
+            sql_session.add(InventoryCost(
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                base_volume=float(base_volume),
+                quote_volume=float(quote_volume),
+            ))
+        sql_session.query(cls).filter(cls.id.in_([fill.id for fill in fills])).delete(synchronize_session=False)
+        return len(fills)
+
+    def __repr__(self) -> str:
+        return f"InventoryCostFill(id={self.id}, timestamp={self.timestamp}, base_asset='{self.base_asset}', " \
+            f"quote_asset='{self.quote_asset}', base_volume={self.base_volume}, quote_volume={self.quote_volume})"
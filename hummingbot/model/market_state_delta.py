@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+
+from sqlalchemy import (
+    Column,
+    Text,
+    JSON,
+    Integer,
+    BigInteger,
+    Index
+)
+
+from . import HummingbotBase
+
+
+class MarketStateDelta(HummingbotBase):
+    """
+    A change of a tracking state of a market since its MarketState was saved: the state of a key, or None when the key
+    was deleted. Deltas are applied in id order over the MarketState, and folded into it when compacted.
+    """
+    __tablename__ = "MarketStateDelta"
+    __table_args__ = (Index("msd_config_market_index",
+                            "config_file_path", "market"),
+                      )
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    key = Column(Text, nullable=False)
+    state = Column(JSON, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"MarketStateDelta(id='{self.id}', config_file_path='{self.config_file_path}', " \
+            f"market='{self.market}', timestamp={self.timestamp}, key='{self.key}', state={self.state})"
@@ -1,4 +1,5 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import traceback
 from multiprocessing import Queue
 from typing import List, Optional, Dict, Any, Callable
@@ -43,45 +44,62 @@ class ScriptBase:
         """
         return self.mid_prices[-1]
 
+    def add_mid_price(self, mid_price: Decimal):
+        """
+        Appends the mid price to mid_prices, dropping the oldest ones beyond max_mid_prices_length. Old prices are
+        dropped in place in chunks of 1% of the max length, rather than copying the whole list on every tick once it
+        is full, so the list may briefly hold up to 1% more prices than max_mid_prices_length.
+        """
+        self.mid_prices.append(mid_price)
+        excess = len(self.mid_prices) - self.max_mid_prices_length
+        if excess > 0 and excess >= max(1, self.max_mid_prices_length // 100):
+            del self.mid_prices[:excess]
+
     async def run(self):
         asyncio.ensure_future(self.listen_to_parent())
 
     async def listen_to_parent(self):
-        while True:
-            try:
-                if self._parent_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
-                    continue
-                item = self._parent_queue.get()
-                # print(f"child gets {str(item)}")
-                if item is None:
-                    # print("child exiting..")
-                    asyncio.get_event_loop().stop()
-                    break
-                if isinstance(item, OnTick):
-                    self.mid_prices.append(item.mid_price)
-                    if len(self.mid_prices) > self.max_mid_prices_length:
-                        self.mid_prices = self.mid_prices[len(self.mid_prices) - self.max_mid_prices_length:]
-                    self.pmm_parameters = item.pmm_parameters
-                    self.all_total_balances = item.all_total_balances
-                    self.all_available_balances = item.all_available_balances
-                    self.on_tick()
-                elif isinstance(item, BuyOrderCompletedEvent):
-                    self.on_buy_order_completed(item)
-                elif isinstance(item, SellOrderCompletedEvent):
-                    self.on_sell_order_completed(item)
-                elif isinstance(item, OnStatus):
-                    status_msg = self.on_status()
-                    self.notify(f"Script status: {status_msg}")
-                elif isinstance(item, PmmMarketInfo):
-                    self.pmm_market_info = item
-            except asyncio.CancelledError:
-                raise
-            except Exception as e:
-                # Capturing traceback here and put it as part of ScriptError, which can then be reported in the parent
-                # process.
-                tb = "".join(traceback.TracebackException.from_exception(e).format())
-                self._child_queue.put(ScriptError(e, tb))
+        # A thread of its own blocks on the parent queue, the default executor's threads stay available to the script.
+        parent_queue_executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            while True:
+                try:
+                    # Waits on the queue in its worker thread, so ticks are handled as soon as they arrive without
+                    # polling.
+                    item = await asyncio.get_event_loop().run_in_executor(parent_queue_executor, self._parent_queue.get)
+                    # print(f"child gets {str(item)}")
+                    if item is None:
+                        # print("child exiting..")
+                        asyncio.get_event_loop().stop()
+                        break
+                    if isinstance(item, OnTick):
+                        self.add_mid_price(item.mid_price)
+                        # The parent only sends parameters and balances when they have changed since the last tick.
+                        if item.pmm_parameters is not None:
+                            self.pmm_parameters = item.pmm_parameters
+                        if item.all_total_balances is not None:
+                            self.all_total_balances = item.all_total_balances
+                        if item.all_available_balances is not None:
+                            self.all_available_balances = item.all_available_balances
+                        self.on_tick()
+                    elif isinstance(item, BuyOrderCompletedEvent):
+                        self.on_buy_order_completed(item)
+                    elif isinstance(item, SellOrderCompletedEvent):
+                        self.on_sell_order_completed(item)
+                    elif isinstance(item, OnStatus):
+                        status_msg = self.on_status()
+                        self.notify(f"Script status: {status_msg}")
+                    elif isinstance(item, PmmMarketInfo):
+                        self.pmm_market_info = item
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # Capturing traceback here and put it as part of ScriptError, which can then be reported in the
+                    # parent process.
+                    tb = "".join(traceback.TracebackException.from_exception(e).format())
+                    self._child_queue.put(ScriptError(e, tb))
+        finally:
+            parent_queue_executor.shutdown(wait=False)
 
     def notify(self, msg: str):
         """
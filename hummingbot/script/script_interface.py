@@ -113,6 +113,10 @@ class PmmMarketInfo:
 
 
 class OnTick:
+    """
+    Sent to the script on every tick. pmm_parameters and the balances are None when they haven't changed since the
+    previous tick.
+    """
     def __init__(self, mid_price: Decimal,
                  pmm_parameters: PMMParameters,
                  all_total_balances: Dict[str, Dict[str, Decimal]],
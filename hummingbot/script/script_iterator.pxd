@@ -15,7 +15,11 @@ cdef class ScriptIterator(TimeIterator):
         object _script_module
         object _parent_queue
         object _child_queue
+        object _child_queue_executor
         object _ev_loop
         object _script_process
         object _listen_to_child_task
+        object _last_pmm_parameters
+        object _last_total_balances
+        object _last_available_balances
         bint _is_unit_testing_mode
@@ -1,5 +1,6 @@
 # distutils: language=c++
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 import asyncio
 import logging
@@ -29,6 +30,7 @@ from hummingbot.script.script_interface import (
 )
 
 sir_logger = None
+PMM_PARAMETER_NAMES = [attr for attr in PMMParameters.__dict__.keys() if attr[:1] != '_']
 
 
 cdef class ScriptIterator(TimeIterator):
@@ -58,8 +60,14 @@ cdef class ScriptIterator(TimeIterator):
             (MarketEvent.SellOrderCompleted, self._did_complete_sell_order_forwarder)
         ]
         self._ev_loop = asyncio.get_event_loop()
+        self._last_pmm_parameters = None
+        self._last_total_balances = None
+        self._last_available_balances = None
         self._parent_queue = Queue()
         self._child_queue = Queue()
+        # A thread of its own blocks on the child queue, rather than one of the default executor's threads for as
+        # long as the script runs.
+        self._child_queue_executor = ThreadPoolExecutor(max_workers=1)
         self._listen_to_child_task = safe_ensure_future(self.listen_to_child_queue(), loop=self._ev_loop)
 
         self._script_process = Process(
@@ -88,18 +96,34 @@ cdef class ScriptIterator(TimeIterator):
         self._script_process.join()
         if self._listen_to_child_task is not None:
             self._listen_to_child_task.cancel()
+        self._child_queue_executor.shutdown(wait=False)
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         if not self._strategy.all_markets_ready():
             return
-        cdef object pmm_strategy = PMMParameters()
-        for attr in PMMParameters.__dict__.keys():
-            if attr[:1] != '_':
-                param_value = getattr(self._strategy, attr)
-                setattr(pmm_strategy, attr, param_value)
-        cdef object on_tick = OnTick(self.strategy.get_mid_price(), pmm_strategy,
-                                     self.all_total_balances(), self.all_available_balances())
+        cdef:
+            object pmm_parameters = None
+            dict parameter_values = {attr: getattr(self._strategy, attr) for attr in PMM_PARAMETER_NAMES}
+            dict total_balances = self.all_total_balances()
+            dict available_balances = self.all_available_balances(total_balances)
+            object on_tick
+        # Only the mid price changes on most ticks, so parameters and balances are sent only when they changed and the
+        # script keeps its last copy otherwise. This keeps the per tick message small and cheap to pickle.
+        if parameter_values != self._last_pmm_parameters:
+            pmm_parameters = PMMParameters()
+            for attr, param_value in parameter_values.items():
+                setattr(pmm_parameters, attr, param_value)
+            self._last_pmm_parameters = parameter_values
+        if total_balances != self._last_total_balances:
+            self._last_total_balances = total_balances
+        else:
+            total_balances = None
+        if available_balances != self._last_available_balances:
+            self._last_available_balances = available_balances
+        else:
+            available_balances = None
+        on_tick = OnTick(self.strategy.get_mid_price(), pmm_parameters, total_balances, available_balances)
         self._parent_queue.put(on_tick)
 
     def _did_complete_buy_order(self,
@@ -117,10 +141,9 @@ cdef class ScriptIterator(TimeIterator):
     async def listen_to_child_queue(self):
         while True:
             try:
-                if self._child_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
-                    continue
-                item = self._child_queue.get()
+                # Waits on the queue in its worker thread, so items are picked up as soon as they arrive without
+                # polling. c_stop() puts None in the queue to release it.
+                item = await self._ev_loop.run_in_executor(self._child_queue_executor, self._child_queue.get)
                 self.logger().info(f"received: {str(item)}")
                 if item is None:
                     break
@@ -146,8 +169,8 @@ cdef class ScriptIterator(TimeIterator):
         all_bals = {m.name: m.get_all_balances() for m in self._markets}
         return {exchange: {token: bal for token, bal in bals.items() if bal > 0} for exchange, bals in all_bals.items()}
 
-    def all_available_balances(self):
-        all_bals = self.all_total_balances()
+    def all_available_balances(self, all_total_balances=None):
+        all_bals = self.all_total_balances() if all_total_balances is None else all_total_balances
         ret_val = {}
         for exchange, balances in all_bals.items():
             connector = [c for c in self._markets if c.name == exchange][0]
@@ -1,6 +1,7 @@
 from decimal import Decimal
 import logging
 import asyncio
+import time
 import pandas as pd
 from typing import List, Dict, Tuple, Optional
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -84,6 +85,9 @@ class AmmArbStrategy(StrategyPyBase):
         self._quote_eth_rate_fetch_loop_task = None
         self._market_1_quote_eth_rate = None
         self._market_2_quote_eth_rate = None
+        self._last_evaluation_latency = None
+        self._evaluation_latency_sum = 0.
+        self._evaluation_count = 0
 
     @property
     def min_profitability(self) -> Decimal:
@@ -97,6 +101,19 @@ class AmmArbStrategy(StrategyPyBase):
     def order_amount(self, value):
         self._order_amount = value
 
+    @property
+    def last_evaluation_latency(self) -> Optional[float]:
+        """
+        Time in seconds it took to fetch all prices and build arbitrage proposals in the last cycle.
+        """
+        return self._last_evaluation_latency
+
+    @property
+    def average_evaluation_latency(self) -> Optional[float]:
+        if self._evaluation_count == 0:
+            return None
+        return self._evaluation_latency_sum / self._evaluation_count
+
     @property
     def market_info_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
         return self._sb_order_tracker.market_pair_to_active_orders
@@ -123,7 +140,12 @@ class AmmArbStrategy(StrategyPyBase):
         min profitability required, applies the slippage buffer, applies budget constraint, then finally execute the
         arbitrage.
         """
+        start_time = time.perf_counter()
         self._arb_proposals = await create_arb_proposals(self._market_info_1, self._market_info_2, self._order_amount)
+        self._last_evaluation_latency = time.perf_counter() - start_time
+        self._evaluation_latency_sum += self._last_evaluation_latency
+        self._evaluation_count += 1
+        self.logger().debug(f"Arbitrage proposals evaluated in {self._last_evaluation_latency * 1e3:.1f} ms.")
         arb_proposals = [
             t.copy() for t in self._arb_proposals
             if t.profit_pct(
@@ -277,6 +299,10 @@ class AmmArbStrategy(StrategyPyBase):
 
         lines.extend(["", "  Profitability:"] + self.short_proposal_msg(self._arb_proposals))
 
+        if self._last_evaluation_latency is not None:
+            lines.extend(["", f"  Evaluation latency: {self._last_evaluation_latency * 1e3:.1f} ms (last), "
+                              f"{self.average_evaluation_latency * 1e3:.1f} ms (average)"])
+
         warning_lines = self.network_warning([self._market_info_1])
         warning_lines.extend(self.network_warning([self._market_info_2]))
         warning_lines.extend(self.balance_warning([self._market_info_1]))
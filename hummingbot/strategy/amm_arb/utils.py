@@ -1,29 +1,80 @@
+import asyncio
 from decimal import Decimal
-from typing import List
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+)
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from .data_types import ArbProposal, ArbProposalSide
 
 s_decimal_nan = Decimal("NaN")
 
 
+class QuoteCache:
+    """
+    Short lived cache of quote and order prices, meant to live for one arbitrage evaluation. Identical requests,
+    including concurrent ones, share a single connector call. For connectors whose order price is their quote price
+    (e.g. gateway connectors), the order price is served from the quote.
+    """
+    def __init__(self):
+        self._tasks: Dict[Tuple[str, int, str, bool, Decimal], asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def get_quote_price(self, market: ConnectorBase, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        return await self._get("quote", market.get_quote_price, market, trading_pair, is_buy, amount)
+
+    async def get_order_price(self, market: ConnectorBase, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        if market.order_price_is_quote_price:
+            return await self.get_quote_price(market, trading_pair, is_buy, amount)
+        return await self._get("order", market.get_order_price, market, trading_pair, is_buy, amount)
+
+    def _get(self,
+             price_kind: str,
+             price_function: Callable[[str, bool, Decimal], Awaitable[Decimal]],
+             market: ConnectorBase,
+             trading_pair: str,
+             is_buy: bool,
+             amount: Decimal) -> asyncio.Task:
+        key = (price_kind, id(market), trading_pair, is_buy, amount)
+        if key not in self._tasks:
+            self._tasks[key] = safe_ensure_future(price_function(trading_pair, is_buy, amount))
+        return self._tasks[key]
+
+
 async def create_arb_proposals(market_info_1: MarketTradingPairTuple,
                                market_info_2: MarketTradingPairTuple,
                                order_amount: Decimal) -> List[ArbProposal]:
     """
-    Creates base arbitrage proposals for given markets without any filtering.
+    Creates base arbitrage proposals for given markets without any filtering. All price requests are sent
+    concurrently and identical ones are only sent once.
     :param market_info_1: The first market
     :param market_info_2: The second market
     :param order_amount: The required order amount.
     :return A list of 2 proposal - (market_1 buy, market_2 sell) and (market_1 sell, market_2 buy)
     """
     order_amount = Decimal(str(order_amount))
+    quote_cache = QuoteCache()
     results = []
+    tasks = []
     for index in range(0, 2):
         is_buy = not bool(index)  # bool(0) is False, so start with buy first
-        m_1_q_price = await market_info_1.market.get_quote_price(market_info_1.trading_pair, is_buy, order_amount)
-        m_1_o_price = await market_info_1.market.get_order_price(market_info_1.trading_pair, is_buy, order_amount)
-        m_2_q_price = await market_info_2.market.get_quote_price(market_info_2.trading_pair, not is_buy, order_amount)
-        m_2_o_price = await market_info_2.market.get_order_price(market_info_2.trading_pair, not is_buy, order_amount)
+        tasks.extend([
+            quote_cache.get_quote_price(market_info_1.market, market_info_1.trading_pair, is_buy, order_amount),
+            quote_cache.get_order_price(market_info_1.market, market_info_1.trading_pair, is_buy, order_amount),
+            quote_cache.get_quote_price(market_info_2.market, market_info_2.trading_pair, not is_buy, order_amount),
+            quote_cache.get_order_price(market_info_2.market, market_info_2.trading_pair, not is_buy, order_amount)
+        ])
+    prices = await safe_gather(*tasks)
+    for index in range(0, 2):
+        is_buy = not bool(index)
+        m_1_q_price, m_1_o_price, m_2_q_price, m_2_o_price = prices[index * 4: index * 4 + 4]
         if any(p is None for p in (m_1_o_price, m_1_q_price, m_2_o_price, m_2_q_price)):
             continue
         first_side = ArbProposalSide(
@@ -17,6 +17,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.table_formatter import Table
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.arbitrage.arbitrage_market_pair import ArbitrageMarketPair
@@ -110,6 +111,14 @@ cdef class ArbitrageStrategy(StrategyBase):
     def tracked_market_orders_data_frame(self) -> List[pd.DataFrame]:
         return self._sb_order_tracker.tracked_market_orders_data_frame
 
+    @property
+    def tracked_limit_orders_table(self) -> Table:
+        return self._sb_order_tracker.tracked_limit_orders_table
+
+    @property
+    def tracked_market_orders_table(self) -> Table:
+        return self._sb_order_tracker.tracked_market_orders_table
+
     def get_second_to_first_conversion_rate(self) -> Tuple[str, Decimal, str, Decimal]:
         """
         Find conversion rates from secondary market to primary market
@@ -145,6 +154,9 @@ cdef class ArbitrageStrategy(StrategyBase):
             self.logger().info(f"{base_pair} ({base_rate_source}) conversion rate: {smart_round(base_rate)}")
 
     def oracle_status_df(self):
+        return self.oracle_status_table().to_pandas()
+
+    def oracle_status_table(self) -> Table:
         columns = ["Source", "Pair", "Rate"]
         data = []
         quote_pair, quote_rate_source, quote_rate, base_pair, base_rate_source, base_rate = \
@@ -157,7 +169,7 @@ cdef class ArbitrageStrategy(StrategyBase):
             data.extend([
                 [base_rate_source, base_pair, smart_round(base_rate)],
             ])
-        return pd.DataFrame(data=data, columns=columns)
+        return Table(data=data, columns=columns)
 
     def format_status(self) -> str:
         cdef:
@@ -166,18 +178,18 @@ cdef class ArbitrageStrategy(StrategyBase):
         for market_pair in self._market_pairs:
             warning_lines.extend(self.network_warning([market_pair.first, market_pair.second]))
 
-            markets_df = self.market_status_data_frame([market_pair.first, market_pair.second])
+            markets_table = self.market_status_table([market_pair.first, market_pair.second])
             lines.extend(["", "  Markets:"] +
-                         ["    " + line for line in str(markets_df).split("\n")])
+                         ["    " + line for line in str(markets_table).split("\n")])
 
-            oracle_df = self.oracle_status_df()
-            if not oracle_df.empty:
+            oracle_table = self.oracle_status_table()
+            if not oracle_table.empty:
                 lines.extend(["", "  Rate conversion:"] +
-                             ["    " + line for line in str(oracle_df).split("\n")])
+                             ["    " + line for line in str(oracle_table).split("\n")])
 
-            assets_df = self.wallet_balance_data_frame([market_pair.first, market_pair.second])
+            assets_table = self.wallet_balance_table([market_pair.first, market_pair.second])
             lines.extend(["", "  Assets:"] +
-                         ["    " + line for line in str(assets_df).split("\n")])
+                         ["    " + line for line in str(assets_table).split("\n")])
 
             lines.extend(
                 ["", "  Profitability(without fees):"] +
@@ -191,17 +203,15 @@ cdef class ArbitrageStrategy(StrategyBase):
             tracked_market_orders = self.tracked_market_orders
 
             if len(tracked_limit_orders) > 0 or len(tracked_market_orders) > 0:
-                tracked_limit_orders_df = self.tracked_limit_orders_data_frame
-                tracked_market_orders_df = self.tracked_market_orders_data_frame
-                df_limit_lines = (str(tracked_limit_orders_df).split("\n")
-                                  if len(tracked_limit_orders) > 0
-                                  else list())
-                df_market_lines = (str(tracked_market_orders_df).split("\n")
-                                   if len(tracked_market_orders) > 0
-                                   else list())
+                limit_lines = (str(self.tracked_limit_orders_table).split("\n")
+                               if len(tracked_limit_orders) > 0
+                               else list())
+                market_lines = (str(self.tracked_market_orders_table).split("\n")
+                                if len(tracked_market_orders) > 0
+                                else list())
                 lines.extend(["", "  Pending limit orders:"] +
-                             ["    " + line for line in df_limit_lines] +
-                             ["    " + line for line in df_market_lines])
+                             ["    " + line for line in limit_lines] +
+                             ["    " + line for line in market_lines])
             else:
                 lines.extend(["", "  No pending limit orders."])
 
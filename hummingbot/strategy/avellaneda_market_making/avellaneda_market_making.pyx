@@ -1,7 +1,6 @@
 from decimal import Decimal
 import logging
 import pandas as pd
-import numpy as np
 from typing import (
     List,
     Dict,
@@ -18,6 +17,7 @@ from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.table_formatter import Table
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
 from hummingbot.core.event.events import OrderType
@@ -260,6 +260,9 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         return self._sb_order_tracker
 
     def pure_mm_assets_df(self, to_show_current_pct: bool) -> pd.DataFrame:
+        return self.pure_mm_assets_table(to_show_current_pct).to_pandas()
+
+    def pure_mm_assets_table(self, to_show_current_pct: bool) -> Table:
         market, trading_pair, base_asset, quote_asset = self._market_info
         price = self._market_info.get_mid_price()
         base_balance = float(market.get_balance(base_asset))
@@ -278,10 +281,12 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         ]
         if to_show_current_pct:
             data.append(["Current %", f"{base_ratio:.1%}", f"{quote_ratio:.1%}"])
-        df = pd.DataFrame(data=data)
-        return df
+        return Table(data=data)
 
     def active_orders_df(self) -> pd.DataFrame:
+        return self.active_orders_table().to_pandas()
+
+    def active_orders_table(self) -> Table:
         market, trading_pair, base_asset, quote_asset = self._market_info
         price = self.get_price()
         active_orders = self.active_orders
@@ -296,8 +301,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             age = "n/a"
             # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
             if "//" not in order.client_order_id:
-                age = pd.Timestamp(int(time.time()) - int(order.client_order_id[-16:])/1e6,
-                                   unit='s').strftime('%H:%M:%S')
+                age = time.strftime('%H:%M:%S', time.gmtime(int(time.time()) - int(order.client_order_id[-16:])/1e6))
             amount_orig = self._order_amount
             data.append([
                 "",
@@ -309,9 +313,9 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                 age
             ])
 
-        return pd.DataFrame(data=data, columns=columns)
+        return Table(data=data, columns=columns)
 
-    def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+    def market_status_table(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> Table:
         markets_data = []
         markets_columns = ["Exchange", "Market", "Best Bid", "Best Ask", f"MidPrice"]
         markets_columns.append('Reserved Price')
@@ -328,7 +332,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                 float(ref_price),
                 round(self._reserved_price, 5),
             ])
-        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+        return Table(data=markets_data, columns=markets_columns).fillna('')
 
     def format_status(self) -> str:
         if not self._all_markets_ready:
@@ -338,19 +342,19 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             list warning_lines = []
         warning_lines.extend(self.network_warning([self._market_info]))
 
-        markets_df = self.market_status_data_frame([self._market_info])
-        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
+        markets_table = self.market_status_table([self._market_info])
+        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_table.to_string(index=False).split("\n")])
 
-        assets_df = self.pure_mm_assets_df(True)
-        first_col_length = max(*assets_df[0].apply(len))
-        df_lines = assets_df.to_string(index=False, header=False,
-                                       formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
-        lines.extend(["", "  Assets:"] + ["    " + line for line in df_lines])
+        assets_table = self.pure_mm_assets_table(True)
+        first_col_length = max(len(label) for label in assets_table[0])
+        table_lines = assets_table.to_string(index=False, header=False,
+                                             formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
+        lines.extend(["", "  Assets:"] + ["    " + line for line in table_lines])
 
         # See if there are any open orders.
         if len(self.active_orders) > 0:
-            df = self.active_orders_df()
-            lines.extend(["", "  Orders:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+            table = self.active_orders_table()
+            lines.extend(["", "  Orders:"] + ["    " + line for line in table.to_string(index=False).split("\n")])
         else:
             lines.extend(["", "  No active maker orders."])
 
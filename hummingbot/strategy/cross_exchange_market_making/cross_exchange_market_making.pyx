@@ -20,6 +20,7 @@ from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.table_formatter import Table
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
 from hummingbot.core.event.events import OrderType
@@ -209,6 +210,9 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
             self.logger().info(f"{base_pair} ({base_rate_source}) conversion rate: {smart_round(base_rate)}")
 
     def oracle_status_df(self):
+        return self.oracle_status_table().to_pandas()
+
+    def oracle_status_table(self) -> Table:
         columns = ["Source", "Pair", "Rate"]
         data = []
         quote_pair, quote_rate_source, quote_rate, base_pair, base_rate_source, base_rate = \
@@ -221,7 +225,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
             data.extend([
                 [base_rate_source, base_pair, smart_round(base_rate)],
             ])
-        return pd.DataFrame(data=data, columns=columns)
+        return Table(data=data, columns=columns)
 
     def format_status(self) -> str:
         cdef:
@@ -242,28 +246,27 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         for market_pair in self._market_pairs.values():
             warning_lines.extend(self.network_warning([market_pair.maker, market_pair.taker]))
 
-            markets_df = self.market_status_data_frame([market_pair.maker, market_pair.taker])
+            markets_table = self.market_status_table([market_pair.maker, market_pair.taker])
             lines.extend(["", "  Markets:"] +
-                         ["    " + line for line in str(markets_df).split("\n")])
+                         ["    " + line for line in str(markets_table).split("\n")])
 
-            oracle_df = self.oracle_status_df()
-            if not oracle_df.empty:
+            oracle_table = self.oracle_status_table()
+            if not oracle_table.empty:
                 lines.extend(["", "  Rate conversion:"] +
-                             ["    " + line for line in str(oracle_df).split("\n")])
+                             ["    " + line for line in str(oracle_table).split("\n")])
 
-            assets_df = self.wallet_balance_data_frame([market_pair.maker, market_pair.taker])
+            assets_table = self.wallet_balance_table([market_pair.maker, market_pair.taker])
             lines.extend(["", "  Assets:"] +
-                         ["    " + line for line in str(assets_df).split("\n")])
+                         ["    " + line for line in str(assets_table).split("\n")])
 
             # See if there're any open orders.
             if market_pair in tracked_maker_orders and len(tracked_maker_orders[market_pair]) > 0:
                 limit_orders = list(tracked_maker_orders[market_pair].values())
                 bid, ask = self.c_get_top_bid_ask(market_pair)
                 mid_price = (bid + ask)/2
-                df = LimitOrder.to_pandas(limit_orders, mid_price)
-                df_lines = str(df).split("\n")
+                table = LimitOrder.to_table(limit_orders, mid_price)
                 lines.extend(["", "  Active orders:"] +
-                             ["    " + line for line in df_lines])
+                             ["    " + line for line in str(table).split("\n")])
             else:
                 lines.extend(["", "  No active maker orders."])
 
@@ -3,7 +3,6 @@ import logging
 import asyncio
 from typing import Dict, List, Set
 import pandas as pd
-import numpy as np
 from statistics import mean
 import time
 from hummingbot.core.clock import Clock
@@ -15,6 +14,7 @@ from .data_types import Proposal, PriceSize
 from hummingbot.core.event.events import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.table_formatter import Table
 from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
     calculate_bid_ask_ratios_from_base_asset_ratio
 )
@@ -124,6 +124,9 @@ class LiquidityMiningStrategy(StrategyPyBase):
         return -1.
 
     async def active_orders_df(self) -> pd.DataFrame:
+        return (await self.active_orders_table()).to_pandas()
+
+    async def active_orders_table(self) -> Table:
         size_q_col = f"Amt({self._token})" if self.is_token_a_quote_token() else "Amt(Quote)"
         columns = ["Market", "Side", "Price", "Spread", "Amount", size_q_col, "Age"]
         data = []
@@ -133,7 +136,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
             size_q = order.quantity * mid_price
             age = self.order_age(order)
             # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
-            age_txt = "n/a" if age <= 0. else pd.Timestamp(age, unit='s').strftime('%H:%M:%S')
+            age_txt = "n/a" if age <= 0. else time.strftime('%H:%M:%S', time.gmtime(age))
             data.append([
                 order.trading_pair,
                 "buy" if order.is_buy else "sell",
@@ -143,11 +146,12 @@ class LiquidityMiningStrategy(StrategyPyBase):
                 float(size_q),
                 age_txt
             ])
-        df = pd.DataFrame(data=data, columns=columns)
-        df.sort_values(by=["Market", "Side"], inplace=True)
-        return df
+        return Table(data=data, columns=columns).sort_values(by=["Market", "Side"])
 
     def budget_status_df(self) -> pd.DataFrame:
+        return self.budget_status_table().to_pandas()
+
+    def budget_status_table(self) -> Table:
         data = []
         columns = ["Market", f"Budget({self._token})", "Base bal", "Quote bal", "Base/Quote"]
         for market, market_info in self._market_infos.items():
@@ -167,11 +171,12 @@ class LiquidityMiningStrategy(StrategyPyBase):
                 float(quote_bal),
                 f"{base_pct:.0%} / {quote_pct:.0%}"
             ])
-        df = pd.DataFrame(data=data, columns=columns).replace(np.nan, '', regex=True)
-        df.sort_values(by=["Market"], inplace=True)
-        return df
+        return Table(data=data, columns=columns).fillna('').sort_values(by=["Market"])
 
     def market_status_df(self) -> pd.DataFrame:
+        return self.market_status_table().to_pandas()
+
+    def market_status_table(self) -> Table:
         data = []
         columns = ["Market", "Mid price", "Best bid", "Best ask", "Volatility"]
         for market, market_info in self._market_infos.items():
@@ -187,11 +192,12 @@ class LiquidityMiningStrategy(StrategyPyBase):
                 f"{best_ask_pct:.2%}",
                 "" if self._volatility[market].is_nan() else f"{self._volatility[market]:.2%}",
             ])
-        df = pd.DataFrame(data=data, columns=columns).replace(np.nan, '', regex=True)
-        df.sort_values(by=["Market"], inplace=True)
-        return df
+        return Table(data=data, columns=columns).fillna('').sort_values(by=["Market"])
 
     async def miner_status_df(self) -> pd.DataFrame:
+        return (await self.miner_status_table()).to_pandas()
+
+    async def miner_status_table(self) -> Table:
         data = []
         g_sym = RateOracle.global_token_symbol
         columns = ["Market", "Payout", "Reward/wk", "Liquidity", "Yield/yr", "Max spread"]
@@ -206,9 +212,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
                 f"{campaign.apy:.2%}",
                 f"{campaign.spread_max:.2%}%"
             ])
-        df = pd.DataFrame(data=data, columns=columns).replace(np.nan, '', regex=True)
-        df.sort_values(by=["Market"], inplace=True)
-        return df
+        return Table(data=data, columns=columns).fillna('').sort_values(by=["Market"])
 
     async def format_status(self) -> str:
         if not self._ready_to_trade:
@@ -217,20 +221,21 @@ class LiquidityMiningStrategy(StrategyPyBase):
         warning_lines = []
         warning_lines.extend(self.network_warning(list(self._market_infos.values())))
 
-        budget_df = self.budget_status_df()
-        lines.extend(["", "  Budget:"] + ["    " + line for line in budget_df.to_string(index=False).split("\n")])
+        budget_table = self.budget_status_table()
+        lines.extend(["", "  Budget:"] + ["    " + line for line in budget_table.to_string(index=False).split("\n")])
 
-        market_df = self.market_status_df()
-        lines.extend(["", "  Markets:"] + ["    " + line for line in market_df.to_string(index=False).split("\n")])
+        market_table = self.market_status_table()
+        lines.extend(["", "  Markets:"] + ["    " + line for line in market_table.to_string(index=False).split("\n")])
 
-        miner_df = await self.miner_status_df()
-        if not miner_df.empty:
-            lines.extend(["", "  Miner:"] + ["    " + line for line in miner_df.to_string(index=False).split("\n")])
+        miner_table = await self.miner_status_table()
+        if not miner_table.empty:
+            lines.extend(["", "  Miner:"] +
+                         ["    " + line for line in miner_table.to_string(index=False).split("\n")])
 
         # See if there're any open orders.
         if len(self.active_orders) > 0:
-            df = await self.active_orders_df()
-            lines.extend(["", "  Orders:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+            table = await self.active_orders_table()
+            lines.extend(["", "  Orders:"] + ["    " + line for line in table.to_string(index=False).split("\n")])
         else:
             lines.extend(["", "  No active maker orders."])
 
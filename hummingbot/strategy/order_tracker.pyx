@@ -3,6 +3,7 @@ from collections import (
     OrderedDict
 )
 import pandas as pd
+import time
 from typing import (
     Dict,
     List,
@@ -13,6 +14,7 @@ from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.utils.table_formatter import Table
 from .market_trading_pair_tuple import MarketTradingPairTuple
 
 NaN = float("nan")
@@ -84,16 +86,20 @@ cdef class OrderTracker(TimeIterator):
 
     @property
     def tracked_limit_orders_data_frame(self) -> List[pd.DataFrame]:
+        return self.tracked_limit_orders_table.to_pandas()
+
+    @property
+    def tracked_limit_orders_table(self) -> Table:
         limit_orders = [
             [market_trading_pair_tuple.market.display_name, market_trading_pair_tuple.trading_pair, order_id,
              order.quantity,
              "n/a" if "//" in order.client_order_id else
-             pd.Timestamp(int(order.client_order_id[-16:]) / 1e6, unit='s', tz='UTC').strftime('%Y-%m-%d %H:%M:%S')
+             time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(int(order.client_order_id[-16:]) / 1e6))
              ]
             for market_trading_pair_tuple, order_map in self._tracked_limit_orders.items()
             for order_id, order in order_map.items()]
 
-        return pd.DataFrame(data=limit_orders, columns=["market", "trading_pair", "order_id", "quantity", "timestamp"])
+        return Table(data=limit_orders, columns=["market", "trading_pair", "order_id", "quantity", "timestamp"])
 
     @property
     def tracked_market_orders(self) -> List[Tuple[ConnectorBase, MarketOrder]]:
@@ -102,13 +108,17 @@ cdef class OrderTracker(TimeIterator):
 
     @property
     def tracked_market_orders_data_frame(self) -> List[pd.DataFrame]:
+        return self.tracked_market_orders_table.to_pandas()
+
+    @property
+    def tracked_market_orders_table(self) -> Table:
         market_orders = [[market_trading_pair_tuple.market.display_name, market_trading_pair_tuple.trading_pair,
                           order_id, order.amount,
-                          pd.Timestamp(order.timestamp, unit='s', tz='UTC').strftime('%Y-%m-%d %H:%M:%S')]
+                          time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(order.timestamp))]
                          for market_trading_pair_tuple, order_map in self._tracked_market_orders.items()
                          for order_id, order in order_map.items()]
 
-        return pd.DataFrame(data=market_orders, columns=["market", "trading_pair", "order_id", "quantity", "timestamp"])
+        return Table(data=market_orders, columns=["market", "trading_pair", "order_id", "quantity", "timestamp"])
 
     @property
     def in_flight_cancels(self) -> Dict[str, float]:
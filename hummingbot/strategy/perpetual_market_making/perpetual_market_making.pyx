@@ -1,7 +1,6 @@
 from decimal import Decimal
 import logging
 import pandas as pd
-import numpy as np
 from typing import (
     List,
     Dict,
@@ -23,6 +22,7 @@ from hummingbot.core.event.events import (
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.table_formatter import Table
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
 from hummingbot.core.event.events import OrderType
@@ -405,6 +405,9 @@ cdef class PerpetualMarketMakingStrategy(StrategyBase):
         return self._sb_order_tracker
 
     def perpetual_mm_assets_df(self, to_show_current_pct: bool) -> pd.DataFrame:
+        return self.perpetual_mm_assets_table(to_show_current_pct).to_pandas()
+
+    def perpetual_mm_assets_table(self, to_show_current_pct: bool) -> Table:
         market, trading_pair, base_asset, quote_asset = self._market_info
         price = self._market_info.get_mid_price()
         quote_balance = float(market.get_balance(quote_asset))
@@ -414,10 +417,12 @@ cdef class PerpetualMarketMakingStrategy(StrategyBase):
             ["Total Balance", round(quote_balance, 4)],
             ["Available Balance", round(available_quote_balance, 4)]
         ]
-        df = pd.DataFrame(data=data)
-        return df
+        return Table(data=data)
 
     def active_orders_df(self) -> pd.DataFrame:
+        return self.active_orders_table().to_pandas()
+
+    def active_orders_table(self) -> Table:
         price = self.get_price()
         active_orders = self.active_orders
         no_sells = len([o for o in active_orders if not o.is_buy and o.client_order_id not in self._hanging_order_ids])
@@ -439,8 +444,7 @@ cdef class PerpetualMarketMakingStrategy(StrategyBase):
             age = "n/a"
             # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
             if "//" not in order.client_order_id:
-                age = pd.Timestamp(int(time.time()) - int(order.client_order_id[-16:])/1e6,
-                                   unit='s').strftime('%H:%M:%S')
+                age = time.strftime('%H:%M:%S', time.gmtime(int(time.time()) - int(order.client_order_id[-16:])/1e6))
             amount_orig = "" if level is None else self._order_amount + ((level - 1) * self._order_level_amount)
             data.append([
                 "hang" if order.client_order_id in self._hanging_order_ids else level,
@@ -452,9 +456,12 @@ cdef class PerpetualMarketMakingStrategy(StrategyBase):
                 age
             ])
 
-        return pd.DataFrame(data=data, columns=columns)
+        return Table(data=data, columns=columns)
 
     def active_positions_df(self) -> pd.DataFrame:
+        return self.active_positions_table().to_pandas()
+
+    def active_positions_table(self) -> Table:
         columns = ["Symbol", "Type", "Entry Price", "Amount", "Leverage", "Unrealized PnL"]
         data = []
         market, trading_pair = self._market_info.market, self._market_info.trading_pair
@@ -470,9 +477,9 @@ cdef class PerpetualMarketMakingStrategy(StrategyBase):
                 unrealized_profit
             ])
 
-        return pd.DataFrame(data=data, columns=columns)
+        return Table(data=data, columns=columns)
 
-    def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+    def market_status_table(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> Table:
         markets_data = []
         markets_columns = ["Exchange", "Market", "Best Bid", "Best Ask", f"Ref Price ({self._price_type.name})"]
         if self._price_type is PriceType.LastOwnTrade and self._last_own_trade_price.is_nan():
@@ -495,7 +502,7 @@ cdef class PerpetualMarketMakingStrategy(StrategyBase):
                 float(ask_price),
                 float(ref_price)
             ])
-        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+        return Table(data=markets_data, columns=markets_columns).fillna('')
 
     def format_status(self) -> str:
         if not self._all_markets_ready:
@@ -506,27 +513,27 @@ cdef class PerpetualMarketMakingStrategy(StrategyBase):
         # warning_lines.extend(self._ping_pong_warning_lines)
         # warning_lines.extend(self.network_warning([self._market_info]))
 
-        markets_df = self.market_status_data_frame([self._market_info])
-        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
+        markets_table = self.market_status_table([self._market_info])
+        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_table.to_string(index=False).split("\n")])
 
-        assets_df = self.perpetual_mm_assets_df(False)
+        assets_table = self.perpetual_mm_assets_table(False)
 
-        first_col_length = max(*assets_df[0].apply(len))
-        df_lines = assets_df.to_string(index=False, header=False,
-                                       formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
-        lines.extend(["", "  Assets:"] + ["    " + line for line in df_lines])
+        first_col_length = max(len(label) for label in assets_table[0])
+        table_lines = assets_table.to_string(index=False, header=False,
+                                             formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
+        lines.extend(["", "  Assets:"] + ["    " + line for line in table_lines])
 
         # See if there're any open orders.
         if len(self.active_orders) > 0:
-            df = self.active_orders_df()
-            lines.extend(["", "  Orders:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+            table = self.active_orders_table()
+            lines.extend(["", "  Orders:"] + ["    " + line for line in table.to_string(index=False).split("\n")])
         else:
             lines.extend(["", "  No active maker orders."])
 
         # See if there're any active positions.
         if len(self.active_positions) > 0:
-            df = self.active_positions_df()
-            lines.extend(["", "  Positions:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+            table = self.active_positions_table()
+            lines.extend(["", "  Positions:"] + ["    " + line for line in table.to_string(index=False).split("\n")])
         else:
             lines.extend(["", "  No active positions."])
 
@@ -0,0 +1,79 @@
+from decimal import Decimal
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+
+class HangingOrderRegistry:
+    """
+    Keeps the ids of a strategy's hanging orders, along with their side and price. Lookups are O(1) and ids are
+    iterated in the order they were added. The per side views are sorted best price first (highest buy, lowest sell)
+    and are only sorted again after the registry has changed.
+    """
+
+    def __init__(self):
+        self._orders: Dict[str, Tuple[bool, Decimal]] = {}
+        self._buy_ids: Optional[List[str]] = None
+        self._sell_ids: Optional[List[str]] = None
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._orders
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._orders)
+
+    @property
+    def order_ids(self) -> List[str]:
+        return list(self._orders)
+
+    @property
+    def buy_ids(self) -> List[str]:
+        if self._buy_ids is None:
+            buys = [(price, order_id) for order_id, (is_buy, price) in self._orders.items() if is_buy]
+            self._buy_ids = [order_id for _, order_id in sorted(buys, key=lambda b: b[0], reverse=True)]
+        return self._buy_ids
+
+    @property
+    def sell_ids(self) -> List[str]:
+        if self._sell_ids is None:
+            sells = [(price, order_id) for order_id, (is_buy, price) in self._orders.items() if not is_buy]
+            self._sell_ids = [order_id for _, order_id in sorted(sells, key=lambda s: s[0])]
+        return self._sell_ids
+
+    def add(self, order_id: str, is_buy: bool, price: Decimal) -> bool:
+        """
+        :return: False if the order was already registered.
+        """
+        if order_id in self._orders:
+            return False
+        self._orders[order_id] = (is_buy, price)
+        self._invalidate_side(is_buy)
+        return True
+
+    def remove(self, order_id: str) -> bool:
+        """
+        :return: False if the order wasn't registered.
+        """
+        entry = self._orders.pop(order_id, None)
+        if entry is None:
+            return False
+        self._invalidate_side(entry[0])
+        return True
+
+    def clear(self):
+        self._orders.clear()
+        self._buy_ids = None
+        self._sell_ids = None
+
+    def _invalidate_side(self, is_buy: bool):
+        if is_buy:
+            self._buy_ids = None
+        else:
+            self._sell_ids = None
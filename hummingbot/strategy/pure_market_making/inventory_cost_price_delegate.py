@@ -1,32 +1,79 @@
+import asyncio
 from decimal import Decimal, InvalidOperation
-from typing import Optional
+import logging
+import threading
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
 
 from hummingbot.core.event.events import OrderFilledEvent, TradeType
+from hummingbot.logger import HummingbotLogger
 from hummingbot.model.inventory_cost import InventoryCost
+from hummingbot.model.inventory_cost_fill import InventoryCostFill
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 
 s_decimal_0 = Decimal("0")
+icpd_logger = None
 
 
 class InventoryCostPriceDelegate:
-    def __init__(self, sql: SQLConnectionManager, trading_pair: str) -> None:
+    """
+    Serves the inventory cost price from memory. The record is loaded once, when the delegate is created, and fills
+    update the in-memory volumes right away. Each fill is also saved as it happens, as an InventoryCostFill row: a
+    single insert, so no fill is lost if the bot stops. The saved fills are coalesced into the InventoryCost record
+    flush_interval seconds later, together with the fills that arrived in the meantime, on an executor thread so that
+    the event loop doesn't wait for the database. flush() coalesces them right away and should be called when the
+    strategy stops.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global icpd_logger
+        if icpd_logger is None:
+            icpd_logger = logging.getLogger(__name__)
+        return icpd_logger
+
+    def __init__(self, sql: SQLConnectionManager, trading_pair: str, flush_interval: float = 5.0) -> None:
         self.base_asset, self.quote_asset = trading_pair.split("-")
+        self._sql = sql
         self._session = sql.get_shared_session()
+        self._flush_interval = flush_interval
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._coalesce_lock = threading.Lock()
+        self._base_volume: Optional[Decimal] = None
+        self._quote_volume: Optional[Decimal] = None
+        # Fills whose InventoryCostFill row couldn't be saved yet, as (timestamp, base volume, quote volume).
+        self._unsaved_fills: List[Tuple[int, Decimal, Decimal]] = []
+        self.reload()
 
     @property
     def ready(self) -> bool:
         return True
 
-    def get_price(self) -> Optional[Decimal]:
-        record = InventoryCost.get_record(
-            self._session, self.base_asset, self.quote_asset
-        )
+    @property
+    def has_unsaved_changes(self) -> bool:
+        return len(self._unsaved_fills) > 0
 
-        if record is None or record.base_volume is None or record.base_volume is None:
+    def reload(self):
+        """
+        Reloads the inventory cost from the database, coalescing the saved fills first.
+        """
+        self.flush()
+        record = InventoryCost.get_record(self._session, self.base_asset, self.quote_asset)
+        if record is None:
+            self._base_volume = self._quote_volume = None
+        else:
+            self._base_volume = record.base_volume
+            self._quote_volume = record.quote_volume
+
+    def get_price(self) -> Optional[Decimal]:
+        if self._base_volume is None or self._quote_volume is None:
             return None
 
         try:
-            price = record.quote_volume / record.base_volume
+            price = self._quote_volume / self._base_volume
         except InvalidOperation:
             # decimal.InvalidOperation: [<class 'decimal.DivisionUndefined'>] - both volumes are 0
             return None
@@ -56,15 +103,90 @@ class InventoryCostPriceDelegate:
                     # Ok, some other asset used (like BNB), assume that we paid in base asset for simplicity
                     base_volume /= 1 + fill_event.trade_fee.percent
 
+        if (base_asset, quote_asset) != (self.base_asset, self.quote_asset):
+            # Not the pair held in memory, fall back to updating the database directly.
+            if fill_event.trade_type == TradeType.SELL:
+                record = InventoryCost.get_record(self._session, base_asset, quote_asset)
+                if not record:
+                    raise RuntimeError("Sold asset without having inventory price set. This should not happen.")
+                quote_volume = -(Decimal(record.quote_volume / record.base_volume) * base_volume)
+                base_volume = -base_volume
+            InventoryCost.add_volume(self._session, base_asset, quote_asset, base_volume, quote_volume)
+            return
+
         if fill_event.trade_type == TradeType.SELL:
-            record = InventoryCost.get_record(self._session, base_asset, quote_asset)
-            if not record:
+            if self._base_volume is None:
                 raise RuntimeError("Sold asset without having inventory price set. This should not happen.")
 
             # We're keeping initial buy price intact. Profits are not changing inventory price intentionally.
-            quote_volume = -(Decimal(record.quote_volume / record.base_volume) * base_volume)
+            quote_volume = -(Decimal(self._quote_volume / self._base_volume) * base_volume)
             base_volume = -base_volume
 
-        InventoryCost.add_volume(
-            self._session, base_asset, quote_asset, base_volume, quote_volume
-        )
+        if self._base_volume is None:
+            self._base_volume, self._quote_volume = base_volume, quote_volume
+        else:
+            self._base_volume += base_volume
+            self._quote_volume += quote_volume
+        self._unsaved_fills.append((int(fill_event.timestamp * 1e3), base_volume, quote_volume))
+        self._save_fills()
+        self._schedule_flush()
+
+    def _save_fills(self) -> bool:
+        """
+        Saves the fills that haven't been saved yet. The ones that fail are retried with the next fill or flush.
+        """
+        for timestamp, base_volume, quote_volume in self._unsaved_fills:
+            self._session.add(InventoryCostFill(timestamp=timestamp,
+                                                base_asset=self.base_asset,
+                                                quote_asset=self.quote_asset,
+                                                base_volume=base_volume,
+                                                quote_volume=quote_volume))
+        try:
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            self.logger().warning("Failed to save the inventory cost fills, retrying shortly.", exc_info=True)
+            return False
+        self._unsaved_fills.clear()
+        return True
+
+    def _schedule_flush(self):
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_event_loop().call_later(self._flush_interval, self._flush_in_executor)
+
+    def _flush_in_executor(self):
+        self._flush_handle = None
+        if not self._save_fills():
+            self._schedule_flush()
+            return
+        loop = asyncio.get_event_loop()
+        loop.run_in_executor(None, self._coalesce).add_done_callback(self._did_coalesce)
+
+    def _did_coalesce(self, future: asyncio.Future):
+        if not future.cancelled() and not future.result():
+            self._schedule_flush()
+
+    def _coalesce(self) -> bool:
+        """
+        Adds the saved fills to the InventoryCost record, in a session of its own since it may run on an executor
+        thread.
+        :return: True if the change was committed, False if it was rolled back
+        """
+        with self._coalesce_lock:
+            try:
+                with self._sql.begin() as session:
+                    InventoryCostFill.coalesce(session, self.base_asset, self.quote_asset)
+            except Exception:
+                self.logger().warning("Failed to coalesce the inventory cost fills, retrying shortly.", exc_info=True)
+                return False
+        return True
+
+    def flush(self):
+        """
+        Saves the fills that haven't been saved yet and coalesces them into the InventoryCost record right away.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not (self._save_fills() and self._coalesce()):
+            self._schedule_flush()
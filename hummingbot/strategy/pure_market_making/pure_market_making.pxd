@@ -40,6 +40,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         list _ping_pong_warning_lines
         bint _hb_app_notification
         object _order_override
+        bint _incremental_order_refresh
 
         double _cancel_timestamp
         double _create_timestamp
@@ -47,12 +48,17 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bint _all_markets_ready
         int _filled_buys_balance
         int _filled_sells_balance
-        list _hanging_order_ids
+        object _hanging_orders
+        list _active_non_hanging_orders
+        double _active_non_hanging_orders_expiry
         double _last_timestamp
         double _status_report_interval
         int64_t _logging_options
         object _last_own_trade_price
         list _hanging_aged_order_prices
+        double _refresh_stats_start_timestamp
+        int64_t _refresh_api_calls
+        int64_t _refresh_api_calls_saved
 
     cdef object c_get_mid_price(self)
     cdef object c_create_base_proposal(self)
@@ -70,9 +76,14 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_apply_add_transaction_costs(self, object proposal)
     cdef bint c_is_within_tolerance(self, list current_prices, list proposal_prices)
     cdef c_cancel_active_orders(self, object proposal)
+    cdef c_refresh_orders_incrementally(self, list active_orders, object proposal)
+    cdef bint c_has_pending_cancels(self)
+    cdef tuple c_match_orders_to_levels(self, list orders, list levels, bint is_buy)
     cdef c_cancel_hanging_orders(self)
     cdef c_cancel_orders_below_min_spread(self)
     cdef c_aged_order_refresh(self)
     cdef bint c_to_create_orders(self, object proposal)
     cdef c_execute_orders_proposal(self, object proposal)
     cdef set_timers(self)
+    cdef c_add_hanging_order(self, str order_id, bint is_buy, object price)
+    cdef double c_get_next_cancel_expiry(self)
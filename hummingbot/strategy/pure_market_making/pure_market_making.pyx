@@ -1,7 +1,6 @@
 from decimal import Decimal
 import logging
 import pandas as pd
-import numpy as np
 from typing import (
     List,
     Dict,
@@ -17,6 +16,7 @@ from hummingbot.core.event.events import TradeType, PriceType
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.table_formatter import Table
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
 from hummingbot.core.event.events import OrderType
@@ -37,6 +37,7 @@ from .inventory_skew_calculator cimport c_calculate_bid_ask_ratios_from_base_ass
 from .inventory_skew_calculator import calculate_total_order_size
 from .order_book_asset_price_delegate cimport OrderBookAssetPriceDelegate
 from .inventory_cost_price_delegate import InventoryCostPriceDelegate
+from .hanging_order_registry import HangingOrderRegistry
 
 
 NaN = float("nan")
@@ -94,6 +95,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                  minimum_spread: Decimal = Decimal(0),
                  hb_app_notification: bool = False,
                  order_override: Dict[str, List[str]] = {},
+                 incremental_order_refresh: bool = False,
                  ):
 
         if price_ceiling != s_decimal_neg_one and price_ceiling < price_floor:
@@ -134,6 +136,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._ping_pong_warning_lines = []
         self._hb_app_notification = hb_app_notification
         self._order_override = order_override
+        self.incremental_order_refresh = incremental_order_refresh
 
         self._cancel_timestamp = 0
         self._create_timestamp = 0
@@ -144,11 +147,16 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._all_markets_ready = False
         self._filled_buys_balance = 0
         self._filled_sells_balance = 0
-        self._hanging_order_ids = []
+        self._hanging_orders = HangingOrderRegistry()
+        self._active_non_hanging_orders = None
+        self._active_non_hanging_orders_expiry = NaN
         self._logging_options = logging_options
         self._last_timestamp = 0
         self._status_report_interval = status_report_interval
         self._last_own_trade_price = Decimal('nan')
+        self._refresh_stats_start_timestamp = 0
+        self._refresh_api_calls = 0
+        self._refresh_api_calls_saved = 0
 
         self.c_add_markets([market_info.market])
 
@@ -349,6 +357,29 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def order_override(self, value: Dict[str, List[str]]):
         self._order_override = value
 
+    @property
+    def incremental_order_refresh(self) -> bool:
+        return self._incremental_order_refresh
+
+    @incremental_order_refresh.setter
+    def incremental_order_refresh(self, value: bool):
+        # Exchanges that expire orders instead of cancelling them have nothing to reconcile.
+        self._incremental_order_refresh = value and self._market_info.market.name not in self.RADAR_RELAY_TYPE_EXCHANGES
+
+    @property
+    def order_refresh_api_stats(self) -> Dict[str, float]:
+        """
+        Order API calls (cancels and creates) issued by the order refresh cycle, and the calls saved by keeping
+        orders in place with the incremental refresh instead of cancelling and re-creating them.
+        """
+        cdef double elapsed_hours = (self._current_timestamp - self._refresh_stats_start_timestamp) / 3600.0
+        return {
+            "api_calls": self._refresh_api_calls,
+            "api_calls_saved": self._refresh_api_calls_saved,
+            "api_calls_per_hour": self._refresh_api_calls / elapsed_hours if elapsed_hours > 0 else 0.0,
+            "api_calls_saved_per_hour": self._refresh_api_calls_saved / elapsed_hours if elapsed_hours > 0 else 0.0,
+        }
+
     def get_price(self) -> float:
         price_provider = self._asset_price_delegate or self._market_info
         if self._price_type is PriceType.LastOwnTrade:
@@ -381,7 +412,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     @property
     def hanging_order_ids(self) -> List[str]:
-        return self._hanging_order_ids
+        return self._hanging_orders.order_ids
+
+    @property
+    def hanging_orders(self) -> HangingOrderRegistry:
+        return self._hanging_orders
 
     @property
     def market_info_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
@@ -403,8 +438,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     @property
     def active_non_hanging_orders(self) -> List[LimitOrder]:
-        orders = [o for o in self.active_orders if o.client_order_id not in self._hanging_order_ids]
-        return orders
+        # Only rebuilt after an order is created, cancelled or stops being tracked (filled, failed or expired), after
+        # the hanging orders changed, or once a cancel expires and its order is active again. Callers must not modify
+        # the returned list.
+        if self._active_non_hanging_orders is None or \
+                self._current_timestamp >= self._active_non_hanging_orders_expiry:
+            self._active_non_hanging_orders = [o for o in self.active_orders
+                                               if o.client_order_id not in self._hanging_orders]
+            self._active_non_hanging_orders_expiry = self.c_get_next_cancel_expiry()
+        return self._active_non_hanging_orders
 
     @property
     def logging_options(self) -> int:
@@ -435,6 +477,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         return self._sb_order_tracker
 
     def inventory_skew_stats_data_frame(self) -> Optional[pd.DataFrame]:
+        return self.inventory_skew_stats_table().to_pandas()
+
+    def inventory_skew_stats_table(self) -> Table:
         cdef:
             ExchangeBase market = self._market_info.market
 
@@ -480,7 +525,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             float(target_base_ratio),
             float(base_asset_range)
         )
-        inventory_skew_df = pd.DataFrame(data=[
+        return Table(data=[
             [f"Target Value ({self.quote_asset})", f"{target_base_amount_in_quote:.4f}",
              f"{target_quote_amount:.4f}"],
             ["Current %", f"{base_asset_ratio:.1%}", f"{quote_asset_ratio:.1%}"],
@@ -489,9 +534,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
              f"{1 - high_water_mark_ratio:.1%} - {1 - low_water_mark_ratio:.1%}"],
             ["Order Adjust %", f"{bid_ask_ratios.bid_ratio:.1%}", f"{bid_ask_ratios.ask_ratio:.1%}"]
         ])
-        return inventory_skew_df
 
     def pure_mm_assets_df(self, to_show_current_pct: bool) -> pd.DataFrame:
+        return self.pure_mm_assets_table(to_show_current_pct).to_pandas()
+
+    def pure_mm_assets_table(self, to_show_current_pct: bool) -> Table:
         market, trading_pair, base_asset, quote_asset = self._market_info
         price = self._market_info.get_mid_price()
         base_balance = float(market.get_balance(base_asset))
@@ -510,21 +557,23 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         ]
         if to_show_current_pct:
             data.append(["Current %", f"{base_ratio:.1%}", f"{quote_ratio:.1%}"])
-        df = pd.DataFrame(data=data)
-        return df
+        return Table(data=data)
 
     def active_orders_df(self) -> pd.DataFrame:
+        return self.active_orders_table().to_pandas()
+
+    def active_orders_table(self) -> Table:
         price = self.get_price()
-        active_orders = self.active_orders
-        no_sells = len([o for o in active_orders if not o.is_buy and o.client_order_id not in self._hanging_order_ids])
-        active_orders.sort(key=lambda x: x.price, reverse=True)
+        active_orders = sorted(self.active_orders, key=lambda x: x.price, reverse=True)
+        no_sells = len([o for o in self.active_non_hanging_orders if not o.is_buy])
         columns = ["Level", "Type", "Price", "Spread", "Amount (Orig)", "Amount (Adj)", "Age"]
         data = []
         lvl_buy, lvl_sell = 0, 0
         for idx in range(0, len(active_orders)):
             order = active_orders[idx]
             level = None
-            if order.client_order_id not in self._hanging_order_ids:
+            is_hanging = order.client_order_id in self._hanging_orders
+            if not is_hanging:
                 if order.is_buy:
                     level = lvl_buy + 1
                     lvl_buy += 1
@@ -535,11 +584,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             age = "n/a"
             # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
             if "//" not in order.client_order_id:
-                age = pd.Timestamp(int(time.time()) - int(order.client_order_id[-16:])/1e6,
-                                   unit='s').strftime('%H:%M:%S')
+                age = time.strftime('%H:%M:%S', time.gmtime(int(time.time()) - int(order.client_order_id[-16:])/1e6))
             amount_orig = "" if level is None else self._order_amount + ((level - 1) * self._order_level_amount)
             data.append([
-                "hang" if order.client_order_id in self._hanging_order_ids else level,
+                "hang" if is_hanging else level,
                 "buy" if order.is_buy else "sell",
                 float(order.price),
                 f"{spread:.2%}",
@@ -548,9 +596,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 age
             ])
 
-        return pd.DataFrame(data=data, columns=columns)
+        return Table(data=data, columns=columns)
 
-    def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+    def market_status_table(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> Table:
         markets_data = []
         markets_columns = ["Exchange", "Market", "Best Bid", "Best Ask", f"Ref Price ({self._price_type.name})"]
         if self._price_type is PriceType.LastOwnTrade and self._last_own_trade_price.is_nan():
@@ -582,7 +630,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 float(ask_price),
                 float(ref_price)
             ])
-        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+        return Table(data=markets_data, columns=markets_columns).fillna('')
 
     def format_status(self) -> str:
         if not self._all_markets_ready:
@@ -593,27 +641,31 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         warning_lines.extend(self._ping_pong_warning_lines)
         warning_lines.extend(self.network_warning([self._market_info]))
 
-        markets_df = self.market_status_data_frame([self._market_info])
-        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
+        markets_table = self.market_status_table([self._market_info])
+        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_table.to_string(index=False).split("\n")])
 
-        assets_df = self.pure_mm_assets_df(not self._inventory_skew_enabled)
+        assets_table = self.pure_mm_assets_table(not self._inventory_skew_enabled)
         # append inventory skew stats.
         if self._inventory_skew_enabled:
-            inventory_skew_df = self.inventory_skew_stats_data_frame()
-            assets_df = assets_df.append(inventory_skew_df)
+            assets_table = assets_table.append(self.inventory_skew_stats_table())
 
-        first_col_length = max(*assets_df[0].apply(len))
-        df_lines = assets_df.to_string(index=False, header=False,
-                                       formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
-        lines.extend(["", "  Assets:"] + ["    " + line for line in df_lines])
+        first_col_length = max(len(label) for label in assets_table[0])
+        table_lines = assets_table.to_string(index=False, header=False,
+                                             formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
+        lines.extend(["", "  Assets:"] + ["    " + line for line in table_lines])
 
         # See if there're any open orders.
         if len(self.active_orders) > 0:
-            df = self.active_orders_df()
-            lines.extend(["", "  Orders:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+            table = self.active_orders_table()
+            lines.extend(["", "  Orders:"] + ["    " + line for line in table.to_string(index=False).split("\n")])
         else:
             lines.extend(["", "  No active maker orders."])
 
+        if self._incremental_order_refresh:
+            stats = self.order_refresh_api_stats
+            lines.extend(["", f"  Order refresh API calls: {stats['api_calls_per_hour']:.1f}/hour "
+                              f"({stats['api_calls_saved_per_hour']:.1f}/hour saved by incremental refresh)"])
+
         warning_lines.extend(self.balance_warning([self._market_info]))
 
         if len(warning_lines) > 0:
@@ -634,11 +686,18 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_start(self, Clock clock, double timestamp):
         StrategyBase.c_start(self, clock, timestamp)
         self._last_timestamp = timestamp
+        self._refresh_stats_start_timestamp = timestamp
         # start tracking any restored limit order
         restored_order_ids = self.c_track_restored_orders(self.market_info)
         # make restored order hanging orders
         for order_id in restored_order_ids:
-            self._hanging_order_ids.append(order_id)
+            order = self._sb_order_tracker.c_get_limit_order(self._market_info, order_id)
+            self.c_add_hanging_order(order_id, order.is_buy, order.price)
+
+    cdef c_stop(self, Clock clock):
+        if self._inventory_cost_price_delegate is not None:
+            self._inventory_cost_price_delegate.flush()
+        StrategyBase.c_stop(self, clock)
 
     cdef c_tick(self, double timestamp):
         StrategyBase.c_tick(self, timestamp)
@@ -989,11 +1048,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             limit_order_record = self._sb_order_tracker.c_get_limit_order(self._market_info, order_id)
         if limit_order_record is None:
             return
-        active_sell_ids = [x.client_order_id for x in self.active_orders if not x.is_buy]
+        active_sells = [x for x in self.active_orders if not x.is_buy]
 
         if self._hanging_orders_enabled:
             # If the filled order is a hanging order, do nothing
-            if order_id in self._hanging_order_ids:
+            if order_id in self._hanging_orders:
                 self.log_with_clock(
                     logging.INFO,
                     f"({self.trading_pair}) Hanging maker buy order {order_id} "
@@ -1011,8 +1070,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._cancel_timestamp = min(self._cancel_timestamp, self._create_timestamp)
 
         if self._hanging_orders_enabled:
-            for other_order_id in active_sell_ids:
-                self._hanging_order_ids.append(other_order_id)
+            for other_order in active_sells:
+                self.c_add_hanging_order(other_order.client_order_id, False, other_order.price)
 
         self._filled_buys_balance += 1
         self._last_own_trade_price = limit_order_record.price
@@ -1034,10 +1093,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             LimitOrder limit_order_record = self._sb_order_tracker.c_get_limit_order(self._market_info, order_id)
         if limit_order_record is None:
             return
-        active_buy_ids = [x.client_order_id for x in self.active_orders if x.is_buy]
+        active_buys = [x for x in self.active_orders if x.is_buy]
         if self._hanging_orders_enabled:
             # If the filled order is a hanging order, do nothing
-            if order_id in self._hanging_order_ids:
+            if order_id in self._hanging_orders:
                 self.log_with_clock(
                     logging.INFO,
                     f"({self.trading_pair}) Hanging maker sell order {order_id} "
@@ -1055,8 +1114,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._cancel_timestamp = min(self._cancel_timestamp, self._create_timestamp)
 
         if self._hanging_orders_enabled:
-            for other_order_id in active_buy_ids:
-                self._hanging_order_ids.append(other_order_id)
+            for other_order in active_buys:
+                self.c_add_hanging_order(other_order.client_order_id, True, other_order.price)
 
         self._filled_sells_balance += 1
         self._last_own_trade_price = limit_order_record.price
@@ -1098,6 +1157,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             list active_buy_prices = []
             list active_sells = []
             bint to_defer_canceling = False
+        if self._incremental_order_refresh and proposal is not None:
+            if self.c_has_pending_cancels():
+                # The funds of the orders being cancelled stay locked until their cancels are confirmed, so the
+                # levels replacing them are placed once that happens.
+                proposal.buys = []
+                proposal.sells = []
+            elif len(active_orders) > 0:
+                self.c_refresh_orders_incrementally(active_orders, proposal)
+            return
         if len(active_orders) == 0:
             return
         if proposal is not None and self._order_refresh_tolerance_pct >= 0:
@@ -1113,12 +1181,79 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         if not to_defer_canceling:
             for order in active_orders:
                 self.c_cancel_order(self._market_info, order.client_order_id)
+            self._refresh_api_calls += len(active_orders)
         else:
             # self.logger().info(f"Not cancelling active orders since difference between new order prices "
             #                    f"and current order prices is within "
             #                    f"{self._order_refresh_tolerance_pct:.2%} order_refresh_tolerance_pct")
             self.set_timers()
 
+    cdef c_refresh_orders_incrementally(self, list active_orders, object proposal):
+        """
+        Keeps the active orders whose price and size are still within order_refresh_tolerance_pct of their
+        proposal level and cancels the rest. Levels covered by a kept order are removed from the proposal, so only
+        the levels that moved are placed again.
+        """
+        cdef:
+            list kept_buys, kept_sells, stale_buys, stale_sells
+        proposal.buys, kept_buys, stale_buys = self.c_match_orders_to_levels(
+            [o for o in active_orders if o.is_buy], proposal.buys, True)
+        proposal.sells, kept_sells, stale_sells = self.c_match_orders_to_levels(
+            [o for o in active_orders if not o.is_buy], proposal.sells, False)
+
+        # None of the connectors supports amending an order in place, so a moved level is a cancel plus a create.
+        for order in stale_buys + stale_sells:
+            self.c_cancel_order(self._market_info, order.client_order_id)
+        self._refresh_api_calls += len(stale_buys) + len(stale_sells)
+        # Each kept order saves the cancel and the create a full refresh would have issued.
+        self._refresh_api_calls_saved += 2 * (len(kept_buys) + len(kept_sells))
+
+        if len(stale_buys) + len(stale_sells) > 0 and self.c_has_pending_cancels():
+            # The budget constraint counted the stale orders' funds as available, the replacements wait for the
+            # cancels to be confirmed.
+            proposal.buys = []
+            proposal.sells = []
+        elif len(proposal.buys) == 0 and len(proposal.sells) == 0:
+            self.set_timers()
+
+    cdef bint c_has_pending_cancels(self):
+        """
+        Whether any order tracked on the market is still waiting for its cancel to be confirmed.
+        """
+        cdef:
+            dict orders = self._sb_order_tracker.c_get_limit_orders().get(self._market_info, {})
+            str order_id
+        for order_id in orders:
+            if self._sb_order_tracker.c_has_in_flight_cancel(order_id):
+                return True
+        return False
+
+    cdef tuple c_match_orders_to_levels(self, list orders, list levels, bint is_buy):
+        """
+        Pairs the orders on one side of the book with the proposal levels, best price first.
+        :return: (levels left to be placed, orders to keep, orders to cancel)
+        """
+        cdef:
+            list remaining_levels = []
+            list kept_orders = []
+            list stale_orders = []
+            object current_price
+            object current_size
+        orders = sorted(orders, key=lambda o: o.price, reverse=is_buy)
+        levels = sorted(levels, key=lambda p: p.price, reverse=is_buy)
+        for order, level in zip(orders, levels):
+            current_price = Decimal(str(order.price))
+            current_size = Decimal(str(order.quantity))
+            if abs(level.price - current_price) / current_price > self._order_refresh_tolerance_pct or \
+                    abs(level.size - current_size) / current_size > self._order_refresh_tolerance_pct:
+                stale_orders.append(order)
+                remaining_levels.append(level)
+            else:
+                kept_orders.append(order)
+        stale_orders.extend(orders[len(levels):])
+        remaining_levels.extend(levels[len(orders):])
+        return remaining_levels, kept_orders, stale_orders
+
     cdef c_cancel_hanging_orders(self):
         if not global_config_map.get("0x_active_cancels").value:
             if ((self._market_info.market.name in self.RADAR_RELAY_TYPE_EXCHANGES) or
@@ -1127,23 +1262,20 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         cdef:
             object price = self.get_price()
-            list active_orders = self.active_orders
-            list orders
+            dict active_orders = {o.client_order_id: o for o in self.active_orders}
             LimitOrder order
-        for h_order_id in self._hanging_order_ids:
-            orders = [o for o in active_orders if o.client_order_id == h_order_id]
-            if orders and price > 0:
-                order = orders[0]
-                if abs(order.price - price)/price >= self._hanging_orders_cancel_pct:
-                    self.c_cancel_order(self._market_info, order.client_order_id)
+        if price <= 0:
+            return
+        for h_order_id in self._hanging_orders.buy_ids + self._hanging_orders.sell_ids:
+            order = active_orders.get(h_order_id)
+            if order is not None and abs(order.price - price)/price >= self._hanging_orders_cancel_pct:
+                self.c_cancel_order(self._market_info, order.client_order_id)
 
     # Cancel Non-Hanging, Active Orders if Spreads are below minimum_spread
     cdef c_cancel_orders_below_min_spread(self):
         cdef:
-            list active_orders = self.market_info_to_active_orders.get(self._market_info, [])
+            list active_orders = self.active_non_hanging_orders
             object price = self.get_price()
-        active_orders = [order for order in active_orders
-                         if order.client_order_id not in self._hanging_order_ids]
         for order in active_orders:
             negation = -1 if order.is_buy else 1
             if (negation * (order.price - price) / price) < self._minimum_spread:
@@ -1174,7 +1306,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     buys.append(PriceSize(order.price, order.quantity))
                 else:
                     sells.append(PriceSize(order.price, order.quantity))
-                if order.client_order_id in self._hanging_order_ids:
+                if order.client_order_id in self._hanging_orders:
                     self._hanging_aged_order_prices.append(order.price)
                 self.logger().info(f"Refreshing {'Buy' if order.is_buy else 'Sell'} order with ID - "
                                    f"{order.client_order_id} because it reached maximum order age of "
@@ -1183,6 +1315,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         return Proposal(buys, sells)
 
     cdef bint c_to_create_orders(self, object proposal):
+        if self._incremental_order_refresh:
+            # Levels covered by kept orders were already removed from the proposal.
+            return self._create_timestamp < self._current_timestamp and \
+                proposal is not None and \
+                len(proposal.buys) + len(proposal.sells) > 0
         return self._create_timestamp < self._current_timestamp and \
             proposal is not None and \
             len(self.active_non_hanging_orders) == 0
@@ -1215,9 +1352,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     expiration_seconds=expiration_seconds
                 )
                 if buy.price in self._hanging_aged_order_prices:
-                    self._hanging_order_ids.append(bid_order_id)
+                    self.c_add_hanging_order(bid_order_id, True, buy.price)
                     self._hanging_aged_order_prices.remove(buy.price)
                 orders_created = True
+            self._refresh_api_calls += len(proposal.buys)
         if len(proposal.sells) > 0:
             if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
                 price_quote_str = [f"{sell.size.normalize()} {self.base_asset}, "
@@ -1236,12 +1374,47 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     expiration_seconds=expiration_seconds
                 )
                 if sell.price in self._hanging_aged_order_prices:
-                    self._hanging_order_ids.append(ask_order_id)
+                    self.c_add_hanging_order(ask_order_id, False, sell.price)
                     self._hanging_aged_order_prices.remove(sell.price)
                 orders_created = True
+            self._refresh_api_calls += len(proposal.sells)
         if orders_created:
             self.set_timers()
 
+    cdef c_add_hanging_order(self, str order_id, bint is_buy, object price):
+        if self._hanging_orders.add(order_id, is_buy, price):
+            self._active_non_hanging_orders = None
+
+    cdef double c_get_next_cancel_expiry(self):
+        """
+        When the next in flight cancel expires. Orders with an in flight cancel aren't active, they are again once it
+        expires unconfirmed.
+        """
+        cdef:
+            double expiry
+            double next_expiry = NaN
+        for cancel_timestamp in self._sb_order_tracker.in_flight_cancels.values():
+            expiry = cancel_timestamp + self._sb_order_tracker.CANCEL_EXPIRY_DURATION
+            if expiry > self._current_timestamp and not expiry >= next_expiry:
+                next_expiry = expiry
+        return next_expiry
+
+    cdef c_cancel_order(self, object market_pair, str order_id):
+        StrategyBase.c_cancel_order(self, market_pair, order_id)
+        # The order isn't active while its cancel is in flight.
+        self._active_non_hanging_orders = None
+
+    cdef c_start_tracking_limit_order(self, object market_pair, str order_id, bint is_buy, object price,
+                                      object quantity):
+        StrategyBase.c_start_tracking_limit_order(self, market_pair, order_id, is_buy, price, quantity)
+        self._active_non_hanging_orders = None
+
+    cdef c_stop_tracking_limit_order(self, object market_pair, str order_id):
+        StrategyBase.c_stop_tracking_limit_order(self, market_pair, order_id)
+        # Orders that are no longer active don't need to be remembered as hanging.
+        self._hanging_orders.remove(order_id)
+        self._active_non_hanging_orders = None
+
     cdef set_timers(self):
         cdef double next_cycle = self._current_timestamp + self._order_refresh_time
         if self._create_timestamp <= self._current_timestamp:
@@ -51,6 +51,7 @@ def start(self):
         price_source_custom_api = c_map.get("price_source_custom_api").value
         order_refresh_tolerance_pct = c_map.get("order_refresh_tolerance_pct").value / Decimal('100')
         order_override = c_map.get("order_override").value
+        incremental_order_refresh = c_map.get("incremental_order_refresh").value
 
         trading_pair: str = raw_trading_pair
         maker_assets: Tuple[str, str] = self._initialize_market_assets(exchange, [trading_pair])[0]
@@ -108,6 +109,7 @@ def start(self):
             minimum_spread=minimum_spread,
             hb_app_notification=True,
             order_override={} if order_override is None else order_override,
+            incremental_order_refresh=incremental_order_refresh,
         )
     except Exception as e:
         self._notify(str(e))
@@ -19,8 +19,17 @@ cdef class StrategyBase(TimeIterator):
         EventListener _sb_complete_funding_payment_listener
         bint _sb_delegate_lock
         public OrderTracker _sb_order_tracker
+        dict _sb_order_book_listeners
+        bint _sb_wakeup_on_fills
+        double _sb_wakeup_interval
+        double _sb_last_wakeup
+        object _sb_wakeup_handle
+        int _sb_wakeup_count
+        int _sb_coalesced_wakeup_count
 
     cdef c_add_markets(self, list markets)
+    cdef c_schedule_wakeup(self)
+    cdef c_wakeup(self, double timestamp)
     cdef c_remove_markets(self, list markets)
     cdef c_did_create_buy_order(self, object order_created_event)
     cdef c_did_create_sell_order(self, object order_created_event)
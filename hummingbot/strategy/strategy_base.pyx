@@ -1,10 +1,15 @@
+import asyncio
 from decimal import Decimal
 import logging
 import pandas as pd
+import time
 from typing import (
     List)
+from libc.math cimport isnan
 
 from hummingbot.core.clock cimport Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.event.events import MarketEvent
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.network_iterator import NetworkStatus
@@ -12,6 +17,8 @@ from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.connector.connector_base cimport ConnectorBase
 from hummingbot.core.data_type.trade import Trade
+from hummingbot.core.utils.market_data_latency import MarketDataLatencyTracer
+from hummingbot.core.utils.table_formatter import Table
 from hummingbot.core.event.events import (
     OrderFilledEvent,
     OrderType,
@@ -55,6 +62,8 @@ cdef class FundingPaymentCompletedListener(BaseStrategyEventListener):
 cdef class OrderFilledListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
         self._owner.c_did_fill_order(arg)
+        if self._owner._sb_wakeup_on_fills:
+            self._owner.c_schedule_wakeup()
 
 
 cdef class OrderFailedListener(BaseStrategyEventListener):
@@ -83,6 +92,35 @@ cdef class BuyOrderCreatedListener(BaseStrategyEventListener):
 cdef class SellOrderCreatedListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
         self._owner.c_did_create_sell_order(arg)
+
+
+cdef class OrderBookTopChangedListener(BaseStrategyEventListener):
+    cdef:
+        OrderBook _order_book
+        double _mid_price_threshold
+        bint _top_of_book
+        double _reference_mid_price
+
+    def __init__(self, StrategyBase owner, OrderBook order_book, double mid_price_threshold, bint top_of_book):
+        super().__init__(owner)
+        self._order_book = order_book
+        self._mid_price_threshold = mid_price_threshold
+        self._top_of_book = top_of_book
+        self.c_reset_reference()
+
+    cdef c_reset_reference(self):
+        # Through c_get_price(), composite order books overlay their recorded orders on the prices of another book.
+        try:
+            self._reference_mid_price = (self._order_book.c_get_price(False) + self._order_book.c_get_price(True)) / 2
+        except EnvironmentError:
+            self._reference_mid_price = NaN
+
+    cdef c_call(self, object arg):
+        cdef:
+            double mid_price_change = abs((arg.best_bid + arg.best_ask) / 2 - self._reference_mid_price)
+        if (self._top_of_book or isnan(self._reference_mid_price) or
+                (mid_price_change > 0 and mid_price_change >= self._mid_price_threshold * self._reference_mid_price)):
+            self._owner.c_schedule_wakeup()
 # </editor-fold>
 
 
@@ -118,6 +156,14 @@ cdef class StrategyBase(TimeIterator):
 
         self._sb_order_tracker = OrderTracker()
 
+        self._sb_order_book_listeners = {}
+        self._sb_wakeup_on_fills = False
+        self._sb_wakeup_interval = 0.1
+        self._sb_last_wakeup = 0
+        self._sb_wakeup_handle = None
+        self._sb_wakeup_count = 0
+        self._sb_coalesced_wakeup_count = 0
+
     @property
     def active_markets(self) -> List[ConnectorBase]:
         return list(self._sb_markets)
@@ -149,6 +195,10 @@ cdef class StrategyBase(TimeIterator):
         return sorted(past_trades, key=lambda x: x.timestamp)
 
     def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+        table = self.market_status_table(market_trading_pair_tuples)
+        return table.to_pandas() if table is not None else None
+
+    def market_status_table(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> Table:
         cdef:
             ConnectorBase market
             str trading_pair
@@ -171,12 +221,16 @@ cdef class StrategyBase(TimeIterator):
                     float(ask_price),
                     float(mid_price)
                 ])
-            return pd.DataFrame(data=markets_data, columns=markets_columns)
+            return Table(data=markets_data, columns=markets_columns)
 
         except Exception:
             self.logger().error("Error formatting market stats.", exc_info=True)
 
     def wallet_balance_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+        table = self.wallet_balance_table(market_trading_pair_tuples)
+        return table.to_pandas() if table is not None else None
+
+    def wallet_balance_table(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> Table:
         cdef:
             ConnectorBase market
             str base_asset
@@ -199,7 +253,7 @@ cdef class StrategyBase(TimeIterator):
                     [market.display_name, quote_asset, quote_balance, available_quote_balance]
                 ])
 
-            return pd.DataFrame(data=assets_data, columns=assets_columns)
+            return Table(data=assets_data, columns=assets_columns)
 
         except Exception:
             self.logger().error("Error formatting wallet balance stats.", exc_info=True)
@@ -236,6 +290,87 @@ cdef class StrategyBase(TimeIterator):
             ])
         return warning_lines
 
+    # <editor-fold desc="+ Reactive wakeups">
+    # ----------------------------------------------------------------------------------------------------------
+    @property
+    def wakeup_interval(self) -> float:
+        """
+        Minimum time between two wakeups, the changes in between are coalesced into one wakeup.
+        """
+        return self._sb_wakeup_interval
+
+    @wakeup_interval.setter
+    def wakeup_interval(self, value: float):
+        self._sb_wakeup_interval = value
+
+    @property
+    def wakeup_count(self) -> int:
+        return self._sb_wakeup_count
+
+    @property
+    def coalesced_wakeup_count(self) -> int:
+        return self._sb_coalesced_wakeup_count
+
+    def subscribe_to_order_book_changes(self,
+                                        market_trading_pair_tuple: MarketTradingPairTuple,
+                                        mid_price_threshold: Decimal = s_decimal_0,
+                                        top_of_book: bool = False):
+        """
+        Opts in to reactive wakeups on the market's order book: the strategy ticks as soon as the mid price moved by
+        mid_price_threshold (a fraction of the mid price at its last tick), or on any best bid or ask change with
+        top_of_book, instead of waiting for the next clock tick. Wakeups only happen in real time mode.
+        """
+        self.unsubscribe_from_order_book_changes(market_trading_pair_tuple)
+        order_book = market_trading_pair_tuple.order_book
+        listener = OrderBookTopChangedListener(self, order_book, float(mid_price_threshold), top_of_book)
+        (<OrderBook>order_book).c_add_listener(OrderBook.ORDER_BOOK_TOP_CHANGED_EVENT_TAG, listener)
+        self._sb_order_book_listeners[order_book] = listener
+
+    def unsubscribe_from_order_book_changes(self, market_trading_pair_tuple: MarketTradingPairTuple):
+        order_book = market_trading_pair_tuple.order_book
+        listener = self._sb_order_book_listeners.pop(order_book, None)
+        if listener is not None:
+            (<OrderBook>order_book).c_remove_listener(OrderBook.ORDER_BOOK_TOP_CHANGED_EVENT_TAG, listener)
+
+    def subscribe_to_fills(self):
+        """
+        Opts in to reactive wakeups on the fills of the strategy's markets.
+        """
+        self._sb_wakeup_on_fills = True
+
+    def unsubscribe_from_fills(self):
+        self._sb_wakeup_on_fills = False
+
+    cdef c_schedule_wakeup(self):
+        cdef:
+            double delay
+        if self._sb_wakeup_handle is not None:
+            self._sb_coalesced_wakeup_count += 1
+            return
+        if self._clock is None or self._clock.clock_mode is not ClockMode.REALTIME:
+            return
+        delay = max(self._sb_last_wakeup + self._sb_wakeup_interval - time.time(), 0)
+        self._sb_wakeup_handle = asyncio.get_event_loop().call_later(delay, self._wakeup)
+
+    def _wakeup(self):
+        self._sb_wakeup_handle = None
+        if self._clock is None:
+            return
+        self._sb_last_wakeup = time.time()
+        self._sb_wakeup_count += 1
+        try:
+            self.c_wakeup(self._sb_last_wakeup)
+        except Exception:
+            self.logger().error("Unexpected error running strategy wakeup.", exc_info=True)
+
+    cdef c_wakeup(self, double timestamp):
+        """
+        Reacts to the changes the strategy subscribed to, outside of the clock ticks. Runs a tick by default.
+        """
+        self.c_tick(timestamp)
+    # ----------------------------------------------------------------------------------------------------------
+    # </editor-fold>
+
     cdef c_start(self, Clock clock, double timestamp):
         TimeIterator.c_start(self, clock, timestamp)
         self._sb_order_tracker.c_start(clock, timestamp)
@@ -243,11 +378,24 @@ cdef class StrategyBase(TimeIterator):
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         self._sb_order_tracker.c_tick(timestamp)
+        latency_tracer = MarketDataLatencyTracer.get_instance()
+        if latency_tracer.enabled:
+            latency_tracer.observe_tick()
+        # A tick sees the latest changes, a wakeup pending for them is no longer needed.
+        if self._sb_wakeup_handle is not None:
+            self._sb_wakeup_handle.cancel()
+            self._sb_wakeup_handle = None
+            self._sb_coalesced_wakeup_count += 1
+        for listener in self._sb_order_book_listeners.values():
+            (<OrderBookTopChangedListener>listener).c_reset_reference()
 
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
         self._sb_order_tracker.c_stop(clock)
         self.c_remove_markets(list(self._sb_markets))
+        if self._sb_wakeup_handle is not None:
+            self._sb_wakeup_handle.cancel()
+            self._sb_wakeup_handle = None
 
     cdef c_add_markets(self, list markets):
         cdef:
@@ -4,7 +4,10 @@ from .incoming_eth_watcher import IncomingEthWatcher
 from .new_blocks_watcher import NewBlocksWatcher
 from .zeroex_fill_watcher import ZeroExFillWatcher
 from .weth_watcher import WethWatcher
-from .contract_event_logs import ContractEventLogger
+from .contract_event_logs import (
+    ContractEventLogger,
+    MultiContractEventLogger,
+)
 
 
 __all__ = [
@@ -15,4 +18,5 @@ __all__ = [
     WethWatcher,
     ZeroExFillWatcher,
     ContractEventLogger,
+    MultiContractEventLogger,
 ]
@@ -1,12 +1,17 @@
 #!/usr/bin/env python
 
 import asyncio
+from eth_bloom import BloomFilter
+import json
 import logging
+import os
+import time
 from typing import (
     List,
     Dict,
     Optional,
-    Coroutine
+    Coroutine,
+    Tuple
 )
 from decimal import Decimal
 
@@ -16,7 +21,12 @@ from web3.datastructures import AttributeDict
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
-from hummingbot.core.event.events import NewBlocksWatcherEvent
+from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
+from hummingbot.core.event.events import (
+    NewBlocksWatcherEvent,
+    WalletBalanceChangedEvent,
+    WalletEvent,
+)
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
@@ -26,6 +36,15 @@ from .base_watcher import BaseWatcher
 from .websocket_watcher import WSNewBlocksWatcher
 
 s_decimal_0 = Decimal(0)
+DEFAULT_FULL_REFRESH_INTERVAL = 20
+
+with open(os.path.join(os.path.dirname(__file__), "../token_abi/multicall_abi.json")) as multicall_abi_json:
+    multicall_abi: List[Dict[str, any]] = json.load(multicall_abi_json)
+
+# MakerDAO's Multicall contract, which reads the token balances and the ETH balance in a single eth_call.
+MULTICALL_ADDRESSES: Dict[EthereumChain, str] = {
+    EthereumChain.MAIN_NET: "0xeefBa1e63905eF1D7ACbA5a8513c70Fd5c2d9C0D",
+}
 
 
 class AccountBalanceWatcher(BaseWatcher):
@@ -42,7 +61,15 @@ class AccountBalanceWatcher(BaseWatcher):
                  blocks_watcher: WSNewBlocksWatcher,
                  account_address: str,
                  erc20_addresses: List[str],
-                 erc20_abis: List[any]):
+                 erc20_abis: List[any],
+                 multicall_address: Optional[str] = None,
+                 full_refresh_interval: int = DEFAULT_FULL_REFRESH_INTERVAL):
+        """
+        Token balances are only refreshed for new blocks whose bloom filter shows logs of a watched token that name
+        the account, e.g. Transfer, Deposit or Withdrawal, and every full_refresh_interval blocks regardless. The ETH
+        balance is refreshed on every block. If a multicall_address is given, all balances are read in one eth_call
+        through the Multicall contract there, otherwise with one call each.
+        """
         super().__init__(w3)
         self._blocks_watcher: WSNewBlocksWatcher = blocks_watcher
         self._account_address: str = account_address
@@ -55,6 +82,13 @@ class AccountBalanceWatcher(BaseWatcher):
         self._erc20_decimals: Dict[str, int] = {}
         self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
         self._raw_account_balances: Dict[str, int] = {}
+        self._multicall_contract: Optional[Contract] = w3.eth.contract(address=multicall_address, abi=multicall_abi) \
+            if multicall_address is not None else None
+        self._full_refresh_interval: int = full_refresh_interval
+        self._blocks_since_full_refresh: int = 0
+        # Indexed address arguments are logged as 32 byte topics.
+        self._account_topic: bytes = bytes(12) + bytes.fromhex(account_address[2:])
+        self._erc20_address_bytes: List[bytes] = [bytes.fromhex(address[2:]) for address in erc20_addresses]
 
     async def start_network(self):
         account_address: str = self._account_address
@@ -127,24 +161,29 @@ class AccountBalanceWatcher(BaseWatcher):
             raise ValueError(f"{asset_name} is not a recognized asset in this watcher.")
         return self._erc20_decimals[asset_name]
 
-    def did_receive_new_blocks(self, _: List[AttributeDict]):
-        safe_ensure_future(self.update_balances())
-
-    async def update_balances(self):
-        asset_symbols: List[str] = []
-        asset_update_tasks: List[Coroutine] = []
-
-        for asset_name, contract in self._erc20_contracts.items():
-            asset_symbols.append(asset_name)
-            asset_update_tasks.append(self.call_async(contract.functions.balanceOf(self._account_address).call))
-
-        asset_symbols.append("ETH")
-        asset_update_tasks.append(self.call_async(self._w3.eth.getBalance, self._account_address))
-
+    def did_receive_new_blocks(self, new_blocks: List[AttributeDict]):
+        self._blocks_since_full_refresh += len(new_blocks)
+        if self._blocks_since_full_refresh >= self._full_refresh_interval or \
+                any(self._block_may_change_token_balances(block) for block in new_blocks):
+            self._blocks_since_full_refresh = 0
+            safe_ensure_future(self.update_balances())
+        else:
+            safe_ensure_future(self.update_balances(include_tokens=False))
+
+    def _block_may_change_token_balances(self, block: AttributeDict) -> bool:
+        logs_bloom = block.get("logsBloom") if block is not None else None
+        if logs_bloom is None:
+            return True
+        block_bloom_filter = BloomFilter(int.from_bytes(logs_bloom, byteorder='big'))
+        return self._account_topic in block_bloom_filter and \
+            any(address in block_bloom_filter for address in self._erc20_address_bytes)
+
+    async def update_balances(self, include_tokens: bool = True):
         try:
-            asset_raw_balances: List[int] = await safe_gather(*asset_update_tasks)
-            for asset_name, raw_balance in zip(asset_symbols, asset_raw_balances):
-                self._raw_account_balances[asset_name] = raw_balance
+            if include_tokens and self._multicall_contract is not None:
+                new_raw_balances: Dict[str, int] = await self._fetch_balances_with_multicall()
+            else:
+                new_raw_balances: Dict[str, int] = await self._fetch_balances(include_tokens)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -152,3 +191,41 @@ class AccountBalanceWatcher(BaseWatcher):
                                   exc_info=True,
                                   app_warning_msg="Error account balance updates. "
                                                   "Check Ethereum node connection.")
+            return
+
+        timestamp: float = time.time()
+        for asset_name, raw_balance in new_raw_balances.items():
+            if self._raw_account_balances.get(asset_name) != raw_balance:
+                self._raw_account_balances[asset_name] = raw_balance
+                self.trigger_event(WalletEvent.BalanceChanged,
+                                   WalletBalanceChangedEvent(timestamp, self._account_address, asset_name,
+                                                             self.get_balance(asset_name), raw_balance))
+
+    async def _fetch_balances(self, include_tokens: bool = True) -> Dict[str, int]:
+        asset_symbols: List[str] = []
+        asset_update_tasks: List[Coroutine] = []
+
+        if include_tokens:
+            for asset_name, contract in self._erc20_contracts.items():
+                asset_symbols.append(asset_name)
+                asset_update_tasks.append(self.call_async(contract.functions.balanceOf(self._account_address).call))
+
+        asset_symbols.append("ETH")
+        asset_update_tasks.append(self.call_async(self._w3.eth.getBalance, self._account_address))
+
+        asset_raw_balances: List[int] = await safe_gather(*asset_update_tasks)
+        return dict(zip(asset_symbols, asset_raw_balances))
+
+    async def _fetch_balances_with_multicall(self) -> Dict[str, int]:
+        asset_symbols: List[str] = []
+        calls: List[Tuple[str, str]] = []
+        for asset_name, contract in self._erc20_contracts.items():
+            asset_symbols.append(asset_name)
+            calls.append((contract.address, contract.encodeABI(fn_name="balanceOf", args=[self._account_address])))
+        asset_symbols.append("ETH")
+        calls.append((self._multicall_contract.address,
+                      self._multicall_contract.encodeABI(fn_name="getEthBalance", args=[self._account_address])))
+
+        _, return_data = await self.call_async(self._multicall_contract.functions.aggregate(calls).call)
+        return {asset_name: int.from_bytes(data, byteorder='big')
+                for asset_name, data in zip(asset_symbols, return_data)}
@@ -9,7 +9,8 @@ from typing import (
     Dict,
     List,
     Optional,
-    Set
+    Set,
+    Tuple
 )
 from web3 import Web3
 from web3.datastructures import AttributeDict
@@ -20,6 +21,7 @@ from eth_abi.codec import (
     ABICodec,
 )
 from eth_abi.registry import registry
+from eth_utils import event_abi_to_log_topic
 
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.utils.async_utils import safe_gather
@@ -134,3 +136,127 @@ class ContractEventLogger:
                 self.logger().debug(f"Block not found with filters: '{event_filter_params}'. Retrying...")
                 await asyncio.sleep(0.5)
         return logs
+
+
+class MultiContractEventLogger:
+    """
+    Fetches new logs of several events of several contracts with a single eth_getLogs call for each range of
+    consecutive blocks, where ContractEventLogger makes one call per block, event and contract. Logs from blocks that
+    are no longer part of the given blocks, e.g. after a chain reorganization, are left out.
+    """
+    _mcel_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mcel_logger is None:
+            cls._mcel_logger = logging.getLogger(__name__)
+        return cls._mcel_logger
+
+    def __init__(self,
+                 w3: Web3,
+                 contract_abis: Dict[str, List[Dict[str, any]]],
+                 event_names: List[str],
+                 block_events_window_size: Optional[int] = DEFAULT_WINDOW_SIZE):
+        self._w3: Web3 = w3
+        self._block_events_window_size = block_events_window_size
+        self._addresses: List[str] = list(contract_abis.keys())
+        # Event ABIs by (lower case contract address, event topic), as different contracts can define the same event
+        # with different argument names (e.g. WETH's Transfer).
+        self._event_abi_map: Dict[Tuple[str, bytes], Dict[str, any]] = {}
+        for address, contract_abi in contract_abis.items():
+            for event_name in event_names:
+                event_abi: Dict[str, any] = find_matching_event_abi(contract_abi, event_name=event_name)
+                self._event_abi_map[(address.lower(), event_abi_to_log_topic(event_abi))] = event_abi
+        self._topics: List[bytes] = list(set(topic for _, topic in self._event_abi_map.keys()))
+        self._abi_codec: ABICodec = ABICodec(registry)
+        self._event_cache: Set[Tuple[HexBytes, int]] = set()
+        self._block_events: OrderedDict = OrderedDict()
+
+    @property
+    def addresses(self) -> List[str]:
+        return self._addresses
+
+    def _block_may_have_logs(self, block: AttributeDict) -> bool:
+        block_bloom_filter = BloomFilter(int.from_bytes(block["logsBloom"], byteorder='big'))
+        return (any(topic in block_bloom_filter for topic in self._topics) and
+                any(bytes.fromhex(address[2:]) in block_bloom_filter for address in self._addresses))
+
+    @staticmethod
+    def _block_ranges(blocks: List[AttributeDict]) -> List[List[AttributeDict]]:
+        # The latest block seen for a block number wins, i.e. the replacement of a reorganized block.
+        blocks_by_number: Dict[int, AttributeDict] = {block["number"]: block for block in blocks if block is not None}
+        block_ranges: List[List[AttributeDict]] = []
+        for block_number in sorted(blocks_by_number.keys()):
+            if len(block_ranges) > 0 and block_ranges[-1][-1]["number"] == block_number - 1:
+                block_ranges[-1].append(blocks_by_number[block_number])
+            else:
+                block_ranges.append([blocks_by_number[block_number]])
+        return block_ranges
+
+    async def get_new_entries_from_logs(self, blocks: List[AttributeDict]) -> List[AttributeDict]:
+        tasks = []
+        block_hash_sets = []
+        for block_range in self._block_ranges(blocks):
+            matching_blocks: List[AttributeDict] = [block for block in block_range if self._block_may_have_logs(block)]
+            if len(matching_blocks) == 0:
+                continue
+            block_hash_sets.append(set(block["hash"] for block in block_range))
+            tasks.append(self._get_logs({
+                "fromBlock": matching_blocks[0]["number"],
+                "toBlock": matching_blocks[-1]["number"],
+                "address": self._addresses,
+                "topics": [["0x" + topic.hex() for topic in self._topics]]
+            }))
+
+        new_entries = []
+        if len(tasks) > 0:
+            raw_logs = await safe_gather(*tasks, return_exceptions=True)
+            for block_hashes, logs in zip(block_hash_sets, raw_logs):
+                if isinstance(logs, Exception):
+                    continue
+                for log in logs:
+                    if log["blockHash"] not in block_hashes:
+                        continue
+                    new_entry: Optional[AttributeDict] = self._process_log(log)
+                    if new_entry is not None:
+                        new_entries.append(new_entry)
+
+            while len(self._block_events) > self._block_events_window_size:
+                event_keys: List[Tuple[HexBytes, int]] = self._block_events.popitem(last=False)[1]
+                for event_key in event_keys:
+                    self._event_cache.discard(event_key)
+        return new_entries
+
+    def _process_log(self, log: AttributeDict) -> Optional[AttributeDict]:
+        event_abi: Optional[Dict[str, any]] = self._event_abi_map.get((log["address"].lower(), bytes(log["topics"][0])))
+        if event_abi is None:
+            return None
+        event_data: AttributeDict = get_event_data(self._abi_codec, event_abi, log)
+        event_key: Tuple[HexBytes, int] = (event_data["transactionHash"], event_data["logIndex"])
+        if event_key in self._event_cache:
+            self.logger().debug(f"Duplicate event found - '{event_data['transactionHash'].hex()}'.")
+            return None
+        self._event_cache.add(event_key)
+        self._block_events.setdefault(event_data["blockNumber"], []).append(event_key)
+        return event_data
+
+    async def _get_logs(self,
+                        filter_params: Dict[str, any],
+                        max_tries: Optional[int] = 30) -> List[Dict[str, any]]:
+        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
+        count: int = 0
+        logs = []
+        while True:
+            try:
+                count += 1
+                if count > max_tries:
+                    self.logger().debug(f"Error fetching logs with filters: '{filter_params}'.")
+                    break
+                logs = await async_scheduler.call_async(functools.partial(self._w3.eth.getLogs, filter_params))
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().debug(f"Error fetching logs with filters: '{filter_params}'. Retrying...")
+                await asyncio.sleep(0.5)
+        return logs
@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 
 import asyncio
-import cytoolz
 import logging
 import math
 from typing import (
@@ -24,13 +23,10 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
 from hummingbot.core.event.event_forwarder import EventForwarder
-from hummingbot.core.utils.async_utils import (
-    safe_ensure_future,
-    safe_gather,
-)
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from .base_watcher import BaseWatcher
 from .websocket_watcher import WSNewBlocksWatcher
-from .contract_event_logs import ContractEventLogger
+from .contract_event_logs import MultiContractEventLogger
 
 weth_sai_symbols: Set[str] = {"WETH", "SAI"}
 TRANSFER_EVENT_NAME = "Transfer"
@@ -69,7 +65,7 @@ class ERC20EventsWatcher(BaseWatcher):
         self._watch_addresses: Set[str] = set(watch_addresses)
         self._address_to_asset_name_map: Dict[str, str] = {}
         self._asset_decimals: Dict[str, int] = {}
-        self._contract_event_loggers: Dict[str, ContractEventLogger] = {}
+        self._contract_event_logger: Optional[MultiContractEventLogger] = None
         self._new_blocks_queue: asyncio.Queue = asyncio.Queue()
         self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
         self._poll_erc20_logs_task: Optional[asyncio.Task] = None
@@ -90,7 +86,13 @@ class ERC20EventsWatcher(BaseWatcher):
                                           exc_info=True)
                 self._address_to_asset_name_map[address] = asset_name
                 self._asset_decimals[asset_name] = decimals
-                self._contract_event_loggers[address] = ContractEventLogger(self._w3, address, contract.abi)
+        if self._contract_event_logger is None:
+            # Transfers and approvals of all token contracts are fetched with one eth_getLogs per range of blocks.
+            self._contract_event_logger = MultiContractEventLogger(
+                self._w3,
+                {address: contract.abi for address, contract in self._addresses_to_contracts.items()},
+                [TRANSFER_EVENT_NAME, APPROVAL_EVENT_NAME]
+            )
 
         if self._poll_erc20_logs_task is not None:
             await self.stop_network()
@@ -112,28 +114,9 @@ class ERC20EventsWatcher(BaseWatcher):
         while True:
             try:
                 new_blocks: List[AttributeDict] = await self._new_blocks_queue.get()
-
-                transfer_tasks = []
-                approval_tasks = []
-                for address in self._addresses_to_contracts.keys():
-                    contract_event_logger: ContractEventLogger = self._contract_event_loggers[address]
-                    transfer_tasks.append(
-                        contract_event_logger.get_new_entries_from_logs(TRANSFER_EVENT_NAME,
-                                                                        new_blocks)
-                    )
-                    approval_tasks.append(
-                        contract_event_logger.get_new_entries_from_logs(APPROVAL_EVENT_NAME,
-                                                                        new_blocks)
-                    )
-
-                raw_transfer_entries = await safe_gather(*transfer_tasks)
-                raw_approval_entries = await safe_gather(*approval_tasks)
-                transfer_entries = list(cytoolz.concat(raw_transfer_entries))
-                approval_entries = list(cytoolz.concat(raw_approval_entries))
-                for transfer_entry in transfer_entries:
-                    await self._handle_event_data(transfer_entry)
-                for approval_entry in approval_entries:
-                    await self._handle_event_data(approval_entry)
+                entries: List[AttributeDict] = await self._contract_event_logger.get_new_entries_from_logs(new_blocks)
+                for entry in entries:
+                    await self._handle_event_data(entry)
 
             except asyncio.CancelledError:
                 raise
@@ -18,10 +18,14 @@ from web3.exceptions import BlockNotFound
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import NewBlocksWatcherEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import (
+    safe_ensure_future,
+    safe_gather,
+)
 from .base_watcher import BaseWatcher
 
 DEFAULT_BLOCK_WINDOW_SIZE = 30
+DEFAULT_MAX_BLOCKS_PER_RANGE = 20
 
 
 class NewBlocksWatcher(BaseWatcher):
@@ -33,9 +37,24 @@ class NewBlocksWatcher(BaseWatcher):
             cls._nbw_logger = logging.getLogger(__name__)
         return cls._nbw_logger
 
-    def __init__(self, w3: Web3, block_window_size: Optional[int] = DEFAULT_BLOCK_WINDOW_SIZE):
+    def __init__(self,
+                 w3: Web3,
+                 block_window_size: Optional[int] = DEFAULT_BLOCK_WINDOW_SIZE,
+                 range_scan_enabled: bool = False,
+                 max_blocks_per_range: int = DEFAULT_MAX_BLOCKS_PER_RANGE,
+                 poll_interval: float = 1.0):
+        """
+        :param range_scan_enabled: In range scan mode, the watcher polls the chain head and catches up by ranges of
+        up to max_blocks_per_range blocks, fetching headers only (transactions are hashes), and emits each range as
+        a single NewBlocks event. Log consumers like MultiContractEventLogger can then query a whole range at once.
+        Consumers that need full transactions, like IncomingEthWatcher, need the default mode.
+        :param poll_interval: seconds between chain head polls once caught up, in range scan mode
+        """
         super().__init__(w3)
         self._block_window_size = block_window_size
+        self._range_scan_enabled: bool = range_scan_enabled
+        self._max_blocks_per_range: int = max_blocks_per_range
+        self._poll_interval: float = poll_interval
         self._current_block_number: int = -1
         self._block_number_to_fetch: int = -1
         self._blocks_window: Dict = {}
@@ -64,7 +83,10 @@ class NewBlocksWatcher(BaseWatcher):
                                                   "Check Ethereum node connection",
                                   exc_info=True)
         self._block_number_to_fetch = self._current_block_number
-        self._fetch_new_blocks_task: asyncio.Task = safe_ensure_future(self.fetch_new_blocks_loop())
+        if self._range_scan_enabled:
+            self._fetch_new_blocks_task: asyncio.Task = safe_ensure_future(self.fetch_new_block_ranges_loop())
+        else:
+            self._fetch_new_blocks_task: asyncio.Task = safe_ensure_future(self.fetch_new_blocks_loop())
 
     async def stop_network(self):
         if self._fetch_new_blocks_task is not None:
@@ -162,7 +184,75 @@ class NewBlocksWatcher(BaseWatcher):
         except asyncio.CancelledError:
             raise
 
-    async def get_block_reorganization(self, incoming_block: AttributeDict) -> List[AttributeDict]:
+    async def fetch_new_block_ranges_loop(self):
+        try:
+            while True:
+                caught_up: bool = True
+                try:
+                    async with timeout(30.0):
+                        caught_up = await self.fetch_new_block_range()
+                except asyncio.CancelledError:
+                    raise
+                except asyncio.TimeoutError:
+                    self.logger().network("Timed out fetching new blocks.", exc_info=True,
+                                          app_warning_msg="Timed out fetching new blocks. "
+                                                          "Check wallet network connection")
+                except BlockNotFound:
+                    pass
+                except Exception:
+                    self.logger().network("Error fetching new blocks.", exc_info=True,
+                                          app_warning_msg="Error fetching new blocks. "
+                                                          "Check wallet network connection")
+                # Keep going without waiting while catching up with the chain head.
+                await asyncio.sleep(self._poll_interval if caught_up else 0)
+        except asyncio.CancelledError:
+            raise
+
+    async def fetch_new_block_range(self) -> bool:
+        """
+        Fetches the headers of the next range of blocks up to the chain head and emits them, along with any blocks
+        replaced by a reorganization, as one NewBlocks event.
+        :return: True if the watcher has caught up with the chain head
+        """
+        head_block_number: int = await self.call_async(getattr, self._w3.eth, "blockNumber")
+        if head_block_number < self._block_number_to_fetch:
+            return True
+        last_block_number: int = min(head_block_number, self._block_number_to_fetch + self._max_blocks_per_range - 1)
+        fetched_blocks: List[Optional[AttributeDict]] = await safe_gather(*[
+            self.call_async(functools.partial(self._w3.eth.getBlock, block_number, full_transactions=False))
+            for block_number in range(self._block_number_to_fetch, last_block_number + 1)
+        ])
+
+        # Only the part of the range that links up is used, in case the chain reorganized while it was fetched or
+        # the node doesn't have all of the blocks yet. The rest is fetched again on the next round.
+        incoming_blocks: List[AttributeDict] = []
+        for block in fetched_blocks:
+            if block is None or (len(incoming_blocks) > 0 and block.parentHash != incoming_blocks[-1].hash):
+                break
+            incoming_blocks.append(block)
+        if len(incoming_blocks) == 0:
+            return True
+
+        new_blocks: List[AttributeDict] = []
+        current_block_hash: Optional[HexBytes] = self._block_number_to_hash_map.get(self._current_block_number, None)
+        if current_block_hash is not None and current_block_hash != incoming_blocks[0].parentHash:
+            new_blocks += await self.get_block_reorganization(incoming_blocks[0], full_transactions=False)
+        for block in incoming_blocks:
+            self._block_number_to_hash_map[block.number] = block.hash
+            self._blocks_window[block.hash] = block
+        new_blocks += incoming_blocks
+        self._current_block_number = incoming_blocks[-1].number
+        self._block_number_to_fetch = self._current_block_number + 1
+        self.trigger_event(NewBlocksWatcherEvent.NewBlocks, new_blocks)
+
+        while len(self._blocks_window) > self._block_window_size and len(self._block_number_to_hash_map) > 0:
+            block_hash = self._block_number_to_hash_map.popitem(last=False)[1]
+            self._blocks_window.pop(block_hash, None)
+        return self._current_block_number >= head_block_number
+
+    async def get_block_reorganization(self,
+                                       incoming_block: AttributeDict,
+                                       full_transactions: bool = True) -> List[AttributeDict]:
         block_reorganization: List[AttributeDict] = []
         expected_parent_hash: HexBytes = incoming_block.parentHash
         try:
@@ -174,7 +264,7 @@ class NewBlocksWatcher(BaseWatcher):
                             functools.partial(
                                 self._w3.eth.getBlock,
                                 expected_parent_hash,
-                                full_transactions=True)
+                                full_transactions=full_transactions)
                         )
                         replacement_block = block
                     except BlockNotFound:
@@ -185,6 +275,9 @@ class NewBlocksWatcher(BaseWatcher):
                 replacement_block_number: int = replacement_block.number
                 replacement_block_hash: HexBytes = replacement_block.hash
                 replacement_block_parent_hash: HexBytes = replacement_block.parentHash
+                replaced_block_hash: Optional[HexBytes] = self._block_number_to_hash_map.get(replacement_block_number)
+                if replaced_block_hash is not None:
+                    self._blocks_window.pop(replaced_block_hash, None)
                 self._block_number_to_hash_map[replacement_block_number] = replacement_block_hash
                 self._blocks_window[replacement_block_hash] = replacement_block
                 block_reorganization.append(replacement_block)
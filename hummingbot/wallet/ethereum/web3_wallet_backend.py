@@ -56,6 +56,7 @@ from hummingbot.wallet.ethereum.watcher import (
     WethWatcher,
     ZeroExFillWatcher,
 )
+from hummingbot.wallet.ethereum.watcher.account_balance_watcher import MULTICALL_ADDRESSES
 from hummingbot.wallet.ethereum.watcher.websocket_watcher import WSNewBlocksWatcher
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
 from hummingbot.logger import HummingbotLogger
@@ -240,7 +241,8 @@ class Web3WalletBackend(PubSub):
             self._new_blocks_watcher,
             self._account.address,
             [erc20_token.address for erc20_token in self._erc20_tokens.values()],
-            [token.abi for token in self._erc20_tokens.values()]
+            [token.abi for token in self._erc20_tokens.values()],
+            multicall_address=MULTICALL_ADDRESSES.get(self._chain)
         )
         self._erc20_events_watcher = ERC20EventsWatcher(
             self._w3,
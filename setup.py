@@ -94,7 +94,8 @@ def main():
             "wallet/ethereum/erc20_tokens.json",
             "wallet/ethereum/erc20_tokens_kovan.json",
             "VERSION",
-            "templates/*TEMPLATE.yml"
+            "templates/*TEMPLATE.yml",
+            "client/connector_manifest.json"
         ],
     }
     install_requires = [
@@ -0,0 +1,54 @@
+"""
+Helpers for the benchmarks of the unit tests.
+
+Benchmarks are slow and their timings depend on the machine: they only run when the HUMMINGBOT_BENCHMARKS environment
+variable is set, and report their results to the `test.benchmark` logger, e.g.
+
+    HUMMINGBOT_BENCHMARKS=1 python -m pytest test/test_pubsub.py --log-cli-level=INFO
+"""
+import logging
+import os
+import time
+import tracemalloc
+from typing import Callable
+import unittest
+
+BENCHMARKS_ENV_VAR = "HUMMINGBOT_BENCHMARKS"
+
+benchmark_logger = logging.getLogger(__name__)
+benchmark_logger.setLevel(logging.INFO)
+
+
+def benchmark(test_method: Callable) -> Callable:
+    """
+    Skips the decorated test unless benchmarks are asked for.
+    """
+    return unittest.skipUnless(os.environ.get(BENCHMARKS_ENV_VAR),
+                               f"Benchmark, set {BENCHMARKS_ENV_VAR}=1 to run it.")(test_method)
+
+
+def cpu_time(func: Callable, calls: int = 1) -> float:
+    """
+    Returns the mean CPU time of the calls to func, in seconds.
+    """
+    start = time.process_time()
+    for _ in range(calls):
+        func()
+    return (time.process_time() - start) / calls
+
+
+def peak_allocations(func: Callable) -> int:
+    """
+    Returns the peak of the memory allocated during a call to func, in bytes.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def report(message: str):
+    benchmark_logger.info(message)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../../")))
+
+import asyncio
+from decimal import Decimal
+import tempfile
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+import unittest.mock
+
+from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_derivative import BinancePerpetualDerivative
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.utils.warm_start_cache import WarmStartCache
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderType,
+    PositionSide,
+    TradeType,
+)
+
+TRADING_PAIR = "ETH-USDT"
+SYMBOL = "ETHUSDT"
+
+
+def account_update(positions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "e": "ACCOUNT_UPDATE",
+        "E": 1600000000000,
+        "a": {
+            "m": "ORDER",
+            "B": [{"a": "USDT", "wb": "1000", "cw": "900"}],
+            "P": positions,
+        }
+    }
+
+
+def order_trade_update(client_order_id: str, status: str, trade_id: int, last_qty: str, cumulative_qty: str):
+    return {
+        "e": "ORDER_TRADE_UPDATE",
+        "E": 1600000000000,
+        "o": {
+            "s": SYMBOL, "c": client_order_id, "S": "BUY", "o": "LIMIT", "q": "2", "p": "100",
+            "x": "TRADE" if Decimal(last_qty) > 0 else status, "X": status, "i": 1,
+            "l": last_qty, "z": cumulative_qty, "L": "100", "N": "USDT", "n": "0.01", "t": trade_id,
+        }
+    }
+
+
+class BinancePerpetualPositionTrackingUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.derivative = BinancePerpetualDerivative("api_key", "api_secret", [TRADING_PAIR])
+        self.derivative._leverage[TRADING_PAIR] = 1
+        self.requests: List[str] = []
+        self.request_weights: List[int] = []
+        self.responses: Dict[str, Any] = {}
+        self.derivative.request = self.mock_request
+        self.event_logger = EventLogger()
+        for event_tag in [MarketEvent.OrderFilled, MarketEvent.OrderCancelled, MarketEvent.BuyOrderCompleted]:
+            self.derivative.add_listener(event_tag, self.event_logger)
+
+    async def mock_request(self, path: str, params: Dict[str, Any] = {}, request_weight: int = 1, **kwargs):
+        self.requests.append(path)
+        self.request_weights.append(request_weight)
+        return self.responses.get(path)
+
+    def set_user_stream_live(self):
+        self.derivative._user_stream_tracker.data_source._last_recv_time = time.time()
+
+    def start_tracking(self, client_order_id: str):
+        self.derivative.start_tracking_order(client_order_id, "1", TRADING_PAIR, TradeType.BUY, Decimal("100"),
+                                             Decimal("2"), OrderType.LIMIT, 1, "OPEN")
+
+    def process(self, event: Dict[str, Any]):
+        self.ev_loop.run_until_complete(self.derivative._process_user_stream_event(event))
+
+    def test_positions_follow_account_updates(self):
+        self.process(account_update([{"s": SYMBOL, "pa": "1.5", "ep": "100", "up": "2", "ps": "BOTH"}]))
+        position = self.derivative._account_positions[f"{SYMBOL}BOTH"]
+        self.assertEqual(Decimal("1.5"), position.amount)
+        self.assertEqual(PositionSide.BOTH, position.position_side)
+        self.assertEqual(Decimal("900"), self.derivative.get_available_balance("USDT"))
+
+        self.process(account_update([{"s": SYMBOL, "pa": "0.5", "ep": "100", "up": "1", "ps": "BOTH"}]))
+        self.assertEqual(Decimal("0.5"), position.amount)
+
+        self.process(account_update([{"s": SYMBOL, "pa": "0", "ep": "0", "up": "0", "ps": "BOTH"}]))
+        self.assertNotIn(f"{SYMBOL}BOTH", self.derivative._account_positions)
+        self.assertEqual([], self.requests)
+
+    def test_order_updates_without_rest(self):
+        self.start_tracking("order1")
+        self.process(order_trade_update("order1", "PARTIALLY_FILLED", 11, "1", "1"))
+        # A repeated message doesn't fill the order twice.
+        self.process(order_trade_update("order1", "PARTIALLY_FILLED", 11, "1", "1"))
+        self.process(order_trade_update("order1", "FILLED", 12, "1", "2"))
+
+        self.assertEqual(2, len([e for e in self.event_logger.event_log if hasattr(e, "trade_fee")]))
+        self.assertNotIn("order1", self.derivative.in_flight_orders)
+        self.assertEqual([], self.requests)
+        self.assertFalse(self.derivative._reconciliation_requested)
+
+        self.start_tracking("order2")
+        self.process(order_trade_update("order2", "NEW", 0, "0", "0"))
+        self.process(order_trade_update("order2", "CANCELED", 0, "0", "0"))
+        self.assertNotIn("order2", self.derivative.in_flight_orders)
+        self.assertEqual([], self.requests)
+
+    def test_missed_fill_triggers_reconciliation(self):
+        self.set_user_stream_live()
+        self.derivative.tick(1.0)
+        self.derivative._user_stream_was_silent = False
+        self.derivative._poll_notifier.clear()
+
+        self.start_tracking("order1")
+        # The fill of trade 11 never came through the stream.
+        self.process(order_trade_update("order1", "PARTIALLY_FILLED", 12, "0.5", "1.5"))
+        self.assertTrue(self.derivative._reconciliation_requested)
+        self.derivative.tick(2.0)
+        self.assertTrue(self.derivative._poll_notifier.is_set())
+
+        self.responses = {
+            "/fapi/v1/openOrders": [{"clientOrderId": "order1", "status": "PARTIALLY_FILLED", "executedQty": "1.5",
+                                     "cumQuote": "150", "type": "LIMIT"}],
+            "/fapi/v1/userTrades": [{"orderId": 1, "id": 11, "price": "100", "qty": "1", "quoteQty": "100",
+                                     "commission": "0.01", "commissionAsset": "USDT"},
+                                    {"orderId": 1, "id": 12, "price": "100", "qty": "0.5", "quoteQty": "50",
+                                     "commission": "0.01", "commissionAsset": "USDT"}],
+        }
+        # Reconciling after a gap doesn't wait for UPDATE_ORDER_STATUS_MIN_INTERVAL.
+        with unittest.mock.patch.object(BinancePerpetualDerivative, "current_timestamp",
+                                        new_callable=unittest.mock.PropertyMock, return_value=5.0):
+            self.ev_loop.run_until_complete(self.derivative._update_order_status())
+            self.assertEqual([], self.requests)
+            self.ev_loop.run_until_complete(self.derivative._update_order_status(force=True))
+        # One open orders request instead of a request per order, and trades of the affected trading pair only.
+        self.assertEqual(["/fapi/v1/openOrders", "/fapi/v1/userTrades"], self.requests)
+        self.assertEqual([1, 5], self.request_weights)
+        self.assertEqual(Decimal("1.5"), self.derivative.in_flight_orders["order1"].executed_amount_base)
+        self.assertEqual(2, len(self.event_logger.event_log))
+
+    def test_reconciliation_interval(self):
+        self.set_user_stream_live()
+        reconciliations = 0
+        for timestamp in range(1, 3601):
+            self.derivative._poll_notifier.clear()
+            self.derivative.tick(float(timestamp))
+            if self.derivative._poll_notifier.is_set():
+                reconciliations += 1
+                self.derivative._reconciliation_requested = False
+        # Once for the stream coming up, then every RECONCILIATION_INTERVAL, where polling used to run every 120
+        # seconds on a live stream.
+        self.assertEqual(1 + 3600 / BinancePerpetualDerivative.RECONCILIATION_INTERVAL, reconciliations)
+        self.assertLess(reconciliations, 3600 / 120)
+
+    def test_tracking_metrics(self):
+        self.set_user_stream_live()
+        now = time.time()
+        self.derivative._rest_weight_log.extend([(now - 120, 5), (now - 30, 5), (now, 1)])
+        metrics = self.derivative.tracking_metrics
+        self.assertEqual(6, metrics["rest_weight_per_minute"])
+        self.assertEqual(2, len(self.derivative._rest_weight_log))
+        self.assertLess(metrics["position_staleness"], 1.0)
+
+    def test_trading_rules_warm_start(self):
+        exchange_info = {"symbols": [{"symbol": SYMBOL, "contractType": "PERPETUAL", "filters": [
+            {"filterType": "LOT_SIZE", "minQty": "0.001", "stepSize": "0.001"},
+            {"filterType": "PRICE_FILTER", "tickSize": "0.01"}]}]}
+        self.responses = {"/fapi/v1/exchangeInfo": exchange_info}
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                unittest.mock.patch.object(BinancePerpetualDerivative, "current_timestamp",
+                                           new_callable=unittest.mock.PropertyMock, return_value=0.0):
+            WarmStartCache._shared_instance = WarmStartCache(cache_dir)
+            try:
+                self.ev_loop.run_until_complete(self.derivative._update_trading_rules())
+                self.assertIn(TRADING_PAIR, self.derivative._trading_rules)
+
+                # The next run has its trading rules before the exchange replies.
+                derivative = BinancePerpetualDerivative("api_key", "api_secret", [TRADING_PAIR])
+                trading_rules_when_requested = []
+
+                async def request(path: str, **kwargs):
+                    trading_rules_when_requested.append(list(derivative._trading_rules.keys()))
+                    return exchange_info
+                derivative.request = request
+                self.ev_loop.run_until_complete(derivative._update_trading_rules())
+                self.assertEqual([[TRADING_PAIR]], trading_rules_when_requested)
+            finally:
+                WarmStartCache._shared_instance = None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -703,7 +703,7 @@ class BinanceExchangeUnitTest(unittest.TestCase):
                           "fee_asset": "LINK",
                           "fee_paid": "0.0"}
             self.market.restore_tracking_states({buy_id: order_json})
-            self.market.in_flight_orders.get(buy_id).trade_id_set.add(str(FixtureBinance.WS_AFTER_BUY_2['t']))
+            self.market.in_flight_orders.get(buy_id).add_trade_id(str(FixtureBinance.WS_AFTER_BUY_2['t']))
             # Simulate incoming responses as if buy_id is executed again
             data = self.fixture(FixtureBinance.WS_AFTER_BUY_2, c=buy_id)
             HummingWsServerFactory.send_json_threadsafe(self._ws_user_url, data, delay=0.11)
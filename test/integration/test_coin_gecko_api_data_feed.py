@@ -6,6 +6,7 @@ import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
 import unittest
 
 from hummingbot.data_feed.coin_gecko_data_feed import CoinGeckoDataFeed
+from hummingbot.data_feed.price_feed_service import PriceFeedService
 
 
 def async_run(func):
@@ -20,7 +21,7 @@ class CoinGeckoUnitTest(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
-        async_run(CoinGeckoDataFeed.get_instance()._shared_client.close())
+        async_run(PriceFeedService.get_instance().http_client().close())
 
     def setUp(self):
         pass
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import asyncio
+import tempfile
+import unittest
+from unittest import mock
+
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+from hummingbot.core.utils.warm_start_cache import WarmStartCache
+from test.integration.assets.mock_data.fixture_binance import FixtureBinance
+from test.integration.humming_web_app import HummingWebApp
+
+BASE_API_URL = "api.binance.com"
+
+
+class WarmStartCacheIntegrationTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.web_app = HummingWebApp.get_instance()
+        cls.web_app.add_host_to_mock(BASE_API_URL, [])
+        cls.web_app.start()
+        cls.ev_loop.run_until_complete(cls.web_app.wait_til_started())
+        cls._patcher = mock.patch("aiohttp.client.URL")
+        cls._url_mock = cls._patcher.start()
+        cls._url_mock.side_effect = cls.web_app.reroute_local
+        cls.web_app.update_response("get", BASE_API_URL, "/api/v1/exchangeInfo", FixtureBinance.MARKETS)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._patcher.stop()
+        cls.web_app.stop()
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        WarmStartCache._shared_instance = WarmStartCache(self.cache_dir.name)
+
+    def tearDown(self):
+        WarmStartCache._shared_instance = None
+        self.cache_dir.cleanup()
+
+    def fetch_trading_pairs(self):
+        fetcher = TradingPairFetcher()
+        self.ev_loop.run_until_complete(fetcher.fetch("binance"))
+        return fetcher.trading_pairs["binance"]
+
+    def test_cold_and_warm_start(self):
+        cold_trading_pairs = self.fetch_trading_pairs()
+        self.assertGreater(len(cold_trading_pairs), 0)
+        # A warm start reads the trading pairs from the cache, without calling the exchange.
+        with mock.patch("hummingbot.connector.exchange.binance.binance_api_order_book_data_source."
+                        "BinanceAPIOrderBookDataSource.fetch_trading_pairs") as fetch_mock:
+            warm_trading_pairs = self.fetch_trading_pairs()
+            fetch_mock.assert_not_called()
+        self.assertEqual(cold_trading_pairs, warm_trading_pairs)
+
+
+if __name__ == "__main__":
+    unittest.main()
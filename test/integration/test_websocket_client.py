@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import asyncio
+import json
+import time
+from typing import (
+    Any,
+    Dict,
+    Tuple,
+)
+import unittest
+import unittest.mock
+
+from hummingbot.connector.exchange.hitbtc.hitbtc_constants import Constants
+from hummingbot.connector.exchange.hitbtc.hitbtc_websocket import HitbtcWebsocket
+from hummingbot.core.utils.websocket_client import WebsocketClient
+from test.benchmark import (
+    benchmark,
+    report,
+)
+from test.integration.humming_ws_server import HummingWsServerFactory
+
+WS_URL = Constants.WS_PUBLIC_URL
+NUM_MESSAGES = 20000
+TRADE_MESSAGE = json.dumps({"method": "updateTrades", "params": {"data": [{"id": 1, "price": "9000.00",
+                                                                           "quantity": "0.01", "side": "buy"}],
+                                                                 "symbol": "BTCUSDT"}})
+
+
+class WebsocketClientIntegrationTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.ws_server = HummingWsServerFactory.start_new_server(WS_URL)
+        cls.ws_server.add_stock_response("subscribeTrades", {"jsonrpc": "2.0", "result": True, "id": 1})
+        cls._patcher = unittest.mock.patch("websockets.connect", autospec=True)
+        cls._mock = cls._patcher.start()
+        cls._mock.side_effect = HummingWsServerFactory.reroute_ws_connect
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._patcher.stop()
+
+    def send_from_server(self, messages):
+        async def send_all():
+            for message in messages:
+                await self.ws_server.websocket.send(message)
+        asyncio.run_coroutine_threadsafe(send_all(), self.ws_server.ev_loop)
+
+    async def wait_for_server_connection(self, previous_websocket=None):
+        while self.ws_server.websocket is None or self.ws_server.websocket is previous_websocket:
+            await asyncio.sleep(0.01)
+
+    def test_subscribe_and_resubscribe_after_reconnect(self):
+        client = WebsocketClient(WS_URL, reconnect_delay=0.1)
+        subscription = client.subscribe("trades", payload={"method": "subscribeTrades", "id": 1},
+                                        matcher=lambda m: m.get("id") == 1 or m.get("method") == "updateTrades")
+        client.start()
+        self.ev_loop.run_until_complete(asyncio.wait_for(subscription.get(), 5))
+        self.send_from_server([json.dumps({"method": "updateTrades", "params": {"n": n}}) for n in range(3)])
+        for n in range(3):
+            message = self.ev_loop.run_until_complete(asyncio.wait_for(subscription.get(), 5))
+            self.assertEqual(n, message["params"]["n"])
+
+        # The server drops the connection, the client comes back and subscribes again.
+        server_websocket = self.ws_server.websocket
+        asyncio.run_coroutine_threadsafe(server_websocket.close(), self.ws_server.ev_loop)
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.wait_for_server_connection(server_websocket), 5))
+        message = self.ev_loop.run_until_complete(asyncio.wait_for(subscription.get(), 5))
+        self.assertTrue(message["result"])
+        self.assertEqual(1, client.stats["reconnects"])
+        self.ev_loop.run_until_complete(client.stop())
+
+    async def consume_hitbtc(self, message: str) -> float:
+        ws = HitbtcWebsocket()
+        await ws.connect()
+        await self.wait_for_server_connection()
+        start = time.perf_counter()
+        self.send_from_server([message] * NUM_MESSAGES)
+        received = 0
+        async for _ in ws.on_message():
+            received += 1
+            if received == NUM_MESSAGES:
+                break
+        elapsed = time.perf_counter() - start
+        await ws.disconnect()
+        return elapsed
+
+    async def consume_client(self, message: str) -> Tuple[float, Dict[str, Any]]:
+        client = WebsocketClient(WS_URL)
+        subscription = client.subscribe("trades", matcher=lambda m: m.get("method") == "updateTrades",
+                                        maxsize=NUM_MESSAGES)
+        client.start()
+        await client.wait_til_connected()
+        await self.wait_for_server_connection()
+        start = time.perf_counter()
+        self.send_from_server([message] * NUM_MESSAGES)
+        received = 0
+        async for _ in subscription:
+            received += 1
+            if received == NUM_MESSAGES:
+                break
+        elapsed = time.perf_counter() - start
+        stats = client.stats
+        await client.stop()
+        return elapsed, stats
+
+    def test_message_burst(self):
+        self.ws_server.websocket = None
+        _, stats = self.ev_loop.run_until_complete(self.consume_client(TRADE_MESSAGE))
+        self.assertEqual(NUM_MESSAGES, stats["messages_received"])
+        self.assertEqual(0, stats["queues"]["trades"]["dropped"])
+
+    @benchmark
+    def test_benchmark_against_hitbtc_websocket(self):
+        self.ws_server.websocket = None
+        hitbtc_elapsed = self.ev_loop.run_until_complete(self.consume_hitbtc(TRADE_MESSAGE))
+        self.ws_server.websocket = None
+        client_elapsed, stats = self.ev_loop.run_until_complete(self.consume_client(TRADE_MESSAGE))
+        report(f"HitbtcWebsocket: {NUM_MESSAGES / hitbtc_elapsed:,.0f} msg/s, "
+               f"WebsocketClient: {NUM_MESSAGES / client_elapsed:,.0f} msg/s, "
+               f"mean decode time: {stats['mean_decode_time_us']:.1f} us")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../../../")))
+import asyncio
+import time
 import unittest
 from decimal import Decimal
 
@@ -48,3 +50,43 @@ class AmmArbUtilsUnitTest(unittest.TestCase):
         self.assertEqual(buy_1_sell_2_profit_pct, arb_proposals[0].profit_pct())
         buy_2_sell_1_profit_pct = (Decimal("104") - Decimal("103")) / Decimal("103")
         self.assertEqual(buy_2_sell_1_profit_pct, arb_proposals[1].profit_pct())
+
+
+class MockGatewayConnector(ConnectorBase):
+    def __init__(self, buy_price: Decimal, sell_price: Decimal):
+        super().__init__()
+        self.buy_price = buy_price
+        self.sell_price = sell_price
+        self.quote_requests = 0
+
+    @property
+    def order_price_is_quote_price(self) -> bool:
+        return True
+
+    async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        self.quote_requests += 1
+        await asyncio.sleep(0.1)
+        return self.buy_price if is_buy else self.sell_price
+
+    async def get_order_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        return await self.get_quote_price(trading_pair, is_buy, amount)
+
+
+class AmmArbQuoteCacheUnitTest(unittest.TestCase):
+    def test_create_arb_proposals_fetches_each_quote_once_concurrently(self):
+        connector_1 = MockGatewayConnector(Decimal("105"), Decimal("104"))
+        connector_2 = MockGatewayConnector(Decimal("103"), Decimal("100"))
+        market_info1 = MarketTradingPairTuple(connector_1, trading_pair, base, quote)
+        market_info2 = MarketTradingPairTuple(connector_2, trading_pair, base, quote)
+        start = time.perf_counter()
+        arb_proposals = asyncio.get_event_loop().run_until_complete(
+            utils.create_arb_proposals(market_info1, market_info2, Decimal("1")))
+        elapsed = time.perf_counter() - start
+        self.assertEqual(2, len(arb_proposals))
+        # One quote per side and connector, the order prices are served from the quotes.
+        self.assertEqual(2, connector_1.quote_requests)
+        self.assertEqual(2, connector_2.quote_requests)
+        # All requests are in flight at the same time, rather than 8 sequential round trips.
+        self.assertLess(elapsed, 0.3)
+        self.assertEqual(Decimal("105"), arb_proposals[0].first_side.order_price)
+        self.assertEqual(Decimal("100"), arb_proposals[0].second_side.order_price)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from collections import defaultdict
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+import unittest
+
+from eth_bloom import BloomFilter
+from web3.datastructures import AttributeDict
+
+from hummingbot.core.event.events import WalletEvent
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.wallet.ethereum.watcher.account_balance_watcher import AccountBalanceWatcher
+
+ACCOUNT_ADDRESS = "0x" + "aa" * 20
+MULTICALL_ADDRESS = "0x" + "cc" * 20
+TOKENS = {"0x" + "01" * 20: "TKA", "0x" + "02" * 20: "TKB", "0x" + "03" * 20: "TKC"}
+
+
+class MockCall:
+    def __init__(self, calls: Dict[str, int], method: str, result):
+        self._calls = calls
+        self._method = method
+        self._result = result
+
+    def call(self):
+        self._calls[self._method] += 1
+        return self._result
+
+
+class MockFunctions:
+    def __init__(self, contract: "MockContract"):
+        self._contract = contract
+
+    def symbol(self) -> MockCall:
+        return MockCall(self._contract.calls, "eth_call", TOKENS.get(self._contract.address))
+
+    def decimals(self) -> MockCall:
+        return MockCall(self._contract.calls, "eth_call", 18)
+
+    def balanceOf(self, address: str) -> MockCall:
+        return MockCall(self._contract.calls, "eth_call", self._contract.eth.balances[self._contract.address])
+
+    def aggregate(self, calls: List) -> MockCall:
+        return_data = [self._contract.eth.balances[target].to_bytes(32, byteorder="big") for target, _ in calls]
+        return MockCall(self._contract.calls, "eth_call", (0, return_data))
+
+
+class MockContract:
+    def __init__(self, eth: "MockEth", address: str):
+        self.eth = eth
+        self.calls = eth.calls
+        self.address = address
+        self.functions = MockFunctions(self)
+
+    def encodeABI(self, fn_name: str, args: List) -> str:
+        return fn_name
+
+
+class MockEth:
+    """
+    Stands in for the JSON-RPC node, counting the calls made.
+    """
+    def __init__(self):
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.balances: Dict[str, int] = {address: 10 ** 18 for address in TOKENS.keys()}
+        self.balances[MULTICALL_ADDRESS] = 5 * 10 ** 18
+
+    def contract(self, address: str, abi: List) -> MockContract:
+        return MockContract(self, address)
+
+    def getBalance(self, address: str) -> int:
+        self.calls["eth_getBalance"] += 1
+        return self.balances[MULTICALL_ADDRESS]
+
+
+class MockWeb3:
+    def __init__(self):
+        self.eth = MockEth()
+
+
+class MockBlocksWatcher:
+    def add_listener(self, *_):
+        pass
+
+    def remove_listener(self, *_):
+        pass
+
+
+def make_block(number: int, log_addresses: Optional[List[bytes]] = None) -> AttributeDict:
+    bloom = BloomFilter()
+    for item in (log_addresses or []):
+        bloom.add(item)
+    return AttributeDict({"number": number, "logsBloom": int(bloom).to_bytes(256, byteorder="big")})
+
+
+class AccountBalanceWatcherUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.w3 = MockWeb3()
+
+    def start_watcher(self, multicall_address: Optional[str]) -> AccountBalanceWatcher:
+        watcher = AccountBalanceWatcher(self.w3, MockBlocksWatcher(), ACCOUNT_ADDRESS,
+                                        list(TOKENS.keys()), [[] for _ in TOKENS], multicall_address=multicall_address)
+        self.ev_loop.run_until_complete(watcher.start_network())
+        self.w3.eth.calls.clear()
+        return watcher
+
+    def receive_blocks(self, watcher: AccountBalanceWatcher, blocks: List[AttributeDict]):
+        for block in blocks:
+            watcher.did_receive_new_blocks([block])
+            self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+
+    def test_calls_per_block(self):
+        quiet_blocks = [make_block(n) for n in range(10)]
+        account_topic = bytes(12) + bytes.fromhex(ACCOUNT_ADDRESS[2:])
+        transfer_block = make_block(10, [bytes.fromhex(list(TOKENS.keys())[1][2:]), account_topic])
+
+        # Before: every token balance and the ETH balance, on every block.
+        watcher = self.start_watcher(None)
+        watcher._full_refresh_interval = 1
+        self.receive_blocks(watcher, quiet_blocks)
+        self.assertEqual(30, self.w3.eth.calls["eth_call"])
+        self.assertEqual(10, self.w3.eth.calls["eth_getBalance"])
+
+        # After: the ETH balance only, until a block may hold a transfer for the account.
+        watcher = self.start_watcher(MULTICALL_ADDRESS)
+        self.receive_blocks(watcher, quiet_blocks)
+        self.assertEqual(0, self.w3.eth.calls["eth_call"])
+        self.assertEqual(10, self.w3.eth.calls["eth_getBalance"])
+        self.receive_blocks(watcher, [transfer_block])
+        self.assertEqual(1, self.w3.eth.calls["eth_call"])
+        self.assertEqual(10, self.w3.eth.calls["eth_getBalance"])
+
+    def test_full_refresh_interval(self):
+        watcher = self.start_watcher(MULTICALL_ADDRESS)
+        watcher._full_refresh_interval = 5
+        self.receive_blocks(watcher, [make_block(n) for n in range(10)])
+        self.assertEqual(2, self.w3.eth.calls["eth_call"])
+        self.assertEqual(8, self.w3.eth.calls["eth_getBalance"])
+
+    def test_only_changed_balances_are_published(self):
+        watcher = self.start_watcher(MULTICALL_ADDRESS)
+        event_logger = EventLogger()
+        watcher.add_listener(WalletEvent.BalanceChanged, event_logger)
+        self.ev_loop.run_until_complete(watcher.update_balances())
+        self.assertEqual(0, len(event_logger.event_log))
+
+        self.w3.eth.balances[list(TOKENS.keys())[2]] = 3 * 10 ** 18
+        self.ev_loop.run_until_complete(watcher.update_balances())
+        self.assertEqual(1, len(event_logger.event_log))
+        self.assertEqual("TKC", event_logger.event_log[0].asset_name)
+        self.assertEqual(Decimal(3), event_logger.event_log[0].balance)
+        self.assertEqual(Decimal(3), watcher.get_balance("TKC"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import importlib
+import subprocess
+import unittest
+from unittest.mock import patch
+
+from hummingbot.client.connector_manifest import (
+    generate_connector_manifest,
+    load_connector_manifest,
+)
+from hummingbot.client.settings import ConnectorConfigKeys
+
+PACKAGE_DIR = realpath(join(__file__, "../../"))
+IMPORTED_CONNECTORS = "print(len([m for m in sys.modules if m.startswith('hummingbot.connector.') and " \
+                      "(m.endswith('_utils') or m.endswith('_api_order_book_data_source'))]))"
+
+
+def run_python(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], cwd=PACKAGE_DIR, check=True, capture_output=True,
+                          text=True).stdout.strip()
+
+
+class ConnectorManifestUnitTest(unittest.TestCase):
+    def test_manifest_is_up_to_date(self):
+        self.assertEqual(generate_connector_manifest(skip_missing_dependencies=False), load_connector_manifest(),
+                         "The connector manifest is outdated, run python hummingbot/client/connector_manifest.py")
+
+    def test_missing_dependency(self):
+        import_module = importlib.import_module
+
+        def import_without_web3(name: str):
+            if name == "hummingbot.connector.connector.uniswap.uniswap_utils":
+                raise ModuleNotFoundError("No module named 'web3'", name="web3")
+            return import_module(name)
+
+        with patch("hummingbot.client.connector_manifest.importlib.import_module", side_effect=import_without_web3):
+            # Skipped when the client scans the connectors, an error when generating the manifest at build time.
+            with self.assertLogs(level="WARNING"):
+                manifest = generate_connector_manifest()
+            self.assertNotIn("uniswap", manifest)
+            self.assertIn("binance", manifest)
+            with self.assertRaises(ModuleNotFoundError):
+                generate_connector_manifest(skip_missing_dependencies=False)
+
+    def test_config_keys_are_loaded_on_access(self):
+        config_keys = ConnectorConfigKeys("hummingbot.connector.exchange.binance.binance_utils",
+                                          ["binance_us_api_key", "binance_us_api_secret"], "binance_us")
+        self.assertEqual(["binance_us_api_key", "binance_us_api_secret"], list(config_keys))
+        self.assertIn("binance_us_api_key", config_keys)
+        self.assertNotIn("binance_api_key", config_keys)
+        self.assertFalse(config_keys.is_loaded)
+        self.assertEqual("binance_us_api_key", config_keys["binance_us_api_key"].key)
+        self.assertTrue(config_keys.is_loaded)
+        with self.assertRaises(KeyError):
+            config_keys["binance_api_key"]
+
+    def test_settings_import_no_connector(self):
+        output = run_python("import sys\n"
+                            "from hummingbot.client.settings import CONNECTOR_SETTINGS, EXAMPLE_PAIRS\n"
+                            "assert 'binance_us_api_key' in CONNECTOR_SETTINGS['binance_us'].config_keys\n"
+                            f"{IMPORTED_CONNECTORS}\n")
+        self.assertEqual("0", output)
+
+    def test_startup_imports(self):
+        code = "import sys\n" \
+               "from hummingbot.client import settings\n" \
+               "from hummingbot.client.config.config_helpers import (\n" \
+               "    config_map_complete, load_secure_values, missing_required_configs\n" \
+               ")\n" \
+               "from hummingbot.client.config.global_config_map import global_config_map\n" \
+               "from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher\n" \
+               "TradingPairFetcher.get_instance()\n" \
+               f"{IMPORTED_CONNECTORS}\n" \
+               "{setup}" \
+               "config_map_complete(global_config_map)\n" \
+               "missing_required_configs(global_config_map)\n" \
+               "load_secure_values(global_config_map)\n" \
+               f"{IMPORTED_CONNECTORS}\n"
+
+        def imported_connectors(setup: str) -> int:
+            # Connectors imported by the config checks, on top of the ones imported with the modules (the rate oracle
+            # uses Binance).
+            before, after = run_python(code.format(setup=setup)).split()
+            return int(after) - int(before)
+
+        # The config checks run on start and status only import the connectors the strategy requires.
+        self.assertEqual(0, imported_connectors(""))
+        self.assertEqual(1, imported_connectors("settings.required_exchanges.append('kucoin')\n"))
+        # Accessing every config var is what startup used to pay for.
+        self.assertGreater(imported_connectors("dict(global_config_map)\n"), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
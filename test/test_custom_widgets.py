@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from collections import deque
+import random
+import unittest
+from unittest.mock import patch
+
+from prompt_toolkit.document import Document
+from prompt_toolkit.history import InMemoryHistory
+from prompt_toolkit.search import (
+    SearchDirection,
+    SearchState,
+)
+
+from hummingbot.client.ui.custom_widgets import (
+    CustomBuffer,
+    CustomTextArea,
+    LogLines,
+)
+from test.benchmark import (
+    benchmark,
+    cpu_time,
+    report,
+)
+
+
+class LogLinesUnitTest(unittest.TestCase):
+    def test_text_matches_joined_lines(self):
+        random.seed(7)
+        log_lines = LogLines(50)
+        expected = deque(maxlen=50)
+        for i in range(2000):
+            lines = [f"line {i}-{j} " + "x" * random.randint(0, 30) for j in range(random.randint(1, 80))]
+            if random.random() < 0.1:
+                lines.append("")
+            log_lines.extend(lines)
+            expected.extend(lines)
+            if random.random() < 0.3:
+                self.assertEqual("\n".join(expected), log_lines.text)
+        self.assertEqual("\n".join(expected), log_lines.text)
+        self.assertEqual(list(expected), list(log_lines))
+
+    def test_document_lines(self):
+        log_lines = LogLines(3)
+        self.assertEqual([""], log_lines.document.lines)
+        log_lines.extend(["a", "", "bc", "def"])
+        document = log_lines.document
+        reference = Document(document.text + " ")
+        self.assertEqual(["", "bc", "def"], document.lines)
+        self.assertEqual(len(document.text), document.cursor_position)
+        for position in range(len(document.text) + 1):
+            self.assertEqual(Document(document.text, position).cursor_position_row,
+                             Document(reference.text[:-1], position).cursor_position_row)
+            self.assertEqual(document.translate_index_to_position(position),
+                             Document(reference.text[:-1]).translate_index_to_position(position))
+
+    def test_find(self):
+        log_lines = LogLines(10)
+        log_lines.extend(["Order filled", "order cancelled", "", "ORDER İD 5", "price 100"])
+        text = log_lines.text
+        self.assertTrue(log_lines.is_text(text))
+        for sub in ("order", "Order", "ORDER", "d 5", "100", "xyz", "i̇d"):
+            for ignore_case in (False, True):
+                for backwards in (False, True):
+                    for include_current_position in (False, True):
+                        for position in range(len(text) + 1):
+                            buffer = CustomBuffer(document=Document(text, position))
+                            state = SearchState(sub, SearchDirection.BACKWARD if backwards else SearchDirection.FORWARD,
+                                                ignore_case=ignore_case)
+                            expected = buffer._search(state, include_current_position)
+                            found = log_lines.find(sub, position, backwards, ignore_case, include_current_position)
+                            self.assertEqual(None if expected is None else expected[1], found,
+                                             f"{sub} {ignore_case} {backwards} {include_current_position} {position}")
+
+
+class CustomTextAreaUnitTest(unittest.TestCase):
+    def test_log(self):
+        text_area = CustomTextArea(max_line_count=3, initial_text="Running Logs")
+        text_area.log("a\nb")
+        self.assertEqual("Running Logs\na\nb", text_area.text)
+        self.assertEqual(len(text_area.text), text_area.document.cursor_position)
+        text_area.log("c")
+        self.assertEqual("a\nb\nc", text_area.text)
+
+        # Silent lines are kept, and shown with the next line logged.
+        text_area.log("d", silent=True)
+        self.assertEqual("a\nb\nc", text_area.buffer.text)
+        text_area.log("live", save_log=False)
+        self.assertEqual("live", text_area.text)
+        text_area.log("e")
+        self.assertEqual("c\nd\ne", text_area.text)
+
+    def test_lines_wrapped(self):
+        text_area = CustomTextArea(max_line_count=10)
+        text_area.log("x" * 250)
+        self.assertEqual(["", "x" * 100, "x" * 100, "x" * 50], text_area.text.split("\n"))
+
+    def test_search(self):
+        text_area = CustomTextArea(max_line_count=10)
+        text_area.log("Order filled\norder cancelled\nprice 100")
+        text_area.flush_log()
+        text_area.buffer.cursor_position = 0
+        state = SearchState("order", ignore_case=True)
+        text_area.buffer.apply_search(state, include_current_position=False)
+        self.assertEqual(text_area.text.index("Order"), text_area.buffer.cursor_position)
+        text_area.buffer.apply_search(state, include_current_position=False)
+        self.assertEqual(text_area.text.index("order"), text_area.buffer.cursor_position)
+        text_area.buffer.apply_search(state, include_current_position=False)
+        self.assertEqual(text_area.text.index("Order"), text_area.buffer.cursor_position)
+
+    def test_search_with_history(self):
+        # Searching a buffer with a history goes through the history too, as prompt_toolkit's search does.
+        history = InMemoryHistory()
+        history.append_string("order placed")
+        text_area = CustomTextArea(history=history)
+        state = SearchState("order")
+        with patch.object(CustomBuffer, "_search", return_value=None) as buffer_search:
+            text_area.buffer._search(state)
+        buffer_search.assert_called_once_with(state, False, 1)
+
+    @benchmark
+    def test_log_cpu_time_per_line(self):
+        line_count = 100000
+        max_line_count = 1000
+        lines = [f"12:00:00 - binance_exchange - Order book diff {i} processed for ETH-USDT." for i in range(line_count)]
+
+        # How every line was logged before: joining all the lines into a new document.
+        old_line_count = 10000
+        text_area = CustomTextArea(max_line_count=max_line_count)
+        log_lines = deque()
+
+        def log_joined_lines():
+            for line in lines[:old_line_count]:
+                log_lines.append(line)
+                while len(log_lines) > max_line_count:
+                    log_lines.popleft()
+                new_text = "\n".join(log_lines)
+                text_area.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+
+        old_time = cpu_time(log_joined_lines) / old_line_count
+
+        text_area = CustomTextArea(max_line_count=max_line_count)
+
+        def log_lines_with_frames():
+            for i, line in enumerate(lines):
+                text_area.log(line)
+                if i % 100 == 0:
+                    # A frame: the buffer is brought up to date and its document split into lines for the layout.
+                    text_area.flush_log()
+                    text_area.buffer.document.lines
+
+        new_time = cpu_time(log_lines_with_frames) / line_count
+        self.assertEqual("\n".join(lines[-max_line_count:]), text_area.text)
+
+        report(f"Logging {line_count} lines into a {max_line_count} line pane, a frame every 100 lines: "
+               f"{new_time * 1e6:.1f}us of CPU time per line, {old_time * 1e6:.1f}us when joining all the lines for "
+               f"each line.")
+        self.assertLess(new_time, old_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
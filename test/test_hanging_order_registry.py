@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import unittest
+
+from hummingbot.strategy.pure_market_making.hanging_order_registry import HangingOrderRegistry
+
+
+class HangingOrderRegistryUnitTest(unittest.TestCase):
+    def test_add_and_remove(self):
+        registry = HangingOrderRegistry()
+        self.assertTrue(registry.add("sell1", False, Decimal("101")))
+        self.assertTrue(registry.add("buy1", True, Decimal("99")))
+        self.assertFalse(registry.add("buy1", True, Decimal("99")))
+        self.assertIn("buy1", registry)
+        self.assertNotIn("buy2", registry)
+        self.assertEqual(["sell1", "buy1"], registry.order_ids)
+        self.assertEqual(2, len(registry))
+
+        self.assertTrue(registry.remove("sell1"))
+        self.assertFalse(registry.remove("sell1"))
+        self.assertEqual(["buy1"], list(registry))
+        registry.clear()
+        self.assertEqual(0, len(registry))
+
+    def test_sorted_views(self):
+        registry = HangingOrderRegistry()
+        registry.add("buy1", True, Decimal("98"))
+        registry.add("sell1", False, Decimal("103"))
+        registry.add("buy2", True, Decimal("99"))
+        registry.add("sell2", False, Decimal("101"))
+        self.assertEqual(["buy2", "buy1"], registry.buy_ids)
+        self.assertEqual(["sell2", "sell1"], registry.sell_ids)
+
+        registry.add("buy3", True, Decimal("99.5"))
+        registry.remove("sell2")
+        self.assertEqual(["buy3", "buy2", "buy1"], registry.buy_ids)
+        self.assertEqual(["sell1"], registry.sell_ids)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import gc
+import tracemalloc
+import unittest
+
+from hummingbot.connector.exchange.binance.binance_in_flight_order import BinanceInFlightOrder
+from hummingbot.connector.exchange.crypto_com.crypto_com_in_flight_order import CryptoComInFlightOrder
+from hummingbot.core.event.events import (
+    OrderType,
+    TradeType,
+)
+from test.benchmark import (
+    benchmark,
+    cpu_time,
+    report,
+)
+
+
+def make_order(cls, i: int = 1, exchange_order_id: str = "1"):
+    return cls(f"buy-HBOT-USDT-{i}", exchange_order_id, "HBOT-USDT", OrderType.LIMIT, TradeType.BUY,
+               Decimal("100") + i, Decimal(i))
+
+
+class InFlightOrderBaseUnitTest(unittest.TestCase):
+    def test_json_cache(self):
+        order = make_order(BinanceInFlightOrder)
+        json = order.to_json()
+        self.assertIs(json, order.to_json())
+        self.assertEqual("101", json["price"])
+        version = order.version
+
+        order.executed_amount_base += Decimal("0.5")
+        order.last_state = "PARTIALLY_FILLED"
+        self.assertEqual(version + 2, order.version)
+        json = order.to_json()
+        self.assertEqual("0.5", json["executed_amount_base"])
+        self.assertEqual("PARTIALLY_FILLED", json["last_state"])
+        self.assertEqual(json, BinanceInFlightOrder.from_json(json).to_json())
+
+    def test_trading_pair_assets(self):
+        order = make_order(BinanceInFlightOrder)
+        self.assertEqual(("HBOT", "USDT"), (order.base_asset, order.quote_asset))
+        order.trading_pair = "ETH-BTC"
+        self.assertEqual(("ETH", "BTC"), (order.base_asset, order.quote_asset))
+        self.assertEqual("ETH-BTC", order.to_json()["trading_pair"])
+
+    def test_trade_ids(self):
+        order = make_order(BinanceInFlightOrder)
+        self.assertEqual(0, len(order.trade_id_set))
+        for i in range(20):
+            self.assertTrue(order.add_trade_id(str(i)))
+            self.assertFalse(order.add_trade_id(str(i)))
+            self.assertIn(str(i), order.trade_id_set)
+        self.assertEqual({str(i) for i in range(20)}, set(order.trade_id_set))
+        order.trade_id_set = ["a", "b", "a"]
+        self.assertEqual(["a", "b"], sorted(order.trade_id_set))
+        # Some exchanges report numeric trade ids.
+        self.assertTrue(order.add_trade_id(12))
+        self.assertFalse(order.add_trade_id(12))
+
+    def test_exchange_order_id(self):
+        ev_loop = asyncio.get_event_loop()
+        order = make_order(BinanceInFlightOrder, exchange_order_id=None)
+
+        async def update_later():
+            await asyncio.sleep(0.01)
+            order.update_exchange_order_id("42")
+
+        async def wait_for_exchange_order_id():
+            update_task = asyncio.ensure_future(update_later())
+            exchange_order_id = await order.get_exchange_order_id()
+            await update_task
+            return exchange_order_id
+
+        self.assertEqual("42", ev_loop.run_until_complete(wait_for_exchange_order_id()))
+        order = make_order(BinanceInFlightOrder, exchange_order_id=None)
+        order.update_exchange_order_id("43")
+        self.assertEqual("43", ev_loop.run_until_complete(order.get_exchange_order_id()))
+
+    def test_python_subclass(self):
+        order = make_order(CryptoComInFlightOrder)
+        self.assertFalse(hasattr(order, "__dict__"))
+        self.assertTrue(order.add_trade_id("1"))
+        order.cancelled_event.set()
+        self.assertTrue(order.cancelled_event.is_set())
+        self.assertEqual(order.to_json(), CryptoComInFlightOrder.from_json(order.to_json()).to_json())
+
+    @benchmark
+    def test_memory_and_tracking_states_time(self):
+        order_count = 10000
+        results = []
+        for cls in (BinanceInFlightOrder, CryptoComInFlightOrder):
+            args = [(f"buy-HBOT-USDT-{i}", str(i), "HBOT-USDT", OrderType.LIMIT, TradeType.BUY, Decimal(100 + i),
+                     Decimal(i + 1)) for i in range(order_count)]
+            gc.collect()
+            tracemalloc.start()
+            orders = {arg[0]: cls(*arg) for arg in args}
+            order_size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            def tracking_states():
+                return {key: value.to_json() for key, value in orders.items() if not value.is_done}
+
+            first_time = cpu_time(tracking_states)
+            repeat_time = cpu_time(tracking_states)
+            self.assertEqual(order_count, len(tracking_states()))
+            results.append((cls.__name__, order_size / order_count, first_time, repeat_time))
+
+        report("In flight orders at 10k orders, bytes per order and tracking_states CPU time, first and repeated: " +
+               ", ".join(f"{name} {size:.0f}B {first * 1e3:.1f}ms {repeat * 1e3:.1f}ms"
+                         for name, size, first, repeat in results) + ".")
+
+
+if __name__ == "__main__":
+    unittest.main()
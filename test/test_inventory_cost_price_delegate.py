@@ -1,9 +1,13 @@
+import asyncio
+import os
+import tempfile
 import unittest
 from decimal import Decimal
 
 from hummingbot.core.event.events import OrderFilledEvent, TradeType
 from hummingbot.core.event.events import TradeFee, OrderType
 from hummingbot.model.inventory_cost import InventoryCost
+from hummingbot.model.inventory_cost_fill import InventoryCostFill
 from hummingbot.model.sql_connection_manager import (
     SQLConnectionManager,
     SQLConnectionType,
@@ -24,7 +28,7 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
         cls._session = cls.trade_fill_sql.get_shared_session()
 
     def setUp(self):
-        for table in [InventoryCost.__table__]:
+        for table in [InventoryCost.__table__, InventoryCostFill.__table__]:
             self.trade_fill_sql.get_shared_session().execute(table.delete())
         self.delegate = InventoryCostPriceDelegate(
             self.trade_fill_sql, self.trading_pair
@@ -45,11 +49,13 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
         )
         # first event creates DB record
         self.delegate.process_order_fill_event(event)
+        self.delegate.flush()
         count = self._session.query(InventoryCost).count()
         self.assertEqual(count, 1)
 
         # second event causes update to existing record
         self.delegate.process_order_fill_event(event)
+        self.delegate.flush()
         record = InventoryCost.get_record(
             self._session, self.base_asset, self.quote_asset
         )
@@ -71,6 +77,7 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
         )
         self._session.add(record)
         self._session.commit()
+        self.delegate.reload()
 
         amount_sell = Decimal("0.5")
         price_sell = Decimal("10000")
@@ -86,6 +93,7 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
         )
 
         self.delegate.process_order_fill_event(event)
+        self.delegate.flush()
         record = InventoryCost.get_record(
             self._session, self.base_asset, self.quote_asset
         )
@@ -125,6 +133,7 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
         )
         self._session.add(record)
         self._session.commit()
+        self.delegate.reload()
         delegate_price = self.delegate.get_price()
         self.assertEqual(delegate_price, price)
 
@@ -140,4 +149,76 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
         )
         self._session.add(record)
         self._session.commit()
+        self.delegate.reload()
         self.assertIsNone(self.delegate.get_price())
+
+    def test_get_price_is_served_from_memory(self):
+        record = InventoryCost(
+            base_asset=self.base_asset,
+            quote_asset=self.quote_asset,
+            base_volume=Decimal("2"),
+            quote_volume=Decimal("18000"),
+        )
+        self._session.add(record)
+        self._session.commit()
+        delegate = InventoryCostPriceDelegate(self.trade_fill_sql, self.trading_pair)
+
+        # Changes made to the database after the delegate is created are not seen until it reloads.
+        self._session.execute(InventoryCost.__table__.delete())
+        self.assertEqual(Decimal("9000"), delegate.get_price())
+        delegate.reload()
+        self.assertIsNone(delegate.get_price())
+
+    def make_buy_events(self, count: int):
+        return [
+            OrderFilledEvent(
+                timestamp=i,
+                order_id=f"order{i}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal("9000") + i,
+                amount=Decimal("1"),
+                trade_fee=TradeFee(percent=Decimal("0"), flat_fees=[]),
+            ) for i in range(count)
+        ]
+
+    def test_fills_are_saved_then_coalesced(self):
+        for event in self.make_buy_events(10):
+            self.delegate.process_order_fill_event(event)
+
+        # The price reflects every fill straight away, and each fill is saved as it happens.
+        self.assertEqual(Decimal("9004.5"), self.delegate.get_price())
+        self.assertFalse(self.delegate.has_unsaved_changes)
+        self.assertEqual(10, self._session.query(InventoryCostFill).count())
+        self.assertEqual(0, self._session.query(InventoryCost).count())
+
+        self.delegate.flush()
+        self.assertEqual(0, self._session.query(InventoryCostFill).count())
+        record = InventoryCost.get_record(self._session, self.base_asset, self.quote_asset)
+        self.assertEqual(Decimal("10"), record.base_volume)
+        self.assertEqual(Decimal("90045"), record.quote_volume)
+
+        # Fills saved but not coalesced when the bot stopped are coalesced on the next start.
+        self.delegate.process_order_fill_event(self.make_buy_events(1)[0])
+        delegate = InventoryCostPriceDelegate(self.trade_fill_sql, self.trading_pair)
+        self.assertEqual(0, self._session.query(InventoryCostFill).count())
+        self.assertEqual(Decimal("99045") / Decimal("11"), delegate.get_price())
+
+    def test_fills_are_coalesced_off_the_event_loop(self):
+        db_fd, db_path = tempfile.mkstemp(suffix=".sqlite")
+        os.close(db_fd)
+        self.addCleanup(os.remove, db_path)
+        sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=db_path)
+        delegate = InventoryCostPriceDelegate(sql, self.trading_pair, flush_interval=0.01)
+        session = sql.get_shared_session()
+        for event in self.make_buy_events(3):
+            delegate.process_order_fill_event(event)
+        self.assertEqual(3, session.query(InventoryCostFill).count())
+
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.5))
+        session.commit()
+        self.assertEqual(0, session.query(InventoryCostFill).count())
+        record = InventoryCost.get_record(session, self.base_asset, self.quote_asset)
+        self.assertEqual(Decimal("3"), record.base_volume)
+        self.assertEqual(Decimal("27003"), record.quote_volume)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import importlib
+import json
+import pkgutil
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.core.utils import json_codec
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from test.benchmark import (
+    benchmark,
+    cpu_time,
+    report,
+)
+import test.integration.assets.mock_data as mock_data
+
+DEPTH_NUMERIC_SCHEMA = json_codec.NumericSchema(["bids", "asks"])
+
+
+def fixture_payloads() -> Dict[str, List[str]]:
+    """
+    The recorded responses of each exchange's fixture, encoded back to JSON.
+    """
+    payloads = {}
+    for module_info in pkgutil.iter_modules(mock_data.__path__):
+        if not module_info.name.startswith("fixture_") or module_info.name == "fixture_configs":
+            continue
+        module = importlib.import_module(f"{mock_data.__name__}.{module_info.name}")
+        for fixture_class in [v for k, v in vars(module).items() if k.startswith("Fixture")]:
+            exchange_payloads = payloads.setdefault(module_info.name[len("fixture_"):], [])
+            for name, value in vars(fixture_class).items():
+                if name.isupper() and isinstance(value, (dict, list)):
+                    exchange_payloads.append(json.dumps(value))
+    return payloads
+
+
+class JsonCodecUnitTest(unittest.TestCase):
+    def tearDown(self):
+        json_codec.set_backend(json_codec.AUTO_BACKEND)
+
+    def test_backends(self):
+        self.assertIn("json", json_codec.available_backends())
+        self.assertEqual(json_codec.available_backends()[0], json_codec.get_backend(json_codec.AUTO_BACKEND).name)
+        self.assertIsNone(json_codec.validate_backend("auto"))
+        self.assertIsNotNone(json_codec.validate_backend("simplejson"))
+        with self.assertRaises(ValueError):
+            json_codec.set_backend("simplejson")
+
+        for backend in json_codec.available_backends():
+            json_codec.set_backend(backend)
+            self.assertEqual(backend, json_codec.backend_name())
+            self.assertEqual({"a": [1, "2", 3.5]}, json_codec.loads('{"a": [1, "2", 3.5]}'))
+            self.assertEqual({"a": [1, "2", 3.5]}, json_codec.loads(b'{"a": [1, "2", 3.5]}'))
+            self.assertEqual('{"a":[1,"2"]}', json_codec.dumps({"a": [1, "2"]}))
+
+    def test_numeric_schema(self):
+        message = '{"stream": "ethbtc@depth", "data": {"u": 7, "b": [["0.1", "2", "id1"]], "a": [], "s": "ETHBTC"}}'
+        schema = json_codec.NumericSchema(["b", "a"])
+        decoded = json_codec.loads(message, schema)
+        self.assertEqual({"stream": "ethbtc@depth", "data": {"u": 7, "b": [[0.1, 2.0, "id1"]], "a": [], "s": "ETHBTC"}},
+                         decoded)
+
+        decimal_schema = json_codec.NumericSchema(["b"], Decimal)
+        decoded = json_codec.loads_with(decimal_schema)(message)
+        self.assertEqual([[Decimal("0.1"), Decimal("2"), "id1"]], decoded["data"]["b"])
+
+    def test_backends_decode_fixtures(self):
+        payloads = fixture_payloads()
+        self.assertIn("binance", payloads)
+        for backend in json_codec.available_backends():
+            json_codec.set_backend(backend)
+            for exchange, exchange_payloads in payloads.items():
+                self.assertEqual([json.loads(p) for p in exchange_payloads],
+                                 [json_codec.loads(p) for p in exchange_payloads], f"{backend} {exchange}")
+
+    @benchmark
+    def test_decode_throughput(self):
+        payloads = fixture_payloads()
+        backends = json_codec.available_backends()
+        rounds = 20
+        rows = [f"{'exchange':<18}" + "".join(f"{backend:>12}" for backend in backends)]
+        for exchange, exchange_payloads in sorted(payloads.items()):
+            size = sum(len(p) for p in exchange_payloads)
+            row = f"{exchange:<18}"
+            for backend in backends:
+                json_codec.set_backend(backend)
+
+                def decode_payloads():
+                    for payload in exchange_payloads:
+                        json_codec.loads(payload)
+
+                row += f"{size / cpu_time(decode_payloads, calls=rounds) / 1e6:>12.1f}"
+            rows.append(row)
+        report(f"Decode throughput over the mock data fixtures (MB/s, {rounds} rounds):\n" + "\n".join(rows))
+
+    def test_parse_numbers_once(self):
+        snapshot: Dict[str, Any] = {
+            "lastUpdateId": 1,
+            "bids": [[f"{100 - i * 0.01:.2f}", "1.5"] for i in range(500)],
+            "asks": [[f"{101 + i * 0.01:.2f}", "1.5"] for i in range(500)],
+        }
+        payload = json.dumps(snapshot)
+
+        def read_levels(content: Dict[str, Any]):
+            message = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {**content, "update_id": 1}, 0)
+            return message.bids, message.asks
+
+        string_levels = read_levels(json_codec.loads(payload))
+        float_levels = read_levels(json_codec.loads(payload, DEPTH_NUMERIC_SCHEMA))
+        self.assertEqual(string_levels, float_levels)
+        self.assertIsInstance(json_codec.loads(payload, DEPTH_NUMERIC_SCHEMA)["bids"][0][0], float)
+
+
+if __name__ == "__main__":
+    unittest.main()
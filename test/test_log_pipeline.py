@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from typing import Optional
+import unittest
+
+from hummingbot.logger.log_pipeline import (
+    LogPipeline,
+    LogPipelineHandler,
+)
+
+FORMAT = "%(asctime)s - %(process)d - %(name)s - %(levelname)s - %(message)s"
+
+
+class LogPipelineUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmp_dir.name, "logs.log")
+        self.file_handler = logging.FileHandler(self.file_path)
+        self.file_handler.name = "file_handler"
+        self.file_handler.setLevel(logging.DEBUG)
+        self.file_handler.setFormatter(logging.Formatter(FORMAT))
+        self.logger = logging.getLogger("test.log_pipeline")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.logger.addHandler(self.file_handler)
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        self.file_handler.close()
+        self.tmp_dir.cleanup()
+
+    def read_lines(self):
+        with open(self.file_path) as f:
+            return f.read().splitlines()
+
+    def test_records_written_in_order(self):
+        pipeline = LogPipeline()
+        pipeline.install(["file_handler"], ["test.log_pipeline"])
+        self.assertTrue(pipeline.started)
+        self.assertNotIn(self.file_handler, self.logger.handlers)
+        self.assertTrue(any(isinstance(h, LogPipelineHandler) for h in self.logger.handlers))
+        for i in range(1000):
+            self.logger.debug("Record %d", i)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            self.logger.error("Failed.", exc_info=True)
+        pipeline.stop()
+
+        lines = self.read_lines()
+        self.assertTrue(lines[0].endswith("DEBUG - Record 0"))
+        self.assertTrue(lines[999].endswith("DEBUG - Record 999"))
+        self.assertTrue(lines[1000].endswith("ERROR - Failed."))
+        self.assertEqual("ValueError: boom", lines[-1])
+        self.assertEqual(1001, pipeline.processed_count)
+        self.assertEqual(0, pipeline.dropped_count)
+
+        pipeline.uninstall()
+        self.assertIn(self.file_handler, self.logger.handlers)
+        self.assertFalse(any(isinstance(h, LogPipelineHandler) for h in self.logger.handlers))
+
+    def test_drops_when_full(self):
+        pipeline = LogPipeline(capacity=10)
+        self.logger.removeHandler(self.file_handler)
+        self.logger.addHandler(LogPipelineHandler(pipeline, [self.file_handler]))
+        # Not started yet, the queue fills up.
+        for i in range(25):
+            self.logger.info("Record %d", i)
+        self.assertEqual(10, pipeline.queue_size)
+        self.assertEqual(15, pipeline.dropped_count)
+        self.assertEqual({"INFO": 15}, pipeline.dropped_by_level)
+
+        pipeline.start()
+        pipeline.stop()
+        lines = self.read_lines()
+        self.assertEqual(11, len(lines))
+        self.assertTrue(lines[9].endswith("Record 9"))
+        self.assertIn("15 log records were dropped", lines[10])
+
+    def log_storm(self, records: int, pipeline: Optional[LogPipeline] = None) -> float:
+        """
+        Returns the time the event loop spent in logging calls during a burst of debug logs, i.e. could not serve
+        anything else.
+        """
+        ev_loop = asyncio.new_event_loop()
+        if pipeline is not None:
+            pipeline.install(["file_handler"], ["test.log_pipeline"])
+
+        async def storm() -> float:
+            blocked = 0.0
+            for i in range(records):
+                start = time.perf_counter()
+                self.logger.debug("Order book diff %d processed for %s.", i, "ETH-USDT")
+                blocked += time.perf_counter() - start
+                if i % 100 == 0:
+                    await asyncio.sleep(0)
+            return blocked
+
+        blocked_time = ev_loop.run_until_complete(storm())
+        ev_loop.close()
+        if pipeline is not None:
+            pipeline.uninstall()
+        return blocked_time
+
+    def test_log_storm_event_loop_blocking(self):
+        records = 5000
+        self.log_storm(records)
+        self.log_storm(records, LogPipeline(capacity=records))
+        self.assertEqual(records * 2, len(self.read_lines()))
+
+        # The same storm with a disk that takes 100us per write, e.g. a busy or network mounted volume.
+        self.file_handler.flush = lambda: time.sleep(1e-4)
+        slow_direct_time = self.log_storm(records)
+        slow_pipeline_time = self.log_storm(records, LogPipeline(capacity=records))
+        self.assertLess(slow_pipeline_time, slow_direct_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from typing import List
+import unittest
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.market_data_hub import MarketDataHub
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+
+
+class MockDataSource:
+    def __init__(self):
+        self.order_book_create_function = None
+
+
+class MockOrderBookTracker:
+    instances: List["MockOrderBookTracker"] = []
+
+    def __init__(self, trading_pairs: List[str], domain: str = "com"):
+        self.trading_pairs = trading_pairs
+        self.domain = domain
+        self.data_source = MockDataSource()
+        self.order_books = {}
+        self.started = False
+        self.stopped = False
+        MockOrderBookTracker.instances.append(self)
+
+    @property
+    def exchange_name(self) -> str:
+        return "mock_exchange"
+
+    @property
+    def ready(self) -> bool:
+        return self.started
+
+    def start(self):
+        self.started = True
+        self.order_books = {trading_pair: OrderBook() for trading_pair in self.trading_pairs}
+
+    def stop(self):
+        self.stopped = True
+
+
+class MarketDataHubUnitTest(unittest.TestCase):
+    def setUp(self):
+        MockOrderBookTracker.instances = []
+        self.hub = MarketDataHub()
+
+    def test_subscriptions_before_start_share_one_tracker(self):
+        sub_1 = self.hub.subscribe("mock", ["ETH-USDT"], MockOrderBookTracker)
+        sub_2 = self.hub.subscribe("mock", ["BTC-USDT", "ETH-USDT"], MockOrderBookTracker)
+        sub_1.start()
+        sub_2.start()
+        self.assertEqual(1, len(self.hub.trackers))
+        tracker = self.hub.trackers[0]
+        self.assertEqual(["BTC-USDT", "ETH-USDT"], tracker.trading_pairs)
+        self.assertTrue(tracker.started)
+        self.assertIs(sub_1.order_books["ETH-USDT"], sub_2.order_books["ETH-USDT"])
+        self.assertEqual(["ETH-USDT"], list(sub_1.order_books.keys()))
+        self.assertTrue(sub_1.ready)
+
+    def test_domains_are_tracked_separately(self):
+        self.hub.subscribe("mock", ["ETH-USDT"], MockOrderBookTracker).start()
+        self.hub.subscribe("mock", ["ETH-USDT"], MockOrderBookTracker, domain="us", connector_name="mock_us").start()
+        self.assertEqual(2, len(self.hub.trackers))
+        self.assertEqual("us", self.hub.get_tracker("mock", "us", "ETH-USDT").domain)
+        self.assertEqual("mock_us", self.hub.get_tracker("mock", "us", "ETH-USDT").connector_name)
+        self.assertEqual("mock", self.hub.get_tracker("mock", None, "ETH-USDT").connector_name)
+
+    def test_pairs_added_after_start_get_their_own_tracker(self):
+        sub_1 = self.hub.subscribe("mock", ["ETH-USDT"], MockOrderBookTracker)
+        sub_1.start()
+        sub_2 = self.hub.subscribe("mock", ["ETH-USDT", "BTC-USDT"], MockOrderBookTracker)
+        sub_2.start()
+        self.assertEqual(2, len(self.hub.trackers))
+        self.assertIs(self.hub.get_tracker("mock", None, "ETH-USDT"), MockOrderBookTracker.instances[0])
+        self.assertEqual(["BTC-USDT"], self.hub.get_tracker("mock", None, "BTC-USDT").trading_pairs)
+
+    def test_tracker_stops_with_last_subscription(self):
+        sub_1 = self.hub.subscribe("mock", ["ETH-USDT"], MockOrderBookTracker)
+        sub_2 = self.hub.subscribe("mock", ["ETH-USDT"], MockOrderBookTracker)
+        sub_1.start()
+        sub_2.start()
+        tracker = self.hub.trackers[0]
+        sub_1.stop()
+        self.assertFalse(tracker.stopped)
+        sub_2.stop()
+        self.assertTrue(tracker.stopped)
+        self.assertEqual(0, len(self.hub.trackers))
+        self.assertFalse(sub_1.ready)
+
+        # Restarting a subscription brings up a fresh tracker.
+        sub_1.start()
+        self.assertEqual(1, len(self.hub.trackers))
+        self.assertIsNot(tracker, self.hub.trackers[0])
+
+    def test_stop_before_start_is_a_no_op(self):
+        sub = self.hub.subscribe("mock", ["ETH-USDT"], MockOrderBookTracker)
+        sub.stop()
+        self.assertEqual(0, self.hub.status_dict["active_subscriptions"])
+        sub.start()
+        self.assertEqual(1, self.hub.status_dict["active_subscriptions"])
+
+    def test_order_book_overlays(self):
+        sub_1 = self.hub.subscribe("mock", ["ETH-USDT"], MockOrderBookTracker, order_book_overlay=CompositeOrderBook)
+        sub_2 = self.hub.subscribe("mock", ["ETH-USDT"], MockOrderBookTracker, order_book_overlay=CompositeOrderBook)
+        sub_3 = self.hub.subscribe("mock", ["ETH-USDT"], MockOrderBookTracker)
+        for sub in (sub_1, sub_2, sub_3):
+            sub.start()
+        shared_order_book = sub_3.order_books["ETH-USDT"]
+        shared_order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        overlay = sub_1.order_books["ETH-USDT"]
+        self.assertIs(overlay, sub_1.order_books["ETH-USDT"])
+        self.assertIsNot(overlay, sub_2.order_books["ETH-USDT"])
+        self.assertIs(shared_order_book, overlay.order_book)
+
+        # Simulated fills stay with the overlay they were recorded on.
+        overlay.record_filled_order(OrderFilledEvent(1, "order-1", "ETH-USDT", TradeType.BUY, OrderType.MARKET, 101,
+                                                     0.4, TradeFee(0)))
+        self.assertEqual([OrderBookRow(101, 0.6, 1)], list(overlay.ask_entries()))
+        self.assertEqual([OrderBookRow(101, 1, 1)], list(sub_2.order_books["ETH-USDT"].ask_entries()))
+        self.assertEqual([OrderBookRow(101, 1, 1)], list(shared_order_book.ask_entries()))
+
+        # Updates of the shared order book reach every overlay, along with its trades.
+        trade_logger = EventLogger()
+        overlay.add_listener(OrderBookEvent.TradeEvent, trade_logger)
+        shared_order_book.apply_diffs([], [OrderBookRow(102, 2, 2)], 2)
+        self.assertEqual([OrderBookRow(101, 0.6, 1), OrderBookRow(102, 2, 2)], list(overlay.ask_entries()))
+        shared_order_book.apply_trade(OrderBookTradeEvent("ETH-USDT", 2, TradeType.SELL, 99, 1))
+        self.assertEqual(1, len(trade_logger.event_log))
+        self.assertEqual(99, overlay.last_trade_price)
+
+    def test_overlay_event_forwarding(self):
+        shared_order_book = OrderBook()
+        overlay = CompositeOrderBook(shared_order_book)
+        # Without listeners of its own, the overlay doesn't listen to the shared order book.
+        self.assertEqual([], overlay.forwarded_event_tags)
+        self.assertEqual([], shared_order_book.get_listeners(OrderBookEvent.TopChangedEvent))
+
+        top_logger = EventLogger()
+        overlay.add_listener(OrderBookEvent.TopChangedEvent, top_logger)
+        self.assertEqual([OrderBookEvent.TopChangedEvent.value], overlay.forwarded_event_tags)
+        shared_order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        self.assertEqual(1, len(top_logger.event_log))
+
+        overlay.remove_listener(OrderBookEvent.TopChangedEvent, top_logger)
+        self.assertEqual([], overlay.forwarded_event_tags)
+        self.assertEqual([], shared_order_book.get_listeners(OrderBookEvent.TopChangedEvent))
+
+        # Listeners garbage collected without being removed: the overlay stops listening on the next event.
+        overlay.add_listener(OrderBookEvent.TradeEvent, EventLogger())
+        shared_order_book.apply_trade(OrderBookTradeEvent("ETH-USDT", 2, TradeType.SELL, 99, 1))
+        self.assertEqual([], overlay.forwarded_event_tags)
+        self.assertEqual([], shared_order_book.get_listeners(OrderBookEvent.TradeEvent))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import csv
+import os
+import tempfile
+import time
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.utils.market_data_latency import (
+    BUCKET_BOUNDS_MS,
+    LatencyHistogram,
+    LatencyStage,
+    MarketDataLatencyTracer,
+    set_tracing_enabled,
+)
+
+
+class MockOrderBookTracker(OrderBookTracker):
+    pass
+
+
+class MarketDataLatencyUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        MarketDataLatencyTracer._shared_instance = None
+        self.tracer = MarketDataLatencyTracer.get_instance()
+        self.tracker = MockOrderBookTracker(None, ["ETH-USDT"])
+        self.tracker.connector_name = "mock_us"
+
+    def tearDown(self):
+        MarketDataLatencyTracer._shared_instance = None
+
+    @staticmethod
+    def diff_message(update_id: int, exchange_timestamp: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "ETH-USDT",
+            "update_id": update_id,
+            "bids": [["100", "1"]],
+            "asks": [["101", "1"]],
+            "exchange_timestamp": exchange_timestamp
+        }, time.time())
+
+    def apply(self, order_book: OrderBook, message: OrderBookMessage):
+        self.tracker._apply_diff_message("ETH-USDT", order_book, message, message.bids, message.asks,
+                                         message.update_id)
+
+    def test_histogram(self):
+        histogram = LatencyHistogram()
+        for latency_ms in [0.05, 3, 3, 3, 20000]:
+            histogram.add(latency_ms)
+        self.assertEqual(5, histogram.count)
+        self.assertEqual(0.05, histogram.min_ms)
+        self.assertEqual(20000, histogram.max_ms)
+        self.assertEqual(1, histogram.counts[0])
+        self.assertEqual(3, histogram.counts[BUCKET_BOUNDS_MS.index(5)])
+        self.assertEqual(1, histogram.counts[-1])
+        self.assertEqual(5, histogram.percentile_ms(50))
+        self.assertEqual(20000, histogram.percentile_ms(99))
+
+    def test_connector_name(self):
+        self.assertEqual("MockOrderBookTracker", MockOrderBookTracker(None, ["ETH-USDT"]).connector_name)
+        set_tracing_enabled("Yes")
+        self.apply(OrderBook(), self.diff_message(1, time.time()))
+        self.assertEqual({"mock_us"}, {exchange for exchange, _, _ in self.tracer.histograms})
+
+    def test_tracing_off(self):
+        self.assertFalse(self.tracer.enabled)
+        message = self.diff_message(1, time.time())
+        self.assertIsNone(message.received_timestamp)
+        self.apply(OrderBook(), message)
+        self.assertEqual(0, len(self.tracer.histograms))
+
+    def test_trace_stages(self):
+        set_tracing_enabled("Yes")
+        self.assertTrue(self.tracer.enabled)
+        order_book = OrderBook()
+        # Sent by the exchange 50ms ago, in milliseconds as binance does.
+        message = self.diff_message(1, (time.time() - 0.05) * 1e3)
+        self.assertIsNotNone(message.received_timestamp)
+        self.apply(order_book, message)
+        self.assertEqual(100, order_book.get_price(False))
+
+        receive = self.tracer.histograms[("mock_us", "ETH-USDT", LatencyStage.RECEIVE)]
+        self.assertEqual(1, receive.count)
+        self.assertGreaterEqual(receive.min_ms, 50)
+        self.assertLess(receive.min_ms, 1000)
+        self.assertEqual(1, self.tracer.histograms[("mock_us", "ETH-USDT", LatencyStage.QUEUE)].count)
+        self.assertEqual(1, self.tracer.histograms[("mock_us", "ETH-USDT", LatencyStage.APPLY)].count)
+        self.assertNotIn(("mock_us", "ETH-USDT", LatencyStage.STRATEGY), self.tracer.histograms)
+
+        # Only the oldest diff applied since the last tick is timed to the strategy.
+        self.apply(order_book, self.diff_message(2, time.time() * 1e3))
+        self.tracer.observe_tick(time.time() + 0.2)
+        strategy = self.tracer.histograms[("mock_us", "ETH-USDT", LatencyStage.STRATEGY)]
+        self.assertEqual(1, strategy.count)
+        self.assertGreaterEqual(strategy.min_ms, 200)
+        self.tracer.observe_tick()
+        self.assertEqual(1, strategy.count)
+
+        df = self.tracer.summary_df()
+        self.assertEqual(["receive", "queue", "apply", "strategy"], list(df["Stage"]))
+        self.assertEqual([2, 2, 2, 1], list(df["Count"]))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "latency.csv")
+            self.tracer.export_csv(file_path)
+            with open(file_path) as f:
+                rows = list(csv.reader(f))
+        self.assertEqual(5, len(rows))
+        self.assertEqual(len(df.columns) + len(BUCKET_BOUNDS_MS) + 1, len(rows[0]))
+
+        set_tracing_enabled("False")
+        self.tracer.reset()
+        self.assertEqual(0, len(self.tracer.histograms))
+
+    def test_tracing_overhead(self):
+        diffs = 5000
+        rows = [OrderBookRow(100.0 - i * 0.01, 1.0, 0) for i in range(10)]
+        timings = {}
+        for enabled in (False, True):
+            self.tracer.enabled = enabled
+            order_book = OrderBook()
+            messages = [self.diff_message(i, time.time()) for i in range(diffs)]
+            start = time.perf_counter()
+            for message in messages:
+                self.tracker._apply_diff_message("ETH-USDT", order_book, message, rows, rows, message.update_id)
+            timings[enabled] = time.perf_counter() - start
+        # Tracing takes a couple of clock reads and histogram updates per diff.
+        self.assertLess(timings[True] - timings[False], diffs * 50e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import time
+from typing import (
+    Any,
+    Dict,
+)
+import unittest
+
+from sqlalchemy import event
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.exchange.binance.binance_in_flight_order import BinanceInFlightOrder
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderType,
+    TradeType,
+)
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_delta import MarketStateDelta
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+
+config_path = "test_config"
+strategy_name = "test_strategy"
+trading_pair = "HBOT-USDT"
+
+
+class MockConnector(ConnectorBase):
+    def __init__(self):
+        super().__init__()
+        self.orders: Dict[str, BinanceInFlightOrder] = {}
+        self.order_count = 0
+
+    @property
+    def tracking_states(self) -> Dict[str, Any]:
+        return {key: value.to_json() for key, value in self.orders.items() if not value.is_done}
+
+    def restore_tracking_states(self, saved_states: Dict[str, Any]):
+        self.orders.update({key: BinanceInFlightOrder.from_json(value) for key, value in saved_states.items()})
+
+    def add_order(self) -> BinanceInFlightOrder:
+        self.order_count += 1
+        order = BinanceInFlightOrder(f"buy-HBOT-USDT-{self.order_count}", str(self.order_count), trading_pair,
+                                     OrderType.LIMIT, TradeType.BUY, Decimal("100"), Decimal("1"))
+        self.orders[order.client_order_id] = order
+        return order
+
+    def create_order(self):
+        order = self.add_order()
+        self.trigger_event(MarketEvent.BuyOrderCreated,
+                           BuyOrderCreatedEvent(time.time(), OrderType.LIMIT, trading_pair, order.amount, order.price,
+                                                order.client_order_id, order.exchange_order_id))
+
+    def cancel_order(self, order_id: str):
+        del self.orders[order_id]
+        self.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(time.time(), order_id))
+
+
+class FullSnapshotMarketsRecorder(MarketsRecorder):
+    """
+    Saves the whole tracking states on every order event, as the recorder did before market state deltas.
+    """
+
+    def save_market_states(self, config_file_path: str, market: ConnectorBase, no_commit: bool = False):
+        market_states = self._query_market_states(config_file_path, market)
+        if market_states is not None:
+            market_states.saved_state = market.tracking_states
+            market_states.timestamp = self.db_timestamp
+        else:
+            self.session.add(MarketState(config_file_path=config_file_path,
+                                         market=market.display_name,
+                                         timestamp=self.db_timestamp,
+                                         saved_state=market.tracking_states))
+        if not no_commit:
+            self.session.commit()
+
+
+class MarketsRecorderUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=":memory:")
+        self.connector = MockConnector()
+        self.recorder = MarketsRecorder(self.sql, [self.connector], config_path, strategy_name)
+
+    def delta_count(self) -> int:
+        return self.sql.get_shared_session().query(MarketStateDelta).count()
+
+    def restored_tracking_states(self) -> Dict[str, Any]:
+        connector = MockConnector()
+        recorder = MarketsRecorder(self.sql, [connector], config_path, strategy_name)
+        recorder.restore_market_states(config_path, connector)
+        return connector.tracking_states
+
+    def test_deltas_and_restore(self):
+        orders = [self.connector.add_order() for _ in range(3)]
+        self.recorder.save_market_states(config_path, self.connector)
+        self.assertEqual(3, self.delta_count())
+        # Unchanged orders aren't saved again.
+        self.recorder.save_market_states(config_path, self.connector)
+        self.assertEqual(3, self.delta_count())
+
+        orders[0].executed_amount_base = Decimal("0.5")
+        orders[1].last_state = "CANCELED"
+        self.connector.add_order()
+        self.recorder.save_market_states(config_path, self.connector)
+        self.assertEqual(6, self.delta_count())
+        self.assertEqual(self.connector.tracking_states, self.restored_tracking_states())
+
+        # Restoring compacts the deltas into the market state.
+        self.assertEqual(0, self.delta_count())
+        self.assertEqual(self.connector.tracking_states,
+                         self.recorder.get_market_states(config_path, self.connector).saved_state)
+
+    def test_compaction(self):
+        self.recorder.start()
+        for _ in range(MarketsRecorder.MARKET_STATE_COMPACTION_MIN_DELTAS):
+            self.connector.create_order()
+        self.assertEqual(MarketsRecorder.MARKET_STATE_COMPACTION_MIN_DELTAS, self.delta_count())
+        self.connector.cancel_order("buy-HBOT-USDT-1")
+        self.assertEqual(0, self.delta_count())
+        market_states = self.recorder._query_market_states(config_path, self.connector)
+        self.assertEqual(self.connector.tracking_states, market_states.saved_state)
+
+        self.connector.cancel_order("buy-HBOT-USDT-2")
+        self.assertEqual(1, self.delta_count())
+        self.assertEqual(self.connector.tracking_states, self.restored_tracking_states())
+        self.recorder.stop()
+
+    def test_bytes_written_per_order_event(self):
+        open_order_count = 200
+        event_count = 200
+        bytes_per_event = {}
+        for name, recorder_class in (("full snapshot", FullSnapshotMarketsRecorder), ("deltas", MarketsRecorder)):
+            sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=":memory:")
+            connector = MockConnector()
+            recorder = recorder_class(sql, [connector], config_path, strategy_name)
+            recorder.start()
+            for _ in range(open_order_count):
+                connector.create_order()
+            written_bytes = []
+
+            def count_bytes(conn, cursor, statement, parameters, context, executemany):
+                if statement.split(None, 1)[0] not in ("INSERT", "UPDATE", "DELETE"):
+                    return
+                rows = parameters if executemany else [parameters]
+                written_bytes.append(len(statement) + sum(len(str(value)) for row in rows for value in row))
+
+            event.listen(sql.engine, "before_cursor_execute", count_bytes)
+            # Orders replaced one by one: as many order events as open orders stay open.
+            for i in range(event_count // 2):
+                connector.create_order()
+                connector.cancel_order(f"buy-HBOT-USDT-{i + 1}")
+            event.remove(sql.engine, "before_cursor_execute", count_bytes)
+            recorder.stop()
+
+            self.assertEqual(connector.tracking_states, recorder.get_market_states(config_path, connector).saved_state)
+            bytes_per_event[name] = sum(written_bytes) / event_count
+
+        self.assertLess(bytes_per_event["deltas"], bytes_per_event["full snapshot"] / 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from typing import (
+    Dict,
+    List,
+    Union,
+)
+import unittest
+
+from hexbytes import HexBytes
+from web3.datastructures import AttributeDict
+
+from hummingbot.core.event.events import NewBlocksWatcherEvent
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.wallet.ethereum.watcher.new_blocks_watcher import NewBlocksWatcher
+
+
+class MockEth:
+    """
+    Stands in for the JSON-RPC node, serving a chain of blocks and counting the calls made.
+    """
+    def __init__(self, head_block_number: int):
+        self.blocks_by_number: Dict[int, AttributeDict] = {}
+        self.blocks_by_hash: Dict[HexBytes, AttributeDict] = {}
+        self.calls: Dict[str, int] = {"eth_blockNumber": 0, "eth_getBlockByNumber": 0, "eth_getBlockByHash": 0}
+        self.extend_chain(0, head_block_number)
+
+    def extend_chain(self, from_block_number: int, to_block_number: int, fork: str = ""):
+        for number in range(from_block_number, to_block_number + 1):
+            parent = self.blocks_by_number.get(number - 1)
+            block = AttributeDict({
+                "number": number,
+                "hash": HexBytes(f"{fork}{number}".encode().rjust(32, b"\x00")),
+                "parentHash": parent.hash if parent is not None else HexBytes(b"\x00" * 32),
+                "logsBloom": HexBytes(b"\x00" * 256),
+                "timestamp": 1600000000 + number * 13,
+            })
+            self.blocks_by_number[number] = block
+            self.blocks_by_hash[block.hash] = block
+
+    @property
+    def blockNumber(self) -> int:
+        self.calls["eth_blockNumber"] += 1
+        return max(self.blocks_by_number.keys())
+
+    def getBlock(self, block_identifier: Union[int, HexBytes], full_transactions: bool = False) -> AttributeDict:
+        if isinstance(block_identifier, int):
+            self.calls["eth_getBlockByNumber"] += 1
+            return self.blocks_by_number.get(block_identifier)
+        self.calls["eth_getBlockByHash"] += 1
+        return self.blocks_by_hash.get(block_identifier)
+
+
+class MockWeb3:
+    def __init__(self, head_block_number: int):
+        self.eth = MockEth(head_block_number)
+
+
+class NewBlocksWatcherRangeScanUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.w3 = MockWeb3(100)
+        self.watcher = NewBlocksWatcher(self.w3, range_scan_enabled=True, max_blocks_per_range=20)
+        self.event_logger = EventLogger()
+        self.watcher.add_listener(NewBlocksWatcherEvent.NewBlocks, self.event_logger)
+        # Sets the watcher at the current head, without leaving the fetch loop running.
+        self.ev_loop.run_until_complete(self.watcher.start_network())
+        self.ev_loop.run_until_complete(self.watcher.stop_network())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+    def catch_up(self) -> int:
+        rounds = 0
+        while not self.ev_loop.run_until_complete(self.watcher.fetch_new_block_range()):
+            rounds += 1
+        return rounds + 1
+
+    def emitted_block_numbers(self) -> List[int]:
+        return [block.number for blocks in self.event_logger.event_log for block in blocks]
+
+    def test_catch_up_by_ranges(self):
+        self.w3.eth.extend_chain(101, 145)
+        initial_calls = dict(self.w3.eth.calls)
+        rounds = self.catch_up()
+        self.assertEqual(3, rounds)
+        self.assertEqual(list(range(100, 146)), self.emitted_block_numbers())
+        self.assertEqual(3, len(self.event_logger.event_log))
+        self.assertEqual(145, self.watcher.block_number)
+
+        # One header request per block, plus one chain head poll per range.
+        block_calls = self.w3.eth.calls["eth_getBlockByNumber"] - initial_calls["eth_getBlockByNumber"]
+        head_calls = self.w3.eth.calls["eth_blockNumber"] - initial_calls["eth_blockNumber"]
+        self.assertEqual(46, block_calls)
+        self.assertEqual(3, head_calls)
+        self.assertLess((block_calls + head_calls) / 46, 1.1)
+
+    def test_caught_up(self):
+        self.catch_up()
+        self.event_logger.clear()
+        self.assertTrue(self.ev_loop.run_until_complete(self.watcher.fetch_new_block_range()))
+        self.assertEqual(0, len(self.event_logger.event_log))
+
+    def test_block_reorganization(self):
+        self.w3.eth.extend_chain(101, 110)
+        self.catch_up()
+        self.event_logger.clear()
+
+        # Blocks 109 and 110 are replaced, and the new chain goes on to 112.
+        self.w3.eth.extend_chain(109, 112, fork="b")
+        self.catch_up()
+        self.assertEqual([109, 110, 111, 112], self.emitted_block_numbers())
+        emitted_hashes = [block.hash for blocks in self.event_logger.event_log for block in blocks]
+        self.assertEqual([self.w3.eth.blocks_by_number[n].hash for n in range(109, 113)], emitted_hashes)
+        self.assertEqual(2, self.w3.eth.calls["eth_getBlockByHash"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import time
+from typing import (
+    Callable,
+    Tuple,
+)
+import unittest
+
+import pandas as pd
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from test.benchmark import (
+    benchmark,
+    cpu_time,
+    report,
+)
+
+
+def build_order_book(levels: int, order_book: OrderBook = None) -> OrderBook:
+    order_book = order_book if order_book is not None else OrderBook()
+    bids = [OrderBookRow(100.0 - i * 0.01, 1.0 + i % 7, 1) for i in range(levels)]
+    asks = [OrderBookRow(100.01 + i * 0.01, 1.0 + i % 5, 1) for i in range(levels)]
+    order_book.apply_snapshot(bids, asks, 1)
+    return order_book
+
+
+class OrderBookTopLevelsUnitTest(unittest.TestCase):
+    def test_top_levels(self):
+        order_book = build_order_book(100)
+        bids, asks = order_book.top_levels(3)
+        self.assertEqual([100.0, 99.99, 99.98], [round(row.price, 2) for row in bids])
+        self.assertEqual([100.01, 100.02, 100.03], [round(row.price, 2) for row in asks])
+        self.assertEqual(list(order_book.bid_entries())[:3], bids)
+        self.assertEqual(list(order_book.ask_entries())[:3], asks)
+
+        bids, asks = order_book.top_levels(500)
+        self.assertEqual(100, len(bids))
+        self.assertEqual(100, len(asks))
+        self.assertEqual(([], []), OrderBook().top_levels(5))
+
+    def test_version(self):
+        order_book = OrderBook()
+        self.assertEqual(0, order_book.version)
+        build_order_book(10, order_book)
+        self.assertEqual(1, order_book.version)
+        order_book.apply_diffs([OrderBookRow(100.0, 0, 2)], [], 2)
+        self.assertEqual(2, order_book.version)
+        order_book.apply_trade(OrderBookTradeEvent("ETH-USDT", time.time(), TradeType.BUY, 100.01, 1.0))
+        self.assertEqual(3, order_book.version)
+        order_book.last_trade_price = 100.02
+        self.assertEqual(4, order_book.version)
+        order_book.top_levels(5)
+        order_book.snapshot
+        self.assertEqual(4, order_book.version)
+
+    def test_composite_order_book(self):
+        order_book = build_order_book(10, CompositeOrderBook())
+        version = order_book.version
+        bids, asks = order_book.top_levels(2)
+        self.assertEqual([1.0, 2.0], [row.amount for row in bids])
+        self.assertEqual([1.0, 2.0], [row.amount for row in asks])
+
+        # Filled orders are taken out of the composite book.
+        order_book.record_filled_order(OrderFilledEvent(2, "buy1", "ETH-USDT", TradeType.BUY, OrderType.LIMIT,
+                                                        asks[0].price, 0.5, TradeFee(0)))
+        self.assertGreater(order_book.version, version)
+        bids, asks = order_book.top_levels(2)
+        self.assertEqual([0.5, 2.0], [row.amount for row in asks])
+
+        version = order_book.version
+        order_book.clear_traded_order_book()
+        self.assertGreater(order_book.version, version)
+        self.assertEqual(1.0, order_book.top_levels(1)[1][0].amount)
+
+    @staticmethod
+    def live_views(order_book: OrderBook, lines: int) -> Tuple[Callable[[], str], Callable[[], str]]:
+        # How the live order book view rendered a refresh before: two full snapshots cut down to the top lines.
+        def snapshot_view() -> str:
+            bids = order_book.snapshot[0][["price", "amount"]].head(lines)
+            asks = order_book.snapshot[1][["price", "amount"]].head(lines)
+            return pd.concat([bids, asks], axis=1).to_string(index=False)
+
+        def top_levels_view() -> str:
+            bids, asks = order_book.top_levels(lines)
+            bids = pd.DataFrame(data=bids, columns=OrderBookRow._fields, dtype="float64")[["price", "amount"]]
+            asks = pd.DataFrame(data=asks, columns=OrderBookRow._fields, dtype="float64")[["price", "amount"]]
+            return pd.concat([bids, asks], axis=1).to_string(index=False)
+
+        return snapshot_view, top_levels_view
+
+    def test_live_view(self):
+        lines = 35
+        order_book = build_order_book(500)
+        snapshot_view, top_levels_view = self.live_views(order_book, lines)
+        self.assertEqual(snapshot_view(), top_levels_view())
+
+        # Refreshes on an order book that has not changed are skipped.
+        version, rendered = None, 0
+        for i in range(50):
+            if i % 5 == 0:
+                order_book.apply_diffs([OrderBookRow(100.0 - (i % lines) * 0.01, 3.0, i + 2)], [], i + 2)
+            if order_book.version != version:
+                version = order_book.version
+                top_levels_view()
+                rendered += 1
+        self.assertEqual(10, rendered)
+        self.assertEqual(snapshot_view(), top_levels_view())
+
+    @benchmark
+    def test_live_view_cpu_time(self):
+        lines = 35
+        order_book = build_order_book(5000)
+        snapshot_view, top_levels_view = self.live_views(order_book, lines)
+
+        refreshes = 50
+        timings = {}
+        for name, view in (("snapshot", snapshot_view), ("top_levels", top_levels_view)):
+            timings[name] = cpu_time(view, calls=refreshes)
+
+        version = None
+
+        def versioned_refreshes():
+            nonlocal version
+            for i in range(refreshes):
+                if i % 5 == 0:
+                    order_book.apply_diffs([OrderBookRow(100.0 - (i % lines) * 0.01, 3.0, i + 2)], [], i + 2)
+                if order_book.version != version:
+                    version = order_book.version
+                    top_levels_view()
+
+        timings["versioned"] = cpu_time(versioned_refreshes) / refreshes
+
+        report(f"Live order book view of 5000 levels a side, CPU time per refresh: "
+               f"{timings['snapshot'] * 1e3:.2f}ms with snapshots, {timings['top_levels'] * 1e3:.2f}ms with top_levels, "
+               f"{timings['versioned'] * 1e3:.2f}ms when the book changes on one refresh in five.")
+
+
+if __name__ == "__main__":
+    unittest.main()
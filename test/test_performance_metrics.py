@@ -6,8 +6,9 @@ import unittest
 import asyncio
 from unittest.mock import patch
 
-from hummingbot.client.performance import calculate_performance_metrics
+from hummingbot.client.performance import calculate_performance_metrics, PerformanceMetricsStore
 from hummingbot.core.data_type.trade import Trade, TradeType, TradeFee
+from hummingbot.model.trade_fill import TradeFill
 
 trading_pair = "HBOT-USDT"
 base, quote = trading_pair.split("-")
@@ -33,3 +34,86 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
             calculate_performance_metrics("hbot_exchange", trading_pair, trades, cur_bals))
         self.assertEqual(Decimal("250"), metrics.trade_pnl)
         print(metrics)
+
+    @patch('hummingbot.client.performance.get_last_price')
+    def test_performance_metrics_store(self, mock_get_last_price):
+        async def get_last_price(exchange, pair):
+            return Decimal("110") if pair == trading_pair else Decimal("2")
+        mock_get_last_price.side_effect = get_last_price
+
+        trades: List[Trade] = [
+            Trade(trading_pair, TradeType.BUY, Decimal("100"), Decimal("10"), None, "hbot_exchange", 1,
+                  TradeFee(Decimal("0"), [("BNB", Decimal("1"))])),
+            Trade(trading_pair, TradeType.SELL, Decimal("120"), Decimal("15"), None, "hbot_exchange", 2,
+                  TradeFee(Decimal("0"), [("BNB", Decimal("1"))])),
+            Trade(trading_pair, TradeType.BUY, Decimal("105"), Decimal("5"), None, "hbot_exchange", 3,
+                  TradeFee(Decimal("0"), [(quote, Decimal("3"))])),
+        ]
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        ev_loop = asyncio.get_event_loop()
+        store = PerformanceMetricsStore()
+        for trade in trades[:2]:
+            store.add_trade(trade)
+        metrics = ev_loop.run_until_complete(store.calculate_metrics("hbot_exchange", trading_pair, cur_bals))
+        self.assertEqual(2, metrics.num_trades)
+        self.assertEqual(Decimal("2"), metrics.fees["BNB"])
+
+        # Adding the remaining trade gives the same metrics as calculating them from all trades at once.
+        store.add_trade(trades[2])
+        metrics = ev_loop.run_until_complete(store.calculate_metrics("hbot_exchange", trading_pair, cur_bals))
+        expected = ev_loop.run_until_complete(
+            calculate_performance_metrics("hbot_exchange", trading_pair, trades, cur_bals))
+        self.assertEqual(3, store.num_trades)
+        self.assertEqual(expected.tot_vol_base, metrics.tot_vol_base)
+        self.assertEqual(expected.tot_vol_quote, metrics.tot_vol_quote)
+        self.assertEqual(expected.fee_in_quote, metrics.fee_in_quote)
+        self.assertEqual(expected.total_pnl, metrics.total_pnl)
+        self.assertEqual(Decimal("0"), metrics.tot_vol_base)
+        # 2 BNB at 2 USDT plus 3 USDT
+        self.assertEqual(Decimal("7"), metrics.fee_in_quote)
+
+    @patch('hummingbot.client.performance.get_last_price')
+    def test_percent_fees_of_partial_fills(self, mock_get_last_price):
+        async def get_last_price(exchange, pair):
+            return Decimal("110")
+        mock_get_last_price.side_effect = get_last_price
+
+        def partial_fill(side: TradeType, price: Decimal, amount: Decimal, order_amount: Decimal, percent: Decimal):
+            # A trade of a partially filled order, which also carries the amount of its whole order.
+            trade = Trade(trading_pair, side, price, amount, None, "hbot_exchange", 1, TradeFee(percent))
+            trade.order_amount = order_amount
+            return trade
+
+        trades = [
+            partial_fill(TradeType.BUY, Decimal("100"), Decimal("4"), Decimal("10"), Decimal("0.001")),
+            partial_fill(TradeType.SELL, Decimal("120"), Decimal("5"), Decimal("15"), Decimal("0.002")),
+        ]
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        ev_loop = asyncio.get_event_loop()
+        store = PerformanceMetricsStore()
+        for trade in trades:
+            store.add_trade(trade)
+        metrics = ev_loop.run_until_complete(store.calculate_metrics("hbot_exchange", trading_pair, cur_bals))
+        expected = ev_loop.run_until_complete(
+            calculate_performance_metrics("hbot_exchange", trading_pair, trades, cur_bals))
+        # The percent fees of Trade objects are charged on their order amount: 100 * 10 * 0.001 + 120 * 15 * 0.002
+        self.assertEqual(Decimal("4.6"), metrics.fees[quote])
+        self.assertEqual(expected.fees, metrics.fees)
+        self.assertEqual(expected.fee_in_quote, metrics.fee_in_quote)
+
+    def test_derivative_trade_pnl(self):
+        def trade_fill(order_id: str, trade_type: str, position: str, price: float, amount: float) -> TradeFill:
+            return TradeFill(market="hbot_perpetual", symbol=trading_pair, order_id=order_id, trade_type=trade_type,
+                             position=position, price=price, amount=amount, trade_fee={"percent": 0, "flat_fees": []})
+        trades = [
+            trade_fill("1", "BUY", "OPEN", 100., 1.),
+            trade_fill("2", "SELL", "OPEN", 110., 2.),
+            trade_fill("3", "SELL", "CLOSE", 104., 0.5),
+            trade_fill("3", "SELL", "CLOSE", 106., 0.5),
+            trade_fill("4", "BUY", "CLOSE", 100., 2.),
+        ]
+        store = PerformanceMetricsStore.from_trades(trades)
+        accumulator = store.accumulators[("hbot_perpetual", trading_pair)]
+        self.assertTrue(accumulator.is_derivative)
+        # Long: (105 - 100) * 1, short: (110 - 100) * 2
+        self.assertEqual(Decimal("25"), accumulator.derivative_trade_pnl())
@@ -621,6 +621,18 @@ class PMMUnitTest(unittest.TestCase):
 
         self.order_fill_logger.clear()
 
+    def test_cancelled_order_leaves_active_non_hanging_orders(self):
+        strategy = self.one_level_strategy
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(2, len(strategy.active_non_hanging_orders))
+
+        order_id = strategy.active_non_hanging_orders[0].client_order_id
+        strategy.cancel_order(order_id)
+        # Gone in the same tick, whether the cancel is confirmed yet or still in flight.
+        self.assertNotIn(order_id, [o.client_order_id for o in strategy.active_non_hanging_orders])
+        self.assertEqual(1, len(strategy.active_non_hanging_orders))
+
     def test_hanging_orders_multiple_orders(self):
         strategy = self.multi_levels_strategy
         strategy.order_refresh_time = 4.0
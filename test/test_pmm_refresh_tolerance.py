@@ -111,6 +111,18 @@ class PMMRefreshToleranceUnitTest(unittest.TestCase):
             order_refresh_tolerance_pct=0,
             hanging_orders_enabled=True
         )
+        self.incremental_strategy: PureMarketMakingStrategy = PureMarketMakingStrategy(
+            self.market_info,
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_levels=5,
+            order_level_spread=Decimal("0.01"),
+            order_refresh_time=4,
+            filled_order_delay=8,
+            order_refresh_tolerance_pct=Decimal("0.01"),
+            incremental_order_refresh=True
+        )
 
     def test_active_orders_are_cancelled_when_mid_price_moves(self):
         strategy = self.one_level_strategy
@@ -240,3 +252,70 @@ class PMMRefreshToleranceUnitTest(unittest.TestCase):
         new_sells = [o for o in strategy.active_sells if o.client_order_id not in strategy.hanging_order_ids]
         self.assertEqual([o.client_order_id for o in old_sells], [o.client_order_id for o in new_sells])
         self.assertEqual([o.client_order_id for o in old_buys], [o.client_order_id for o in new_buys])
+
+    def test_incremental_refresh_keeps_orders_within_tolerance(self):
+        strategy = self.incremental_strategy
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        self.assertEqual(5, len(strategy.active_buys))
+        self.assertEqual(5, len(strategy.active_sells))
+        old_buys = strategy.active_buys
+        old_sells = strategy.active_sells
+        self.clock.backtest_til(self.start_timestamp + 6 * self.clock_tick_size)
+        self.assertEqual([o.client_order_id for o in old_buys], [o.client_order_id for o in strategy.active_buys])
+        self.assertEqual([o.client_order_id for o in old_sells], [o.client_order_id for o in strategy.active_sells])
+        self.assertEqual(0, len(self.cancel_order_logger.event_log))
+        stats = strategy.order_refresh_api_stats
+        self.assertEqual(10, stats["api_calls"])
+        self.assertEqual(20, stats["api_calls_saved"])
+
+    def test_incremental_refresh_is_off_on_radar_relay_type_exchanges(self):
+        class RadarRelayMarket(BacktestMarket):
+            @property
+            def name(self) -> str:
+                return "radar_relay"
+
+        market_info = MarketTradingPairTuple(RadarRelayMarket(), self.trading_pair, self.base_asset, self.quote_asset)
+        strategy = PureMarketMakingStrategy(market_info, bid_spread=Decimal("0.01"), ask_spread=Decimal("0.01"),
+                                            order_amount=Decimal("1"), incremental_order_refresh=True)
+        self.assertFalse(strategy.incremental_order_refresh)
+        # Orders expire on these exchanges, enabling it later doesn't stack new orders on the live ones.
+        strategy.incremental_order_refresh = True
+        self.assertFalse(strategy.incremental_order_refresh)
+        self.assertTrue(self.incremental_strategy.incremental_order_refresh)
+        self.incremental_strategy.incremental_order_refresh = False
+        self.assertFalse(self.incremental_strategy.incremental_order_refresh)
+
+    def test_incremental_refresh_only_replaces_moved_levels(self):
+        strategy = self.incremental_strategy
+        strategy.order_levels = 1
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        old_bid = strategy.active_buys[0]
+        old_ask = strategy.active_sells[0]
+        # The bid level moves by ~2% (beyond tolerance), the ask level by ~0.5% (within tolerance).
+        strategy.ask_spread = Decimal("0.005")
+        strategy.bid_spread = Decimal("0.03")
+        self.clock.backtest_til(self.start_timestamp + 6 * self.clock_tick_size)
+        self.assertEqual(1, len(strategy.active_buys))
+        self.assertEqual(1, len(strategy.active_sells))
+        self.assertNotEqual(old_bid.client_order_id, strategy.active_buys[0].client_order_id)
+        self.assertEqual(old_ask.client_order_id, strategy.active_sells[0].client_order_id)
+        self.assertEqual(1, len(self.cancel_order_logger.event_log))
+
+    def test_incremental_refresh_replaces_resized_levels(self):
+        strategy = self.incremental_strategy
+        strategy.order_levels = 1
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        old_bid = strategy.active_buys[0]
+        old_ask = strategy.active_sells[0]
+        # Prices stay within tolerance, but the order amount doubles.
+        strategy.order_amount = Decimal("2")
+        self.clock.backtest_til(self.start_timestamp + 6 * self.clock_tick_size)
+        self.assertEqual(1, len(strategy.active_buys))
+        self.assertEqual(1, len(strategy.active_sells))
+        self.assertNotEqual(old_bid.client_order_id, strategy.active_buys[0].client_order_id)
+        self.assertNotEqual(old_ask.client_order_id, strategy.active_sells[0].client_order_id)
+        self.assertEqual(Decimal("2"), strategy.active_buys[0].quantity)
+        self.assertEqual(2, len(self.cancel_order_logger.event_log))
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from collections import defaultdict
+from decimal import Decimal
+import time
+from typing import Dict
+import unittest
+
+from aiohttp import web
+
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.data_feed.coin_cap_data_feed import CoinCapDataFeed
+from hummingbot.data_feed.coin_gecko_data_feed import CoinGeckoDataFeed
+from hummingbot.data_feed.custom_api_data_feed import CustomAPIDataFeed
+from hummingbot.data_feed.price_feed_service import PriceFeedService
+
+
+class PriceFixtures:
+    """
+    A local HTTP server serving Coin Gecko, CoinCap and custom API like prices, it counts the requests by path and
+    answers conditional requests with a 304 as long as the prices haven't changed.
+    """
+
+    def __init__(self):
+        self.requests: Dict[str, int] = defaultdict(int)
+        self.not_modified: int = 0
+        self.version: int = 1
+        # Whether 304s repeat the ETag, some servers leave it out.
+        self.etag_on_not_modified: bool = True
+        self.runner: web.AppRunner = None
+        self.url: str = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/api/v3/coins/markets", self.coins_markets)
+        app.router.add_get("/api/v3/simple/supported_vs_currencies", self.supported_vs_currencies)
+        app.router.add_get("/v2/assets", self.coin_cap_assets)
+        app.router.add_get("/v2/rates", self.coin_cap_rates)
+        app.router.add_get("/custom", self.custom)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    def respond(self, request: web.Request, body) -> web.Response:
+        self.requests[request.path] += 1
+        etag = f'"{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag} if self.etag_on_not_modified else {})
+        if isinstance(body, str):
+            return web.Response(text=body, headers={"ETag": etag})
+        return web.json_response(body, headers={"ETag": etag})
+
+    async def coins_markets(self, request: web.Request) -> web.Response:
+        page = int(request.query["page"])
+        return self.respond(request, [{"symbol": f"c{page}x{i}", "current_price": page * 1000 + i + self.version}
+                                      for i in range(250)])
+
+    async def supported_vs_currencies(self, request: web.Request) -> web.Response:
+        return self.respond(request, ["usd", "btc"])
+
+    async def coin_cap_assets(self, request: web.Request) -> web.Response:
+        return self.respond(request, {"data": [{"symbol": "eth", "priceUsd": "2000"}, {"symbol": "btc",
+                                                                                       "priceUsd": "40000"}]})
+
+    async def coin_cap_rates(self, request: web.Request) -> web.Response:
+        return self.respond(request, {"data": [{"symbol": "eur", "rateUsd": "1.1"}]})
+
+    async def custom(self, request: web.Request) -> web.Response:
+        return self.respond(request, str(self.version + 0.5))
+
+
+class PriceFeedServiceUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.coin_gecko_base_url = CoinGeckoDataFeed.BASE_URL
+        cls.coin_cap_base_url = CoinCapDataFeed.COIN_CAP_BASE_URL
+        cls.coingecko_usd_price_url = RateOracle.coingecko_usd_price_url
+        cls.coingecko_supported_vs_tokens_url = RateOracle.coingecko_supported_vs_tokens_url
+
+    @classmethod
+    def tearDownClass(cls):
+        CoinGeckoDataFeed.BASE_URL = cls.coin_gecko_base_url
+        CoinCapDataFeed.COIN_CAP_BASE_URL = cls.coin_cap_base_url
+        RateOracle.coingecko_usd_price_url = cls.coingecko_usd_price_url
+        RateOracle.coingecko_supported_vs_tokens_url = cls.coingecko_supported_vs_tokens_url
+
+    def setUp(self):
+        PriceFeedService._shared_instance = None
+        RateOracle._cgecko_supported_vs_tokens = []
+        self.fixtures = PriceFixtures()
+        self.ev_loop.run_until_complete(self.fixtures.start())
+        CoinGeckoDataFeed.BASE_URL = f"{self.fixtures.url}/api/v3"
+        CoinCapDataFeed.COIN_CAP_BASE_URL = f"{self.fixtures.url}/v2"
+        RateOracle.coingecko_usd_price_url = self.fixtures.url + "/api/v3/coins/markets?vs_currency={}" \
+                                                                 "&order=market_cap_desc&per_page=250&page={}" \
+                                                                 "&sparkline=false"
+        RateOracle.coingecko_supported_vs_tokens_url = f"{self.fixtures.url}/api/v3/simple/supported_vs_currencies"
+        self.service = PriceFeedService.get_instance()
+
+    def tearDown(self):
+        for source in self.service.sources.values():
+            while source.subscribers > 0:
+                self.service.unsubscribe(source.name)
+        self.ev_loop.run_until_complete(self.service.http_client().close())
+        PriceFeedService._shared_instance = None
+        self.ev_loop.run_until_complete(self.fixtures.stop())
+
+    def async_run(self, coroutine):
+        return self.ev_loop.run_until_complete(coroutine)
+
+    def test_fetch_coalescing(self):
+        url = f"{self.fixtures.url}/custom"
+        first, second = self.async_run(asyncio.gather(self.service.fetch(url, as_json=False),
+                                                      self.service.fetch(url, as_json=False)))
+        self.assertEqual(("1.5", "1.5"), (first, second))
+        self.assertEqual(1, self.fixtures.requests["/custom"])
+        self.assertEqual("1.5", self.async_run(self.service.fetch(url, max_age=10, as_json=False)))
+        self.assertEqual(1, self.fixtures.requests["/custom"])
+        self.assertEqual(2, self.service.coalesced_count)
+
+        # Same url and params in another order are the same request.
+        self.assertEqual(self.service.request_key(f"{url}?b=2&a=1"), self.service.request_key(url, {"a": 1, "b": "2"}))
+
+    def test_conditional_requests(self):
+        url = f"{self.fixtures.url}/custom"
+        self.assertEqual("1.5", self.async_run(self.service.fetch(url, as_json=False)))
+        self.assertEqual("1.5", self.async_run(self.service.fetch(url, as_json=False)))
+        self.assertEqual(1, self.fixtures.not_modified)
+        self.assertEqual(1, self.service.not_modified_count)
+        self.fixtures.version = 2
+        self.assertEqual("2.5", self.async_run(self.service.fetch(url, as_json=False)))
+        self.assertEqual(3, self.service.request_count)
+        self.assertEqual(3, self.service.requests_per_minute)
+
+        # The cached ETag is kept when a 304 leaves it out.
+        self.fixtures.etag_on_not_modified = False
+        self.assertEqual("2.5", self.async_run(self.service.fetch(url, as_json=False)))
+        self.assertEqual("2.5", self.async_run(self.service.fetch(url, as_json=False)))
+        self.assertEqual(3, self.fixtures.not_modified)
+
+    def test_price_table(self):
+        feed = CoinGeckoDataFeed(update_interval=30)
+        self.assertIsNone(feed.get_price("C1X0"))
+        self.async_run(feed.fetch_data())
+        self.async_run(asyncio.wait_for(feed.get_ready(), 1))
+        prices = self.service.prices(feed.name)
+        self.assertEqual(1000, len(prices))
+        self.assertEqual(1001.0, feed.get_price("c1x0"))
+        self.assertEqual(4, self.fixtures.requests["/api/v3/coins/markets"])
+
+        # The rate oracle's Coin Gecko usd pages are the ones just fetched by the data feed.
+        rate_oracle_prices = self.async_run(RateOracle.get_coingecko_prices("USDT"))
+        self.assertEqual(Decimal("1001"), rate_oracle_prices["C1X0-USD"])
+        self.assertEqual(4, self.fixtures.requests["/api/v3/coins/markets"])
+
+        # Prices are published as a new table, the one read before is left as it was.
+        self.fixtures.version = 2
+        feed._update_interval = 0
+        self.async_run(feed.fetch_data())
+        self.assertEqual(1001.0, prices["C1X0"])
+        self.assertEqual(1002.0, feed.get_price("C1X0"))
+
+    def test_feeds_schedules(self):
+        coin_gecko_feed = CoinGeckoDataFeed(update_interval=0.5)
+        coin_cap_feed = CoinCapDataFeed(update_interval=0.25)
+        # Two strategies pricing with the same custom API.
+        custom_feeds = [CustomAPIDataFeed(f"{self.fixtures.url}/custom", update_interval=0.1) for _ in range(2)]
+        feeds = [coin_gecko_feed, coin_cap_feed] + custom_feeds
+
+        start = time.time()
+        for feed in feeds:
+            self.async_run(feed.start_network())
+        self.async_run(asyncio.wait_for(asyncio.gather(*[feed.get_ready() for feed in feeds]), 5))
+        self.async_run(asyncio.sleep(2.0))
+        for feed in feeds:
+            self.async_run(feed.stop_network())
+        elapsed = time.time() - start
+
+        self.assertEqual(Decimal("1.5"), custom_feeds[0].get_price())
+        self.assertEqual(2000.0, coin_cap_feed.get_price("WETH"))
+        self.assertEqual(1.1, coin_cap_feed.price_dict["EUR"])
+        self.assertIsNone(self.service.sources[coin_gecko_feed.name].update_task)
+
+        # Independent loops: each custom feed on its own, and a request for each of the Coin Gecko pages and CoinCap
+        # endpoints on every update.
+        requests = sum(self.fixtures.requests.values())
+        independent_requests = (len(custom_feeds) * elapsed / 0.1 + 4 * elapsed / 0.5 + 2 * elapsed / 0.25)
+        self.assertLess(self.fixtures.requests["/custom"], elapsed / 0.1 + 2)
+        self.assertLess(requests, independent_requests)
+        self.assertGreater(self.fixtures.not_modified, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
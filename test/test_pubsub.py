@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import gc
+from enum import Enum
+from typing import (
+    Any,
+    List,
+)
+import unittest
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+from test.benchmark import (
+    benchmark,
+    cpu_time,
+    report,
+)
+
+
+class TestEvent(Enum):
+    Ping = 1
+    Pong = 2
+
+
+class RecordingListener(EventListener):
+    def __init__(self, name: str, calls: List[Any]):
+        super().__init__()
+        self.name = name
+        self.calls = calls
+
+    def __call__(self, arg: Any):
+        self.calls.append((self.name, arg))
+
+
+class NoOpListener(EventListener):
+    def __call__(self, arg: Any):
+        pass
+
+
+class PubSubUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.pubsub = PubSub()
+        self.calls = []
+
+    def listener(self, name: str) -> RecordingListener:
+        return RecordingListener(name, self.calls)
+
+    def test_dispatch_order_and_duplicates(self):
+        listeners = [self.listener(name) for name in ("a", "b", "c")]
+        for listener in listeners + listeners[:1]:
+            self.pubsub.add_listener(TestEvent.Ping, listener)
+        self.pubsub.trigger_event(TestEvent.Ping, 1)
+        self.pubsub.trigger_event(TestEvent.Pong, 2)
+        self.assertEqual([("a", 1), ("b", 1), ("c", 1)], self.calls)
+        self.assertEqual(listeners, self.pubsub.get_listeners(TestEvent.Ping))
+
+        self.pubsub.remove_listener(TestEvent.Ping, listeners[1])
+        self.pubsub.trigger_event(TestEvent.Ping, 3)
+        self.assertEqual([("a", 3), ("c", 3)], self.calls[3:])
+
+    def test_dead_listeners(self):
+        listener = self.listener("a")
+        self.pubsub.add_listener(TestEvent.Ping, listener)
+        self.assertEqual(1, self.pubsub.dispatch_metrics()[TestEvent.Ping.value]["listeners"])
+        # Removed as soon as it is garbage collected, not on a later dispatch.
+        del listener
+        self.assertEqual(0, self.pubsub.dispatch_metrics()[TestEvent.Ping.value]["listeners"])
+        self.assertEqual([], self.pubsub.get_listeners(TestEvent.Ping))
+
+    def test_subscriptions(self):
+        subscription = self.pubsub.subscribe(TestEvent.Ping, self.listener("a"))
+        self.assertTrue(subscription.active)
+        self.pubsub.trigger_event(TestEvent.Ping, 1)
+        subscription.unsubscribe()
+        self.assertFalse(subscription.active)
+        self.pubsub.trigger_event(TestEvent.Ping, 2)
+        self.assertEqual([("a", 1)], self.calls)
+
+        with self.pubsub.subscribe(TestEvent.Ping, self.listener("b")):
+            self.pubsub.trigger_event(TestEvent.Ping, 3)
+        self.pubsub.trigger_event(TestEvent.Ping, 4)
+        self.assertEqual([("a", 1), ("b", 3)], self.calls)
+
+        # A dropped subscription drops its listener.
+        self.pubsub.subscribe(TestEvent.Ping, self.listener("c"))
+        self.assertEqual([], self.pubsub.get_listeners(TestEvent.Ping))
+
+    def test_changes_during_dispatch(self):
+        added = self.listener("added")
+
+        class SelfRemovingListener(EventListener):
+            def __call__(listener, arg: Any):
+                self.calls.append(("removing", arg))
+                self.pubsub.remove_listener(TestEvent.Ping, listener)
+                self.pubsub.add_listener(TestEvent.Ping, added)
+
+        removing = SelfRemovingListener()
+        self.pubsub.add_listener(TestEvent.Ping, removing)
+        self.pubsub.trigger_event(TestEvent.Ping, 1)
+        self.pubsub.trigger_event(TestEvent.Ping, 2)
+        self.assertEqual([("removing", 1), ("added", 2)], self.calls)
+
+    def test_dispatch_metrics(self):
+        listeners = [self.listener("a"), self.listener("b")]
+        for listener in listeners:
+            self.pubsub.add_listener(TestEvent.Ping, listener)
+        PubSub.enable_dispatch_timing()
+        try:
+            for i in range(3):
+                self.pubsub.trigger_event(TestEvent.Ping, i)
+        finally:
+            PubSub.enable_dispatch_timing(False)
+        metrics = self.pubsub.dispatch_metrics()[TestEvent.Ping.value]
+        self.assertEqual({"listeners": 2, "dispatches": 3, "listener_calls": 6},
+                         {k: v for k, v in metrics.items() if k != "dispatch_time"})
+        self.assertGreater(metrics["dispatch_time"], 0)
+        self.assertNotIn(TestEvent.Pong.value, self.pubsub.dispatch_metrics())
+
+    @benchmark
+    def test_dispatch_cpu_time(self):
+        results = []
+        for listener_count, event_count in ((1, 1000000), (8, 250000), (64, 40000)):
+            listeners = [NoOpListener() for _ in range(listener_count)]
+            for listener in listeners:
+                self.pubsub.add_listener(TestEvent.Pong, listener)
+
+            def trigger_events():
+                for i in range(event_count):
+                    self.pubsub.trigger_event(TestEvent.Pong, i)
+
+            gc.disable()
+            elapsed = cpu_time(trigger_events)
+            gc.enable()
+            for listener in listeners:
+                self.pubsub.remove_listener(TestEvent.Pong, listener)
+            results.append((listener_count, event_count, elapsed))
+
+        self.assertEqual(sum(listener_count * event_count for listener_count, event_count, _ in results),
+                         self.pubsub.dispatch_metrics()[TestEvent.Pong.value]["listener_calls"])
+        report("Dispatch CPU time: " + ", ".join(f"{listener_count} listeners {elapsed / event_count * 1e9:.0f}ns "
+                                                 f"per event over {event_count} events"
+                                                 for listener_count, event_count, elapsed in results) + ".")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from aiohttp import web
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.logger.log_server_client import LogServerClient
+from hummingbot.logger.reporting_proxy_handler import ReportingProxyHandler
+from test.benchmark import (
+    benchmark,
+    cpu_time,
+    report,
+)
+
+
+class LogSink:
+    """
+    A local HTTP server standing in for the reporting proxy, records the batches posted to it.
+    """
+
+    def __init__(self):
+        self.batches: List[List[Dict[str, Any]]] = []
+        self.encodings: List[str] = []
+        self.runner: web.AppRunner = None
+        self.url: str = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/", self.status)
+        app.router.add_post("/{path}", self.receive)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    async def status(self, request: web.Request) -> web.Response:
+        return web.Response(text="OK")
+
+    async def receive(self, request: web.Request) -> web.Response:
+        # aiohttp decompresses gzip request bodies.
+        self.encodings.append(request.headers.get("Content-Encoding", ""))
+        self.batches.append(json.loads(await request.text()))
+        return web.Response(text="OK")
+
+    @property
+    def record_count(self) -> int:
+        return sum(len(batch) for batch in self.batches)
+
+
+class ReportingProxyHandlerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        global_config_map["send_error_logs"].value = True
+        global_config_map["heartbeat_enabled"].value = False
+
+    def setUp(self):
+        LogServerClient._lsc_shared_instance = None
+        self.sink = LogSink()
+        self.ev_loop.run_until_complete(self.sink.start())
+
+    def tearDown(self):
+        if LogServerClient._lsc_shared_instance is not None:
+            LogServerClient._lsc_shared_instance.stop()
+            LogServerClient._lsc_shared_instance = None
+        self.ev_loop.run_until_complete(self.sink.stop())
+
+    def run_until(self, condition, timeout: float = 10.0):
+        async def wait():
+            while not condition():
+                await asyncio.sleep(0.05)
+        self.ev_loop.run_until_complete(asyncio.wait_for(wait(), timeout))
+
+    @staticmethod
+    def record(i: int) -> logging.LogRecord:
+        return logging.LogRecord("test.reporting_proxy_handler", logging.ERROR, __file__, 0, "Error %d.", (i,), None)
+
+    def test_batches(self):
+        handler = ReportingProxyHandler(proxy_url=self.sink.url, enable_order_event_logging=True, capacity=10,
+                                        flush_interval=0.5, compress=True)
+        for i in range(25):
+            handler.handle(self.record(i))
+        self.run_until(lambda: self.sink.record_count == 25)
+
+        # Two full batches, the rest is sent once the flush interval has passed.
+        self.assertEqual([10, 10, 5], [len(batch) for batch in self.sink.batches])
+        self.assertEqual(["gzip"] * 3, self.sink.encodings)
+        self.assertEqual(["Error 0.", "Error 24."], [self.sink.batches[0][0]["msg"], self.sink.batches[2][-1]["msg"]])
+        self.assertEqual(3, handler.log_server_client.sent_count)
+        handler.close()
+
+    def test_compression(self):
+        client = LogServerClient(compress=True)
+        data = json.dumps([{"name": "hummingbot.strategy", "msg": f"Error {i}.", "level": "ERROR"} for i in range(100)])
+        request_obj = client.compressed({"headers": {"Content-Type": "application/json"}, "data": data})
+        self.assertEqual("gzip", request_obj["headers"]["Content-Encoding"])
+        self.assertEqual(data, gzip.decompress(request_obj["data"]).decode("utf8"))
+        self.assertLess(len(request_obj["data"]), len(data) / 5)
+
+    def test_drop_when_full(self):
+        client = LogServerClient(log_server_url=self.sink.url, queue_capacity=2)
+        for i in range(5):
+            client.request({"method": "POST", "url": f"{self.sink.url}/logs", "request_obj": {"data": json.dumps([i])}})
+        self.assertEqual({"queue_depth": 2, "sent": 0, "dropped": 3, "spilled": 0, "spilled_pending": 0},
+                         client.metrics())
+        self.run_until(lambda: client.sent_count == 2)
+        self.assertEqual([[0], [1]], self.sink.batches)
+        client.stop()
+
+    def test_spill_to_disk(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            spill_file_path = os.path.join(tmp_dir, "spill.jsonl")
+            client = LogServerClient(log_server_url=self.sink.url, queue_capacity=2, overflow_policy="spill",
+                                     spill_file_path=spill_file_path)
+            for i in range(7):
+                client.request({"method": "POST", "url": f"{self.sink.url}/logs",
+                                "request_obj": {"data": json.dumps([i])}})
+            self.assertEqual(2, client.queue_depth)
+            self.assertEqual(5, client.spilled_count)
+            self.assertEqual(0, client.dropped_count)
+            # The spill file is written by the spill thread, not by the event loop.
+            writer_thread = client.spill_executor.submit(threading.get_ident).result()
+            self.assertNotEqual(threading.get_ident(), writer_thread)
+            with open(spill_file_path) as fd:
+                self.assertEqual([[i] for i in range(2, 7)],
+                                 [json.loads(json.loads(line)["request_obj"]["data"]) for line in fd])
+
+            self.run_until(lambda: client.sent_count == 7)
+            self.assertEqual([[i] for i in range(7)], self.sink.batches)
+            self.assertEqual(0, client.spilled_pending)
+            self.assertFalse(os.path.exists(spill_file_path))
+            client.stop()
+
+    @benchmark
+    def test_emit_cpu_time(self):
+        records = 2000
+        timings = {}
+        for capacity in (1, 100):
+            LogServerClient._lsc_shared_instance = None
+            handler = ReportingProxyHandler(proxy_url=self.sink.url, enable_order_event_logging=True,
+                                            capacity=capacity, flush_interval=60, queue_capacity=records,
+                                            compress=capacity > 1)
+
+            def send_records():
+                for i in range(records):
+                    handler.handle(self.record(i))
+                self.run_until(lambda: handler.log_server_client.sent_count == records // capacity, 60)
+
+            timings[capacity] = cpu_time(send_records)
+            handler.close()
+            LogServerClient._lsc_shared_instance = None
+        self.assertEqual(records * 2, self.sink.record_count)
+
+        report(f"{records} error logs sent to a local sink, CPU time: {timings[1] * 1e3:.0f}ms one request per record, "
+               f"{timings[100] * 1e3:.0f}ms in compressed batches of 100.")
+        self.assertLess(timings[100], timings[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,10 +3,14 @@
 from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import queue
 import unittest
 from decimal import Decimal
 from statistics import mean
 from hummingbot.script.script_base import ScriptBase
+from hummingbot.script.script_interface import OnTick
 
 
 class ScriptIteratorUnitTest(unittest.TestCase):
@@ -74,3 +78,42 @@ class ScriptIteratorUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("1.75"), ScriptBase.round_by_step(Decimal("1.7567"), Decimal("0.01")))
         self.assertEqual(Decimal("1"), ScriptBase.round_by_step(Decimal("1.7567"), Decimal("1")))
         self.assertEqual(Decimal("-1.75"), ScriptBase.round_by_step(Decimal("-1.8"), Decimal("0.25")))
+
+    def test_add_mid_price(self):
+        script_base = ScriptBase()
+        script_base.max_mid_prices_length = 200
+        for price in range(1, 202):
+            script_base.add_mid_price(Decimal(price))
+        # Old prices are dropped in chunks of 1% of the max length.
+        self.assertEqual(201, len(script_base.mid_prices))
+        script_base.add_mid_price(Decimal(202))
+        self.assertEqual(200, len(script_base.mid_prices))
+        self.assertEqual(Decimal(3), script_base.mid_prices[0])
+        self.assertEqual(Decimal(202), script_base.mid_price)
+
+    def test_listen_to_parent_leaves_default_executor(self):
+        ev_loop = asyncio.new_event_loop()
+        ev_loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+        parent_queue = queue.Queue()
+        script_base = ScriptBase()
+        script_base.assign_init(parent_queue, queue.Queue(), 0.01)
+        ticks = []
+        script_base.on_tick = lambda: ticks.append(script_base.mid_price)
+
+        async def run():
+            listen_task = ev_loop.create_task(script_base.listen_to_parent())
+            await asyncio.sleep(0.01)
+            # The listener blocks on the queue, the default executor's only thread is still available.
+            self.assertEqual(42, await asyncio.wait_for(ev_loop.run_in_executor(None, lambda: 42), 1))
+            parent_queue.put(OnTick(Decimal("100"), None, None, None))
+            for _ in range(100):
+                if len(ticks) > 0:
+                    break
+                await asyncio.sleep(0.01)
+            listen_task.cancel()
+            # Releases the listener's thread.
+            parent_queue.put(None)
+
+        ev_loop.run_until_complete(run())
+        ev_loop.close()
+        self.assertEqual([Decimal("100")], ticks)
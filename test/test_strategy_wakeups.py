@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import logging
+import random
+import time
+from typing import (
+    List,
+    Tuple,
+)
+import unittest
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderBookEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+from test.benchmark import (
+    benchmark,
+    cpu_time,
+    report,
+)
+
+trading_pair = "HBOT-USDT"
+
+
+def set_mid_price(order_book: OrderBook, mid_price: float, update_id: int, levels: int = 20):
+    bids = [OrderBookRow(mid_price - 0.005 - i * 0.01, 1.0, update_id) for i in range(levels)]
+    asks = [OrderBookRow(mid_price + 0.005 + i * 0.01, 1.0, update_id) for i in range(levels)]
+    order_book.apply_snapshot(bids, asks, update_id)
+
+
+class MockConnector(ConnectorBase):
+    def __init__(self, order_book: OrderBook):
+        super().__init__()
+        self.order_book = order_book
+
+    def get_order_book(self, trading_pair: str) -> OrderBook:
+        return self.order_book
+
+
+class ReactiveStrategy(StrategyPyBase):
+    """
+    Records when its ticks, clock ticks and wakeups alike, first see each version of the order book.
+    """
+
+    @classmethod
+    def logger(cls):
+        return logging.getLogger(__name__)
+
+    def __init__(self, market_info: MarketTradingPairTuple):
+        super().__init__()
+        self.market_info = market_info
+        self.add_markets([market_info.market])
+        self.ticks: List[float] = []
+        self.seen_versions: List[Tuple[int, float]] = []
+        self.on_tick = None
+        self.tick_cpu_time = 0.0
+
+    def tick(self, timestamp: float):
+        start = time.process_time()
+        self.ticks.append(timestamp)
+        order_book = self.market_info.order_book
+        if len(self.seen_versions) == 0 or self.seen_versions[-1][0] != order_book.version:
+            self.seen_versions.append((order_book.version, time.perf_counter()))
+        # Some work on the book, as a strategy would do to price its orders.
+        order_book.top_levels(10)
+        order_book.get_vwap_for_volume(True, 5.0)
+        if self.on_tick is not None:
+            self.on_tick()
+        self.tick_cpu_time += time.process_time() - start
+
+
+class StrategyWakeupsUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.order_book = OrderBook()
+        set_mid_price(self.order_book, 100.0, 1)
+        self.market = MockConnector(self.order_book)
+        self.market_info = MarketTradingPairTuple(self.market, trading_pair, "HBOT", "USDT")
+        self.strategy = ReactiveStrategy(self.market_info)
+
+    def run_with_clock(self, scenario, tick_size: float = 3600.0):
+        # A clock ticking once an hour: the ticks seen are the wakeups.
+        clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+
+        async def run():
+            with clock:
+                clock.add_iterator(self.market)
+                clock.add_iterator(self.strategy)
+                clock_task = safe_ensure_future(clock.run())
+                try:
+                    await asyncio.sleep(0.01)
+                    return await scenario()
+                finally:
+                    clock_task.cancel()
+                    await asyncio.sleep(0)
+        return self.ev_loop.run_until_complete(run())
+
+    def test_top_changed_event(self):
+        event_logger = EventLogger()
+        self.order_book.add_listener(OrderBookEvent.TopChangedEvent, event_logger)
+        # Deeper levels don't change the top of the book.
+        self.order_book.apply_diffs([OrderBookRow(99.5, 3.0, 2)], [OrderBookRow(100.5, 3.0, 2)], 2)
+        self.assertEqual(0, len(event_logger.event_log))
+        self.order_book.apply_diffs([OrderBookRow(99.999, 1.0, 3)], [], 3)
+        set_mid_price(self.order_book, 100.0, 4)
+        self.assertEqual([(99.999, 100.005), (99.995, 100.005)],
+                         [(round(e.best_bid, 3), round(e.best_ask, 3)) for e in event_logger.event_log])
+
+    def test_mid_price_threshold_and_coalescing(self):
+        self.strategy.subscribe_to_order_book_changes(self.market_info, mid_price_threshold=Decimal("0.01"))
+        self.strategy.wakeup_interval = 0.2
+
+        async def scenario():
+            set_mid_price(self.order_book, 100.5, 2)
+            await asyncio.sleep(0.02)
+            self.assertEqual(0, self.strategy.wakeup_count)
+
+            # A burst of moves past the threshold, a single wakeup.
+            for i in range(5):
+                set_mid_price(self.order_book, 102.0 + i * 0.1, 3 + i)
+            await asyncio.sleep(0.02)
+            self.assertEqual(1, self.strategy.wakeup_count)
+            self.assertEqual(4, self.strategy.coalesced_wakeup_count)
+            self.assertEqual(self.order_book.version, self.strategy.seen_versions[-1][0])
+
+            # The next move is measured from the mid price of the wakeup, and waits for the wakeup interval.
+            set_mid_price(self.order_book, 102.5, 8)
+            await asyncio.sleep(0.02)
+            self.assertEqual(1, self.strategy.wakeup_count)
+            set_mid_price(self.order_book, 104.0, 9)
+            await asyncio.sleep(0.05)
+            self.assertEqual(1, self.strategy.wakeup_count)
+            await asyncio.sleep(0.2)
+            self.assertEqual(2, self.strategy.wakeup_count)
+
+            self.strategy.unsubscribe_from_order_book_changes(self.market_info)
+            set_mid_price(self.order_book, 110.0, 10)
+            await asyncio.sleep(0.25)
+            self.assertEqual(2, self.strategy.wakeup_count)
+
+        self.run_with_clock(scenario)
+        self.assertEqual(2, len(self.strategy.ticks))
+
+    def test_composite_order_book_mid_price_threshold(self):
+        # Paper trade markets see the shared order book of the exchange through a composite order book.
+        self.market.order_book = CompositeOrderBook(self.order_book)
+        self.strategy.subscribe_to_order_book_changes(self.market_info, mid_price_threshold=Decimal("0.01"))
+
+        async def scenario():
+            set_mid_price(self.order_book, 100.5, 2)
+            await asyncio.sleep(0.02)
+            self.assertEqual(0, self.strategy.wakeup_count)
+            set_mid_price(self.order_book, 102.0, 3)
+            await asyncio.sleep(0.02)
+            self.assertEqual(1, self.strategy.wakeup_count)
+
+        self.run_with_clock(scenario)
+
+    def test_fills(self):
+        self.strategy.subscribe_to_fills()
+        fill = OrderFilledEvent(time.time(), "buy-HBOT-USDT-1", trading_pair, TradeType.BUY, OrderType.LIMIT,
+                                Decimal("100"), Decimal("1"), TradeFee(Decimal("0")))
+
+        async def scenario():
+            self.market.trigger_event(MarketEvent.OrderFilled, fill)
+            await asyncio.sleep(0.02)
+            self.assertEqual(1, self.strategy.wakeup_count)
+            self.strategy.unsubscribe_from_fills()
+            await asyncio.sleep(self.strategy.wakeup_interval)
+            self.market.trigger_event(MarketEvent.OrderFilled, fill)
+            await asyncio.sleep(0.02)
+            self.assertEqual(1, self.strategy.wakeup_count)
+
+        self.run_with_clock(scenario)
+
+    def test_no_wakeups_outside_real_time_mode(self):
+        self.strategy.subscribe_to_order_book_changes(self.market_info, top_of_book=True)
+        self.strategy.on_tick = lambda: set_mid_price(self.order_book, 100.0 + len(self.strategy.ticks), 2)
+        clock = Clock(ClockMode.BACKTEST, tick_size=1.0, start_time=0.0, end_time=3.0)
+        clock.add_iterator(self.strategy)
+
+        async def backtest():
+            clock.backtest()
+            await asyncio.sleep(0.02)
+
+        self.ev_loop.run_until_complete(backtest())
+        self.assertEqual(0, self.strategy.wakeup_count)
+        self.assertEqual([1.0, 2.0, 3.0], self.strategy.ticks)
+
+    @benchmark
+    def test_reaction_latency_and_cpu_time(self):
+        # Market moving diffs at random times, amid diffs of deeper levels every 10ms.
+        duration = 2.0
+        random.seed(0)
+        move_times = sorted(random.uniform(0.05, duration - 0.1) for _ in range(12))
+        results = {}
+
+        def run_mode(name: str, tick_size: float, reactive: bool):
+            self.setUp()
+            if reactive:
+                self.strategy.subscribe_to_order_book_changes(self.market_info, mid_price_threshold=Decimal("0.005"))
+                self.strategy.subscribe_to_fills()
+            moves: List[Tuple[int, float]] = []
+
+            async def scenario():
+                start = time.perf_counter()
+                update_id = 2
+                mid_price = 100.0
+                pending_moves = list(move_times)
+                while time.perf_counter() - start < duration:
+                    update_id += 1
+                    if len(pending_moves) > 0 and time.perf_counter() - start >= pending_moves[0]:
+                        pending_moves.pop(0)
+                        mid_price *= 1.01
+                        set_mid_price(self.order_book, mid_price, update_id)
+                        moves.append((self.order_book.version, time.perf_counter()))
+                    else:
+                        self.order_book.apply_diffs([OrderBookRow(mid_price - 0.1, random.random(), update_id)],
+                                                    [OrderBookRow(mid_price + 0.1, random.random(), update_id)],
+                                                    update_id)
+                    await asyncio.sleep(0.01)
+                # Lets the last move be seen.
+                await asyncio.sleep(tick_size if not reactive else self.strategy.wakeup_interval + 0.05)
+
+            total_cpu_time = cpu_time(lambda: self.run_with_clock(scenario, tick_size=tick_size))
+            latencies = []
+            for version, moved_at in moves:
+                seen_at = next(t for v, t in self.strategy.seen_versions if v >= version)
+                latencies.append(seen_at - moved_at)
+            results[name] = (sum(latencies) / len(latencies), len(self.strategy.ticks), self.strategy.tick_cpu_time,
+                             total_cpu_time)
+
+        run_mode("tick_1s", 1.0, False)
+        run_mode("tick_100ms", 0.1, False)
+        run_mode("reactive", 1.0, True)
+
+        report(f"Reaction to market moving diffs over {duration:.0f}s, mean latency, strategy ticks, CPU time in the "
+               f"ticks and in total: " +
+               ", ".join(f"{name} {latency * 1e3:.1f}ms {ticks} ticks {tick_cpu * 1e3:.2f}ms {cpu * 1e3:.0f}ms"
+                         for name, (latency, ticks, tick_cpu, cpu) in results.items()) + ".")
+        self.assertLess(results["reactive"][0], results["tick_100ms"][0])
+        self.assertLess(results["reactive"][1], results["tick_100ms"][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
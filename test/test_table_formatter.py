@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+from typing import (
+    Any,
+    List,
+)
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.client import format_decimal
+from hummingbot.core.utils.table_formatter import (
+    get_display_float_format,
+    set_display_float_format,
+    Table,
+)
+from test.benchmark import (
+    benchmark,
+    cpu_time,
+    peak_allocations,
+    report,
+)
+
+MARKETS_COLUMNS = ["Exchange", "Market", "Best Bid", "Best Ask", "Ref Price (MidPrice)"]
+ORDERS_COLUMNS = ["Level", "Type", "Price", "Spread", "Amount (Orig)", "Amount (Adj)", "Age"]
+
+
+def markets_data() -> List[List[Any]]:
+    return [["binance", "ETH-USDT", 99.95, 100.05, 100.0],
+            ["kucoin", "ETH-USDT", 99.9, 100.1, float("nan")]]
+
+
+def assets_data() -> List[List[Any]]:
+    return [["", "ETH", "USDT"],
+            ["Total Balance", 10.5, 1000.0],
+            ["Available Balance", 8.25, 750.0],
+            ["Current %", "50.0%", "50.0%"]]
+
+
+def orders_data(levels: int) -> List[List[Any]]:
+    data = []
+    for level in range(1, levels + 1):
+        data.append([level, "sell", 100.0 + level * 0.1, f"{level * 0.001:.2%}", Decimal("1") + level, 1.0 + level,
+                     "00:01:02"])
+        data.append([level, "buy", 100.0 - level * 0.1, f"{level * 0.001:.2%}", Decimal("1") + level, 1.0 + level,
+                     "00:01:02"])
+    data.append(["hang", "buy", 95.0, "5.00%", "", 0.5, "n/a"])
+    return data
+
+
+class TableFormatterUnitTest(unittest.TestCase):
+    def setUp(self):
+        # Importing hummingbot.client sets the display float format of the client, tested on its own below.
+        self.float_format = get_display_float_format()
+        set_display_float_format(None)
+
+    def tearDown(self):
+        set_display_float_format(self.float_format)
+
+    def test_to_string(self):
+        table = Table(data=markets_data(), columns=MARKETS_COLUMNS)
+        self.assertEqual("Exchange   Market  Best Bid  Best Ask  Ref Price (MidPrice)\n"
+                         " binance ETH-USDT     99.95    100.05                 100.0\n"
+                         "  kucoin ETH-USDT     99.90    100.10                   NaN",
+                         table.to_string(index=False))
+
+        # With NaN replaced the column holds objects, its floats are formatted one by one.
+        self.assertEqual("Exchange   Market  Best Bid  Best Ask Ref Price (MidPrice)\n"
+                         " binance ETH-USDT     99.95    100.05                  100\n"
+                         "  kucoin ETH-USDT     99.90    100.10                     ",
+                         table.fillna('').to_string(index=False))
+
+        self.assertEqual("Level Type  Price Spread Amount (Orig)  Amount (Adj)      Age\n"
+                         "    1 sell  100.1  0.10%             2           2.0 00:01:02\n"
+                         "    1  buy   99.9  0.10%             2           2.0 00:01:02\n"
+                         " hang  buy   95.0  5.00%                         0.5      n/a",
+                         Table(data=orders_data(1), columns=ORDERS_COLUMNS).to_string(index=False))
+
+    def test_header_and_formatters(self):
+        table = Table(data=assets_data())
+        first_col_length = max(len(label) for label in table[0])
+        self.assertEqual("                    ETH  USDT\n"
+                         "Total Balance      10.5  1000\n"
+                         "Available Balance  8.25   750\n"
+                         "Current %         50.0% 50.0%",
+                         table.to_string(index=False, header=False,
+                                         formatters={0: ("{:<" + str(first_col_length) + "}").format}))
+
+    def test_str(self):
+        table = Table(data=markets_data(), columns=MARKETS_COLUMNS)
+        self.assertEqual("  Exchange    Market  Best Bid  Best Ask  Ref Price (MidPrice)\n"
+                         "0  binance  ETH-USDT     99.95    100.05                 100.0\n"
+                         "1   kucoin  ETH-USDT     99.90    100.10                   NaN",
+                         str(table))
+
+        # Tables wider than the line width are wrapped.
+        table = Table(data=[["x" * 30, 1, 12345678.9, "y" * 30]], columns=["Order ID", "Level", "Price", "Market"])
+        self.assertEqual("                         Order ID  Level       Price  \\\n"
+                         "0  xxxxxxxxxxxxxxxxxxxxxxxxxxxxxx      1  12345678.9   \n"
+                         "\n"
+                         "                           Market  \n"
+                         "0  yyyyyyyyyyyyyyyyyyyyyyyyyyyyyy  ",
+                         table.to_string(line_width=80))
+
+        self.assertEqual("Empty DataFrame\nColumns: [Asset, Amount]\nIndex: []",
+                         Table(columns=["Asset", "Amount"]).to_string(index=False))
+
+    def test_float_format(self):
+        table = Table(data=[["a", 1.5, 2.0, 3], ["b", float("nan"), "", 4]], columns=["s", "f", "o", "i"])
+        set_display_float_format(format_decimal)
+        self.assertEqual("s   f o  i\n"
+                         "a 1.5 2  3\n"
+                         "b NaN    4",
+                         table.to_string(index=False))
+        self.assertEqual("s    f    o  i\n"
+                         "a 1.50 2.00  3\n"
+                         "b  NaN       4",
+                         table.to_string(index=False, float_format="{:.2f}".format))
+        self.assertEqual("s   f o  i\n"
+                         "a   F 2  3\n"
+                         "b NaN    4",
+                         table.to_string(index=False, formatters={"f": lambda x: "F"}))
+
+    def test_numpy_values(self):
+        # Values out of DataFrames are numpy scalars, rendered like the python values.
+        table = Table(data=[[np.float64(1.5), np.int64(2), np.bool_(True)],
+                            [np.float64(float("nan")), np.int64(3), np.bool_(False)]])
+        self.assertEqual(Table(data=[[1.5, 2, True], [float("nan"), 3, False]]).to_string(index=False),
+                         table.to_string(index=False))
+
+    def test_table_operations(self):
+        table = Table(data=[{"Asset": "USDT", "Amount": Decimal("2")}, {"Asset": "BTC", "Amount": Decimal("1")}],
+                      columns=["Asset", "Amount"])
+        self.assertEqual(["BTC", "USDT"], table.sort_values(by=["Asset"])["Asset"])
+        self.assertEqual(["USDT", "BTC"], table["Asset"])
+        self.assertEqual(Decimal("3"), sum(table["Amount"]))
+
+        table = Table(data=assets_data()[:2]).append(Table(data=[["Target %", "50.0%", "50.0%"]]))
+        self.assertEqual(["", "Total Balance", "Target %"], table[0])
+
+        data_frame = Table(data=markets_data(), columns=MARKETS_COLUMNS).to_pandas()
+        self.assertEqual(MARKETS_COLUMNS, list(data_frame.columns))
+        self.assertEqual(100.05, data_frame.iloc[0, 3])
+
+    @benchmark
+    def test_status_render_cpu_time_and_allocations(self):
+        # The tables of a market making status: markets, assets with the inventory skew stats and 10 order levels.
+        orders = orders_data(10)
+
+        def data_frame_status() -> str:
+            markets_df = pd.DataFrame(data=markets_data(), columns=MARKETS_COLUMNS).replace(np.nan, '', regex=True)
+            assets_df = pd.concat([pd.DataFrame(data=assets_data()),
+                                   pd.DataFrame(data=[["Target %", "50.0%", "50.0%"]])])
+            first_col_length = max(*assets_df[0].apply(len))
+            orders_df = pd.DataFrame(data=orders, columns=ORDERS_COLUMNS)
+            return "\n".join([markets_df.to_string(index=False),
+                              assets_df.to_string(index=False, header=False,
+                                                  formatters={0: ("{:<" + str(first_col_length) + "}").format}),
+                              orders_df.to_string(index=False)])
+
+        def table_status() -> str:
+            markets_table = Table(data=markets_data(), columns=MARKETS_COLUMNS).fillna('')
+            assets_table = Table(data=assets_data()).append(Table(data=[["Target %", "50.0%", "50.0%"]]))
+            first_col_length = max(len(label) for label in assets_table[0])
+            orders_table = Table(data=orders, columns=ORDERS_COLUMNS)
+            return "\n".join([markets_table.to_string(index=False),
+                              assets_table.to_string(index=False, header=False,
+                                                     formatters={0: ("{:<" + str(first_col_length) + "}").format}),
+                              orders_table.to_string(index=False)])
+
+        timings = {}
+        peaks = {}
+        for name, render in (("data_frame", data_frame_status), ("table", table_status)):
+            render()
+            timings[name] = cpu_time(render, calls=50)
+            peaks[name] = peak_allocations(render)
+
+        report(f"Status tables rendering, per call: {timings['data_frame'] * 1e3:.2f}ms of CPU time and "
+               f"{peaks['data_frame'] / 1024:.0f}KB peak allocations with DataFrames, "
+               f"{timings['table'] * 1e3:.2f}ms and {peaks['table'] / 1024:.0f}KB with tables.")
+        self.assertLess(timings["table"], timings["data_frame"])
+        self.assertLess(peaks["table"], peaks["data_frame"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from hummingbot.core.utils.warm_start_cache import WarmStartCache
+
+
+class WarmStartCacheUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache = WarmStartCache(self.cache_dir.name)
+        self.fetch_count = 0
+        self.revalidated = []
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    async def fetch(self):
+        self.fetch_count += 1
+        return ["ETH-USDT", "BTC-USDT"]
+
+    async def failing_fetch(self):
+        self.fetch_count += 1
+        raise IOError("Exchange unreachable.")
+
+    def age_entry(self, namespace: str, key: str, age: float):
+        path = join(self.cache.cache_dir, namespace, f"{key}.json")
+        with open(path) as fd:
+            data = json.load(fd)
+        data["timestamp"] -= age
+        with open(path, "w") as fd:
+            json.dump(data, fd)
+        os.utime(path, (data["timestamp"], data["timestamp"]))
+
+    def test_set_and_get(self):
+        self.assertIsNone(self.cache.get("trading_pairs", "binance"))
+        self.cache.set("trading_pairs", "binance", ["ETH-USDT"])
+        entry = self.cache.get("trading_pairs", "binance")
+        self.assertEqual(["ETH-USDT"], entry.value)
+        self.assertLess(entry.age(), 1)
+
+        self.age_entry("trading_pairs", "binance", 100)
+        self.assertIsNone(self.cache.get("trading_pairs", "binance", max_age=50))
+        self.cache.invalidate("trading_pairs", "binance")
+        self.assertIsNone(self.cache.get("trading_pairs", "binance"))
+
+    def test_other_versions_are_ignored(self):
+        self.cache.set("trading_pairs", "binance", ["ETH-USDT"])
+        self.assertIsNone(WarmStartCache(self.cache.cache_dir, WarmStartCache.CACHE_VERSION + 1)
+                          .get("trading_pairs", "binance"))
+
+    def test_min_interval(self):
+        self.cache.set("trading_rules", "binance", {"symbols": []})
+        self.cache.set("trading_rules", "binance", {"symbols": [1]}, min_interval=60)
+        self.assertEqual({"symbols": []}, self.cache.get("trading_rules", "binance").value)
+        self.age_entry("trading_rules", "binance", 120)
+        self.cache.set("trading_rules", "binance", {"symbols": [1]}, min_interval=60)
+        self.assertEqual({"symbols": [1]}, self.cache.get("trading_rules", "binance").value)
+
+    def test_get_or_fetch(self):
+        get_or_fetch = self.cache.get_or_fetch("trading_pairs", "binance", self.fetch, self.revalidated.append, ttl=60)
+        self.assertEqual(["ETH-USDT", "BTC-USDT"], self.ev_loop.run_until_complete(get_or_fetch))
+        # A warm start doesn't go to the exchange.
+        get_or_fetch = self.cache.get_or_fetch("trading_pairs", "binance", self.fetch, self.revalidated.append, ttl=60)
+        self.assertEqual(["ETH-USDT", "BTC-USDT"], self.ev_loop.run_until_complete(get_or_fetch))
+        self.assertEqual(1, self.fetch_count)
+        self.assertEqual([], self.revalidated)
+
+    def test_stale_entries_are_revalidated_in_background(self):
+        self.cache.set("trading_pairs", "binance", ["ETH-USDT"])
+        self.age_entry("trading_pairs", "binance", 120)
+        get_or_fetch = self.cache.get_or_fetch("trading_pairs", "binance", self.fetch, self.revalidated.append, ttl=60)
+        self.assertEqual(["ETH-USDT"], self.ev_loop.run_until_complete(get_or_fetch))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertEqual(1, self.fetch_count)
+        self.assertEqual([["ETH-USDT", "BTC-USDT"]], self.revalidated)
+        self.assertEqual(["ETH-USDT", "BTC-USDT"], self.cache.get("trading_pairs", "binance").value)
+        self.assertLess(self.cache.get("trading_pairs", "binance").age(), 1)
+
+    def test_failed_revalidation_keeps_cached_value(self):
+        self.cache.set("trading_pairs", "binance", ["ETH-USDT"])
+        self.age_entry("trading_pairs", "binance", 120)
+        self.ev_loop.run_until_complete(self.cache.revalidate("trading_pairs", "binance", self.failing_fetch,
+                                                              self.revalidated.append))
+        self.assertEqual(1, self.fetch_count)
+        self.assertEqual([], self.revalidated)
+        self.assertEqual(["ETH-USDT"], self.cache.get("trading_pairs", "binance").value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import json
+import unittest
+
+from websockets.exceptions import ConnectionClosed
+
+from hummingbot.core.utils.websocket_client import (
+    OverflowPolicy,
+    WebsocketClient,
+    WebsocketMessageQueue,
+)
+
+
+class WebsocketMessageQueueUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def test_drop_oldest(self):
+        queue = WebsocketMessageQueue(3, OverflowPolicy.DROP_OLDEST)
+        for i in range(5):
+            self.assertTrue(queue.put_nowait(i))
+        self.assertEqual(3, queue.qsize())
+        self.assertEqual(2, queue.dropped)
+        self.assertEqual([2, 3, 4], [queue.get_nowait() for _ in range(3)])
+
+    def test_drop_newest(self):
+        queue = WebsocketMessageQueue(3, OverflowPolicy.DROP_NEWEST)
+        results = [queue.put_nowait(i) for i in range(5)]
+        self.assertEqual([True, True, True, False, False], results)
+        self.assertEqual(2, queue.dropped)
+        self.assertEqual([0, 1, 2], [queue.get_nowait() for _ in range(3)])
+
+    def test_coalesce(self):
+        queue = WebsocketMessageQueue(2, OverflowPolicy.COALESCE, coalesce_key=lambda m: m["pair"])
+        queue.put_nowait({"pair": "ETH-USDT", "seq": 1})
+        queue.put_nowait({"pair": "BTC-USDT", "seq": 2})
+        queue.put_nowait({"pair": "ETH-USDT", "seq": 3})
+        self.assertEqual(2, queue.qsize())
+        self.assertEqual(1, queue.coalesced)
+        # The replaced message keeps its place in the queue.
+        self.assertEqual({"pair": "ETH-USDT", "seq": 3}, queue.get_nowait())
+        queue.put_nowait({"pair": "LTC-USDT", "seq": 4})
+        queue.put_nowait({"pair": "XRP-USDT", "seq": 5})
+        self.assertEqual(1, queue.dropped)
+        self.assertEqual(["LTC-USDT", "XRP-USDT"], [queue.get_nowait()["pair"] for _ in range(2)])
+
+    def test_coalesce_needs_key(self):
+        with self.assertRaises(ValueError):
+            WebsocketMessageQueue(2, OverflowPolicy.COALESCE)
+
+    def test_get_waits_for_message(self):
+        queue = WebsocketMessageQueue()
+
+        async def put_later():
+            await asyncio.sleep(0.01)
+            queue.put_nowait("message")
+
+        self.ev_loop.call_soon(lambda: asyncio.ensure_future(put_later()))
+        self.assertEqual("message", self.ev_loop.run_until_complete(asyncio.wait_for(queue.get(), 1)))
+
+
+class WebsocketClientRoutingUnitTest(unittest.TestCase):
+    def test_messages_are_routed_to_matching_subscriptions(self):
+        client = WebsocketClient("ws://localhost")
+        trades = client.subscribe("trades", matcher=lambda m: m.get("channel") == "trades")
+        everything = client.subscribe("everything")
+        client._process_message(json.dumps({"channel": "trades", "id": 1}))
+        client._process_message(json.dumps({"channel": "book", "id": 2}))
+        client._process_message("not json")
+
+        self.assertEqual(1, trades.queue.qsize())
+        self.assertEqual(2, everything.queue.qsize())
+        stats = client.stats
+        self.assertEqual(3, stats["messages_received"])
+        self.assertEqual(1, stats["decode_errors"])
+        self.assertEqual({"depth": 2, "dropped": 0, "coalesced": 0}, stats["queues"]["everything"])
+
+    def test_ping_responder(self):
+        client = WebsocketClient("ws://localhost", ping_responder=lambda m: {"pong": m["ping"]} if "ping" in m else None)
+        subscription = client.subscribe("everything")
+        sent = []
+
+        async def send(payload):
+            sent.append(payload)
+        client.send = send
+        client._process_message(json.dumps({"ping": 123}))
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0))
+        self.assertEqual([{"pong": 123}], sent)
+        self.assertEqual(0, subscription.queue.qsize())
+
+
+class ClosedWebsocket:
+    """
+    A websocket the server has closed: pings fail.
+    """
+    def __init__(self):
+        self.close_calls = 0
+
+    async def ping(self):
+        raise ConnectionClosed(1006, "")
+
+    async def close(self):
+        self.close_calls += 1
+
+
+class WebsocketClientWatchdogUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.client = WebsocketClient("ws://localhost", message_timeout=0.01)
+
+    def test_closed_connection_is_dropped(self):
+        ws = ClosedWebsocket()
+        self.client._ws = ws
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.client._watchdog_loop(), 1))
+        self.assertEqual(1, ws.close_calls)
+
+    def test_stops_once_disconnected(self):
+        self.client._ws = None
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.client._watchdog_loop(), 1))
+
+
+if __name__ == "__main__":
+    unittest.main()